@@ -0,0 +1,125 @@
+"""
+Benchmarks of total coloring on synthetic banded and block sparse jacobian sparsity patterns.
+
+Run this file directly to print the time and number of solves for each coloring.  Use
+--baseline to compare against another version of OpenMDAO.
+"""
+import argparse
+import inspect
+import json
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+import numpy as np
+from scipy.sparse import coo_matrix
+
+from openmdao.utils.coloring import _compute_coloring
+
+
+def _banded(n, bandwidth):
+    # square matrix with nonzeros within bandwidth of the diagonal
+    rows = np.repeat(np.arange(n), 2 * bandwidth + 1)
+    cols = rows + np.tile(np.arange(-bandwidth, bandwidth + 1), n)
+    mask = (cols >= 0) & (cols < n)
+    return coo_matrix((np.ones(np.count_nonzero(mask), dtype=bool), (rows[mask], cols[mask])),
+                      shape=(n, n))
+
+
+def _block_sparse(nblocks, block_size, ndense=2):
+    # dense diagonal blocks plus some dense rows at the bottom, like a multipoint problem
+    # with constraints on each point and an objective and constraints that depend on all of them
+    n = nblocks * block_size
+    starts = np.repeat(np.arange(nblocks) * block_size, block_size * block_size)
+    local = np.arange(block_size * block_size)
+    rows = starts + np.tile(local // block_size, nblocks)
+    cols = starts + np.tile(local % block_size, nblocks)
+    rows = np.concatenate([rows, np.repeat(np.arange(n, n + ndense), n)])
+    cols = np.concatenate([cols, np.tile(np.arange(n), ndense)])
+    return coo_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(n + ndense, n))
+
+
+class BM(unittest.TestCase):
+    """Coloring of large sparsity patterns."""
+
+    def benchmark_banded_10K_fwd(self):
+        _compute_coloring(_banded(10000, 3), 'fwd')
+
+    def benchmark_banded_10K_auto(self):
+        _compute_coloring(_banded(10000, 3), 'auto')
+
+    def benchmark_banded_50K_fwd(self):
+        _compute_coloring(_banded(50000, 3), 'fwd')
+
+    def benchmark_block_10K_rev(self):
+        _compute_coloring(_block_sparse(1000, 10), 'rev')
+
+    def benchmark_block_10K_auto(self):
+        _compute_coloring(_block_sparse(1000, 10), 'auto')
+
+    def benchmark_block_50K_auto(self):
+        _compute_coloring(_block_sparse(5000, 10), 'auto')
+
+
+def _run_cases(sizes):
+    # yield (case, time, fwd solves, rev solves) for each coloring of each pattern
+    try:
+        inspect.signature(_compute_coloring).bind(None, 'fwd', order='id')
+        orders = ('id', 'sl')
+    except TypeError:
+        orders = ('id',)  # older versions only color in incidence degree order
+
+    for size in sizes:
+        for name, J in [('banded', _banded(size, 3)), ('block', _block_sparse(size // 10, 10))]:
+            for mode in ('fwd', 'rev', 'auto'):
+                if name == 'block' and mode == 'fwd' and size > 5000:
+                    # the dense rows make every column adjacent to every other one
+                    continue
+                for order in orders:
+                    kwargs = {} if order == 'id' else {'order': order}
+                    start = time.perf_counter()
+                    coloring = _compute_coloring(J, mode, **kwargs)
+                    elapsed = time.perf_counter() - start
+                    yield (f"{name:>6} {str(J.shape):>16} {mode:>4} {order:>2}", elapsed,
+                           coloring.total_solves(rev=False), coloring.total_solves(fwd=False))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('sizes', nargs='*', type=int, default=[1000, 10000, 50000],
+                        help='Number of columns of the sparsity patterns.')
+    parser.add_argument('--baseline', action='store',
+                        help='Directory containing another version of the openmdao package, '
+                        'e.g. a git worktree of an older commit.  The same cases are run with '
+                        'that version in a subprocess and the timings are compared.')
+    parser.add_argument('--json', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.json:
+        for case in _run_cases(args.sizes):
+            print(json.dumps(case), flush=True)
+        sys.exit(0)
+
+    baseline = {}
+    if args.baseline:
+        env = os.environ.copy()
+        env['PYTHONPATH'] = os.path.abspath(args.baseline)
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--json'] +
+                             [str(s) for s in args.sizes], env=env, check=True,
+                             stdout=subprocess.PIPE, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+        for line in out.splitlines():
+            case, elapsed, fwd, rev = json.loads(line)
+            baseline[case] = (elapsed, fwd, rev)
+
+    for case, elapsed, fwd, rev in _run_cases(args.sizes):
+        line = f"{case}: fwd solves {fwd:>6}, rev solves {rev:>6}, {elapsed:8.3f} sec"
+        if case in baseline:
+            belapsed, bfwd, brev = baseline[case]
+            line += f"  (baseline {belapsed:8.3f} sec, {belapsed / elapsed:6.1f}x"
+            if (bfwd, brev) != (fwd, rev):
+                line += f", baseline solves {bfwd}/{brev}"
+            line += ")"
+        print(line, flush=True)
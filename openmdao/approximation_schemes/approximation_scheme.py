@@ -7,6 +7,7 @@ from openmdao.core.constants import INT_DTYPE
 from openmdao.vectors.vector import _full_slice
 from openmdao.utils.array_utils import get_input_idx_split, ValueRepeater
 import openmdao.utils.coloring as coloring_mod
+from openmdao.utils.concurrent_utils import concurrent_eval_pool
 from openmdao.utils.general_utils import LocalRangeIterable
 from openmdao.utils.mpi import check_mpi_env
 from openmdao.utils.rangemapper import RangeMapper
@@ -601,11 +602,92 @@ class ApproximationScheme(object):
         # This will either generate new approx groups or use cached ones
         approx_groups, colored_approx_groups = self._get_approx_groups(system, under_cs)
 
+        if _use_local_pool(system):
+            yield from self._local_pool_column_iter(system, approx_groups, colored_approx_groups)
+            return
+
         if colored_approx_groups:
             yield from self._colored_column_iter(system, colored_approx_groups)
 
         yield from self._uncolored_column_iter(system, approx_groups)
 
+    def _local_pool_column_iter(self, system, approx_groups, colored_approx_groups):
+        """
+        Perform component approximations in a pool of local processes and yield the columns.
+
+        Each worker is forked from this process, so it starts from a copy of the component in
+        its current state.  Only the index of the point to run and the resulting column are
+        passed between processes.
+
+        Parameters
+        ----------
+        system : Component
+            Component where this approximation is occurring.
+        approx_groups : list of tuples
+            Uncolored approximation groups (see _uncolored_column_iter).
+        colored_approx_groups : list of tuples or None
+            Colored approximation groups (see _colored_column_iter).
+
+        Yields
+        ------
+        int
+            column index
+        ndarray
+            solution array corresponding to the jacobian column at the given column index
+        """
+        # each run is (idx_info, data, mult, idx_range, jac cols, nonzero rows if colored)
+        runs = []
+
+        if colored_approx_groups:
+            for data, jcols, vec_ind_list, nzrows, _ in colored_approx_groups:
+                runs.append((vec_ind_list, data, self._get_multiplier(data), range(1),
+                             jcols, nzrows))
+
+        for _, data, jcol_idxs, vec_ind_list, directional, direction in approx_groups:
+            if direction is not None:
+                app_data = self.apply_directional(data, direction)
+            else:
+                app_data = data
+
+            mult = self._get_multiplier(data)
+
+            jidx = 0
+            for vec_ind_info, vecidxs in self._vec_ind_iter(vec_ind_list):
+                if vecidxs is None:
+                    continue  # non-local partial jac column
+                jinds = jcol_idxs[jidx]
+                jidx += 1
+                # _vec_ind_iter reuses its entry list, so save a copy
+                runs.append(([tuple(ent) for ent in vec_ind_info], app_data, mult, jcol_idxs,
+                             jinds[0] if directional else jinds, None))
+
+        results_array = system._residuals.asarray(copy=True)
+
+        def run(i):
+            idx_info, data, mult, idx_range, _, _ = runs[i]
+            result = self._transform_result(self._run_point(system, idx_info, data,
+                                                            results_array, False, idx_range))
+            if mult != 1.0:
+                result *= mult
+            return result.copy()
+
+        scratch = np.empty(len(system._outputs))
+
+        for i, result, err in concurrent_eval_pool(run, [((i,), None) for i in range(len(runs))],
+                                                   num_workers=system._num_par_fd):
+            if err is not None:
+                raise RuntimeError(f"{system.msginfo}: Error during parallel approximation of "
+                                   f"partial derivatives:\n{err}")
+
+            _, _, _, _, jcols, nzrows = runs[i]
+            if nzrows is None:
+                yield jcols, result
+            else:
+                for j, col in enumerate(jcols):
+                    scratch[:] = 0.0
+                    scratch[nzrows[j]] = result[nzrows[j]]
+                    yield col, scratch
+
     def _get_total_result(self, outarr, totarr):
         """
         Convert output array into a column array that matches the size of the total jacobian.
@@ -648,3 +730,21 @@ def _is_group(obj):
     """
     from openmdao.core.group import Group
     return isinstance(obj, Group)
+
+
+def _use_local_pool(system):
+    """
+    Return True if approximations for the given system should run in a local process pool.
+
+    Parameters
+    ----------
+    system : System
+        System where the approximation is occurring.
+
+    Returns
+    -------
+    bool
+        True if the system is a component using the 'process_pool' parallel FD backend.
+    """
+    return system._num_par_fd > 1 and not _is_group(system) and \
+        system.options['par_fd_backend'] == 'process_pool'
@@ -1,6 +1,9 @@
 """Define the ExecComp class, a component that evaluates an expression."""
 import re
+import ast
 import time
+from types import FunctionType, CodeType
+from functools import lru_cache
 from itertools import product
 from contextlib import contextmanager
 
@@ -29,7 +32,29 @@ _allowed_meta = {'value', 'val', 'shape', 'units', 'res_units', 'desc',
 # Names that are not allowed for input or output variables (keywords for options)
 _option_names = {'has_diag_partials', 'units', 'shape', 'default_shape', 'shape_by_conn',
                  'run_root_only', 'constant', 'do_coloring', 'assembled_jac_type', 'derivs_method',
-                 'distributed', 'always_opt', 'use_jit'}
+                 'distributed', 'always_opt', 'use_jit', 'use_kernel'}
+
+# name of the kernel argument used to store output values
+_KERNEL_SET = '_om_assign_'
+
+
+@lru_cache(maxsize=256)
+def _compile_kernel(src):
+    """
+    Compile the source of an ExecComp kernel function, caching the most recent results.
+
+    Parameters
+    ----------
+    src : str
+        Source code defining a single kernel function.
+
+    Returns
+    -------
+    CodeType
+        The code object of the kernel function.
+    """
+    modcode = compile(src, '<ExecComp kernel>', 'exec')
+    return [c for c in modcode.co_consts if isinstance(c, CodeType)][0]
 
 
 def check_option(option, value):
@@ -118,6 +143,13 @@ class ExecComp(ExplicitComponent):
     _viewdict : dict or None
         If using internal CS, this maps input, output, and constant names to their corresponding
         views/values.
+    _kernel : function or None
+        Function that evaluates all of the expressions in a single call, or None if the
+        expressions are evaluated one at a time using exec.
+    _kernel_argnames : list of str
+        Names of the input and constant variables passed to the kernel, in order.
+    _kernel_args : list or None
+        (view, is_scalar) tuples from _viewdict for each kernel argument.
     """
 
     def __init__(self, exprs=[], **kwargs):
@@ -243,6 +275,9 @@ class ExecComp(ExplicitComponent):
         self._outarray = None
         self._indict = None
         self._viewdict = None
+        self._kernel = None
+        self._kernel_argnames = []
+        self._kernel_args = None
 
     def initialize(self):
         """
@@ -272,6 +307,12 @@ class ExecComp(ExplicitComponent):
                              desc='If True (the default), compute the partial jacobian '
                              'coloring for this component.')
 
+        self.options.declare('use_kernel', types=bool, default=True,
+                             desc='If True (the default), compile all of the expressions into a '
+                                  'single function that is shared by all ExecComps having the '
+                                  'same expressions, rather than evaluating each expression '
+                                  'separately.')
+
         self.options.undeclare("distributed")
 
     @classmethod
@@ -513,6 +554,7 @@ class ExecComp(ExplicitComponent):
                 init_vals[var] = current_meta['val']
 
         self._codes = self._compile_exprs(self._exprs)
+        self._kernel, self._kernel_argnames = self._build_kernel()
 
     def add_expr(self, expr, **kwargs):
         """
@@ -568,6 +610,70 @@ class ExecComp(ExplicitComponent):
                                    (self.msginfo, exprs[i]))
         return compiled
 
+    def _build_kernel(self):
+        """
+        Create a function that evaluates all of the expressions in a single call.
+
+        Each expression of the form 'name = rhs' becomes a statement of the function.  Inputs and
+        constants are passed in as arguments and outputs are stored (and rebound to their stored
+        values) as they are computed, so the kernel gives the same results as exec'ing the
+        expressions one at a time. The compiled code is cached so that ExecComps with identical
+        expressions only compile it once.
+
+        Returns
+        -------
+        function or None
+            The kernel function, or None if it can't be used for these expressions.
+        list of str
+            Names of the variables to be passed to the kernel, in order.
+        """
+        if not self.options['use_kernel'] or not self._exprs:
+            return None, []
+
+        exprs = tuple(self._exprs)
+        assigns = []
+        outs = set()
+        loaded = set()
+        reused = set()
+        try:
+            for expr in exprs:
+                tree = ast.parse(expr.strip())
+                if len(tree.body) != 1:
+                    return None, []
+                node = tree.body[0]
+                if not (isinstance(node, ast.Assign) and len(node.targets) == 1 and
+                        isinstance(node.targets[0], ast.Name)):
+                    return None, []
+
+                for n in ast.walk(node.value):
+                    if isinstance(n, ast.Name):
+                        if n.id in outs:
+                            reused.add(n.id)
+                        else:
+                            loaded.add(n.id)
+                    elif isinstance(n, (ast.Lambda, ast.comprehension, ast.NamedExpr)):
+                        # these introduce their own names, so leave them to exec
+                        return None, []
+
+                name = node.targets[0].id
+                outs.add(name)
+                assigns.append((name, ast.unparse(node.value)))
+        except SyntaxError:
+            return None, []
+
+        # only rebind an output to its stored value if a later expression uses it
+        stmts = [f"    {name} = {_KERNEL_SET}('{name}', {rhs})" if name in reused
+                 else f"    {_KERNEL_SET}('{name}', {rhs})" for name, rhs in assigns]
+
+        argnames = sorted(n for n in loaded if n not in _expr_dict)
+        if _KERNEL_SET in argnames:
+            return None, []
+
+        src = '\n'.join([f"def _exec_comp_kernel({', '.join([_KERNEL_SET] + argnames)}):"] +
+                        stmts)
+
+        return FunctionType(_compile_kernel(src), _expr_dict), argnames
+
     def _parse_for_out_vars(self, s):
         vnames = set([x.strip() for x in re.findall(VAR_RGX, s)
                       if not x.endswith('(') and not x.startswith('.')])
@@ -618,6 +724,7 @@ class ExecComp(ExplicitComponent):
         """
         state = self.__dict__.copy()
         del state['_codes']
+        state['_kernel'] = None
         return state
 
     def __setstate__(self, state):
@@ -631,6 +738,8 @@ class ExecComp(ExplicitComponent):
         """
         self.__dict__.update(state)
         self._codes = self._compile_exprs(self._exprs)
+        if self._exprs_info:
+            self._kernel, self._kernel_argnames = self._build_kernel()
 
     def declare_partials(self, *args, **kwargs):
         """
@@ -788,6 +897,7 @@ class ExecComp(ExplicitComponent):
             viewdict.update({n: (np.atleast_1d(v), np.isscalar(v))
                              for n, v in self._constants.items()})
             self._viewdict = _ViewDict(viewdict)
+            self._kernel_args = [viewdict[n] for n in self._kernel_argnames]
 
     def compute(self, inputs, outputs):
         """
@@ -818,6 +928,16 @@ class ExecComp(ExplicitComponent):
         if self._iodict._inputs is not inputs:
             self._iodict = _IODict(outputs, inputs, self._constants)
 
+        iodict = self._iodict
+        kernel_err = None
+        if self._kernel is not None:
+            try:
+                self._kernel(iodict.assign, *[iodict[n] for n in self._kernel_argnames])
+                return
+            except Exception as err:
+                # evaluate the expressions one at a time to report the failing one
+                kernel_err = err
+
         for i, expr in enumerate(self._codes):
             try:
                 #  inputs, outputs, and _constants are vectors
@@ -827,6 +947,9 @@ class ExecComp(ExplicitComponent):
                 raise RuntimeError(f"{self.msginfo}: Error occurred evaluating '{self._exprs[i]}':"
                                    f"\n{err}")
 
+        if kernel_err is not None:
+            self._disable_kernel(kernel_err)
+
     def _linearize(self, sub_do_ln=False):
         """
         Compute jacobian / factorization. The model is assumed to be in a scaled state.
@@ -910,6 +1033,16 @@ class ExecComp(ExplicitComponent):
         self._manual_decl_partials = True
 
     def _exec(self):
+        kernel_err = None
+        if self._kernel is not None:
+            try:
+                self._kernel(self._viewdict.assign,
+                             *[v.item() if is_scalar else v for v, is_scalar in self._kernel_args])
+                return
+            except Exception as err:
+                # evaluate the expressions one at a time to report the failing one
+                kernel_err = err
+
         for i, expr in enumerate(self._codes):
             try:
                 exec(expr, _expr_dict, self._viewdict)  # nosec:
@@ -917,6 +1050,25 @@ class ExecComp(ExplicitComponent):
                 raise RuntimeError(f"{self.msginfo}: Error occurred evaluating "
                                    f"'{self._exprs[i]}':\n{err}")
 
+        if kernel_err is not None:
+            self._disable_kernel(kernel_err)
+
+    def _disable_kernel(self, err):
+        """
+        Stop using the kernel after it failed on expressions that evaluate without error.
+
+        Parameters
+        ----------
+        err : Exception
+            The exception raised by the kernel.
+        """
+        self._kernel = None
+        self._kernel_args = None
+        issue_warning("Evaluation of the expressions in a single call failed, but evaluating "
+                      "them one at a time succeeded, so they will be evaluated one at a time "
+                      f"from now on. The error was:\n{type(err).__name__}: {err}",
+                      prefix=self.msginfo)
+
     def _compute_coloring(self, recurse=False, **overrides):
         """
         Compute a coloring of the partial jacobian.
@@ -1160,6 +1312,14 @@ class _ViewDict(object):
     def __contains__(self, name):
         return name in self.dct
 
+    def assign(self, name, value):
+        val, is_scalar = self.dct[name]
+        try:
+            val[:] = value
+        except ValueError:
+            self[name] = value
+        return val.item() if is_scalar else val
+
 
 class _IODict(object):
     """
@@ -1224,6 +1384,25 @@ class _IODict(object):
     def __contains__(self, name):
         return name in self._inputs or name in self._outputs or name in self._constants
 
+    def assign(self, name, value):
+        """
+        Set the value of an output and return its new value.
+
+        Parameters
+        ----------
+        name : str
+            Name of the output.
+        value : float or ndarray
+            The value to store.
+
+        Returns
+        -------
+        float or ndarray
+            The stored value of the output.
+        """
+        self[name] = value
+        return self._outputs[name]
+
 
 def _import_functs(mod, dct, names=None):
     """
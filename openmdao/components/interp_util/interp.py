@@ -334,21 +334,7 @@ class InterpND(object):
         ndarray
             Value of interpolant at all sample points.
         """
-        if not self.extrapolate:
-            for i, p in enumerate(xi.T):
-                if np.isnan(p).any():
-                    raise OutOfBoundsError("One of the requested xi contains a NaN",
-                                           i, np.nan, self.grid[i][0], self.grid[i][-1])
-
-                eps = 1e-14 * self.grid[i][-1]
-                if np.any(p < self.grid[i][0] - eps) or np.any(p > self.grid[i][-1] + eps):
-                    p1 = np.where(self.grid[i][0] > p)[0]
-                    p2 = np.where(p > self.grid[i][-1])[0]
-                    # First violating entry is enough to direct the user.
-                    violated_idx = set(p1).union(p2).pop()
-                    value = p[violated_idx]
-                    raise OutOfBoundsError("One of the requested xi is out of bounds",
-                                           i, value, self.grid[i][0], self.grid[i][-1])
+        self._check_bounds(xi)
 
         if self._compute_d_dvalues:
             # If the table grid or values are component inputs, then we need to create a new table
@@ -393,6 +379,45 @@ class InterpND(object):
 
         return result
 
+    def _supports_stencil(self):
+        """
+        Return whether the table can compute a stencil that is shared by several value arrays.
+
+        This requires a table method that is linear in the table values in every dimension. The
+        fixed-dimension, bsplines and scipy methods never support it.
+
+        Returns
+        -------
+        bool
+            True if the table and all of its subtables implement compute_weights.
+        """
+        return getattr(self.table, '_supports_weights', False) and self.table.supports_weights()
+
+    def _check_bounds(self, xi):
+        """
+        Raise an OutOfBoundsError if extrapolation is off and any coordinate is out of bounds.
+
+        Parameters
+        ----------
+        xi : ndarray of shape (..., ndim)
+            The coordinates to sample the gridded data.
+        """
+        if not self.extrapolate:
+            for i, p in enumerate(xi.T):
+                if np.isnan(p).any():
+                    raise OutOfBoundsError("One of the requested xi contains a NaN",
+                                           i, np.nan, self.grid[i][0], self.grid[i][-1])
+
+                eps = 1e-14 * self.grid[i][-1]
+                if np.any(p < self.grid[i][0] - eps) or np.any(p > self.grid[i][-1] + eps):
+                    p1 = np.where(self.grid[i][0] > p)[0]
+                    p2 = np.where(p > self.grid[i][-1])[0]
+                    # First violating entry is enough to direct the user.
+                    violated_idx = set(p1).union(p2).pop()
+                    value = p[violated_idx]
+                    raise OutOfBoundsError("One of the requested xi is out of bounds",
+                                           i, value, self.grid[i][0], self.grid[i][-1])
+
     def _evaluate_spline(self, values):
         """
         Interpolate at all fixed output coordinates given the new table values.
@@ -81,6 +81,202 @@ def dv_abs_smooth_complex(x, x_deriv, delta_x):
     return y, y_deriv
 
 
+def _abs_window(x, x_deriv, delta_x):
+    """
+    Compute the (optionally smoothed) absolute value and its derivative for many points.
+
+    Parameters
+    ----------
+    x : ndarray
+        Input array.
+    x_deriv : ndarray
+        Derivative of x, with one additional trailing dimension.
+    delta_x : float
+        Half width of the rounded section. Set to 0 for the plain absolute value.
+
+    Returns
+    -------
+    ndarray
+        Absolute value of x.
+    ndarray
+        Derivative of the absolute value of x.
+    """
+    if delta_x > 0:
+        neg = x.real <= -delta_x
+        pos = x.real >= delta_x
+        y = np.where(neg, -x, np.where(pos, x, 0.5 * (x * x / delta_x + delta_x)))
+        y_deriv = np.where(neg[..., np.newaxis], -x_deriv,
+                           np.where(pos[..., np.newaxis], x_deriv,
+                                    (x / delta_x)[..., np.newaxis] * x_deriv))
+    else:
+        neg = x.real < 0
+        y = np.where(neg, -x, x)
+        y_deriv = np.where(neg[..., np.newaxis], -x_deriv, x_deriv)
+
+    return y, y_deriv
+
+
+def _akima_slope(m_a, dm_a, m_b, dm_b, w_a, dw_a, w_b, dw_b, eps):
+    """
+    Compute the Akima slope at a grid point as the weighted mean of two interval slopes.
+
+    Parameters
+    ----------
+    m_a : ndarray
+        Slope of the interval to the left of the point.
+    dm_a : ndarray
+        Derivative of m_a.
+    m_b : ndarray
+        Slope of the interval to the right of the point.
+    dm_b : ndarray
+        Derivative of m_b.
+    w_a : ndarray
+        Weight of m_a.
+    dw_a : ndarray
+        Derivative of w_a.
+    w_b : ndarray
+        Weight of m_b.
+    dw_b : ndarray
+        Derivative of w_b.
+    eps : float
+        Value that triggers division-by-zero safeguard.
+
+    Returns
+    -------
+    ndarray
+        Slope at the grid point.
+    ndarray
+        Derivative of the slope.
+    """
+    den = w_a + w_b
+    ok = den.real > eps
+    den = np.where(ok, den, 1.0)
+
+    b = np.where(ok, (m_a * w_a + m_b * w_b) / den, 0.5 * (m_a + m_b))
+
+    n = np.newaxis
+    db = np.where(ok[..., n],
+                  (dm_a * w_a[..., n] + m_a[..., n] * dw_a + dm_b * w_b[..., n] +
+                   m_b[..., n] * dw_b - b[..., n] * (dw_a + dw_b)) / den[..., n],
+                  0.5 * (dm_a + dm_b))
+
+    return b, db
+
+
+def _akima_window(grid, x, idx, start, vals, delta_x, eps):
+    """
+    Interpolate along one dimension with an Akima spline for many points at once.
+
+    Parameters
+    ----------
+    grid : ndarray
+        Grid locations in this dimension.
+    x : ndarray of shape (n_points, )
+        Coordinates of the points in this dimension.
+    idx : ndarray of int
+        Interval index for each point. An index of len(grid) - 1 means the point is above the
+        table.
+    start : ndarray of int
+        Grid index of the first window value for each point.
+    vals : ndarray of shape (n_points, ..., n_window)
+        Values at the window points. The window must contain the grid points idx - 2 through
+        idx + 3 that are on the grid. Window points that are outside of the grid are ignored.
+    delta_x : float
+        Half width of the smoothing interval added in the valley of the absolute-value function.
+    eps : float
+        Value that triggers division-by-zero safeguard.
+
+    Returns
+    -------
+    ndarray
+        Interpolated values, of shape vals.shape[:-1].
+    ndarray
+        Derivative of the interpolated values with respect to x.
+    ndarray
+        Derivative of the interpolated values with respect to vals.
+    """
+    ngrid = len(grid)
+    n_points = len(x)
+    width = vals.shape[-1]
+    n = np.newaxis
+
+    # Per-point quantities are shaped to broadcast against the interpolated values.
+    shape = (n_points, ) + (1, ) * (vals.ndim - 2)
+
+    extrap_hi = idx == ngrid - 1
+    idx = np.minimum(idx, ngrid - 2)
+    extrap_lo = (idx == 0) & (x.real < grid[0])
+
+    # Values at the grid points idx - 2 through idx + 3, and their derivatives with respect to
+    # the window values.
+    offsets = np.arange(-2, 4)
+    pos = np.clip((idx - start)[:, n] + offsets, 0, width - 1)
+    local = np.take_along_axis(vals, pos.reshape(shape + (6, )), axis=-1)
+    onehot = (pos[..., n] == np.arange(width)).astype(local.dtype)
+
+    # Slopes of the intervals, m1 through m5. Intervals that are not on the grid have zero slope
+    # until the end conditions below are applied.
+    pts = idx[:, n] + offsets
+    valid = (pts[:, :-1] >= 0) & (pts[:, 1:] < ngrid)
+    pts = np.clip(pts, 0, ngrid - 1)
+    steps = np.where(valid, grid[pts[:, 1:]] - grid[pts[:, :-1]], 1.0)
+    rsteps = valid / steps
+
+    m = (local[..., 1:] - local[..., :-1]) * rsteps.reshape(shape + (5, ))
+    dm = (onehot[:, 1:] - onehot[:, :-1]) * rsteps[..., n]
+    m1, m2, m3, m4, m5 = [m[..., j] for j in range(5)]
+    dm1, dm2, dm3, dm4, dm5 = [dm[:, j].reshape(shape + (width, )) for j in range(5)]
+
+    r0 = idx == 0
+    r1 = ~r0 & (idx == 1)
+    r2 = ~r0 & ~r1 & (idx == ngrid - 3)
+    r3 = ~r0 & ~r1 & ~r2 & (idx == ngrid - 2)
+    r0, r1, r2, r3 = [r.reshape(shape) for r in (r0, r1, r2, r3)]
+
+    m2 = np.where(r0, 2.0 * m3 - m4, m2)
+    dm2 = np.where(r0[..., n], 2.0 * dm3 - dm4, dm2)
+    m1 = np.where(r0 | r1, 2.0 * m2 - m3, m1)
+    dm1 = np.where((r0 | r1)[..., n], 2.0 * dm2 - dm3, dm1)
+    m4 = np.where(r3, 2.0 * m3 - m2, m4)
+    dm4 = np.where(r3[..., n], 2.0 * dm3 - dm2, dm4)
+    m5 = np.where(r2 | r3, 2.0 * m4 - m3, m5)
+    dm5 = np.where((r2 | r3)[..., n], 2.0 * dm4 - dm3, dm5)
+
+    # Slopes at the grid points bracketing each interval.
+    w2, dw2 = _abs_window(m4 - m3, dm4 - dm3, delta_x)
+    w31, dw31 = _abs_window(m2 - m1, dm2 - dm1, delta_x)
+    b, db = _akima_slope(m2, dm2, m3, dm3, w2, dw2, w31, dw31, eps)
+
+    w32, dw32 = _abs_window(m5 - m4, dm5 - dm4, delta_x)
+    w4, dw4 = _abs_window(m3 - m2, dm3 - dm2, delta_x)
+    bp1, dbp1 = _akima_slope(m3, dm3, m4, dm4, w32, dw32, w4, dw4, eps)
+
+    # Cubic coefficients. Extrapolation is linear from the end point.
+    interior = ~(extrap_hi | extrap_lo).reshape(shape)
+    extrap_hi = extrap_hi.reshape(shape)
+    h = (1.0 / (grid[idx + 1] - grid[idx])).reshape(shape)
+
+    a = np.where(extrap_hi, local[..., 3], local[..., 2])
+    da = np.where(extrap_hi[..., n], onehot[:, 3].reshape(shape + (width, )),
+                  onehot[:, 2].reshape(shape + (width, )))
+    c = np.where(interior, (3.0 * m3 - 2.0 * b - bp1) * h, 0.0)
+    dc = np.where(interior[..., n], (3.0 * dm3 - 2.0 * db - dbp1) * h[..., n], 0.0)
+    d = np.where(interior, (b + bp1 - 2.0 * m3) * h * h, 0.0)
+    dd = np.where(interior[..., n], (db + dbp1 - 2.0 * dm3) * (h * h)[..., n], 0.0)
+    b = np.where(extrap_hi, bp1, b)
+    db = np.where(extrap_hi[..., n], dbp1, db)
+
+    dx = x.reshape(shape) - np.where(extrap_hi, grid[idx + 1].reshape(shape),
+                                     grid[idx].reshape(shape))
+    val = a + dx * (b + dx * (c + dx * d))
+    dval_dx = b + dx * (2.0 * c + 3.0 * d * dx)
+
+    dx = dx[..., n]
+    dval_dvals = da + dx * (db + dx * (dc + dx * dd))
+
+    return val, dval_dx, dval_dvals
+
+
 class InterpAkima(InterpAlgorithm):
     """
     Interpolate using an Akima polynomial.
@@ -104,6 +300,7 @@ class InterpAkima(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 4
         self._name = 'akima'
+        self._supports_window = True
 
     def initialize(self):
         """
@@ -118,6 +315,59 @@ class InterpAkima(InterpAlgorithm):
         self.options.declare('eps', default=1e-30,
                              desc='Value that triggers division-by-zero safeguard.')
 
+    def compute_window(self, x, idx):
+        """
+        Compute the window of table values needed in this dimension for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, )
+            Coordinates of the points in this dimension.
+        idx : ndarray of int
+            Interval index for each point, as computed by bracket.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first window point in this dimension for each point.
+        int
+            Number of points in the window.
+        """
+        # The spline on an interval depends on two points to the left and three to the right.
+        ngrid = len(self.grid)
+        width = min(6, ngrid)
+        start = np.clip(np.minimum(idx, ngrid - 2) - 2, 0, ngrid - width)
+
+        return start, width
+
+    def interpolate_window(self, x, idx, start, vals):
+        """
+        Interpolate the gathered table values along this dimension for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, )
+            Coordinates of the points in this dimension.
+        idx : ndarray of int
+            Interval index for each point, as computed by bracket.
+        start : ndarray of int
+            Index of the first window point for each point, as returned by compute_window.
+        vals : ndarray of shape (n_points, ..., n_window)
+            Table values in the window. The last axis is this dimension, and any other axes are
+            preceding table dimensions.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, of shape vals.shape[:-1].
+        ndarray
+            Derivative of the interpolated values with respect to x.
+        ndarray
+            Derivative of the interpolated values with respect to vals.
+        """
+        return _akima_window(self.grid, x, idx, start, vals, self.options['delta_x'],
+                             self.options['eps'])
+
     def interpolate(self, x, idx, slice_idx):
         """
         Compute the interpolated value over this grid dimension.
@@ -760,9 +1010,9 @@ def abs_smooth_1d(x, x_deriv=None, delta_x=0):
         pass
 
     else:
-        x = 0.5 * (x**2 / delta_x + delta_x)
         if x_deriv is not None:
             x_deriv = x * x_deriv / delta_x
+        x = 0.5 * (x**2 / delta_x + delta_x)
 
     if x_deriv is not None:
         return x, x_deriv
@@ -1298,6 +1548,45 @@ class InterpAkimaSemi(InterpAlgorithmSemi):
         # Evaluate dependent value and exit
         return a + dx * (b + dx * (c + dx * d)), deriv_dx, deriv_dv, extrap
 
+    def interpolate_vectorized(self, x):
+        """
+        Compute the interpolated value over this grid dimension for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dim)
+            Coordinates of the points being interpolated. First column is the component in this
+            dimension. Remaining columns are interpolated on sub tables.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to this independent and child
+            independents.
+        tuple(ndarray, ndarray) or None
+            Derivative of interpolated values with respect to values for this and subsequent table
+            dimensions. Second term is the indices into the value array.
+        ndarray of bool
+            True where the coordinate is extrapolated in this dimension.
+        """
+        grid = self.grid.ravel()
+        ngrid = len(grid)
+        idx, extrap = self._bracket_vectorized(x[:, 0])
+
+        # The spline on an interval depends on two points to the left and three to the right.
+        start = np.minimum(idx, ngrid - 2) - 2
+        pos = start[:, np.newaxis] + np.arange(6)
+        stencil = self._evaluate_stencil_vectorized(x, pos, (pos >= 0) & (pos < ngrid))
+
+        val, d_val, weights = _akima_window(grid, x[:, 0], idx, start, stencil[0],
+                                            self.options['delta_x'], self.options['eps'])
+
+        val, derivs, d_value = self._combine_stencil_vectorized(val, d_val, weights, stencil)
+
+        return val, derivs, d_value, extrap
+
 
 class Interp1DAkima(InterpAlgorithmFixed):
     """
@@ -6,6 +6,31 @@ import numpy as np
 from openmdao.components.interp_util.outofbounds_error import OutOfBoundsError
 from openmdao.utils.options_dictionary import OptionsDictionary
 
+# Upper limit on the number of gathered table values when many points are interpolated at once.
+# Larger requests are evaluated in chunks of points to bound the memory use.
+_MAX_STENCIL_VALUES = 2 ** 22
+
+
+def _point_chunks(n_points, size):
+    """
+    Split the points so that each chunk gathers a bounded number of table values.
+
+    Parameters
+    ----------
+    n_points : int
+        Number of points being interpolated.
+    size : int
+        Number of table values gathered for each point.
+
+    Yields
+    ------
+    slice
+        Slice of the points in the chunk.
+    """
+    step = max(1, _MAX_STENCIL_VALUES // max(size, 1))
+    for i in range(0, n_points, step):
+        yield slice(i, i + step)
+
 
 class InterpAlgorithm(object):
     """
@@ -46,6 +71,12 @@ class InterpAlgorithm(object):
         Algorithm name for error messages.
     _supports_d_dvalues : bool
         If True, this algorithm can compute the derivatives with respect to table values.
+    _supports_weights : bool
+        If True, this algorithm implements compute_weights, so tables that use it in every
+        dimension can interpolate many points at once.
+    _supports_window : bool
+        If True, this algorithm implements compute_window and interpolate_window, so tables that
+        use it in every dimension can interpolate many points at once.
     _vectorized :bool
         If True, this method is vectorized and can simultaneously solve multiple interpolations.
     """
@@ -74,6 +105,8 @@ class InterpAlgorithm(object):
         self._compute_d_dx = True
         self._full_slice = None
         self._supports_d_dvalues = True
+        self._supports_weights = False
+        self._supports_window = False
 
     def initialize(self):
         """
@@ -111,7 +144,12 @@ class InterpAlgorithm(object):
         bool
             Returns True if this table can be run vectorized.
         """
-        return self._vectorized
+        if self._vectorized:
+            return True
+
+        # If we only have 1 point, use the non-vectorized implementation, which has faster
+        # bracketing than the numpy version.
+        return x.shape[0] > 1 and (self.supports_weights() or self.supports_window())
 
     def bracket(self, x):
         """
@@ -224,6 +262,347 @@ class InterpAlgorithm(object):
 
         return result, d_dx, d_values, d_grid
 
+    def evaluate_vectorized(self, x, slice_idx=None):
+        """
+        Interpolate across this and subsequent table dimensions for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dim)
+            The coordinates to sample the gridded data at.
+        slice_idx : None
+            Only needed for API compatibility.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to the independents.
+        ndarray or None
+            Derivative of interpolated values with respect to values, if requested.
+        None
+            Derivative of interpolated values with respect to grid is not computed.
+        """
+        if not self.supports_weights():
+            return self._evaluate_windows(x)
+
+        stencil = self.compute_stencil(x)
+        result, d_dx = self.evaluate_stencil(stencil, self.values)
+
+        d_values = None
+        if self._compute_d_dvalues:
+            d_values = self.stencil_d_dvalues(stencil, self.values.shape)
+
+        return result, d_dx, d_values, None
+
+    def _evaluate_windows(self, x):
+        """
+        Interpolate many points at once with a method that is nonlinear in the table values.
+
+        The table values in a window around each point are gathered, and then each dimension,
+        starting with the last one, reduces its window to a single value.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dim)
+            The coordinates to sample the gridded data at.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to the independents.
+        ndarray or None
+            Derivative of interpolated values with respect to values, if requested.
+        None
+            Derivative of interpolated values with respect to grid is not computed.
+        """
+        n_points, n_dim = x.shape
+
+        tables = []
+        brackets = []
+        indices = []
+        table = self
+        for i in range(n_dim):
+            grid = table.grid
+            idx = np.searchsorted(grid, x[:, i].real, side='left') - 1
+            np.clip(idx, 0, len(grid) - 1, out=idx)
+
+            start, width = table.compute_window(x[:, i], idx)
+
+            shape = [n_points] + [1] * n_dim
+            shape[i + 1] = width
+            indices.append((start[:, np.newaxis] + np.arange(width)).reshape(shape))
+            tables.append(table)
+            brackets.append((idx, start))
+            table = table.subtable
+
+        result = np.empty(n_points, dtype=np.result_type(self.values, x))
+        d_dx = np.empty((n_points, n_dim), dtype=result.dtype)
+        d_values = None
+        if self._compute_d_dvalues:
+            d_values = np.zeros((n_points, ) + self.values.shape, dtype=result.dtype)
+
+        size = np.prod([ind.shape[i + 1] for i, ind in enumerate(indices)])
+        for chunk in _point_chunks(n_points, size):
+            chunk_idx = tuple(ind[chunk] for ind in indices)
+            vals = self.values[chunk_idx].astype(result.dtype, copy=False)
+
+            grads = []
+            jacs = []
+            for i in range(n_dim - 1, -1, -1):
+                idx, start = brackets[i]
+                vals, dval_dx, jac = tables[i].interpolate_window(x[chunk, i], idx[chunk],
+                                                                  start[chunk], vals)
+                grads = [np.sum(g * jac, axis=-1) for g in grads]
+                grads.insert(0, dval_dx)
+                jacs.insert(0, jac)
+
+            result[chunk] = vals
+            d_dx[chunk] = np.stack(grads, axis=-1)
+
+            if d_values is not None:
+                d_values[chunk] = self.stencil_d_dvalues((chunk_idx, jacs, None),
+                                                         self.values.shape)
+
+        return result, d_dx, d_values, None
+
+    def supports_weights(self):
+        """
+        Return whether this table and all of its subtables implement compute_weights.
+
+        Returns
+        -------
+        bool
+            True if compute_stencil can be used with this table.
+        """
+        table = self
+        while table is not None:
+            if not table._supports_weights:
+                return False
+            table = table.subtable
+
+        return True
+
+    def supports_window(self):
+        """
+        Return whether this table and all of its subtables implement interpolate_window.
+
+        Returns
+        -------
+        bool
+            True if many points can be interpolated at once by gathering a window of values.
+        """
+        table = self
+        while table is not None:
+            if not table._supports_window:
+                return False
+            table = table.subtable
+
+        return True
+
+    def compute_stencil(self, x):
+        """
+        Bracket the points in every dimension and compute their interpolation weights.
+
+        The stencil only depends on the grid, so it can be applied to any number of value arrays
+        defined on the same grid.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dim)
+            The coordinates to sample the gridded data at.
+
+        Returns
+        -------
+        tuple of ndarray
+            Indices of the table values surrounding each point in each dimension, shaped to
+            broadcast against each other.
+        list of ndarray
+            Interpolation weights for each dimension.
+        list of ndarray
+            Derivatives of the interpolation weights for each dimension.
+        """
+        n_points, n_dim = x.shape
+
+        weights = []
+        dweights = []
+        indices = []
+        table = self
+        for i in range(n_dim):
+            grid = table.grid
+            xi = x[:, i]
+            idx = np.searchsorted(grid, xi.real, side='left') - 1
+            np.clip(idx, 0, len(grid) - 1, out=idx)
+
+            start, w, dw = table.compute_weights(xi, idx)
+
+            # shape the weights and indices so that they broadcast over the stencil of the
+            # other dimensions
+            shape = [n_points] + [1] * n_dim
+            shape[i + 1] = w.shape[1]
+            weights.append(w.reshape(shape[:i + 2]))
+            dweights.append(dw.reshape(shape[:i + 2]))
+            indices.append((start[:, np.newaxis] + np.arange(w.shape[1])).reshape(shape))
+            table = table.subtable
+
+        return tuple(indices), weights, dweights
+
+    def evaluate_stencil(self, stencil, values):
+        """
+        Interpolate the given table values using a stencil from compute_stencil.
+
+        The table values surrounding each point are gathered and contracted with the weights one
+        dimension at a time, starting with the last one.
+
+        Parameters
+        ----------
+        stencil : tuple
+            Stencil returned by compute_stencil.
+        values : ndarray
+            Table values. Any leading dimensions in addition to the table dimensions are treated
+            as separate tables on the same grid.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, of shape (..., n_points).
+        ndarray
+            Derivative of interpolated values with respect to the independents, of shape
+            (..., n_points, n_dim).
+        """
+        indices, weights, dweights = stencil
+        n_points = weights[0].shape[0]
+        n_tables = np.prod(values.shape[:-len(weights)], dtype=int)
+        size = n_tables * np.prod([w.shape[-1] for w in weights])
+
+        results = []
+        for chunk in _point_chunks(n_points, size):
+            vals = values[(Ellipsis, ) + tuple(ind[chunk] for ind in indices)]
+            dtype = np.result_type(vals, weights[0])
+            vals = vals.astype(dtype, copy=False)
+
+            grads = []
+            for i in range(len(weights) - 1, -1, -1):
+                w = weights[i][chunk]
+                grads = [np.sum(g * w, axis=-1) for g in grads]
+                grads.insert(0, np.sum(vals * dweights[i][chunk], axis=-1))
+                vals = np.sum(vals * w, axis=-1)
+
+            results.append((vals, np.stack(grads, axis=-1)))
+
+        if len(results) == 1:
+            return results[0]
+
+        return (np.concatenate([r[0] for r in results], axis=-1),
+                np.concatenate([r[1] for r in results], axis=-2))
+
+    def stencil_d_dvalues(self, stencil, shape):
+        """
+        Compute the derivatives of the interpolated values with respect to the table values.
+
+        Parameters
+        ----------
+        stencil : tuple
+            Stencil returned by compute_stencil.
+        shape : tuple
+            Shape of the table values.
+
+        Returns
+        -------
+        ndarray
+            Derivatives of shape (n_points, ) + shape.
+        """
+        indices, weights, _ = stencil
+        stencil_weights = weights[0]
+        for w in weights[1:]:
+            stencil_weights = stencil_weights[..., np.newaxis] * w
+
+        n_points = stencil_weights.shape[0]
+        d_values = np.zeros((n_points, ) + shape, dtype=stencil_weights.dtype)
+        rows = np.arange(n_points).reshape([n_points] + [1] * len(weights))
+        d_values[(rows, ) + indices] = stencil_weights
+
+        return d_values
+
+    def compute_weights(self, x, idx):
+        """
+        Compute the interpolation weights in this dimension for many points at once.
+
+        The interpolated value of a 1D table is the sum of the weights multiplied by the table
+        values at the stencil points. Child classes that interpolate linearly in the table values
+        can define this method and set _supports_weights to True.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, )
+            Coordinates of the points in this dimension.
+        idx : ndarray of int
+            Interval index for each point, as computed by bracket.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first stencil point in this dimension for each point.
+        ndarray of shape (n_points, n_stencil)
+            Weight of the table value at each stencil point.
+        ndarray of shape (n_points, n_stencil)
+            Derivative of the weights with respect to x.
+        """
+        raise NotImplementedError()
+
+    def compute_window(self, x, idx):
+        """
+        Compute the window of table values needed in this dimension for many points at once.
+
+        Child classes that are nonlinear in the table values can define this method and
+        interpolate_window, and set _supports_window to True.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, )
+            Coordinates of the points in this dimension.
+        idx : ndarray of int
+            Interval index for each point, as computed by bracket.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first window point in this dimension for each point.
+        int
+            Number of points in the window.
+        """
+        raise NotImplementedError()
+
+    def interpolate_window(self, x, idx, start, vals):
+        """
+        Interpolate the gathered table values along this dimension for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, )
+            Coordinates of the points in this dimension.
+        idx : ndarray of int
+            Interval index for each point, as computed by bracket.
+        start : ndarray of int
+            Index of the first window point for each point, as returned by compute_window.
+        vals : ndarray of shape (n_points, ..., n_window)
+            Table values in the window. The last axis is this dimension, and any other axes are
+            preceding table dimensions.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, of shape vals.shape[:-1].
+        ndarray
+            Derivative of the interpolated values with respect to x.
+        ndarray
+            Derivative of the interpolated values with respect to vals.
+        """
+        raise NotImplementedError()
+
     def interpolate(self, x, idx, slice_idx):
         """
         Compute the interpolated value over this grid dimension.
@@ -709,15 +1088,17 @@ class InterpAlgorithmSemi(object):
 
         Parameters
         ----------
-        x : float
-            Value of new independent to interpolate.
+        x : ndarray of shape (n_points, n_dim)
+            Points being interpolated.
 
         Returns
         -------
         bool
             Returns True if this table can be run vectorized.
         """
-        return self._vectorized
+        # If we only have 1 point, use the non-vectorized implementation, which has faster
+        # bracketing than the numpy version.
+        return x.shape[0] > 1
 
     def bracket(self, x):
         """
@@ -824,3 +1205,208 @@ class InterpAlgorithmSemi(object):
             True if the coordinate is extrapolated in this dimension.
         """
         raise NotImplementedError()
+
+    def interpolate_vectorized(self, x):
+        """
+        Compute the interpolated value over this grid dimension for many points at once.
+
+        This method must be defined by child classes.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dim)
+            Coordinates of the points being interpolated. First column is the component in this
+            dimension. Remaining columns are interpolated on sub tables.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to this independent and child
+            independents.
+        tuple(ndarray, ndarray) or None
+            Derivative of interpolated values with respect to values for this and subsequent table
+            dimensions. Second term is the indices into the value array. Rows are padded with
+            zero derivatives where a point needs fewer values than others.
+        ndarray of bool
+            True where the coordinate is extrapolated in this dimension.
+        """
+        raise NotImplementedError()
+
+    def _bracket_vectorized(self, x):
+        """
+        Locate the interval of the new independent for many points at once.
+
+        Points that are on a grid point are placed in the interval above it, like bracket does
+        on its first call.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, )
+            Values of the new independent.
+
+        Returns
+        -------
+        ndarray of int
+            Grid interval index that contains x. Points above the table get len(grid) - 1.
+        ndarray of bool
+            True for points that are outside of the table.
+        """
+        grid = self.grid.ravel()
+        ngrid = len(grid)
+        x = x.real
+
+        below = x < grid[0]
+        above = x > grid[-1]
+        extrap = below | above
+        if not self.extrapolate and np.any(extrap):
+            value = x[np.nonzero(extrap)[0][0]]
+            msg = f"Extrapolation while evaluation dimension {self.idim}."
+            raise OutOfBoundsError(msg, self.idim, value, grid[0], grid[-1])
+
+        idx = np.searchsorted(grid, x, side='right') - 1
+        np.clip(idx, 0, ngrid - 2, out=idx)
+        idx[above] = ngrid - 1
+
+        return idx, extrap
+
+    def _evaluate_stencil_vectorized(self, x, pos, valid=None):
+        """
+        Evaluate the subtables (or leaf values) at the given grid indices for many points.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dim)
+            Coordinates of the points being interpolated.
+        pos : ndarray of int, shape (n_points, n_stencil)
+            Grid indices in this dimension needed by each point.
+        valid : ndarray of bool or None
+            Mask of the entries of pos that are needed. Entries that are not needed are not
+            evaluated and are returned as zeros. All are needed if None.
+
+        Returns
+        -------
+        list of ndarray
+            Values at each stencil point, their derivatives with respect to the child
+            independents, their derivatives with respect to the table values (or None), the
+            indices of those table values (or None), and their extrapolation flags.
+        """
+        n_points, n_stencil = pos.shape
+        dtype = np.result_type(self.values, x)
+        if valid is None:
+            valid = np.ones(pos.shape, dtype=bool)
+
+        vals = np.zeros(pos.shape, dtype=dtype)
+        extrap = np.zeros(pos.shape, dtype=bool)
+        d_values = d_idx = None
+
+        if self.subtables is None:
+            idx = pos[valid]
+            vals[valid] = self.values[idx]
+            d_x = np.zeros(pos.shape + (0, ), dtype=dtype)
+            if self._compute_d_dvalues:
+                d_values = valid[..., np.newaxis].astype(dtype)
+                d_idx = np.zeros(pos.shape + (1, ), dtype=int)
+                d_idx[valid, 0] = np.asarray(self._idx)[idx]
+
+            return [vals, d_x, d_values, d_idx, extrap]
+
+        d_x = np.zeros(pos.shape + (x.shape[1] - 1, ), dtype=dtype)
+        for j in np.unique(pos[valid]):
+            # A point needs each subtable at most once, so the rows are unique.
+            rows, cols = np.nonzero(valid & (pos == j))
+            val, dx, d_value, flag = self.subtables[j].interpolate_vectorized(x[rows, 1:])
+
+            vals[rows, cols] = val
+            d_x[rows, cols] = dx
+            extrap[rows, cols] = flag
+            if d_value is not None:
+                if d_values is None:
+                    size = d_value[0].shape[1]
+                    d_values = np.zeros(pos.shape + (size, ), dtype=dtype)
+                    d_idx = np.zeros(pos.shape + (size, ), dtype=int)
+                d_values[rows, cols] = d_value[0]
+                d_idx[rows, cols] = d_value[1]
+
+        return [vals, d_x, d_values, d_idx, extrap]
+
+    def _slide_stencil_vectorized(self, x, idx, first, stencil, rows, step, extrap):
+        """
+        Move the stencil of some points by one grid index, unless the new point extrapolates.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dim)
+            Coordinates of the points being interpolated.
+        idx : ndarray of int
+            Interval index of each point. Updated in place for the points that slide.
+        first : ndarray of int
+            Grid index of the first stencil point of each of the rows.
+        stencil : list of ndarray
+            Stencil data from _evaluate_stencil_vectorized. Updated in place.
+        rows : ndarray of int
+            Points whose stencil should slide.
+        step : int
+            -1 to slide to the left, 1 to slide to the right.
+        extrap : ndarray of bool
+            Extrapolation flag for each point. Set for points that cannot slide.
+        """
+        new_pos = first - 1 if step < 0 else first + stencil[0].shape[1]
+        new = self._evaluate_stencil_vectorized(x[rows], new_pos[:, np.newaxis])
+
+        # Nothing we can do if the new point also extrapolates; there just aren't enough points.
+        ok = ~new[4][:, 0]
+        extrap[rows[~ok]] = True
+        rows = rows[ok]
+
+        for i, (data, new_data) in enumerate(zip(stencil, new)):
+            if data is None:
+                continue
+            if step < 0:
+                stencil[i][rows] = np.concatenate((new_data[ok], data[rows, :-1]), axis=1)
+            else:
+                stencil[i][rows] = np.concatenate((data[rows, 1:], new_data[ok]), axis=1)
+
+        idx[rows] += step
+
+    def _combine_stencil_vectorized(self, val, d_val, weights, stencil):
+        """
+        Assemble the results of this dimension from the interpolated stencil values.
+
+        Parameters
+        ----------
+        val : ndarray of shape (n_points, )
+            Interpolated values.
+        d_val : ndarray of shape (n_points, )
+            Derivative of the interpolated values with respect to the independent in this
+            dimension.
+        weights : ndarray of shape (n_points, n_stencil)
+            Derivative of the interpolated values with respect to the stencil values.
+        stencil : list of ndarray
+            Stencil data from _evaluate_stencil_vectorized.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to this independent and child
+            independents.
+        tuple(ndarray, ndarray) or None
+            Derivative of interpolated values with respect to the table values and the indices of
+            those values.
+        """
+        _, d_x, d_values, d_idx, _ = stencil
+        n_points = len(val)
+
+        derivs = np.empty((n_points, d_x.shape[2] + 1), dtype=np.result_type(val, d_x))
+        derivs[:, 0] = d_val
+        derivs[:, 1:] = np.sum(weights[..., np.newaxis] * d_x, axis=1)
+
+        d_value = None
+        if d_values is not None:
+            d_value = ((weights[..., np.newaxis] * d_values).reshape((n_points, -1)),
+                       d_idx.reshape((n_points, -1)))
+
+        return val, derivs, d_value
@@ -31,6 +31,9 @@ class InterpCubic(InterpAlgorithm):
     ----------
     second_derivs : ndarray
         Cache of all second derivatives for the leaf table only.
+    _second_deriv_map : ndarray or None
+        Cache of the linear map from the values along this dimension to their second
+        derivatives.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
@@ -39,8 +42,10 @@ class InterpCubic(InterpAlgorithm):
         """
         super().__init__(grid, values, interp)
         self.second_derivs = None
+        self._second_deriv_map = None
         self.k = 4
         self._name = 'cubic'
+        self._supports_weights = True
 
     def compute_coeffs(self, grid, values, x):
         """
@@ -95,6 +100,55 @@ class InterpCubic(InterpAlgorithm):
 
         return sec_deriv
 
+    def compute_weights(self, x, idx):
+        """
+        Compute the interpolation weights in this dimension for many points at once.
+
+        The spline is linear in the table values, but each interval depends on all of the values
+        in this dimension, so the stencil spans the whole grid.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, )
+            Coordinates of the points in this dimension.
+        idx : ndarray of int
+            Interval index for each point, as computed by bracket.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first stencil point in this dimension for each point.
+        ndarray of shape (n_points, n_stencil)
+            Weight of the table value at each stencil point.
+        ndarray of shape (n_points, n_stencil)
+            Derivative of the weights with respect to x.
+        """
+        grid = self.grid
+        n = len(grid)
+
+        if self._second_deriv_map is None:
+            # Row i holds the second derivatives of the spline through the unit vector e_i.
+            self._second_deriv_map = self.compute_coeffs(grid, np.eye(n), grid).T
+        sec_deriv = self._second_deriv_map
+
+        # Extrapolate high
+        idx = np.minimum(idx, n - 2)
+
+        step = grid[idx + 1] - grid[idx]
+        r_step = 1.0 / step
+        a = ((grid[idx + 1] - x) * r_step)[:, np.newaxis]
+        b = ((x - grid[idx]) * r_step)[:, np.newaxis]
+        fact = (step * step / 6.0)[:, np.newaxis]
+        dfact = (step / 6.0)[:, np.newaxis]
+
+        eye = np.eye(n)
+        weights = a * eye[idx] + b * eye[idx + 1] + \
+            ((a * a * a - a) * sec_deriv[idx] + (b * b * b - b) * sec_deriv[idx + 1]) * fact
+        dweights = r_step[:, np.newaxis] * (eye[idx + 1] - eye[idx]) + \
+            ((3.0 * b * b - 1) * sec_deriv[idx + 1] - (3.0 * a * a - 1) * sec_deriv[idx]) * dfact
+
+        return np.zeros(len(x), dtype=int), weights, dweights
+
     def interpolate(self, x, idx, slice_idx):
         """
         Compute the interpolated value over this grid dimension.
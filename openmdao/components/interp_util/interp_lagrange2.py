@@ -9,6 +9,53 @@ from openmdao.components.interp_util.interp_algorithm import InterpAlgorithm, \
     InterpAlgorithmSemi, InterpAlgorithmFixed
 
 
+def _lagrange2_weights(grid, x, idx):
+    """
+    Compute the lagrange2 interpolation weights in one dimension for many points at once.
+
+    Parameters
+    ----------
+    grid : ndarray
+        Grid locations in this dimension.
+    x : ndarray of shape (n_points, )
+        Coordinates of the points in this dimension.
+    idx : ndarray of int
+        Interval index for each point.
+
+    Returns
+    -------
+    ndarray of int
+        Index of the first stencil point in this dimension for each point.
+    ndarray of shape (n_points, 3)
+        Weight of the table value at each stencil point.
+    ndarray of shape (n_points, 3)
+        Derivative of the weights with respect to x.
+    """
+    # Extrapolate high
+    idx = np.minimum(idx, len(grid) - 3)
+
+    p1 = grid[idx]
+    p2 = grid[idx + 1]
+    p3 = grid[idx + 2]
+
+    xx1 = x - p1
+    xx2 = x - p2
+    xx3 = x - p3
+
+    c12 = p1 - p2
+    c13 = p1 - p3
+    c23 = p2 - p3
+
+    weights = np.stack((xx2 * xx3 / (c12 * c13),
+                        -xx1 * xx3 / (c12 * c23),
+                        xx1 * xx2 / (c13 * c23)), axis=-1)
+    dweights = np.stack(((2.0 * x - p2 - p3) / (c12 * c13),
+                         -(2.0 * x - p1 - p3) / (c12 * c23),
+                         (2.0 * x - p1 - p2) / (c13 * c23)), axis=-1)
+
+    return idx, weights, dweights
+
+
 class InterpLagrange2(InterpAlgorithm):
     """
     Interpolate using a second order Lagrange polynomial.
@@ -32,6 +79,29 @@ class InterpLagrange2(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 3
         self._name = 'lagrange2'
+        self._supports_weights = True
+
+    def compute_weights(self, x, idx):
+        """
+        Compute the interpolation weights in this dimension for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, )
+            Coordinates of the points in this dimension.
+        idx : ndarray of int
+            Interval index for each point, as computed by bracket.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first stencil point in this dimension for each point.
+        ndarray of shape (n_points, 3)
+            Weight of the table value at each stencil point.
+        ndarray of shape (n_points, 3)
+            Derivative of the weights with respect to x.
+        """
+        return _lagrange2_weights(self.grid, x, idx)
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -296,6 +366,60 @@ class InterpLagrange2Semi(InterpAlgorithmSemi):
 
         return xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2, derivs, d_value, extrap
 
+    def interpolate_vectorized(self, x):
+        """
+        Compute the interpolated value over this grid dimension for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dim)
+            Coordinates of the points being interpolated. First column is the component in this
+            dimension. Remaining columns are interpolated on sub tables.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to this independent and child
+            independents.
+        tuple(ndarray, ndarray) or None
+            Derivative of interpolated values with respect to values for this and subsequent table
+            dimensions. Second term is the indices into the value array.
+        ndarray of bool
+            True where the coordinate is extrapolated in this dimension.
+        """
+        grid = self.grid.ravel()
+        idx, extrap = self._bracket_vectorized(x[:, 0])
+
+        # Extrapolate high
+        idx = np.minimum(idx, len(grid) - 3)
+
+        stencil = self._evaluate_stencil_vectorized(x, idx[:, np.newaxis] + np.arange(3))
+
+        if self.subtables is not None:
+            # Extrapolation detection.
+            flags = stencil[4]
+
+            # Points near the right edge of their sub-region slide to the left.
+            slide = ~extrap & ~flags[:, 0] & ~flags[:, 1] & flags[:, 2] & (idx > 0)
+
+            # All other cases, we are in an extrapolation sub-region.
+            extrap |= np.any(flags, axis=1) & ~slide
+
+            rows = np.nonzero(slide)[0]
+            if len(rows) > 0:
+                self._slide_stencil_vectorized(x, idx, idx[rows], stencil, rows, -1, extrap)
+
+        _, weights, dweights = _lagrange2_weights(grid, x[:, 0], idx)
+        vals = stencil[0]
+
+        val, derivs, d_value = self._combine_stencil_vectorized(np.sum(weights * vals, axis=1),
+                                                                np.sum(dweights * vals, axis=1),
+                                                                weights, stencil)
+
+        return val, derivs, d_value, extrap
+
 
 class Interp3DLagrange2(InterpAlgorithmFixed):
     """
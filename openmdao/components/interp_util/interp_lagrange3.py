@@ -9,6 +9,69 @@ from openmdao.components.interp_util.interp_algorithm import InterpAlgorithm, \
     InterpAlgorithmSemi, InterpAlgorithmFixed
 
 
+def _lagrange3_weights(grid, x, idx):
+    """
+    Compute the lagrange3 interpolation weights in one dimension for many points at once.
+
+    Parameters
+    ----------
+    grid : ndarray
+        Grid locations in this dimension.
+    x : ndarray of shape (n_points, )
+        Coordinates of the points in this dimension.
+    idx : ndarray of int
+        Interval index for each point.
+
+    Returns
+    -------
+    ndarray of int
+        Index of the first stencil point in this dimension for each point.
+    ndarray of shape (n_points, 4)
+        Weight of the table value at each stencil point.
+    ndarray of shape (n_points, 4)
+        Derivative of the weights with respect to x.
+    """
+    # Shift if we don't have 2 points on each side.
+    ngrid = len(grid)
+    idx = np.where(idx > ngrid - 3, ngrid - 3, np.where(idx == 0, 1, idx))
+
+    p1 = grid[idx - 1]
+    p2 = grid[idx]
+    p3 = grid[idx + 1]
+    p4 = grid[idx + 2]
+
+    xx1 = x - p1
+    xx2 = x - p2
+    xx3 = x - p3
+    xx4 = x - p4
+
+    c12 = 1.0 / (p1 - p2)
+    c13 = 1.0 / (p1 - p3)
+    c14 = 1.0 / (p1 - p4)
+    c23 = 1.0 / (p2 - p3)
+    c24 = 1.0 / (p2 - p4)
+    c34 = 1.0 / (p3 - p4)
+
+    q1 = c12 * c13 * c14
+    q2 = c12 * c23 * c24
+    q3 = c13 * c23 * c34
+    q4 = c14 * c24 * c34
+
+    weights = np.stack((q1 * xx2 * xx3 * xx4,
+                        -q2 * xx1 * xx3 * xx4,
+                        q3 * xx1 * xx2 * xx4,
+                        -q4 * xx1 * xx2 * xx3), axis=-1)
+    dweights = np.stack((q1 * (x * (3.0 * x - 2.0 * (p4 + p3 + p2)) + p4 * (p2 + p3) + p2 * p3),
+                         -q2 * (x * (3.0 * x - 2.0 * (p4 + p3 + p1)) + p4 * (p1 + p3) +
+                                p1 * p3),
+                         q3 * (x * (3.0 * x - 2.0 * (p4 + p2 + p1)) + p4 * (p2 + p1) +
+                               p2 * p1),
+                         -q4 * (x * (3.0 * x - 2.0 * (p3 + p2 + p1)) + p1 * (p2 + p3) +
+                                p2 * p3)), axis=-1)
+
+    return idx - 1, weights, dweights
+
+
 class InterpLagrange3(InterpAlgorithm):
     """
     Interpolate using a third order Lagrange polynomial.
@@ -32,6 +95,29 @@ class InterpLagrange3(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 4
         self._name = 'lagrange3'
+        self._supports_weights = True
+
+    def compute_weights(self, x, idx):
+        """
+        Compute the interpolation weights in this dimension for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, )
+            Coordinates of the points in this dimension.
+        idx : ndarray of int
+            Interval index for each point, as computed by bracket.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first stencil point in this dimension for each point.
+        ndarray of shape (n_points, 4)
+            Weight of the table value at each stencil point.
+        ndarray of shape (n_points, 4)
+            Derivative of the weights with respect to x.
+        """
+        return _lagrange3_weights(self.grid, x, idx)
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -241,7 +327,7 @@ class InterpLagrange3Semi(InterpAlgorithmSemi):
                 # If we are already extrapolating, no change needed.
                 # If no sub-points are extrapolating, no change needed.
                 pass
-            elif flags == (False, False, False, True) and idx > 0:
+            elif flags == (False, False, False, True) and idx > 1:
                 # We are near the right edge of our sub-region, so slide to the left.
                 idx -= 1
                 val_a, dx_a, dvalue_a, flag_a = subtables[idx - 1].interpolate(x[1:])
@@ -360,6 +446,66 @@ class InterpLagrange3Semi(InterpAlgorithmSemi):
         return xx4 * (xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2) - q4 * xx1 * xx2 * xx3, \
             derivs, d_value, extrap
 
+    def interpolate_vectorized(self, x):
+        """
+        Compute the interpolated value over this grid dimension for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dim)
+            Coordinates of the points being interpolated. First column is the component in this
+            dimension. Remaining columns are interpolated on sub tables.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to this independent and child
+            independents.
+        tuple(ndarray, ndarray) or None
+            Derivative of interpolated values with respect to values for this and subsequent table
+            dimensions. Second term is the indices into the value array.
+        ndarray of bool
+            True where the coordinate is extrapolated in this dimension.
+        """
+        grid = self.grid.ravel()
+        idx, extrap = self._bracket_vectorized(x[:, 0])
+
+        # Shift if we don't have 2 points on each side.
+        ngrid = len(grid)
+        idx = np.where(idx > ngrid - 3, ngrid - 3, np.where(idx == 0, 1, idx))
+
+        stencil = self._evaluate_stencil_vectorized(x, idx[:, np.newaxis] + np.arange(-1, 3))
+
+        if self.subtables is not None:
+            # Extrapolation detection.
+            flags = stencil[4]
+            inner = ~extrap & ~flags[:, 1] & ~flags[:, 2]
+
+            # Points near the right edge of their sub-region slide to the left, and points near
+            # the left edge slide to the right.
+            left = inner & ~flags[:, 0] & flags[:, 3] & (idx > 1)
+            right = inner & flags[:, 0] & ~flags[:, 3] & (idx < ngrid - 3)
+
+            # All other cases, we are in an extrapolation sub-region.
+            extrap |= np.any(flags, axis=1) & ~left & ~right
+
+            for slide, step in ((left, -1), (right, 1)):
+                rows = np.nonzero(slide)[0]
+                if len(rows) > 0:
+                    self._slide_stencil_vectorized(x, idx, idx[rows] - 1, stencil, rows, step,
+                                                   extrap)
+
+        _, weights, dweights = _lagrange3_weights(grid, x[:, 0], idx)
+        vals = stencil[0]
+
+        val, derivs, d_value = self._combine_stencil_vectorized(np.sum(weights * vals, axis=1),
+                                                                np.sum(dweights * vals, axis=1),
+                                                                weights, stencil)
+
+        return val, derivs, d_value, extrap
+
 
 class Interp3DLagrange3(InterpAlgorithmFixed):
     """
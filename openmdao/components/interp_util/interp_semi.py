@@ -172,19 +172,28 @@ class InterpNDSemi(object):
 
         xi = np.atleast_2d(xi)
         n_nodes, nx = xi.shape
-        result = np.empty((n_nodes, ), dtype=xi.dtype)
-        derivs_x = np.empty((n_nodes, nx), dtype=xi.dtype)
         if self._compute_d_dvalues:
             derivs_val = np.zeros((n_nodes, len(self.values)), dtype=xi.dtype)
 
-        # Loop over n_nodes because there isn't a way to vectorize.
-        for j in range(n_nodes):
-            val, d_x, d_values_tuple, extrapolate = table.interpolate(xi[j, :])
-            result[j] = val.item()
-            derivs_x[j, :] = d_x.ravel()
+        if table.vectorized(xi):
+            result, derivs_x, d_values_tuple, _ = table.interpolate_vectorized(xi)
             if self._compute_d_dvalues:
+                # Rows are padded with zero derivatives, so accumulate rather than assign.
                 d_values, idx = d_values_tuple
-                derivs_val[j, idx] = d_values.ravel()
+                rows = np.arange(n_nodes)[:, np.newaxis]
+                np.add.at(derivs_val, (rows, idx), d_values)
+
+        else:
+            result = np.empty((n_nodes, ), dtype=xi.dtype)
+            derivs_x = np.empty((n_nodes, nx), dtype=xi.dtype)
+
+            for j in range(n_nodes):
+                val, d_x, d_values_tuple, extrapolate = table.interpolate(xi[j, :])
+                result[j] = val.item()
+                derivs_x[j, :] = d_x.ravel()
+                if self._compute_d_dvalues:
+                    d_values, idx = d_values_tuple
+                    derivs_val[j, idx] = d_values.ravel()
 
         # Cache derivatives
         self._d_dx = derivs_x
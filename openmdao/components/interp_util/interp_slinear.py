@@ -9,6 +9,40 @@ from openmdao.components.interp_util.interp_algorithm import InterpAlgorithm, \
     InterpAlgorithmSemi, InterpAlgorithmFixed
 
 
+def _slinear_weights(grid, x, idx):
+    """
+    Compute the slinear interpolation weights in one dimension for many points at once.
+
+    Parameters
+    ----------
+    grid : ndarray
+        Grid locations in this dimension.
+    x : ndarray of shape (n_points, )
+        Coordinates of the points in this dimension.
+    idx : ndarray of int
+        Interval index for each point.
+
+    Returns
+    -------
+    ndarray of int
+        Index of the first stencil point in this dimension for each point.
+    ndarray of shape (n_points, 2)
+        Weight of the table value at each stencil point.
+    ndarray of shape (n_points, 2)
+        Derivative of the weights with respect to x.
+    """
+    # Extrapolate high
+    idx = np.minimum(idx, len(grid) - 2)
+
+    h = 1.0 / (grid[idx + 1] - grid[idx])
+    t = (x - grid[idx]) * h
+
+    weights = np.stack((1.0 - t, t), axis=-1)
+    dweights = np.stack((-h, h), axis=-1)
+
+    return idx, weights, dweights
+
+
 class InterpLinear(InterpAlgorithm):
     """
     Interpolate using a linear polynomial.
@@ -32,6 +66,29 @@ class InterpLinear(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 2
         self._name = 'slinear'
+        self._supports_weights = True
+
+    def compute_weights(self, x, idx):
+        """
+        Compute the interpolation weights in this dimension for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, )
+            Coordinates of the points in this dimension.
+        idx : ndarray of int
+            Interval index for each point, as computed by bracket.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first stencil point in this dimension for each point.
+        ndarray of shape (n_points, 2)
+            Weight of the table value at each stencil point.
+        ndarray of shape (n_points, 2)
+            Derivative of the weights with respect to x.
+        """
+        return _slinear_weights(self.grid, x, idx)
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -219,6 +276,46 @@ class InterpLinearSemi(InterpAlgorithmSemi):
 
             return values[idx] + (x - grid[idx]) * slope, slope, d_value, extrap
 
+    def interpolate_vectorized(self, x):
+        """
+        Compute the interpolated value over this grid dimension for many points at once.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dim)
+            Coordinates of the points being interpolated. First column is the component in this
+            dimension. Remaining columns are interpolated on sub tables.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to this independent and child
+            independents.
+        tuple(ndarray, ndarray) or None
+            Derivative of interpolated values with respect to values for this and subsequent table
+            dimensions. Second term is the indices into the value array.
+        ndarray of bool
+            True where the coordinate is extrapolated in this dimension.
+        """
+        grid = self.grid.ravel()
+        idx, extrap = self._bracket_vectorized(x[:, 0])
+        start, weights, dweights = _slinear_weights(grid, x[:, 0], idx)
+
+        stencil = self._evaluate_stencil_vectorized(x, start[:, np.newaxis] + np.arange(2))
+        vals = stencil[0]
+
+        # Extrapolation detection.
+        # (Not much we can do for linear.)
+        extrap |= np.any(stencil[4], axis=1)
+
+        val, derivs, d_value = self._combine_stencil_vectorized(np.sum(weights * vals, axis=1),
+                                                                np.sum(dweights * vals, axis=1),
+                                                                weights, stencil)
+
+        return val, derivs, d_value, extrap
+
 
 class Interp1DSlinear(InterpAlgorithmFixed):
     """
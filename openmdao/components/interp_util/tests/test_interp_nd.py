@@ -3,6 +3,7 @@ Unit tests for the standalone interpolator.
 """
 from copy import deepcopy
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -353,6 +354,50 @@ class TestInterpNDSemiPython(unittest.TestCase):
         self.assertTrue(cm.exception.args[0].endswith(msg))
 
 
+    def test_vectorized_points(self):
+        # Ragged 3D grid, where the range of the later dimensions depends on the earlier ones, so
+        # that points near the edges of the sub-regions need to slide their stencils.
+        np.random.seed(3)
+        pts = []
+        for i, u in enumerate(np.linspace(0, 4, 7)):
+            v = np.sort(np.random.uniform(-1 + .3 * i, 3 + .2 * i, 6 + i % 3))
+            for j, vv in enumerate(v):
+                w = np.sort(np.random.uniform(-1 + .1 * j, 2 - .1 * i, 5 + j % 2))
+                pts.extend([(u, vv, ww) for ww in w])
+
+        grid = np.array(pts)
+        values = np.sin(grid[:, 0]) + grid[:, 1] ** 2 * np.cos(grid[:, 2])
+
+        x = np.random.random((100, 3)) * [5., 6., 4.] - [.5, 1.5, 1.5]
+
+        for method in self.interp_methods:
+            kwargs = {'delta_x': 0.5} if method == 'akima' else {}
+            with self.subTest(method=method):
+                interp = InterpNDSemi(grid, values, method=method, **kwargs)
+                interp._compute_d_dvalues = True
+                self.assertTrue(interp.table.vectorized(x))
+
+                result = interp._interpolate(x)
+                d_dx = interp._d_dx
+                d_dvalues = interp._d_dvalues
+
+                for j in range(x.shape[0]):
+                    # a single point uses the recursive evaluation
+                    val = interp._interpolate(x[j])
+                    assert_near_equal(result[j], val[0], 1e-8)
+                    assert_near_equal(d_dx[j], interp._d_dx[0], 1e-8)
+                    assert_near_equal(d_dvalues[j], interp._d_dvalues[0], 1e-8)
+
+        # The table is rebuilt with the extrapolate setting when computing training gradients.
+        interp = InterpNDSemi(grid, values, method='slinear', extrapolate=False)
+        interp._compute_d_dvalues = True
+        with self.assertRaises(OutOfBoundsError) as cm:
+            interp.interpolate(np.array([[1.0, 1.0, 0.0], [4.5, 1.0, 0.0]]))
+
+        self.assertEqual(cm.exception.idx, 0)
+        self.assertEqual(cm.exception.value, 4.5)
+
+
 class TestInterpNDPython(unittest.TestCase):
 
     """Tests for the non-scipy interpolation algorithms."""
@@ -929,6 +974,90 @@ class TestInterpNDPython(unittest.TestCase):
             derivs = force_check_partials(prob, method='fd', out_stream=None)
             assert_check_partials(derivs, atol=1e-3, rtol=1e-4)
 
+    def test_vectorized_points(self):
+        np.random.seed(11)
+        grid = (np.linspace(0, 1, 5), np.array([-2., -1., 0.5, 1., 3., 4.]),
+                np.linspace(10, 20, 4), np.array([0., .1, .5, .7, 1.]))
+        values = np.random.random((5, 6, 4, 5))
+
+        x = np.random.random((40, 4))
+        for i, g in enumerate(grid):
+            x[:, i] = g[0] - .2 + x[:, i] * (g[-1] - g[0] + .4)
+        # include points on the grid
+        x[:3] = [[g[j] for g in grid] for j in range(3)]
+
+        for method in ('slinear', 'lagrange2', 'lagrange3', 'akima', 'cubic'):
+            with self.subTest(method=method):
+                interp = InterpND(method=method, points=grid, values=values, extrapolate=True)
+                self.assertTrue(interp.table.vectorized(x))
+
+                # The recursive akima and cubic methods don't compute training gradients in 4D.
+                check_d_dvalues = method not in ('akima', 'cubic')
+
+                interp._compute_d_dvalues = check_d_dvalues
+                result = interp._interpolate(x)
+                d_dx = interp._d_dx
+                d_dvalues = interp._d_dvalues
+
+                for j in range(x.shape[0]):
+                    # a single point uses the recursive evaluation
+                    val, deriv = interp.interpolate(x[j], compute_derivative=True)
+                    assert_near_equal(result[j], val[0], 1e-11)
+                    assert_near_equal(d_dx[j], deriv[0], 1e-11)
+                    if check_d_dvalues:
+                        assert_near_equal(d_dvalues[j],
+                                          interp.training_gradients(x[j]).reshape(values.shape),
+                                          1e-11)
+
+    def test_vectorized_points_chunked(self):
+        np.random.seed(13)
+        grid = (np.linspace(0, 1, 5), np.linspace(-1, 1, 6), np.linspace(10, 20, 7))
+        values = np.random.random((5, 6, 7))
+        x = np.random.random((30, 3)) * [1., 2., 10.] + [0., -1., 10.]
+
+        for method in ('slinear', 'akima', 'cubic'):
+            with self.subTest(method=method):
+                interp = InterpND(method=method, points=grid, values=values, extrapolate=True)
+                interp._compute_d_dvalues = True
+                result = interp._interpolate(x)
+                d_dx = interp._d_dx
+                d_dvalues = interp._d_dvalues
+
+                # Limit the gathered values so that the points are evaluated in several chunks.
+                with mock.patch('openmdao.components.interp_util.interp_algorithm.'
+                                '_MAX_STENCIL_VALUES', 500):
+                    assert_near_equal(interp._interpolate(x), result, 1e-15)
+                    assert_near_equal(interp._d_dx, d_dx, 1e-15)
+                    assert_near_equal(interp._d_dvalues, d_dvalues, 1e-15)
+
+    def test_vectorized_points_d_dvalues(self):
+        np.random.seed(12)
+        grid = (np.linspace(0, 1, 4), np.array([-2., -1., 0.5, 1., 3., 4., 5.]),
+                np.linspace(10, 20, 5))
+        values = np.random.random((4, 7, 5))
+
+        x = np.random.random((20, 3))
+        for i, g in enumerate(grid):
+            x[:, i] = g[0] - .2 + x[:, i] * (g[-1] - g[0] + .4)
+
+        for method in ('akima', 'cubic'):
+            with self.subTest(method=method):
+                interp = InterpND(method=method, points=grid, values=values, extrapolate=True)
+                interp._compute_d_dvalues = True
+                result = interp._interpolate(x)
+                d_dvalues = interp._d_dvalues.reshape((x.shape[0], -1))
+
+                step = 1e-7
+                fd = np.empty(d_dvalues.shape)
+                for k in range(values.size):
+                    new_values = values.copy()
+                    new_values.ravel()[k] += step
+                    interp = InterpND(method=method, points=grid, values=new_values,
+                                      extrapolate=True)
+                    fd[:, k] = (interp._interpolate(x) - result) / step
+
+                assert_near_equal(d_dvalues, fd, 1e-5)
+
 
 class TestInterpNDFixedPython(unittest.TestCase):
     """Tests for efficient fixed-grid interpolation."""
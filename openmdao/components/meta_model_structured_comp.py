@@ -41,6 +41,11 @@ class MetaModelStructuredComp(ExplicitComponent):
         Cached list of input names.
     training_outputs : dict
         Dictionary of training data each output.
+    _stacked_values : ndarray or None
+        Training data of all outputs stacked along a new first axis, used when all outputs are
+        interpolated with a shared stencil.
+    _stencil_cache : tuple or None
+        The input points and the stencil computed for them during the last evaluation.
     """
 
     def __init__(self, **kwargs):
@@ -54,6 +59,8 @@ class MetaModelStructuredComp(ExplicitComponent):
         self.training_outputs = {}
         self.interps = {}
         self.grad_shape = ()
+        self._stacked_values = None
+        self._stencil_cache = None
 
         self._no_check_partials = True
 
@@ -153,6 +160,16 @@ class MetaModelStructuredComp(ExplicitComponent):
         if self.options['training_data_gradients']:
             self.grad_shape = tuple([self.options['vec_size']] + [i.size for i in self.inputs])
 
+        # All outputs share the same grid, so when the method supports it, the bracketing and
+        # interpolation weights are computed once per evaluation and applied to all outputs.
+        self._stacked_values = None
+        self._stencil_cache = None
+        if self.interps:
+            interp = next(iter(self.interps.values()))
+            if interp._supports_stencil() and not self.options['training_data_gradients']:
+                self._stacked_values = np.stack([np.asarray(interp.values)
+                                                 for interp in self.interps.values()])
+
         super()._setup_var_data()
 
     def _setup_partials(self):
@@ -195,6 +212,11 @@ class MetaModelStructuredComp(ExplicitComponent):
             Unscaled, dimensional output variables read via outputs[key].
         """
         pt = np.array([inputs[pname].ravel() for pname in self.pnames]).T
+
+        if self.interps and next(iter(self.interps.values()))._supports_stencil():
+            self._compute_shared_stencil(pt, inputs, outputs)
+            return
+
         for out_name, interp in self.interps.items():
             if self.options['training_data_gradients']:
                 # Training point values may have changed every time we compute.
@@ -216,6 +238,60 @@ class MetaModelStructuredComp(ExplicitComponent):
                                  f"{str(err)}")
             outputs[out_name] = val
 
+    def _compute_shared_stencil(self, pt, inputs, outputs):
+        """
+        Interpolate all outputs using a single stencil computed for the current inputs.
+
+        Parameters
+        ----------
+        pt : ndarray
+            Input values for each point.
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+        outputs : Vector
+            Unscaled, dimensional output variables read via outputs[key].
+        """
+        names = list(self.interps)
+        interp0 = self.interps[names[0]]
+        table = interp0.table
+
+        cache = self._stencil_cache
+        if cache is not None and cache[0].dtype == pt.dtype and np.array_equal(cache[0], pt):
+            stencil = cache[1]
+        else:
+            try:
+                interp0._check_bounds(pt)
+            except OutOfBoundsError as err:
+                # all outputs share the grid, so the point is out of bounds for every one of them
+                if len(names) == 1:
+                    outstr = f"output '{names[0]}'"
+                else:
+                    outstr = f"outputs {', '.join(repr(n) for n in names)}"
+                varname_causing_error = '.'.join((self.pathname, self.pnames[err.idx]))
+                errmsg = (f"{self.msginfo}: Error interpolating {outstr} "
+                          f"because input '{varname_causing_error}' was out of bounds "
+                          f"('{err.lower}', '{err.upper}') with value '{err.value}'")
+                raise AnalysisError(errmsg, inspect.currentframe(), self.msginfo)
+
+            stencil = table.compute_stencil(pt)
+            self._stencil_cache = (pt, stencil)
+
+        if self.options['training_data_gradients']:
+            values = np.stack([inputs[f"{name}_train"] for name in names])
+            d_dvalues = table.stencil_d_dvalues(stencil, values.shape[1:])
+        else:
+            values = self._stacked_values
+            d_dvalues = None
+
+        result, d_dx = table.evaluate_stencil(stencil, values)
+
+        for i, name in enumerate(names):
+            interp = self.interps[name]
+            interp._xi = pt
+            interp._d_dx = d_dx[i]
+            interp._d_dvalues = d_dvalues
+            outputs[name] = result[i]
+
     def compute_partials(self, inputs, partials):
         """
         Collect computed partial derivatives and return them.
@@ -365,22 +365,22 @@ class MetaModelUnStructuredComp(ExplicitComponent):
                     self._metadata(name)['rmse'] = predicted[1]
                     predicted = predicted[0]
                 outputs[name] = np.reshape(predicted, shape)
+                continue
+
+            if isinstance(shape, tuple):
+                output_shape = (vec_size, ) + shape
+            else:
+                output_shape = (vec_size, )
 
-            elif overrides_method('vectorized_predict', surrogate, SurrogateModel):
+            if overrides_method('vectorized_predict', surrogate, SurrogateModel):
                 # Vectorized; surrogate provides vectorized computation.
-                # TODO: This code is untested because no surrogates provide this option.
-                predicted = surrogate.vectorized_predict(flat_inputs.flat)
+                predicted = surrogate.vectorized_predict(flat_inputs)
                 if isinstance(predicted, tuple):  # rmse option
                     self._metadata(name)['rmse'] = predicted[1]
                     predicted = predicted[0]
-                outputs[name] = np.reshape(predicted, shape)
 
             else:
                 # Vectorized; must call surrogate multiple times.
-                if isinstance(shape, tuple):
-                    output_shape = (vec_size, ) + shape
-                else:
-                    output_shape = (vec_size, )
                 predicted = np.zeros(output_shape, dtype=flat_inputs.dtype)
                 rmse = self._metadata(name)['rmse'] = []
                 for i in range(vec_size):
@@ -390,7 +390,7 @@ class MetaModelUnStructuredComp(ExplicitComponent):
                         pred_i = pred_i[0]
                     predicted[i] = np.reshape(pred_i, shape)
 
-                outputs[name] = np.reshape(predicted, output_shape)
+            outputs[name] = np.reshape(predicted, output_shape)
 
     def _vec_to_array(self, vec):
         """
@@ -433,12 +433,10 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         vec_size = self.options['vec_size']
         arr = np.zeros((vec_size, self._input_size), dtype=vec.asarray().dtype)
 
-        vecvals = [(vec[n], sz) for n, sz in self._surrogate_input_names]
-        for row in range(vec_size):
-            idx = 0
-            for val, sz in vecvals:
-                arr[row][idx:idx + sz] = val[row].flat
-                idx += sz
+        idx = 0
+        for name, sz in self._surrogate_input_names:
+            arr[:, idx:idx + sz] = vec[name].reshape((vec_size, sz))
+            idx += sz
 
         return arr
 
@@ -515,7 +513,15 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         for out_name, out_shape in self._surrogate_output_names:
             surrogate = self._metadata(out_name).get('surrogate')
-            if vec_size > 1:
+            if vec_size > 1 and overrides_method('vectorized_linearize', surrogate,
+                                                 SurrogateModel):
+                derivs = surrogate.vectorized_linearize(flat_inputs)
+                idx = 0
+                for in_name, sz in self._surrogate_input_names:
+                    partials[out_name, in_name] = derivs[:, :, idx:idx + sz].ravel()
+                    idx += sz
+
+            elif vec_size > 1:
                 out_size = shape_to_len(out_shape)
                 for j in range(vec_size):
                     flat_input = flat_inputs[j]
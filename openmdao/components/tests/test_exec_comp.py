@@ -14,7 +14,8 @@ except ImportError:
 
 import openmdao.api as om
 from openmdao.components.exec_comp import _expr_dict, _temporary_expr_dict
-from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials, assert_warning
+from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials, assert_warning, \
+    assert_no_warning
 from openmdao.utils.testing_utils import force_check_partials, use_tempdirs
 from openmdao.utils.om_warnings import SetupWarning
 
@@ -1481,6 +1482,90 @@ class TestExecComp(unittest.TestCase):
 
         assert_near_equal(comp._outputs['y'], 2.0 * np.array([1., 2., 3.]), 0.00001)
 
+    def test_kernel(self):
+        exprs = ['y1=2.0*x**2 + sin(z)*a', 'y2=sum(z*x) + exp(x[0])']
+        kwargs = {'x': np.array([1., 2., 3.]), 'z': np.array([.5, .7, -.2]), 'y1': np.zeros(3),
+                  'a': {'val': 3., 'constant': True}}
+
+        probs = []
+        for use_kernel, manual in itertools.product([True, False], [True, False]):
+            prob = om.Problem()
+            model = prob.model
+            for i in range(2):
+                comp = model.add_subsystem(f'comp{i}',
+                                           om.ExecComp(exprs, use_kernel=use_kernel, **kwargs))
+                if manual:
+                    comp.declare_partials('*', '*', method='cs')
+
+            prob.setup(force_alloc_complex=True)
+            prob.run_model()
+            probs.append((prob, prob.compute_totals(['comp0.y1', 'comp0.y2'],
+                                                    ['comp0.x', 'comp0.z'])))
+
+        for prob, J in probs:
+            assert_near_equal(prob.get_val('comp0.y1'),
+                              2.0 * kwargs['x'] ** 2 + np.sin(kwargs['z']) * 3., 1e-15)
+            assert_near_equal(prob.get_val('comp0.y2'),
+                              np.sum(kwargs['z'] * kwargs['x']) + np.exp(1.), 1e-15)
+            for key, val in probs[-1][1].items():
+                assert_near_equal(J[key], val, 1e-15)
+
+        # identical expressions share the same compiled kernel code
+        prob = probs[0][0]
+        self.assertEqual(prob.model.comp0._kernel_argnames, ['a', 'x', 'z'])
+        self.assertIs(prob.model.comp0._kernel.__code__, prob.model.comp1._kernel.__code__)
+        self.assertIsNone(probs[-1][0].model.comp0._kernel)
+
+        # the code cache is bounded
+        from openmdao.components.exec_comp import _compile_kernel
+        self.assertLessEqual(_compile_kernel.cache_info().currsize,
+                             _compile_kernel.cache_info().maxsize)
+
+    def test_kernel_fallback(self):
+        # expressions defining their own names are evaluated with exec
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', om.ExecComp('y=sum([xi**2 for xi in x])',
+                                                            x=np.array([1., 2., 3.])))
+        prob.setup()
+        prob.run_model()
+
+        self.assertIsNone(comp._kernel)
+        assert_near_equal(prob.get_val('comp.y'), 14., 1e-15)
+
+    def test_kernel_failure(self):
+        # if the kernel fails where exec doesn't, it's disabled with a warning
+        def bad_kernel(*args):
+            raise ValueError("bad kernel")
+
+        for manual in (False, True):
+            with self.subTest(manual=manual):
+                prob = om.Problem()
+                comp = prob.model.add_subsystem('comp', om.ExecComp('y=2.0*x + 1.0',
+                                                                    x=np.array([1., 2.]),
+                                                                    y=np.zeros(2)))
+                if manual:
+                    comp.declare_partials('*', '*', method='cs')
+
+                prob.setup()
+                prob.final_setup()
+                self.assertIsNotNone(comp._kernel)
+                comp._kernel = bad_kernel
+
+                msg = ("'comp' <class ExecComp>: Evaluation of the expressions in a single call "
+                       "failed, but evaluating them one at a time succeeded, so they will be "
+                       "evaluated one at a time from now on. The error was:\n"
+                       "ValueError: bad kernel")
+                with assert_warning(UserWarning, msg):
+                    prob.run_model()
+
+                self.assertIsNone(comp._kernel)
+                assert_near_equal(prob.get_val('comp.y'), [3., 5.], 1e-15)
+
+                prob.set_val('comp.x', [2., 3.])
+                with assert_no_warning(UserWarning):
+                    prob.run_model()
+                assert_near_equal(prob.get_val('comp.y'), [5., 7.], 1e-15)
+
 
 class TestFunctionRegistration(unittest.TestCase):
 
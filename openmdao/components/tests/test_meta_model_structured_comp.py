@@ -12,6 +12,7 @@ from openmdao.utils.assert_utils import assert_near_equal, assert_warning, asser
 
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 from openmdao.utils.testing_utils import use_tempdirs, force_check_partials
+from openmdao.components.interp_util.interp import InterpND
 
 scipy_gte_019 = True
 try:
@@ -723,6 +724,26 @@ class TestMetaModelStructuredScipy(unittest.TestCase):
                "input 'MM.x' was out of bounds ('0.0', '1.0') with value '1.1'")
         self.assertEqual(str(cm.exception), msg)
 
+    def test_error_msg_multiple_outputs(self):
+        # The shared-stencil path checks bounds once for all outputs, so all are named.
+        x_bp = np.array([0., 1.])
+
+        p = om.Problem()
+        mm = p.model.add_subsystem('MM', om.MetaModelStructuredComp(method='slinear',
+                                                                    extrapolate=False))
+        mm.add_input('x', val=1.5, training_data=x_bp)
+        mm.add_output('y', val=0., training_data=np.array([0., 4.]))
+        mm.add_output('z', val=0., training_data=np.array([1., 2.]))
+
+        p.setup()
+
+        with self.assertRaises(om.AnalysisError) as cm:
+            p.run_model()
+
+        msg = ("'MM' <class MetaModelStructuredComp>: Error interpolating outputs 'y', 'z' "
+               "because input 'MM.x' was out of bounds ('0.0', '1.0') with value '1.5'")
+        self.assertEqual(str(cm.exception), msg)
+
 
 @use_tempdirs
 class TestMetaModelStructuredPython(unittest.TestCase):
@@ -1267,6 +1288,51 @@ class TestMetaModelStructuredPython(unittest.TestCase):
         # Derivatives have large magniudes, so tols are high.
         assert_check_totals(totals, atol=1e3, rtol=1e-4)
 
+    def test_shared_stencil_multiple_outputs(self):
+        # All outputs are interpolated with one stencil; compare against separate tables.
+        mapdata = SampleMap()
+        params = mapdata.param_data
+        outs = mapdata.output_data
+        grid = [p['values'] for p in params]
+        pts = np.array([[1.0, 0.75, -1.7], [10.0, 0.81, 1.1], [90.0, 1.2, 2.1]])
+
+        for method in ['slinear', 'lagrange2', 'lagrange3']:
+            for train_grads in [False, True]:
+                with self.subTest(method=method, training_data_gradients=train_grads):
+                    prob = om.Problem()
+                    comp = om.MetaModelStructuredComp(method=method, extrapolate=True, vec_size=3,
+                                                      training_data_gradients=train_grads)
+                    for param in params:
+                        comp.add_input(param['name'], np.full(3, param['default']),
+                                       param['values'], units=param['units'])
+                    for i, out in enumerate(outs):
+                        comp.add_output(out['name'], np.full(3, out['default']),
+                                        out['values'] * (i + 1.0))
+                        comp.add_output(f"{out['name']}_sq", np.full(3, out['default']),
+                                        out['values'] ** 2)
+
+                    prob.model.add_subsystem('comp', comp, promotes=['*'])
+                    prob.setup(force_alloc_complex=True)
+                    prob.set_val('x', pts[:, 0])
+                    prob.set_val('y', pts[:, 1])
+                    prob.set_val('z', pts[:, 2])
+                    prob.run_model()
+
+                    for i, out in enumerate(outs):
+                        for name, values in [(out['name'], out['values'] * (i + 1.0)),
+                                             (f"{out['name']}_sq", out['values'] ** 2)]:
+                            interp = InterpND(method=method, points=grid, values=values,
+                                              extrapolate=True)
+                            assert_near_equal(prob.get_val(name), interp.interpolate(pts),
+                                              1e-12)
+
+                    stencil = comp._stencil_cache[1]
+                    prob.run_model()
+                    self.assertIs(comp._stencil_cache[1], stencil)
+
+                    partials = force_check_partials(prob, method='cs', out_stream=None)
+                    assert_check_partials(partials, atol=1e-6, rtol=1e-6)
+
 
 @use_tempdirs
 @unittest.skipIf(not scipy_gte_019, "only run if scipy>=0.19.")
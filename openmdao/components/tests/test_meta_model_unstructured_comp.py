@@ -599,6 +599,41 @@ class MetaModelTestCase(unittest.TestCase):
                          1e-4)
         self.assertEqual(len(prob.model.trig._metadata('y')['rmse']), 3)
 
+    def test_vectorized_surrogates(self):
+        vec_size = 6
+        train_x = np.array([[a, b] for a in np.linspace(0, 2, 6) for b in np.linspace(0, 2, 6)])
+
+        for surrogate in (om.ResponseSurface(), om.KrigingSurrogate(),
+                          om.NearestNeighbor(interpolant_type='rbf')):
+            with self.subTest(surrogate=type(surrogate).__name__):
+                mm = om.MetaModelUnStructuredComp(vec_size=vec_size, default_surrogate=surrogate)
+                mm.add_input('x', np.zeros((vec_size, 2)))
+                mm.add_output('y', np.zeros((vec_size, 2)))
+
+                mm.options['train_x'] = train_x
+                mm.options['train_y'] = np.array([[a*b + a**2, b - a] for a, b in train_x])
+
+                prob = om.Problem()
+                prob.model.add_subsystem('mm', mm)
+                prob.setup()
+
+                x = np.array([[0.3, 0.6], [1.1, 1.7], [1.6, 0.2], [0.7, 1.3], [1.9, 1.1],
+                              [0.4, 0.9]])
+                prob.set_val('mm.x', x)
+                prob.run_model()
+
+                # vectorized results must match point by point predictions
+                y = prob.get_val('mm.y')
+                trained = mm._metadata('y')['surrogate']
+                for i in range(vec_size):
+                    assert_near_equal(y[i], np.ravel(trained.predict(x[i].copy())), 1e-10)
+
+                # vectorized derivatives must match point by point derivatives
+                J = prob.compute_totals('mm.y', 'mm.x', return_format='array')
+                for i in range(vec_size):
+                    assert_near_equal(J[2*i:2*i + 2, 2*i:2*i + 2],
+                                      trained.linearize(x[i].copy()), 1e-10)
+
     def test_derivatives_vectorized_multiD(self):
         vec_size = 5
 
@@ -172,6 +172,15 @@ class Component(System):
                              desc='Default shape for variables that do not set val to a non-scalar '
                              'value or set shape, shape_by_conn, copy_shape, or compute_shape.'
                              ' Default is (1,).')
+        self.options.declare('par_fd_backend', default='mpi', values=['mpi', 'process_pool'],
+                             desc="How to run num_par_fd concurrent FD/CS solves. 'mpi' splits "
+                             "the MPI communicator, while 'process_pool' runs them in a pool of "
+                             "num_par_fd forked local processes and doesn't require MPI. "
+                             "'process_pool' can't be used when the component's communicator "
+                             "has more than one proc. A new pool is forked on each "
+                             "linearization so that the workers start from the current state "
+                             "of the component, which only pays off when a compute is expensive "
+                             "compared to forking num_par_fd processes.")
 
     def setup(self):
         """
@@ -202,7 +211,14 @@ class Component(System):
         """
         super()._setup_procs(pathname, comm, prob_meta)
 
-        if self._num_par_fd > 1:
+        if self._num_par_fd > 1 and self.options['par_fd_backend'] == 'process_pool':
+            if comm.size > 1:
+                # forked workers would make collective calls on the comm without the other procs
+                raise RuntimeError(f"{self.msginfo}: par_fd_backend='process_pool' cannot be "
+                                   "used when the component's communicator has more than one "
+                                   f"proc (comm size is {comm.size}). Use par_fd_backend='mpi' "
+                                   "instead.")
+        elif self._num_par_fd > 1:
             if comm.size > 1:
                 comm = self._setup_par_fd_procs(comm)
             elif not MPI:
@@ -517,7 +533,7 @@ class Component(System):
                 if self._has_distrib_vars:
                     raise RuntimeError(f"{self.msginfo}: Can't set 'run_root_only' option when "
                                        "a component has distributed variables.")
-                if self._num_par_fd > 1:
+                if self._num_par_fd > 1 and self.options['par_fd_backend'] == 'mpi':
                     raise RuntimeError(f"{self.msginfo}: Can't set 'run_root_only' option when "
                                        "using parallel FD.")
                 if self._problem_meta['has_par_deriv_color']:
@@ -1941,6 +1957,31 @@ class Component(System):
         self.comm.gather(nzresids, root=0)
         return nzresids
 
+    def _call_for_each_col(self, func, *args):
+        """
+        Call func once for each column held by the linear vectors.
+
+        During each call the linear vectors hold only the data of a single column, so user
+        functions that don't handle multiple derivative seeds see ordinary flat vectors.
+
+        Parameters
+        ----------
+        func : function
+            Function to call.
+        *args : list
+            Positional arguments passed to func.
+        """
+        vecs = (self._dinputs, self._doutputs, self._dresiduals)
+        datas = [vec._data for vec in vecs]
+        try:
+            for icol in range(datas[0].shape[1]):
+                for vec, data in zip(vecs, datas):
+                    vec._set_data(data[:, icol])
+                func(*args)
+        finally:
+            for vec, data in zip(vecs, datas):
+                vec._set_data(data)
+
     def _get_graph_node_meta(self):
         """
         Return metadata to add to this system's graph node.
@@ -1,4 +1,5 @@
 """Define a base class for all Drivers in OpenMDAO."""
+from contextlib import contextmanager
 from fnmatch import fnmatchcase
 import functools
 from itertools import chain
@@ -22,12 +23,18 @@ from openmdao.utils.mpi import MPI
 from openmdao.utils.options_dictionary import OptionsDictionary
 import openmdao.utils.coloring as coloring_mod
 from openmdao.utils.array_utils import sizes2offsets
+from openmdao.utils.design_point_cache import DesignPointCache
 from openmdao.vectors.vector import _full_slice, _flat_full_indexer
 from openmdao.utils.indexer import indexer
 from openmdao.utils.om_warnings import issue_warning, DerivativesWarning, \
     DriverWarning, OMDeprecationWarning, warn_deprecation
 
 
+# RecordingManagers replaced in a process pool worker.  References are kept here so that the
+# recorders inherited from the parent process are never closed from within the worker.
+_suspended_rec_mgrs = []
+
+
 class DriverResult():
     """
     A container that stores information pertaining to the result of a driver execution.
@@ -191,6 +198,124 @@ class DriverResult():
         return _track_time
 
 
+class _VOIGatherPlan(object):
+    """
+    Precompiled mapping between the model's output array and a flat array of VOI values.
+
+    This is only used when all of the VOIs are local, continuous and not distributed, in which
+    case getting (or setting) the values of all of them becomes a single fancy index into the
+    output array plus one vectorized application of the driver scaling.
+
+    Parameters
+    ----------
+    vois : dict
+        Metadata of the design variables, constraints or objectives, keyed by name.
+    outputs : <Vector>
+        The model's output vector.
+
+    Attributes
+    ----------
+    names : list of str
+        Names of the VOIs.
+    slices : list of slice
+        Location of each VOI in the flat array of values.
+    idxs : ndarray or slice
+        Indices of the flat VOI values in the output array.
+    size : int
+        Total size of the VOI values.
+    adder : ndarray or None
+        Combined total_adder of all VOIs, or None if there are none.
+    scaler : ndarray or None
+        Combined total_scaler of all VOIs, or None if there are none.
+    """
+
+    def __init__(self, vois, outputs):
+        """
+        Initialize attributes.
+        """
+        self.names = []
+        self.slices = []
+        idxs = []
+        adders = []
+        scalers = []
+        has_adder = has_scaler = False
+        start = 0
+
+        for name, meta in vois.items():
+            vstart, vstop = outputs.get_range(meta['source'])
+            vidxs = np.arange(vstart, vstop, dtype=INT_DTYPE)
+            if meta['indices'] is not None:
+                vidxs = vidxs[meta['indices'].as_array()]
+
+            size = vidxs.size
+            self.names.append(name)
+            self.slices.append(slice(start, start + size))
+            idxs.append(vidxs)
+            start += size
+
+            adder = meta['total_adder']
+            has_adder |= adder is not None
+            adders.append(np.broadcast_to(0. if adder is None else adder, (size,)))
+
+            scaler = meta['total_scaler']
+            has_scaler |= scaler is not None
+            scalers.append(np.broadcast_to(1. if scaler is None else scaler, (size,)))
+
+        self.size = start
+        idxs = np.concatenate(idxs) if idxs else np.zeros(0, dtype=INT_DTYPE)
+        if idxs.size > 0 and np.all(np.diff(idxs) == 1):
+            idxs = slice(idxs[0], idxs[-1] + 1)
+        self.idxs = idxs
+
+        self.adder = np.concatenate(adders) if has_adder else None
+        self.scaler = np.concatenate(scalers) if has_scaler else None
+
+    def gather(self, data, driver_scaling):
+        """
+        Return the values of all VOIs in a dict of views into a single flat array.
+
+        Parameters
+        ----------
+        data : ndarray
+            The model's output array.
+        driver_scaling : bool
+            If True, apply the driver scaling to the values.
+
+        Returns
+        -------
+        dict
+            Values of the VOIs, keyed by name.
+        """
+        vals = data[self.idxs]
+        if isinstance(self.idxs, slice):
+            vals = vals.copy()
+
+        if driver_scaling:
+            if self.adder is not None:
+                vals += self.adder
+            if self.scaler is not None:
+                vals *= self.scaler
+
+        return {name: vals[slc] for name, slc in zip(self.names, self.slices)}
+
+    def scatter(self, data, vals):
+        """
+        Set the values of all VOIs from a flat array of driver scaled values.
+
+        Parameters
+        ----------
+        data : ndarray
+            The model's output array.
+        vals : ndarray
+            Driver scaled values of all VOIs.
+        """
+        if self.scaler is not None:
+            vals = vals * (1.0 / self.scaler)
+        if self.adder is not None:
+            vals = vals - self.adder
+        data[self.idxs] = vals
+
+
 class Driver(object, metaclass=DriverMetaclass):
     """
     Top-level container for the systems and drivers.
@@ -259,12 +384,23 @@ class Driver(object, metaclass=DriverMetaclass):
         Cached linear total jacobian handling object.
     result : DriverResult
         DriverResult object containing information for use in the optimization report.
+    design_point_cache : DesignPointCache or None
+        Cache of the model states and total derivatives computed at each design point during
+        the most recent run, or None if design points aren't being cached.
     _has_scaling : bool
         If True, scaling has been set for this driver.
     _filtered_vars_to_record : dict or None
         Variables to record based on recording options.
     _in_find_feasible : bool
         True if the driver is currently executing find_feasible.
+    _gather_plans : dict
+        Cached _VOIGatherPlan objects (or None where a plan can't be used), keyed by the kind of
+        VOI and any filters applied to it.
+    _dp_cache_active : bool
+        True while the design point cache is in use, i.e. during the driver's run method.
+    _design_point_key : tuple or None
+        Key of the design point that the current model state was computed at, or None if it
+        isn't known.
     """
 
     def __init__(self, **kwargs):
@@ -283,6 +419,10 @@ class Driver(object, metaclass=DriverMetaclass):
         self._lin_dvs = None
         self._nl_dvs = None
         self._in_find_feasible = False
+        self._gather_plans = {}
+        self.design_point_cache = None
+        self._dp_cache_active = False
+        self._design_point_key = None
 
         # Driver options
         self.options = OptionsDictionary(parent_name=type(self).__name__)
@@ -302,6 +442,12 @@ class Driver(object, metaclass=DriverMetaclass):
                                   'variable to one of the valid options.',
                              default=default_desvar_behavior)
 
+        self.options.declare('design_point_cache_size', types=int, default=0, lower=0,
+                             desc='Maximum number of design points at which the model state '
+                                  'and total derivatives are kept during a run, so that asking '
+                                  'for the same point again does not rerun the model or '
+                                  'recompute the derivatives. Zero disables the cache.')
+
         # Case recording options
         self.recording_options = OptionsDictionary(parent_name=type(self).__name__)
 
@@ -450,6 +596,7 @@ class Driver(object, metaclass=DriverMetaclass):
         model = problem.model
 
         self._total_jac = None
+        self._gather_plans = {}
 
         # Determine if any design variables are discrete.
         self._designvars_discrete = [name for name, meta in self._designvars.items()
@@ -816,7 +963,7 @@ class Driver(object, metaclass=DriverMetaclass):
                 with model._relevance.nonlinear_active('pre'):
                     self._run_solve_nonlinear()
 
-            with SaveOptResult(self):
+            with SaveOptResult(self), self._memoize_design_points():
                 with model._relevance.nonlinear_active('iter'):
                     self.result.success = not self.run()
 
@@ -825,11 +972,54 @@ class Driver(object, metaclass=DriverMetaclass):
                     self._run_solve_nonlinear()
 
         else:
-            with SaveOptResult(self):
+            with SaveOptResult(self), self._memoize_design_points():
                 self.result.success = not self.run()
 
         return self.result
 
+    @contextmanager
+    def _memoize_design_points(self):
+        """
+        Use the design point cache, if it's enabled, for the duration of the context.
+
+        The cache starts out empty since inputs that aren't design variables may have changed
+        since the last run.
+
+        Yields
+        ------
+        None
+        """
+        size = self.options['design_point_cache_size']
+        if size == 0:
+            self.design_point_cache = None
+            yield
+            return
+
+        if self.design_point_cache is None or self.design_point_cache.capacity != size:
+            self.design_point_cache = DesignPointCache(size)
+        else:
+            self.design_point_cache.clear()
+
+        self._design_point_key = None
+        self._dp_cache_active = True
+        try:
+            yield
+        finally:
+            self._dp_cache_active = False
+            self._design_point_key = None
+
+    def _get_design_point_key(self):
+        """
+        Return a key identifying the current values of the design variables.
+
+        Returns
+        -------
+        tuple
+            Raw bytes of the value of each design variable.
+        """
+        return tuple([np.asarray(val).tobytes() for val in
+                      self.get_design_var_values(driver_scaling=False).values()])
+
     def _get_voi_val(self, name, meta, remote_vois, driver_scaling=True,
                      get_remote=True, rank=None):
         """
@@ -946,6 +1136,38 @@ class Driver(object, metaclass=DriverMetaclass):
 
         return val
 
+    def _get_gather_plan(self, key, vois):
+        """
+        Return the gather plan for the given VOIs, or None if they can't use one.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying this set of VOIs.
+        vois : dict
+            Metadata of the VOIs keyed by name.
+
+        Returns
+        -------
+        _VOIGatherPlan or None
+            The gather plan.
+        """
+        try:
+            return self._gather_plans[key]
+        except KeyError:
+            pass
+
+        model = self._problem().model
+        plan = None
+        # plans are limited to serial models where every VOI is a local, continuous variable
+        if model.comm.size == 1 and vois:
+            discrete = model._discrete_outputs
+            if not any(meta['source'] in discrete for meta in vois.values()):
+                plan = _VOIGatherPlan(vois, model._outputs)
+
+        self._gather_plans[key] = plan
+        return plan
+
     def get_driver_objective_calls(self):
         """
         Return number of objective evaluations made during a driver run.
@@ -994,6 +1216,10 @@ class Driver(object, metaclass=DriverMetaclass):
         dict
            Dictionary containing values of each design variable.
         """
+        plan = self._get_gather_plan(('dv',), self._designvars)
+        if plan is not None:
+            return plan.gather(self._problem().model._outputs.asarray(), driver_scaling)
+
         return {n: self._get_voi_val(n, dvmeta, self._remote_dvs, get_remote=get_remote,
                                      driver_scaling=driver_scaling)
                 for n, dvmeta in self._designvars.items()}
@@ -1086,6 +1312,10 @@ class Driver(object, metaclass=DriverMetaclass):
         dict
            Dictionary containing values of each objective.
         """
+        plan = self._get_gather_plan(('obj',), self._objs)
+        if plan is not None:
+            return plan.gather(self._problem().model._outputs.asarray(), driver_scaling)
+
         return {n: self._get_voi_val(n, obj, self._remote_objs,
                                      driver_scaling=driver_scaling)
                 for n, obj in self._objs.items()}
@@ -1120,18 +1350,16 @@ class Driver(object, metaclass=DriverMetaclass):
         dict
            Dictionary containing values of each constraint.
         """
-        con_dict = {}
-        it = self._cons.items()
-        if lintype == 'linear':
-            it = filter_by_meta(it, 'linear')
-        elif lintype == 'nonlinear':
-            it = filter_by_meta(it, 'linear', exclude=True)
-        if ctype == 'eq':
-            it = filter_by_meta(it, 'equals', chk_none=True)
-        elif ctype == 'ineq':
-            it = filter_by_meta(it, 'equals', chk_none=True, exclude=True)
+        if not viol:
+            key = ('con', ctype, lintype)
+            plan = self._gather_plans.get(key, False)
+            if plan is False:
+                plan = self._get_gather_plan(key, dict(self._filter_cons(ctype, lintype)))
+            if plan is not None:
+                return plan.gather(self._problem().model._outputs.asarray(), driver_scaling)
 
-        for name, meta in it:
+        con_dict = {}
+        for name, meta in self._filter_cons(ctype, lintype):
             if viol:
                 con_val = self._get_voi_val(name, meta, self._remote_cons,
                                             driver_scaling=True)
@@ -1158,6 +1386,33 @@ class Driver(object, metaclass=DriverMetaclass):
 
         return con_dict
 
+    def _filter_cons(self, ctype, lintype):
+        """
+        Return an iterator over the constraints of the given type.
+
+        Parameters
+        ----------
+        ctype : str
+            'all', 'eq' or 'ineq'.
+        lintype : str
+            'all', 'linear' or 'nonlinear'.
+
+        Returns
+        -------
+        iterator
+            Iterator over (name, meta) tuples of the matching constraints.
+        """
+        it = self._cons.items()
+        if lintype == 'linear':
+            it = filter_by_meta(it, 'linear')
+        elif lintype == 'nonlinear':
+            it = filter_by_meta(it, 'linear', exclude=True)
+        if ctype == 'eq':
+            it = filter_by_meta(it, 'equals', chk_none=True)
+        elif ctype == 'ineq':
+            it = filter_by_meta(it, 'equals', chk_none=True, exclude=True)
+        return it
+
     def _get_ordered_nl_responses(self):
         """
         Return the names of nonlinear responses in the order used by the driver.
@@ -1196,6 +1451,7 @@ class Driver(object, metaclass=DriverMetaclass):
         """
         self._objs = objs = {}
         self._cons = cons = {}
+        self._gather_plans = {}
 
         self._responses = responses
         self._designvars = desvars
@@ -1299,15 +1555,135 @@ class Driver(object, metaclass=DriverMetaclass):
     def _recording_iter(self):
         return self._problem()._metadata['recording_iter']
 
-    @DriverResult.track_stats(kind='model')
     def _run_solve_nonlinear(self):
+        if not self._dp_cache_active:
+            return self._run_solve_nonlinear_uncached()
+
+        cache = self.design_point_cache
+        self._design_point_key = None
+        key = self._get_design_point_key()
+
+        state = cache.get_state(key)
+        if state is None:
+            self._run_solve_nonlinear_uncached()
+            cache.add_state(key, self._get_pool_model_state())
+        else:
+            self._set_pool_model_state(state)
+
+        self._design_point_key = key
+
+    @DriverResult.track_stats(kind='model')
+    def _run_solve_nonlinear_uncached(self):
         return self._problem().model.run_solve_nonlinear()
 
-    @DriverResult.track_stats(kind='deriv')
+    def _init_pool_worker(self):
+        """
+        Prepare a forked process pool worker to run cases for this driver.
+
+        All recording is turned off in the worker because the recorders are owned by the
+        parent process, which records each case when its results are sent back.
+        """
+        def _suspend(requester):
+            _suspended_rec_mgrs.append(requester._rec_mgr)
+            requester._rec_mgr = RecordingManager()
+
+        prob = self._problem()
+        _suspend(prob)
+        _suspend(self)
+        for system in prob.model.system_iter(include_self=True, recurse=True):
+            _suspend(system)
+            for solver in (system._nonlinear_solver, system._linear_solver):
+                if solver is not None:
+                    _suspend(solver)
+                    if solver.supports['linesearch'] and solver.linesearch is not None:
+                        _suspend(solver.linesearch)
+
+    def _get_pool_model_state(self):
+        """
+        Return a copy of the nonlinear model state to be sent back from a pool worker.
+
+        Returns
+        -------
+        tuple
+            Copies of the nonlinear output, input and residual arrays and of the
+            discrete output and input values.
+        """
+        model = self._problem().model
+        return (model._outputs.asarray(copy=True),
+                model._inputs.asarray(copy=True),
+                model._residuals.asarray(copy=True),
+                {n: meta['val'] for n, meta in model._var_discrete['output'].items()},
+                {n: meta['val'] for n, meta in model._var_discrete['input'].items()})
+
+    def _set_pool_model_state(self, state):
+        """
+        Set the nonlinear model state to one returned from a pool worker.
+
+        Parameters
+        ----------
+        state : tuple
+            Model state as returned by _get_pool_model_state.
+        """
+        model = self._problem().model
+        outputs, inputs, resids, discrete_outs, discrete_ins = state
+        model._outputs.set_val(outputs)
+        model._inputs.set_val(inputs)
+        model._residuals.set_val(resids)
+        for io, vals in (('output', discrete_outs), ('input', discrete_ins)):
+            metadict = model._var_discrete[io]
+            for name, val in vals.items():
+                metadict[name]['val'] = val
+
     def _compute_totals(self, of=None, wrt=None, return_format='flat_dict', driver_scaling=True):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
 
+        If the design point cache is active and the derivatives have already been computed at
+        the current design point, the cached derivatives are returned.
+
+        Parameters
+        ----------
+        of : list of variable name str or None
+            Variables whose derivatives will be computed. Default is None, which
+            uses the driver's objectives and constraints.
+        wrt : list of variable name str or None
+            Variables with respect to which the derivatives will be computed.
+            Default is None, which uses the driver's desvars.
+        return_format : str
+            Format to return the derivatives. Default is a 'flat_dict', which
+            returns them in a dictionary whose keys are tuples of form (of, wrt). For
+            the scipy optimizer, 'array' is also supported.
+        driver_scaling : bool
+            If True (default), scale derivative values by the quantities specified when the desvars
+            and responses were added. If False, leave them unscaled.
+
+        Returns
+        -------
+        derivs : object
+            Derivatives in form requested by 'return_format'.
+        """
+        key = self._design_point_key
+        # only use the cache if the model state is known to belong to the current design point
+        if not self._dp_cache_active or key is None or key != self._get_design_point_key():
+            return self._compute_totals_uncached(of, wrt, return_format, driver_scaling)
+
+        cache = self.design_point_cache
+        totals_key = (None if of is None else tuple(of), None if wrt is None else tuple(wrt),
+                      return_format, driver_scaling)
+
+        totals = cache.get_totals(key, totals_key)
+        if totals is None:
+            totals = self._compute_totals_uncached(of, wrt, return_format, driver_scaling)
+            cache.add_totals(key, totals_key, totals)
+
+        return totals
+
+    @DriverResult.track_stats(kind='deriv')
+    def _compute_totals_uncached(self, of=None, wrt=None, return_format='flat_dict',
+                                 driver_scaling=True):
+        """
+        Compute derivatives of desired quantities with respect to desired inputs.
+
         All derivatives are returned using driver scaling.
 
         Parameters
@@ -1416,7 +1792,8 @@ class Driver(object, metaclass=DriverMetaclass):
                          show_summary=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_summary'],
                          show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity'],
                          use_scaling=coloring_mod._DEF_COMP_SPARSITY_ARGS['use_scaling'],
-                         randomize_subjacs=True, randomize_seeds=False, direct=True):
+                         randomize_subjacs=True, randomize_seeds=False, direct=True,
+                         sparsity_method='random', order='id'):
         """
         Set options for total deriv coloring.
 
@@ -1446,7 +1823,24 @@ class Driver(object, metaclass=DriverMetaclass):
         direct : bool
             If using bidirectional coloring, use the direct method when computing the column
             adjacency matrix instead of the substitution method.
-        """
+        sparsity_method : str
+            How to determine the sparsity of the total jacobian. 'random' (the default) computes
+            num_full_jacs total jacobians from random partials. 'structural' combines the
+            declared sparsity patterns of the partials without computing any derivatives, which
+            avoids forming a dense total jacobian but may include entries that are declared
+            nonzero yet are always zero.
+        order : str
+            Order in which columns (or rows) are colored. 'id' (the default) uses incidence
+            degree ordering. 'sl' uses smallest last ordering, which sometimes needs fewer
+            colors.
+        """
+        if sparsity_method not in ('random', 'structural'):
+            raise ValueError(f"{self.msginfo}: Invalid sparsity_method '{sparsity_method}'. "
+                             "Must be 'random' or 'structural'.")
+        if order not in ('id', 'sl'):
+            raise ValueError(f"{self.msginfo}: Invalid coloring order '{order}'. "
+                             "Must be 'id' or 'sl'.")
+
         self._coloring_info.coloring = None
         self._coloring_info.num_full_jacs = num_full_jacs
         self._coloring_info.tol = tol
@@ -1463,6 +1857,8 @@ class Driver(object, metaclass=DriverMetaclass):
         self._coloring_info.randomize_subjacs = randomize_subjacs
         self._coloring_info.randomize_seeds = randomize_seeds
         self._coloring_info.direct = direct
+        self._coloring_info.sparsity_method = sparsity_method
+        self._coloring_info.order = order
 
     def use_fixed_coloring(self, coloring=coloring_mod.STD_COLORING_FNAME()):
         """
@@ -2063,6 +2459,11 @@ class Driver(object, metaclass=DriverMetaclass):
             assume all design variables are present in x_new.
         """
         if desvar_names is None:
+            plan = self._get_gather_plan(('dv',), self._designvars)
+            if plan is not None:
+                plan.scatter(self._problem().model._outputs.asarray(), x_new)
+                return
+
             desvar_names = self._designvars.keys()
 
         i = 0
@@ -29,6 +29,8 @@ class ExplicitComponent(Component):
     ----------
     _has_compute_partials : bool
         If True, the instance overrides compute_partials.
+    _has_compute_multi_jacvec_product : bool
+        If True, the instance overrides compute_multi_jacvec_product.
     _vjp_hash : int or None
         Hash value for the last set of inputs to the compute_primal function.
     _vjp_fun : function or None
@@ -42,6 +44,8 @@ class ExplicitComponent(Component):
         super().__init__(**kwargs)
 
         self._has_compute_partials = overrides_method('compute_partials', self, ExplicitComponent)
+        self._has_compute_multi_jacvec_product = overrides_method('compute_multi_jacvec_product',
+                                                                  self, ExplicitComponent)
         self.options.undeclare('assembled_jac_type')
         self._vjp_hash = None
         self._vjp_fun = None
@@ -428,10 +432,21 @@ class ExplicitComponent(Component):
                                     val = get_doutput(v)
                                     val -= get_dresid(v)
 
-                    # We used to negate the residual here, and then re-negate after the hook
-                    with self._call_user_function('compute_jacvec_product'):
-                        self._compute_jacvec_product_wrapper(self._inputs, d_inputs, d_residuals,
-                                                             mode, self._discrete_inputs)
+                    if d_residuals._ncol > 1 and self._has_compute_multi_jacvec_product:
+                        with self._call_user_function('compute_multi_jacvec_product'):
+                            self.compute_multi_jacvec_product(self._inputs, d_inputs,
+                                                              d_residuals, mode)
+                    elif d_residuals._ncol > 1:
+                        with self._call_user_function('compute_jacvec_product'):
+                            self._call_for_each_col(self._compute_jacvec_product_wrapper,
+                                                    self._inputs, d_inputs, d_residuals, mode,
+                                                    self._discrete_inputs)
+                    else:
+                        # We used to negate the residual here, and then re-negate after the hook
+                        with self._call_user_function('compute_jacvec_product'):
+                            self._compute_jacvec_product_wrapper(self._inputs, d_inputs,
+                                                                 d_residuals, mode,
+                                                                 self._discrete_inputs)
                 finally:
                     d_inputs.read_only = d_residuals.read_only = False
 
@@ -589,6 +604,33 @@ class ExplicitComponent(Component):
         """
         pass
 
+    def compute_multi_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+        r"""
+        Compute jac-vector products for several derivative seeds at once.
+
+        This is optional. It is only called when a linear solver propagates a block of seeds
+        through the model at the same time, in which case every variable in d_inputs and
+        d_outputs has a trailing dimension with one entry per seed. If it isn't overridden,
+        compute_jacvec_product is called once per seed instead.
+
+        If mode is:
+            'fwd': d_inputs \|-> d_outputs
+
+            'rev': d_outputs \|-> d_inputs
+
+        Parameters
+        ----------
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+        d_inputs : Vector
+            See inputs; product must be computed only if var_name in d_inputs.
+        d_outputs : Vector
+            See outputs; product must be computed only if var_name in d_outputs.
+        mode : str
+            Either 'fwd' or 'rev'.
+        """
+        pass
+
     def is_explicit(self, is_comp=True):
         """
         Return True if this is an explicit component.
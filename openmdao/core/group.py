@@ -1186,10 +1186,6 @@ class Group(System):
 
         self._fd_rev_xfer_correction_dist = {}
 
-        desvars = self.get_design_vars(get_sizes=False)
-        responses = self._check_alias_overlaps(self.get_responses(get_sizes=False,
-                                                                  use_prom_ivc=True))
-
         self._dataflow_graph = self._get_dataflow_graph()
         self._problem_meta['dataflow_graph'] = self._dataflow_graph
 
@@ -1197,12 +1193,13 @@ class Group(System):
         # in components.  By default all component connected outputs
         # are also connected to all connected inputs from the same component.
         self._missing_partials = {}
+        self._unreachable_outputs = set()
         if not self._owns_approx_jac:  # don't check for missing partials when doing FD
             self._get_missing_partials(self._missing_partials)
             if self._missing_partials:
-                self._update_dataflow_graph(responses)
+                self._update_dataflow_graph()
 
-        self._problem_meta['relevance'] = get_relevance(self, responses, desvars)
+        self._setup_driver_var_relevance()
 
         # Transfers have to be set up after the vector setup.
         self._setup_transfers()
@@ -1229,18 +1226,10 @@ class Group(System):
             subsys._scale_factors = self._scale_factors
             subsys._setup_vectors(self._vectors)
 
-    def _update_dataflow_graph(self, responses):
+    def _update_dataflow_graph(self):
         """
         Update the dataflow graph based on missing partials.
-
-        Parameters
-        ----------
-        responses : dict
-            Dictionary of response metadata.
         """
-        resps = set(meta2src_iter(responses.values()))
-
-        missing_responses = set()
         for pathname, missing in self._missing_partials.items():
             inputs = [n for n, _ in self._dataflow_graph.in_edges(pathname)]
             outputs = [n for _, n in self._dataflow_graph.out_edges(pathname)]
@@ -1254,9 +1243,23 @@ class Group(System):
                         self._dataflow_graph.add_edge(inp, output)
                         found = True
 
-                if not found and output in resps:
-                    missing_responses.add(output)
+                if not found:
+                    self._unreachable_outputs.add(output)
 
+    def _setup_driver_var_relevance(self):
+        """
+        Set up the structures that depend on the current design variables and responses.
+
+        This is called during final setup, and again before a run if design variables or
+        responses have been added or removed since then, in which case the rest of the setup
+        (and the current variable values) are kept.
+        """
+        desvars = self.get_design_vars(get_sizes=False)
+        responses = self._check_alias_overlaps(self.get_responses(get_sizes=False,
+                                                                  use_prom_ivc=True))
+
+        resps = set(meta2src_iter(responses.values()))
+        missing_responses = resps.intersection(self._unreachable_outputs)
         if missing_responses:
             msg = (f"Constraints or objectives [{', '.join(sorted(missing_responses))}] cannot"
                    " be impacted by the design variables of the problem because no partials "
@@ -1266,6 +1269,9 @@ class Group(System):
             else:
                 issue_warning(msg, category=DerivativesWarning)
 
+        self._problem_meta['relevance'] = get_relevance(self, responses, desvars)
+        self._problem_meta['vois_changed'] = False
+
     def set_initial_values(self):
         """
         Set all input and output variables to their declared initial values.
@@ -68,6 +68,12 @@ class ImplicitComponent(Component):
     _has_solve_linear : bool
         If True, this component has a solve_linear method that overrides the ImplicitComponent
         class method.
+    _has_apply_multi_linear : bool
+        If True, this component has an apply_multi_linear method that overrides the
+        ImplicitComponent class method.
+    _has_solve_multi_linear : bool
+        If True, this component has a solve_multi_linear method that overrides the
+        ImplicitComponent class method.
     _has_linearize : bool
         If True, this component has a linearize method that overrides the ImplicitComponent
         class method.
@@ -85,6 +91,8 @@ class ImplicitComponent(Component):
         super().__init__(**kwargs)
         self._has_solve_nl = _UNDEFINED
         self._has_solve_linear = _UNDEFINED
+        self._has_apply_multi_linear = _UNDEFINED
+        self._has_solve_multi_linear = _UNDEFINED
         self._has_linearize = _UNDEFINED
         self._vjp_hash = None
         self._vjp_fun = None
@@ -106,6 +114,14 @@ class ImplicitComponent(Component):
         if is_undefined(self._has_solve_linear):
             self._has_solve_linear = overrides_method('solve_linear', self, ImplicitComponent)
 
+        if is_undefined(self._has_apply_multi_linear):
+            self._has_apply_multi_linear = overrides_method('apply_multi_linear', self,
+                                                            ImplicitComponent)
+
+        if is_undefined(self._has_solve_multi_linear):
+            self._has_solve_multi_linear = overrides_method('solve_multi_linear', self,
+                                                            ImplicitComponent)
+
         if is_undefined(self.matrix_free):
             self.matrix_free = overrides_method('apply_linear', self, ImplicitComponent)
 
@@ -275,9 +291,19 @@ class ImplicitComponent(Component):
                     d_residuals.read_only = True
 
                 try:
-                    with self._call_user_function('apply_linear', protect_outputs=True):
-                        self._apply_linear_wrapper(self._inputs, self._outputs,
-                                                   d_inputs, d_outputs, d_residuals, mode)
+                    if d_residuals._ncol > 1 and self._has_apply_multi_linear:
+                        with self._call_user_function('apply_multi_linear', protect_outputs=True):
+                            self.apply_multi_linear(self._inputs, self._outputs,
+                                                    d_inputs, d_outputs, d_residuals, mode)
+                    elif d_residuals._ncol > 1:
+                        with self._call_user_function('apply_linear', protect_outputs=True):
+                            self._call_for_each_col(self._apply_linear_wrapper, self._inputs,
+                                                    self._outputs, d_inputs, d_outputs,
+                                                    d_residuals, mode)
+                    else:
+                        with self._call_user_function('apply_linear', protect_outputs=True):
+                            self._apply_linear_wrapper(self._inputs, self._outputs,
+                                                       d_inputs, d_outputs, d_residuals, mode)
                 finally:
                     d_inputs.read_only = d_outputs.read_only = d_residuals.read_only = False
 
@@ -337,8 +363,17 @@ class ImplicitComponent(Component):
                     d_outputs.read_only = True
 
                 try:
-                    with self._call_user_function('solve_linear'):
-                        self._solve_linear_wrapper(d_outputs, d_residuals, mode)
+                    if d_outputs._ncol > 1 and self._has_solve_multi_linear:
+                        with self._call_user_function('solve_multi_linear'):
+                            self.solve_multi_linear(d_outputs, d_residuals, mode)
+                    elif d_outputs._ncol > 1 and self._has_solve_linear:
+                        with self._call_user_function('solve_linear'):
+                            self._call_for_each_col(self._solve_linear_wrapper, d_outputs,
+                                                    d_residuals, mode)
+                    else:
+                        # the default identity solve handles any number of columns
+                        with self._call_user_function('solve_linear'):
+                            self._solve_linear_wrapper(d_outputs, d_residuals, mode)
                 finally:
                     d_outputs.read_only = d_residuals.read_only = False
 
@@ -925,6 +960,62 @@ class ImplicitComponent(Component):
         else:  # rev
             d_residuals.set_vec(d_outputs)
 
+    def apply_multi_linear(self, inputs, outputs, d_inputs, d_outputs, d_residuals, mode):
+        r"""
+        Compute jac-vector products for several derivative seeds at once.
+
+        This is optional. It is only called when a linear solver propagates a block of seeds
+        through the model at the same time, in which case every variable in d_inputs, d_outputs
+        and d_residuals has a trailing dimension with one entry per seed. If it isn't
+        overridden, apply_linear is called once per seed instead.
+
+        If mode is:
+            'fwd': (d_inputs, d_outputs) \|-> d_residuals
+
+            'rev': d_residuals \|-> (d_inputs, d_outputs)
+
+        Parameters
+        ----------
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+        outputs : Vector
+            Unscaled, dimensional output variables read via outputs[key].
+        d_inputs : Vector
+            See inputs; product must be computed only if var_name in d_inputs.
+        d_outputs : Vector
+            See outputs; product must be computed only if var_name in d_outputs.
+        d_residuals : Vector
+            See outputs.
+        mode : str
+            Either 'fwd' or 'rev'.
+        """
+        pass
+
+    def solve_multi_linear(self, d_outputs, d_residuals, mode):
+        r"""
+        Apply inverse jac products for several derivative seeds at once.
+
+        This is optional. It is only called when a linear solver propagates a block of seeds
+        through the model at the same time, in which case every variable in d_outputs and
+        d_residuals has a trailing dimension with one entry per seed. If it isn't overridden,
+        solve_linear is called once per seed instead.
+
+        If mode is:
+            'fwd': d_residuals \|-> d_outputs
+
+            'rev': d_outputs \|-> d_residuals
+
+        Parameters
+        ----------
+        d_outputs : Vector
+            Unscaled, dimensional quantities read via d_outputs[key].
+        d_residuals : Vector
+            Unscaled, dimensional quantities read via d_residuals[key].
+        mode : str
+            Either 'fwd' or 'rev'.
+        """
+        pass
+
     def linearize(self, inputs, outputs, jacobian, discrete_inputs=None, discrete_outputs=None):
         """
         Compute sub-jacobian parts and any applicable matrix factorizations.
@@ -1048,7 +1139,8 @@ class _ResidsWrapper(object):
         if name in self._dct:
             slc, shape = self._dct[name]
             view = arr[slc]
-            view.shape = shape
+            # linear vectors holding several derivative seeds have a trailing column dimension
+            view.shape = shape + arr.shape[1:]
             return view
 
         return self._vec.__getitem__(name)  # handles errors
@@ -1057,7 +1149,10 @@ class _ResidsWrapper(object):
         arr = self._vec.asarray(copy=False)
         if name in self._dct:
             slc, _ = self._dct[name]
-            arr[slc] = np.asarray(val).flat
+            if arr.ndim > 1:
+                arr[slc] = np.asarray(val).reshape(arr[slc].shape)
+            else:
+                arr[slc] = np.asarray(val).flat
             return
 
         self._vec.__setitem__(name, val)  # handles errors
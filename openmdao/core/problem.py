@@ -1126,6 +1126,8 @@ class Problem(object, metaclass=ProblemMetaclass):
             'rel_array_cache': {},  # cache of relevance arrays
             'ncompute_totals': 0,  # number of times compute_totals has been called
             'jax_group': None,  # not None if a Group is currently performing a jax operation
+            'vois_changed': False,  # True if design vars or responses were added or removed
+                                    # after final_setup
         })
 
         model_comm = self.driver._setup_comm(comm)
@@ -1187,6 +1189,8 @@ class Problem(object, metaclass=ProblemMetaclass):
         driver = self.driver
         model = self.model
 
+        vois_changed = False
+
         if self._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
             first = True
             self._metadata['static_mode'] = False
@@ -1219,6 +1223,16 @@ class Problem(object, metaclass=ProblemMetaclass):
             designvars = model.get_design_vars(recurse=True, use_prom_ivc=True)
             response_size, desvar_size = driver._update_voi_meta(model, responses, designvars)
 
+            if self._metadata['vois_changed']:
+                # design vars or responses were added or removed after final_setup, so update
+                # only the structures that depend on them, keeping vectors, transfers, solvers
+                # and the current variable values.
+                vois_changed = True
+                model._setup_driver_var_relevance()
+                if self._orig_mode == 'auto':
+                    mode = 'rev' if response_size < desvar_size else 'fwd'
+                    self._metadata['mode'] = mode
+
             # If set_solver_print is called after an initial run, in a multi-run scenario,
             #  this part of _final_setup still needs to happen so that change takes effect
             #  in subsequent runs
@@ -1256,6 +1270,9 @@ class Problem(object, metaclass=ProblemMetaclass):
         if self._metadata['setup_status'] >= _SetupStatus.POST_SETUP:
             driver._setup_recording()
             self._setup_recording()
+            if vois_changed:
+                driver._rec_mgr.update_driver_vars(driver, driver)
+                self._rec_mgr.update_driver_vars(self, driver)
             record_viewer_data(self)
 
         if self._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
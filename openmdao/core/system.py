@@ -3428,7 +3428,7 @@ class System(object, metaclass=SystemMetaclass):
         else:
             size = None
 
-        design_vars[name] = {
+        design_vars[name] = dvmeta = {
             'adder': adder,
             'scaler': scaler,
             'name': name,
@@ -3446,6 +3446,33 @@ class System(object, metaclass=SystemMetaclass):
             'size': size,
         }
 
+        if self._static_mode:
+            self._add_voi_post_setup(self._design_vars, name, dvmeta)
+
+    def remove_design_var(self, name):
+        """
+        Remove a design variable from this system.
+
+        If called after setup, the change takes effect the next time the model or driver is run,
+        without requiring another call to setup.  A design variable that was added during setup
+        or configure will be added again by the next call to setup.
+
+        Parameters
+        ----------
+        name : str
+            Promoted name of the design variable in the system.
+        """
+        found = False
+        for design_vars in (self._static_design_vars, self._design_vars):
+            if name in design_vars:
+                del design_vars[name]
+                found = True
+
+        if not found:
+            raise RuntimeError(f"{self.msginfo}: Design Variable '{name}' does not exist.")
+
+        self._vois_changed()
+
     def add_response(self, name, type_, lower=None, upper=None, equals=None,
                      ref=None, ref0=None, indices=None, index=None, units=None,
                      adder=None, scaler=None, linear=False, parallel_deriv_color=None,
@@ -3641,10 +3668,60 @@ class System(object, metaclass=SystemMetaclass):
             raise TypeError(f"{self.msginfo}: Constraint alias '{alias}' is a duplicate of an "
                             "existing alias or variable name.")
 
-        if alias is not None:
-            responses[alias] = resp
-        else:
-            responses[name] = resp
+        key = name if alias is None else alias
+        responses[key] = resp
+
+        if self._static_mode:
+            self._add_voi_post_setup(self._responses, key, resp)
+
+    def remove_response(self, name):
+        """
+        Remove a response variable (constraint or objective) from this system.
+
+        If called after setup, the change takes effect the next time the model or driver is run,
+        without requiring another call to setup.  A response that was added during setup
+        or configure will be added again by the next call to setup.
+
+        Parameters
+        ----------
+        name : str
+            Promoted name or alias of the response variable in the system.
+        """
+        found = False
+        for responses in (self._static_responses, self._responses):
+            if name in responses:
+                del responses[name]
+                found = True
+
+        if not found:
+            raise RuntimeError(f"{self.msginfo}: Response '{name}' does not exist.")
+
+        self._vois_changed()
+
+    def _add_voi_post_setup(self, vois, name, meta):
+        """
+        Make a design variable or response added after setup part of the current setup.
+
+        Parameters
+        ----------
+        vois : dict
+            Either self._design_vars or self._responses.
+        name : str
+            Name (or alias) of the design variable or response.
+        meta : dict
+            Metadata of the design variable or response.
+        """
+        if self._problem_meta is not None and \
+                self._problem_meta['setup_status'] >= _SetupStatus.POST_SETUP:
+            vois[name] = meta
+            self._vois_changed()
+
+    def _vois_changed(self):
+        """
+        Flag the problem so that design variable and response structures are updated.
+        """
+        if self._problem_meta is not None:
+            self._problem_meta['vois_changed'] = True
 
     def add_constraint(self, name, lower=None, upper=None, equals=None,
                        ref=None, ref0=None, adder=None, scaler=None, units=None,
@@ -5477,6 +5554,29 @@ class System(object, metaclass=SystemMetaclass):
         for sub in self._subsystems_myproc:
             sub._set_complex_step_mode(active)
 
+    def _set_linear_ncol(self, ncol, parent_vectors=None):
+        """
+        Set the number of derivative seeds held by the linear vectors.
+
+        Recurses to switch the linear vectors of all subsystems to the new layout.
+
+        Parameters
+        ----------
+        ncol : int
+            Number of columns in the linear vectors.  A value of 1 restores the flat layout.
+        parent_vectors : dict or None
+            Vectors of the parent system, or None if this is the root of the switch.
+        """
+        for kind in ('input', 'output', 'residual'):
+            parent = None if parent_vectors is None else parent_vectors[kind]['linear']
+            self._vectors[kind]['linear']._set_ncol(ncol, parent)
+
+        if self._jacobian is not None:
+            self._jacobian._reset_views()
+
+        for sub in self._subsystems_myproc:
+            sub._set_linear_ncol(ncol, self._vectors)
+
     def cleanup(self):
         """
         Clean up resources prior to exit.
@@ -5,6 +5,7 @@ import itertools
 import pickle
 
 import unittest
+from unittest import mock
 import numpy as np
 
 from io import StringIO
@@ -28,6 +29,7 @@ from openmdao.utils.general_utils import run_driver, printoptions
 from openmdao.utils.assert_utils import assert_check_totals
 
 import openmdao.test_suite
+import openmdao.utils.coloring as coloring_mod
 
 try:
     from parameterized import parameterized
@@ -172,10 +174,14 @@ def run_opt(driver_class, mode, assemble_type=None, color_info=None, derivs=True
     if 'min_improve_pct' in options:
         del options['min_improve_pct']
 
+    sparsity_method = options.pop('sparsity_method', 'random')
+    order = options.pop('order', 'id')
+
     if 'dynamic_total_coloring' in options:
         if options['dynamic_total_coloring']:
             p.driver.declare_coloring(tol=1e-15, min_improve_pct=min_improve_pct,
-                                      show_sparsity=show_sparsity)
+                                      show_sparsity=show_sparsity,
+                                      sparsity_method=sparsity_method, order=order)
         del options['dynamic_total_coloring']
 
     p.driver.options.update(options)
@@ -1231,6 +1237,66 @@ class BidirectionalTestCase(unittest.TestCase):
         self.assertEqual(tot_colors, 3)
 
 
+
+def _banded(n, bandwidth):
+    rows = np.repeat(np.arange(n), 2 * bandwidth + 1)
+    cols = rows + np.tile(np.arange(-bandwidth, bandwidth + 1), n)
+    mask = (cols >= 0) & (cols < n)
+    return coo_matrix((np.ones(np.count_nonzero(mask), dtype=bool), (rows[mask], cols[mask])),
+                      shape=(n, n))
+
+
+class ColoringOrderTestCase(unittest.TestCase):
+
+    def _check_colors(self, J, coloring, mode):
+        # nonzeros of columns (fwd) or rows (rev) with the same color must not overlap
+        dense = J if isinstance(J, np.ndarray) else J.toarray()
+        if mode == 'rev':
+            dense = dense.T
+        for group in coloring.color_iter(mode):
+            self.assertLessEqual(np.max(np.sum(dense[:, group], axis=1)), 1)
+
+    @parameterized.expand(itertools.product(['fwd', 'rev'], ['id', 'sl']),
+                          name_func=_test_func_name)
+    def test_banded(self, mode, order):
+        J = _banded(200, 3)
+        coloring = _compute_coloring(J, mode, order=order)
+        self._check_colors(J, coloring, mode)
+        self.assertEqual(coloring.total_solves(), 7)
+
+    @parameterized.expand(['fwd', 'rev'], name_func=_test_func_name)
+    def test_sl_random(self, mode):
+        builder = TotJacBuilder(60, 50)
+        builder.add_random_points(300)
+        builder.add_row(7)
+        builder.add_col(11)
+        self._check_colors(builder.J, _compute_coloring(builder.J, mode, order='sl'), mode)
+
+    def test_bad_order(self):
+        with self.assertRaises(ValueError) as cm:
+            _compute_coloring(_banded(10, 1), 'fwd', order='foo')
+
+        self.assertEqual(str(cm.exception), "Invalid coloring order 'foo'. Must be 'id' or 'sl'.")
+
+    def test_fallback_skipped(self):
+        # with a dense row, fwd coloring needs as many colors as there are columns, so it's
+        # never computed
+        builder = TotJacBuilder(41, 40)
+        builder.add_block_diag([(4, 4)] * 10, 0, 0)
+        builder.add_row(40)
+        coloring = _compute_coloring(builder.J, 'auto')
+
+        candidates = coloring._meta['coloring_candidates']
+        self.assertEqual(list(candidates), ['bidirectional', 'fwd', 'rev'])
+        self.assertIsNone(candidates['fwd'])
+        self.assertEqual(candidates['bidirectional'][0], coloring.total_solves())
+        self.assertEqual(coloring.total_solves(), 5)
+
+        stream = StringIO()
+        coloring.summary(out_stream=stream)
+        self.assertIn("fwd: skipped (can't require fewer solves)", stream.getvalue())
+
+
 def _get_random_mat(rows, cols, comm, generator=None):
     gen = generator if generator is not None else np.random.default_rng()
 
@@ -1627,5 +1693,151 @@ class SimulColoringConfigCheckTestCase(unittest.TestCase):
 
         self.assertIsNotNone(p.driver._get_coloring())
 
+
+class _MatFreeDouble(om.ExplicitComponent):
+    def setup(self):
+        self.add_input('a', np.ones(3))
+        self.add_output('b', np.ones(3))
+
+    def compute(self, inputs, outputs):
+        outputs['b'] = 2. * inputs['a']
+
+    def compute_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+        if 'a' in d_inputs:
+            if mode == 'fwd':
+                d_outputs['b'] += 2. * d_inputs['a']
+            else:
+                d_inputs['a'] += 2. * d_outputs['b']
+
+
+class _SquareNoPartials(om.ExplicitComponent):
+    def setup(self):
+        self.add_input('a', np.ones(3))
+        self.add_output('b', np.ones(3))
+
+    def compute(self, inputs, outputs):
+        outputs['b'] = inputs['a'] ** 2
+
+
+@use_tempdirs
+class StructuralSparsityTestCase(unittest.TestCase):
+
+    def setUp(self):
+        om.clear_reports()
+
+    def _sparsity(self, coloring):
+        return set(zip(coloring._nzrows, coloring._nzcols))
+
+    @parameterized.expand(['fwd', 'rev'])
+    def test_matches_random(self, mode):
+        p = run_opt(om.ScipyOptimizeDriver, mode, optimizer='SLSQP', disp=False,
+                    dynamic_total_coloring=True)
+        p_struct = run_opt(om.ScipyOptimizeDriver, mode, optimizer='SLSQP', disp=False,
+                           dynamic_total_coloring=True, sparsity_method='structural')
+
+        assert_almost_equal(p_struct['circle.area'], np.pi, decimal=7)
+
+        coloring = p.driver._coloring_info.coloring
+        struct_coloring = p_struct.driver._coloring_info.coloring
+        self.assertEqual(struct_coloring._meta['sparsity_method'], 'structural')
+        self.assertEqual(self._sparsity(struct_coloring), self._sparsity(coloring))
+        self.assertEqual(struct_coloring.total_solves(), coloring.total_solves())
+
+    def test_dense_partials_superset(self):
+        # ExecComps without has_diag_partials declare dense partials, so the structural
+        # sparsity contains every nonzero found by the random method, and more
+        p = run_opt(om.ScipyOptimizeDriver, 'fwd', optimizer='SLSQP', disp=False,
+                    dynamic_total_coloring=True, has_diag_partials=False)
+
+        nzs = self._sparsity(p.driver._coloring_info.coloring)
+        struct_nzs = self._sparsity(compute_total_coloring(p, sparsity_method='structural'))
+        self.assertTrue(nzs < struct_nzs)
+
+    def test_opaque_systems(self):
+        # a matrix free component and a group that approximates its own derivatives are
+        # treated as dense from all of their inputs to all of their outputs
+        p = om.Problem()
+        model = p.model
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.ones(9)))
+        model.add_subsystem('mf', _MatFreeDouble())
+        sub = model.add_subsystem('sub', om.Group())
+        sub.add_subsystem('sq', _SquareNoPartials())
+        sub.approx_totals(method='cs')
+        model.add_subsystem('diag', om.ExecComp('y = 3.*x', x=np.ones(3), y=np.ones(3),
+                                                has_diag_partials=True))
+        model.connect('ivc.x', 'mf.a', src_indices=[0, 1, 2])
+        model.connect('ivc.x', 'sub.sq.a', src_indices=[3, 4, 5])
+        model.connect('ivc.x', 'diag.x', src_indices=[6, 7, 8])
+
+        model.add_design_var('ivc.x')
+        model.add_constraint('mf.b', upper=0.)
+        model.add_constraint('sub.sq.b', upper=0.)
+        model.add_constraint('diag.y', upper=0.)
+
+        p.setup(mode='fwd', force_alloc_complex=True)
+        p.run_model()
+
+        coloring = compute_total_coloring(p, sparsity_method='structural')
+
+        expected = np.zeros((9, 9), dtype=bool)
+        expected[:3, :3] = True
+        expected[3:6, 3:6] = True
+        expected[6:, 6:] = np.eye(3, dtype=bool)
+        assert_almost_equal(coloring.get_dense_sparsity(), expected)
+
+    def test_bad_sparsity_method(self):
+        p = om.Problem()
+        with self.assertRaises(ValueError) as cm:
+            p.driver.declare_coloring(sparsity_method='foo')
+
+        self.assertEqual(str(cm.exception),
+                         "Driver: Invalid sparsity_method 'foo'. Must be 'random' or "
+                         "'structural'.")
+
+
+@use_tempdirs
+class TotalColoringOrderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        om.clear_reports()
+
+    @parameterized.expand(['fwd', 'rev'])
+    def test_declare_coloring_order(self, mode):
+        orders = []
+        orig = coloring_mod._compute_coloring
+
+        def _compute_coloring_spy(J, mode, direct=True, order='id'):
+            orders.append(order)
+            return orig(J, mode, direct=direct, order=order)
+
+        with mock.patch.object(coloring_mod, '_compute_coloring', _compute_coloring_spy):
+            p = run_opt(om.ScipyOptimizeDriver, mode, optimizer='SLSQP', disp=False,
+                        dynamic_total_coloring=True, order='sl')
+
+        assert_almost_equal(p['circle.area'], np.pi, decimal=7)
+        self.assertEqual(orders, ['sl'])
+        self.assertEqual(p.driver._coloring_info.order, 'sl')
+
+    def test_compute_total_coloring_order(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'fwd', optimizer='SLSQP', disp=False,
+                    dynamic_total_coloring=True)
+        coloring = p.driver._coloring_info.coloring
+        sl_coloring = compute_total_coloring(p, order='sl')
+
+        self.assertEqual(set(zip(sl_coloring._nzrows, sl_coloring._nzcols)),
+                         set(zip(coloring._nzrows, coloring._nzcols)))
+        dense = sl_coloring.get_dense_sparsity()
+        for group in sl_coloring.color_iter('fwd'):
+            self.assertLessEqual(np.max(np.sum(dense[:, group], axis=1)), 1)
+
+    def test_bad_order(self):
+        p = om.Problem()
+        with self.assertRaises(ValueError) as cm:
+            p.driver.declare_coloring(order='foo')
+
+        self.assertEqual(str(cm.exception),
+                         "Driver: Invalid coloring order 'foo'. Must be 'id' or 'sl'.")
+
+
 if __name__ == '__main__':
     unittest.main()
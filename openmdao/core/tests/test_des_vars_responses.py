@@ -6,6 +6,7 @@ import numpy as np
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_totals
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.test_suite.components.sellar import SellarDerivatives, SellarDis1withDerivatives, \
      SellarDis2withDerivatives
 
@@ -1061,5 +1062,151 @@ class TestObjectiveOnModel(unittest.TestCase):
         assert_check_totals(derivs)
 
 
+@use_tempdirs
+class TestVOIsAfterSetup(unittest.TestCase):
+
+    def setup_problem(self):
+        prob = om.Problem()
+        prob.model = SellarDerivatives()
+        prob.model.nonlinear_solver = om.NonlinearBlockGS()
+        prob.model.linear_solver = om.DirectSolver()
+
+        prob.model.add_design_var('x', lower=0, upper=10)
+        prob.model.add_objective('obj')
+        prob.model.add_constraint('con1', upper=0.)
+
+        prob.setup()
+        prob.set_val('x', 2.0)
+        prob.run_model()
+        return prob
+
+    def check_totals(self, prob, ofs, wrts):
+        totals = prob.compute_totals()
+        self.assertEqual(set(totals), {(of, wrt) for of in ofs for wrt in wrts})
+
+        data = prob.check_totals(out_stream=None)
+        assert_check_totals(data, atol=1e-5, rtol=1e-5)
+
+    def test_add_after_run(self):
+        prob = self.setup_problem()
+        outputs = prob.model._outputs
+        y1 = prob.get_val('y1').copy()
+
+        prob.model.add_design_var('z', lower=0, upper=10)
+        prob.model.add_constraint('con2', upper=0.)
+        prob.run_model()
+
+        # the model was not set up again, so vectors and values are unchanged
+        self.assertIs(prob.model._outputs, outputs)
+        assert_near_equal(prob.get_val('x'), 2.0)
+        assert_near_equal(prob.get_val('y1'), y1, 1e-10)
+
+        self.assertEqual(set(prob.model.get_design_vars()), {'x', 'z'})
+        self.assertEqual(set(prob.model.get_constraints()), {'con1', 'con2'})
+        self.check_totals(prob, ['obj', 'con1', 'con2'], ['x', 'z'])
+
+    def test_add_on_subsystem_after_run(self):
+        prob = self.setup_problem()
+
+        prob.model.d2.add_constraint('y2', lower=0., alias='y2_con')
+        prob.run_model()
+
+        self.assertEqual(set(prob.model.get_constraints()), {'con1', 'y2_con'})
+        self.check_totals(prob, ['obj', 'con1', 'y2_con'], ['x'])
+
+    def test_remove_after_run(self):
+        prob = self.setup_problem()
+        prob.model.add_design_var('z', lower=0, upper=10)
+        prob.model.add_constraint('con2', upper=0.)
+        prob.run_model()
+
+        prob.model.remove_design_var('x')
+        prob.model.remove_response('con1')
+        prob.run_model()
+
+        self.assertEqual(set(prob.model.get_design_vars()), {'z'})
+        self.assertEqual(set(prob.model.get_constraints()), {'con2'})
+        self.check_totals(prob, ['obj', 'con2'], ['z'])
+
+        # the removed variables don't come back on the next setup
+        prob.setup()
+        prob.run_model()
+        self.assertEqual(set(prob.model.get_design_vars()), {'z'})
+        self.assertEqual(set(prob.model.get_constraints()), {'con2'})
+
+    def test_run_driver_after_add(self):
+        prob = self.setup_problem()
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.run_driver()
+
+        prob.model.add_design_var('z', lower=np.array([-10.0, 0.0]),
+                                  upper=np.array([10.0, 10.0]))
+        prob.model.add_constraint('con2', upper=0.)
+        prob.run_driver()
+
+        self.assertEqual(set(prob.driver._cons), {'con1', 'con2'})
+        assert_near_equal(prob.get_val('obj'), 3.18339395, 1e-6)
+        assert_near_equal(prob.get_val('z'), [1.97763888, 0.0], 1e-6)
+
+    def test_recorded_after_add(self):
+        prob = self.setup_problem()
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+        prob.run_driver()
+
+        prob.model.add_design_var('z', lower=np.array([-10.0, 0.0]),
+                                  upper=np.array([10.0, 10.0]))
+        prob.model.add_constraint('con2', upper=0.)
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+        self.assertIn('con2', cr.problem_metadata['variables'])
+
+        case = cr.get_case(cr.list_cases('driver', out_stream=None)[-1])
+        self.assertEqual(set(case.get_constraints()), {'con1', 'con2'})
+        self.assertEqual(set(case.get_design_vars()), {'x', 'z'})
+        assert_near_equal(case.get_constraints()['con2'], prob.get_val('con2'), 1e-12)
+
+    def test_setup_after_add(self):
+        # structural changes still need setup, which keeps variables added after a run
+        prob = om.Problem()
+        model = prob.model
+        comps = [model.add_subsystem('c1', om.ExecComp('y = 2.0 * x'), promotes=['*']),
+                 model.add_subsystem('c2', om.ExecComp('z = 3.0 * y'), promotes=['*'])]
+        model.add_design_var('x')
+        model.add_objective('y', index=0)
+        prob.setup()
+        prob.set_val('x', 3.0)
+        prob.run_model()
+
+        model.add_constraint('z', upper=100.)
+        prob.run_model()
+
+        # changing the variable shapes requires a full setup
+        for comp in comps:
+            comp.options['shape'] = (2,)
+        prob.setup()
+        prob.set_val('x', [3.0, 4.0])
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('z'), [18.0, 24.0], 1e-12)
+        self.assertEqual(set(model.get_constraints()), {'z'})
+        self.check_totals(prob, ['y', 'z'], ['x'])
+
+    def test_remove_errors(self):
+        prob = self.setup_problem()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.model.remove_design_var('z')
+        self.assertEqual(str(cm.exception),
+                         "<model> <class SellarDerivatives>: Design Variable 'z' does not exist.")
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.model.remove_response('con2')
+        self.assertEqual(str(cm.exception),
+                         "<model> <class SellarDerivatives>: Response 'con2' does not exist.")
+
+
 if __name__ == '__main__':
     unittest.main()
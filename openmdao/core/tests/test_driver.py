@@ -9,8 +9,9 @@ import unittest
 import numpy as np
 
 import openmdao.api as om
-from openmdao.core.driver import Driver
+from openmdao.core.driver import Driver, _VOIGatherPlan
 from openmdao.utils.units import convert_units
+from openmdao.utils.design_point_cache import DesignPointCache
 from openmdao.utils.assert_utils import assert_near_equal, assert_warnings, assert_check_totals, assert_no_warning
 from openmdao.utils.general_utils import printoptions, set_pyoptsparse_opt
 from openmdao.utils.testing_utils import use_tempdirs
@@ -1187,5 +1188,231 @@ class TestLinearOnlyDVs(unittest.TestCase):
             prob.run_driver()
 
 
+class TestVOIGatherPlan(unittest.TestCase):
+    def build_problem(self, discrete=False):
+        prob = om.Problem()
+        model = prob.model
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('x', np.arange(5, dtype=float))
+        ivc.add_output('z', np.array([3.0, -1.0]))
+        if discrete:
+            ivc.add_discrete_output('n', 2)
+        model.add_subsystem('comp', om.ExecComp(['y = 2.0 * x', 'f = sum(x**2) + sum(z**2)',
+                                                 'c = z[0] - z[1]'],
+                                                x=np.ones(5), y=np.ones(5), z=np.ones(2)))
+        model.connect('ivc.x', 'comp.x')
+        model.connect('ivc.z', 'comp.z')
+
+        model.add_design_var('ivc.z', lower=-10.0, upper=10.0, ref=2.0, ref0=-1.0)
+        model.add_design_var('ivc.x', indices=[4, 0, 2], lower=-10.0, upper=10.0, scaler=3.0)
+        if discrete:
+            model.add_design_var('ivc.n', lower=0, upper=4)
+        model.add_objective('comp.f', ref=10.0)
+        model.add_constraint('comp.y', indices=[1, 3], upper=5.0, adder=1.0)
+        model.add_constraint('comp.y', indices=[0], equals=0.0, alias='y0', ref=4.0)
+        model.add_constraint('comp.c', lower=0.0, linear=True)
+
+        prob.setup()
+        prob.run_model()
+        return prob
+
+    def test_gather(self):
+        prob = self.build_problem()
+        driver = prob.driver
+
+        for driver_scaling in (True, False):
+            for vals, vois, remote in [
+                (driver.get_design_var_values(driver_scaling=driver_scaling),
+                 driver._designvars, driver._remote_dvs),
+                (driver.get_objective_values(driver_scaling=driver_scaling),
+                 driver._objs, driver._remote_objs),
+                (driver.get_constraint_values(driver_scaling=driver_scaling),
+                 driver._cons, driver._remote_cons),
+            ]:
+                self.assertEqual(list(vals), list(vois))
+                for name, meta in vois.items():
+                    assert_near_equal(vals[name],
+                                      driver._get_voi_val(name, meta, remote,
+                                                          driver_scaling=driver_scaling), 1e-15)
+
+        self.assertIsInstance(driver._gather_plans[('dv',)], _VOIGatherPlan)
+
+        eq = driver.get_constraint_values(ctype='eq')
+        self.assertEqual(list(eq), ['y0'])
+        lin = driver.get_constraint_values(lintype='linear')
+        self.assertEqual(list(lin), ['comp.c'])
+        assert_near_equal(lin['comp.c'], [4.0], 1e-15)
+
+    def test_scatter(self):
+        prob = self.build_problem()
+        driver = prob.driver
+
+        x = np.array([0.5, -2.0, 7.0, 1.5, 3.0])
+        driver._scipy_update_design_vars(x)
+
+        assert_near_equal(prob.get_val('ivc.z'), 3.0 * x[:2] - 1.0, 1e-15)
+        assert_near_equal(prob.get_val('ivc.x')[[4, 0, 2]], x[2:] / 3.0, 1e-15)
+        # entries that aren't design variables are untouched
+        assert_near_equal(prob.get_val('ivc.x')[[1, 3]], [1.0, 3.0], 1e-15)
+
+        dvs = driver.get_design_var_values()
+        assert_near_equal(np.concatenate(list(dvs.values())), x, 1e-15)
+
+    def test_discrete_falls_back(self):
+        prob = self.build_problem(discrete=True)
+        driver = prob.driver
+
+        dvs = driver.get_design_var_values()
+        self.assertIsNone(driver._gather_plans[('dv',)])
+        self.assertEqual(dvs['ivc.n'], 2)
+        assert_near_equal(dvs['ivc.z'], (np.array([3.0, -1.0]) + 1.0) / 3.0, 1e-15)
+
+        # objectives and constraints still use a plan
+        driver.get_objective_values()
+        self.assertIsNotNone(driver._gather_plans[('obj',)])
+
+    def test_plans_reset_on_setup(self):
+        prob = self.build_problem()
+        driver = prob.driver
+        driver.get_design_var_values()
+        self.assertIn(('dv',), driver._gather_plans)
+
+        prob.setup()
+        prob.final_setup()
+        self.assertEqual(driver._gather_plans, {})
+
+
+class _RevisitDriver(Driver):
+    """Driver that evaluates a fixed sequence of design points, computing totals at each."""
+
+    def __init__(self, points, **kwargs):
+        super().__init__(**kwargs)
+        self.points = points
+        self.totals = []
+
+    def run(self):
+        for x in self.points:
+            self.set_design_var('x', x)
+            self._run_solve_nonlinear()
+            # the array returned for a newly computed jacobian is reused by the next computation
+            self.totals.append(self._compute_totals(of=['f_xy'], wrt=['x'],
+                                                    return_format='array').copy())
+        return False
+
+
+class TestDesignPointCache(unittest.TestCase):
+    def build_problem(self, driver):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('con', om.ExecComp('c = - x + y'), promotes=['*'])
+        model.set_input_defaults('x', 3.0)
+        model.set_input_defaults('y', -4.0)
+
+        model.add_design_var('x', lower=-50.0, upper=50.0)
+        model.add_design_var('y', lower=-50.0, upper=50.0)
+        model.add_objective('f_xy')
+        model.add_constraint('c', upper=-15.0)
+
+        prob.driver = driver
+        prob.setup()
+        return prob
+
+    def test_lru(self):
+        cache = DesignPointCache(2)
+        cache.add_state('a', 1)
+        cache.add_state('b', 2)
+        self.assertEqual(cache.get_state('a'), 1)
+        cache.add_state('c', 3)
+
+        # 'b' was the least recently used point
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('b', cache)
+        self.assertIsNone(cache.get_state('b'))
+
+        totals = np.ones(3)
+        cache.add_totals('c', 'J', totals)
+        totals[:] = 0.
+        assert_near_equal(cache.get_totals('c', 'J'), np.ones(3))
+        self.assertIsNone(cache.get_totals('a', 'J'))
+
+        # totals for an evicted point are not stored
+        cache.add_totals('b', 'J', totals)
+        self.assertNotIn('b', cache)
+
+        self.assertEqual(cache.hits, {'model': 1, 'deriv': 1})
+        self.assertEqual(cache.misses, {'model': 1, 'deriv': 1})
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, {'model': 0, 'deriv': 0})
+
+    def test_revisited_points(self):
+        driver = _RevisitDriver([1.0, 2.0, 1.0, 1.0], design_point_cache_size=10)
+        prob = self.build_problem(driver)
+        prob.run_driver()
+
+        cache = driver.design_point_cache
+        self.assertEqual(driver.result.model_evals, 2)
+        self.assertEqual(driver.result.deriv_evals, 2)
+        self.assertEqual(cache.hits, {'model': 2, 'deriv': 2})
+        self.assertEqual(cache.misses, {'model': 2, 'deriv': 2})
+
+        # df/dx = 2x - 6 + y
+        assert_near_equal(driver.totals[0], [[-8.]], 1e-9)
+        assert_near_equal(driver.totals[1], [[-6.]], 1e-9)
+        assert_near_equal(driver.totals[2], [[-8.]], 1e-9)
+        assert_near_equal(driver.totals[3], [[-8.]], 1e-9)
+        assert_near_equal(prob.get_val('f_xy'), (1.0 - 3.0)**2 + 1.0 * -4.0 + (-4.0 + 4.0)**2 - 3.0,
+                          1e-12)
+
+        # a second run starts with an empty cache
+        prob.run_driver()
+        self.assertEqual(cache.misses, {'model': 2, 'deriv': 2})
+
+    def test_totals_not_cached_for_stale_state(self):
+        class StaleDriver(Driver):
+            def run(self):
+                self._run_solve_nonlinear()
+                self.set_design_var('x', 5.0)
+                # the model hasn't been run at the new point
+                self._compute_totals(of=['f_xy'], wrt=['x'])
+                self._compute_totals(of=['f_xy'], wrt=['x'])
+                return False
+
+        driver = StaleDriver(design_point_cache_size=10)
+        self.build_problem(driver).run_driver()
+        self.assertEqual(driver.result.deriv_evals, 2)
+        self.assertEqual(driver.design_point_cache.hits['deriv'], 0)
+
+    def test_scipy_differential_evolution(self):
+        results = []
+        for size in (0, 1000):
+            driver = om.ScipyOptimizeDriver(optimizer='differential_evolution', maxiter=5,
+                                            disp=False, design_point_cache_size=size)
+            driver.opt_settings['seed'] = 11
+            prob = self.build_problem(driver)
+            prob.run_driver()
+            results.append((prob.get_val('x'), prob.get_val('y'), driver.result.model_evals))
+
+        assert_near_equal(results[1][0], results[0][0], 1e-15)
+        assert_near_equal(results[1][1], results[0][1], 1e-15)
+
+        # the constraint function re-runs the model at points the objective was evaluated at
+        cache = prob.driver.design_point_cache
+        self.assertGreater(cache.hits['model'], 0)
+        self.assertEqual(results[1][2], cache.misses['model'])
+        self.assertEqual(results[0][2], results[1][2] + cache.hits['model'])
+
+    def test_disabled_by_default(self):
+        driver = _RevisitDriver([1.0, 1.0])
+        prob = self.build_problem(driver)
+        prob.run_driver()
+        self.assertIsNone(driver.design_point_cache)
+        self.assertEqual(driver.result.model_evals, 2)
+        self.assertEqual(driver.result.deriv_evals, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 
 import itertools
+import sys
 import numpy as np
 import unittest
 
@@ -315,6 +316,74 @@ class MatMultTestCase(unittest.TestCase):
         self.assertLess(norm, 1.e-7)
 
 
+class FailingMatMultComp(MatMultComp):
+    def compute(self, inputs, outputs):
+        if self.under_finite_difference:
+            raise RuntimeError("bad perturbation")
+        super().compute(inputs, outputs)
+
+
+@unittest.skipIf(sys.platform == 'win32', "The process pool backend requires 'fork'.")
+@use_tempdirs
+class ProcessPoolFDTestCase(unittest.TestCase):
+
+    @parameterized.expand(itertools.product(['fd', 'cs'], [False, True]),
+                          name_func=_test_func_name)
+    def test_par_fd(self, method, colored):
+        # each output depends on a separate block of 4 inputs, so 4 colors are needed
+        mat = np.kron(np.eye(5), np.random.random(4) + 0.5)
+
+        p = om.Problem()
+        model = p.model
+
+        model.add_subsystem('indep', om.IndepVarComp('x', val=np.ones(mat.shape[1])))
+        comp = model.add_subsystem('comp', MatMultComp(mat, approx_method=method, sleep_time=0.,
+                                                       num_par_fd=3,
+                                                       par_fd_backend='process_pool'))
+        if colored:
+            comp.declare_coloring(wrt='*', method=method)
+
+        model.connect('indep.x', 'comp.x')
+
+        p.setup(mode='fwd', force_alloc_complex=(method == 'cs'))
+        p.run_model()
+
+        if colored:
+            # compute the dynamic coloring first, since that runs the component in this process
+            p.compute_totals(of=['comp.y'], wrt=['indep.x'])
+
+        comp.num_computes = 0
+
+        J = p.compute_totals(of=['comp.y'], wrt=['indep.x'])
+
+        assert_near_equal(J['comp.y', 'indep.x'], mat, 1e-6)
+        assert_near_equal(comp._jacobian['y', 'x'], mat, 1e-6)
+
+        # all perturbed points were run in the worker processes
+        self.assertEqual(comp.num_computes, 0)
+
+        if colored:
+            self.assertEqual(comp._coloring_info.coloring.total_solves(), 4)
+
+    def test_worker_error(self):
+        mat = np.random.random(12).reshape((3, 4))
+
+        p = om.Problem()
+        p.model.add_subsystem('comp', FailingMatMultComp(mat, approx_method='fd', sleep_time=0.,
+                                                         num_par_fd=2,
+                                                         par_fd_backend='process_pool'))
+        p.setup()
+        p.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            p.compute_totals(of=['comp.y'], wrt=['comp.x'])
+
+        msg = str(cm.exception)
+        self.assertTrue(msg.startswith("'comp' <class FailingMatMultComp>: Error during parallel "
+                                       "approximation of partial derivatives:"))
+        self.assertIn("RuntimeError: bad perturbation", msg)
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 @use_tempdirs
 class MatMultParallelTestCase(unittest.TestCase):
@@ -493,6 +562,18 @@ class ParFDErrorsMPITestCase(unittest.TestCase):
 
         self.assertEqual(str(ctx.exception), "'comp' <class MatMultComp>: num_par_fd is > 1 but no FD is active.")
 
+    def test_process_pool_under_mpi(self):
+        p = om.Problem()
+        p.model.add_subsystem('comp', MatMultComp(self.mat, approx_method='fd', num_par_fd=3,
+                                                  par_fd_backend='process_pool'))
+        with self.assertRaises(RuntimeError) as ctx:
+            p.setup()
+
+        self.assertEqual(str(ctx.exception),
+                         "'comp' <class MatMultComp>: par_fd_backend='process_pool' cannot be used "
+                         "when the component's communicator has more than one proc (comm size "
+                         "is 3). Use par_fd_backend='mpi' instead.")
+
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 @use_tempdirs
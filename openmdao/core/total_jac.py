@@ -1420,6 +1420,10 @@ class _TotalJacInfo(object):
 
                 # Main loop over columns (fwd) or rows (rev) of the jacobian
                 for mode in self.modes:
+                    if self._use_multi_rhs(mode):
+                        self._compute_totals_multi_rhs(mode)
+                        continue
+
                     fwd = mode == 'fwd'
                     for key, idx_info in self.idx_iter_dict[mode].items():
                         imeta, idx_iter = idx_info
@@ -1502,6 +1506,96 @@ class _TotalJacInfo(object):
 
         return self.J_final
 
+    def _use_multi_rhs(self, mode):
+        """
+        Return True if all seeds can be solved as a single block of right-hand sides.
+
+        The block solve isn't used if any of the seeds has 'cache_linear_solution' set, because
+        each of those solves has to start from its own cached solution.
+
+        Parameters
+        ----------
+        mode : str
+            Direction of derivative solution.
+
+        Returns
+        -------
+        bool
+            True if the model's linear solver can solve multiple right-hand sides at once.
+        """
+        model = self.model
+        if (self.directional or self.comm.size > 1 or model._owns_approx_jac or
+                model.under_complex_step or not model._linear_solver.can_solve_multi_rhs()):
+            return False
+
+        if not self.has_lin_cons and self.mode == mode:
+            return not any(meta['cache_linear_solution'] for meta in self.input_meta[mode].values())
+
+        return True
+
+    def _compute_totals_multi_rhs(self, mode):
+        """
+        Compute the total jacobian for the given mode using a single block linear solve.
+
+        Each seed (or color) is set into the input vector using the usual input setter and
+        stored as a column of a right-hand side block. The block is solved with the seed
+        variables of all of its columns active. After one call to the linear solver, each column
+        of the solution is placed into the output vector and the usual jac setter copies it into
+        the jacobian.
+
+        Parameters
+        ----------
+        mode : str
+            Direction of derivative solution.
+        """
+        model = self.model
+        input_vec = self.input_vec[mode]
+        output_vec = self.output_vec[mode]
+
+        columns = []
+        setters = []
+        seed_vars = set()
+        for key, idx_info in self.idx_iter_dict[mode].items():
+            imeta, idx_iter = idx_info
+            for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode):
+                input_setter(inds, itermeta, mode)
+                columns.append(input_vec.asarray(copy=True))
+                setters.append((inds, jac_setter, imeta))
+                seed_vars.update(itermeta['seed_vars'])
+                model._problem_meta['parallel_deriv_color'] = None
+
+        if not columns:
+            return
+
+        if self.debug_print:
+            print(f"In mode: {mode}.\nSolving {len(columns)} right-hand sides as a single block",
+                  flush=True)
+            t0 = time.perf_counter()
+
+        seed_vars = tuple(sorted(seed_vars))
+        if mode == 'fwd':
+            fwd_seeds = seed_vars
+            rev_seeds = None
+        else:
+            fwd_seeds = None
+            rev_seeds = seed_vars
+
+        model._problem_meta['seed_vars'] = seed_vars
+        try:
+            with self.relevance.seeds_active(fwd_seeds=fwd_seeds, rev_seeds=rev_seeds):
+                sol = model._linear_solver.solve_multi_rhs(np.stack(columns, axis=1), mode)
+        finally:
+            model._problem_meta['seed_vars'] = None
+        self.nsolves += len(columns)
+
+        if self.debug_print:
+            print(f'Elapsed Time: {time.perf_counter() - t0} secs\n', flush=True)
+
+        self._zero_vecs(mode)
+        for i, (inds, jac_setter, imeta) in enumerate(setters):
+            output_vec.set_val(sol[:, i])
+            jac_setter(inds, mode, imeta)
+
     def _compute_totals_approx(self, progress_out_stream=None):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
@@ -720,7 +720,7 @@ def show_dist_var_conns(group, rev=False, out_stream=_DEFAULT_OUT_STREAM):
                         gprint = True
 
                     conns = {}
-                    for iidx, oidx in zip(transfer._in_inds, transfer._out_inds):
+                    for iidx, oidx in zip(*transfer._get_full_indices()):
                         idata, irind = inmapper.index2key_rel(iidx)
                         ivar, irank = idata
                         odata, orind = outmapper.index2key_rel(oidx)
@@ -4,6 +4,7 @@ AnalysisDriver definition.
 from collections import deque
 from collections.abc import Iterable
 import itertools
+import time
 import traceback
 
 from openmdao.core.driver import Driver, RecordingDebugging
@@ -11,6 +12,7 @@ from openmdao.core.analysis_error import AnalysisError
 
 from openmdao.drivers.analysis_generator import AnalysisGenerator, SequenceGenerator
 from openmdao.utils.mpi import MPI
+from openmdao.utils.concurrent_utils import concurrent_eval_pool
 from openmdao.utils.om_warnings import issue_warning, DriverWarning
 
 
@@ -95,6 +97,15 @@ class AnalysisDriver(Driver):
                              'large.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('parallel_backend', values=['mpi', 'process_pool'], default='mpi',
+                             desc='How samples are executed when run_parallel is True. With '
+                             '"mpi", samples are distributed among the procs of the MPI '
+                             'communicator. With "process_pool", samples are run in a pool of '
+                             'local processes forked from the current one, which does not '
+                             'require MPI.')
+        self.options.declare('num_workers', types=int, default=None, lower=1, allow_none=True,
+                             desc='Number of worker processes to use when parallel_backend is '
+                             '"process_pool". If None, the number of CPUs is used.')
 
     def add_response(self, name, indices=None, units=None,
                      linear=False, parallel_deriv_color=None,
@@ -243,7 +254,13 @@ class AnalysisDriver(Driver):
         self._allowable_vars = model_inputs | model_implicit_outputs
         n_procs = 1 if comm is None else comm.size
 
-        if self.options['run_parallel'] and MPI and n_procs > 1:
+        if self.options['run_parallel'] and self.options['parallel_backend'] == 'process_pool':
+            if n_procs > 1:
+                raise RuntimeError(f"{self.msginfo}: parallel_backend='process_pool' cannot be "
+                                   "used when running under MPI with more than one proc.")
+            self._run_process_pool()
+
+        elif self.options['run_parallel'] and MPI and n_procs > 1:
             batch_size = self.options['batch_size']
             color_cycler = itertools.cycle(range(self._num_colors))
             samples_complete = False
@@ -301,6 +318,31 @@ class AnalysisDriver(Driver):
         """
         Run case, save exception info and mark the metadata if the case fails.
 
+        Parameters
+        ----------
+        sample : dict
+            A dictionary keyed by variable name with each value being
+            a dictionary with a 'val' key, and optionally keys for
+            'units' and 'indices'.
+        sample_num : int
+            The iteration of the AnalysisDriver to which this case corresponds.
+        """
+        self._set_sample(sample, sample_num)
+
+        with RecordingDebugging(self._get_name(), self.iter_count, self):
+            # save reference to metadata for use in record_iteration
+            self._metadata = self._solve_sample()
+
+        if self.recording_options['record_derivatives']:
+            self._compute_totals(of=list(self._responses.keys()),
+                                 wrt=list(self._get_sampled_vars()),
+                                 return_format=self._total_jac_format,
+                                 driver_scaling=False)
+
+    def _set_sample(self, sample, sample_num):
+        """
+        Set the model variables to the values given in the sample.
+
         Parameters
         ----------
         sample : dict
@@ -313,7 +355,6 @@ class AnalysisDriver(Driver):
         comm = self._problem_comm
         rank = 0 if self._problem_comm is None else comm.rank
         self.iter_count = sample_num
-        metadata = {}
 
         sample_vars = set()
 
@@ -343,27 +384,81 @@ class AnalysisDriver(Driver):
                           category=DriverWarning)
         self._prev_sample_vars = sample_vars
 
-        with RecordingDebugging(self._get_name(), self.iter_count, self):
-            try:
-                self._run_solve_nonlinear()
-                metadata['success'] = 1
-                metadata['msg'] = ''
-            except AnalysisError:
-                metadata['success'] = 0
-                metadata['msg'] = traceback.format_exc()
-            except Exception:
-                metadata['success'] = 0
-                metadata['msg'] = traceback.format_exc()
-                print(metadata['msg'])
+    def _solve_sample(self):
+        """
+        Run the model for the current sample, saving exception info if the sample fails.
 
-            # save reference to metadata for use in record_iteration
-            self._metadata = metadata
+        Returns
+        -------
+        dict
+            Metadata indicating the success of the sample and any error message.
+        """
+        metadata = {}
 
-        if self.recording_options['record_derivatives']:
-            self._compute_totals(of=list(self._responses.keys()),
-                                 wrt=list(self._get_sampled_vars()),
-                                 return_format=self._total_jac_format,
-                                 driver_scaling=False)
+        try:
+            self._run_solve_nonlinear()
+            metadata['success'] = 1
+            metadata['msg'] = ''
+        except AnalysisError:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+        except Exception:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+            print(metadata['msg'])
+
+        return metadata
+
+    def _run_process_pool(self):
+        """
+        Run all samples in a pool of local processes and record the results in this process.
+        """
+        samples = (((sample, sample_num), None)
+                   for sample_num, sample in enumerate(self._generator))
+
+        for sample_num, retval, err in concurrent_eval_pool(self._run_pool_sample, samples,
+                                                            self.options['num_workers'],
+                                                            initializer=self._init_pool_worker):
+            if err is not None:
+                raise RuntimeError(f"{self.msginfo}: Error running sample {sample_num}:\n{err}")
+
+            state, metadata, model_time = retval
+            self._set_pool_model_state(state)
+            self.result.model_evals += 1
+            self.result.model_time += model_time
+
+            self.iter_count = sample_num
+            with RecordingDebugging(self._get_name(), self.iter_count, self):
+                self._metadata = metadata
+
+            if self.recording_options['record_derivatives']:
+                self._compute_totals(of=list(self._responses.keys()),
+                                     wrt=list(self._get_sampled_vars()),
+                                     return_format=self._total_jac_format,
+                                     driver_scaling=False)
+
+    def _run_pool_sample(self, sample, sample_num):
+        """
+        Run a single sample in a process pool worker.
+
+        Parameters
+        ----------
+        sample : dict
+            A dictionary keyed by variable name with each value being
+            a dictionary with a 'val' key, and optionally keys for
+            'units' and 'indices'.
+        sample_num : int
+            The iteration of the AnalysisDriver to which this case corresponds.
+
+        Returns
+        -------
+        tuple
+            The resulting model state, the sample metadata and the time spent running the model.
+        """
+        self._set_sample(sample, sample_num)
+        start = time.perf_counter()
+        metadata = self._solve_sample()
+        return self._get_pool_model_state(), metadata, time.perf_counter() - start
 
     def _get_sampled_vars(self):
         """
@@ -4,6 +4,7 @@ Design-of-Experiments Driver.
 
 import traceback
 import inspect
+import time
 
 import numpy as np
 
@@ -12,6 +13,7 @@ from openmdao.core.analysis_error import AnalysisError
 from openmdao.drivers.doe_generators import DOEGenerator, ListGenerator
 
 from openmdao.utils.mpi import MPI
+from openmdao.utils.concurrent_utils import concurrent_eval_pool
 
 
 class DOEDriver(Driver):
@@ -88,6 +90,15 @@ class DOEDriver(Driver):
                              desc='Set to True to execute cases in parallel.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('parallel_backend', values=['mpi', 'process_pool'], default='mpi',
+                             desc='How cases are executed when run_parallel is True. With '
+                             '"mpi", cases are distributed among the procs of the MPI '
+                             'communicator. With "process_pool", cases are run in a pool of '
+                             'local processes forked from the current one, which does not '
+                             'require MPI.')
+        self.options.declare('num_workers', types=int, default=None, lower=1, allow_none=True,
+                             desc='Number of worker processes to use when parallel_backend is '
+                             '"process_pool". If None, the number of CPUs is used.')
 
     def _setup_comm(self, comm):
         """
@@ -182,6 +193,10 @@ class DOEDriver(Driver):
         for name, _ in self._cons.items():
             self._quantities.append(name)
 
+        if self.options['run_parallel'] and self.options['parallel_backend'] == 'process_pool':
+            self._run_process_pool()
+            return False
+
         if MPI and self.options['run_parallel']:
             case_gen = self._parallel_generator
         else:
@@ -202,8 +217,27 @@ class DOEDriver(Driver):
         case : list
             list of name, value tuples for the design variables.
         """
-        metadata = {}
+        self._set_case(case)
+
+        with RecordingDebugging(self._get_name(), self.iter_count, self):
+            # save reference to metadata for use in record_iteration
+            self._metadata = self._solve_case()
+
+        if self.recording_options['record_derivatives']:
+            self._compute_totals(of=self._quantities,
+                                 wrt=self._indep_list,
+                                 return_format=self._total_jac_format,
+                                 driver_scaling=False)
 
+    def _set_case(self, case):
+        """
+        Set the design variables to the values for the given case.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        """
         for dv_name, dv_val in case:
             try:
                 msg = None
@@ -217,27 +251,87 @@ class DOEDriver(Driver):
                 if msg:
                     raise ValueError(msg)
 
-        with RecordingDebugging(self._get_name(), self.iter_count, self):
-            try:
-                self._run_solve_nonlinear()
-                metadata['success'] = 1
-                metadata['msg'] = ''
-            except AnalysisError:
-                metadata['success'] = 0
-                metadata['msg'] = traceback.format_exc()
-            except Exception:
-                metadata['success'] = 0
-                metadata['msg'] = traceback.format_exc()
-                print(metadata['msg'])
+    def _solve_case(self):
+        """
+        Run the model for the current case, saving exception info if the case fails.
 
-            # save reference to metadata for use in record_iteration
-            self._metadata = metadata
+        Returns
+        -------
+        dict
+            Metadata indicating the success of the case and any error message.
+        """
+        metadata = {}
 
-        if self.recording_options['record_derivatives']:
-            self._compute_totals(of=self._quantities,
-                                 wrt=self._indep_list,
-                                 return_format=self._total_jac_format,
-                                 driver_scaling=False)
+        try:
+            self._run_solve_nonlinear()
+            metadata['success'] = 1
+            metadata['msg'] = ''
+        except AnalysisError:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+        except Exception:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+            print(metadata['msg'])
+
+        return metadata
+
+    def _run_process_pool(self):
+        """
+        Run all cases in a pool of local processes and record the results in this process.
+        """
+        comm = self._problem_comm
+        if comm is not None and comm.size > 1:
+            raise RuntimeError(f"{self.msginfo}: parallel_backend='process_pool' cannot be "
+                               "used when running under MPI with more than one proc.")
+
+        cases = (((case,), None)
+                 for case in self.options['generator'](self._designvars, self._problem().model))
+
+        ncases = 0
+        for case_num, retval, err in concurrent_eval_pool(self._run_pool_case, cases,
+                                                          self.options['num_workers'],
+                                                          initializer=self._init_pool_worker):
+            if err is not None:
+                raise RuntimeError(f"{self.msginfo}: Error running case {case_num}:\n{err}")
+
+            state, metadata, model_time = retval
+            self._set_pool_model_state(state)
+            self.result.model_evals += 1
+            self.result.model_time += model_time
+
+            # record under the iteration number the case would have had if run serially
+            self.iter_count = case_num
+            with RecordingDebugging(self._get_name(), self.iter_count, self):
+                self._metadata = metadata
+
+            if self.recording_options['record_derivatives']:
+                self._compute_totals(of=self._quantities,
+                                     wrt=self._indep_list,
+                                     return_format=self._total_jac_format,
+                                     driver_scaling=False)
+            ncases += 1
+
+        self.iter_count = ncases
+
+    def _run_pool_case(self, case):
+        """
+        Run a single case in a process pool worker.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+
+        Returns
+        -------
+        tuple
+            The resulting model state, the case metadata and the time spent running the model.
+        """
+        self._set_case(case)
+        start = time.perf_counter()
+        metadata = self._solve_case()
+        return self._get_pool_model_state(), metadata, time.perf_counter() - start
 
     def _parallel_generator(self, design_vars, model=None):
         """
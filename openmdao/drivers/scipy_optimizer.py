@@ -3,6 +3,7 @@ OpenMDAO Wrapper for the scipy.optimize.minimize family of local optimizers.
 """
 
 import sys
+from collections import defaultdict, namedtuple
 from packaging.version import Version
 
 import numpy as np
@@ -68,6 +69,14 @@ if Version(scipy_version) >= Version("1.14"):
     _supports_new_style.add('COBYQA')
 _use_new_style = True  # Recommended to set to True
 
+# A group of constraints that is passed to scipy as a single vector function.  ctype is 'eq' or
+# 'ineq' for constraint dicts or None for NonlinearConstraint/LinearConstraint objects, vidx and
+# rows index into the flat constraint values and the rows of the total jacobian, sign and offset
+# convert values into the form expected by constraint dicts, and lower and upper are the bounds
+# of NonlinearConstraint/LinearConstraint objects.
+_ConGroup = namedtuple('_ConGroup',
+                       ['ctype', 'linear', 'vidx', 'rows', 'sign', 'offset', 'lower', 'upper'])
+
 CITATIONS = """
 @article{Hwang_maud_2018
  author = {Hwang, John T. and Martins, Joaquim R.R.A.},
@@ -118,7 +127,13 @@ class ScipyOptimizeDriver(Driver):
     _con_cache : dict
         Cached result of constraint evaluations because scipy asks for them in a separate function.
     _con_idx : dict
-        Used for constraint bookkeeping in the presence of 2-sided constraints.
+        Starting row of each constraint in the total jacobian of the nonlinear or the linear
+        constraints.
+    _con_array : ndarray or None
+        Flat array of the values in _con_cache, created on demand.
+    _con_groups : dict
+        Groups of constraints that are each passed to scipy as a single vector function, keyed
+        by group name.
     _grad_cache : {}
         Cached result of nonlinear constraint derivatives because scipy asks for them in a separate
         function.
@@ -161,6 +176,8 @@ class ScipyOptimizeDriver(Driver):
         self._grad_cache = None
         self._con_cache = None
         self._con_idx = {}
+        self._con_array = None
+        self._con_groups = {}
         self._obj_and_nlcons = None
         self._dvlist = None
         self._lincongrad_cache = None
@@ -275,6 +292,7 @@ class ScipyOptimizeDriver(Driver):
             self.iter_count += 1
 
         self._con_cache = self.get_constraint_values()
+        self._con_array = None
         desvar_vals = self.get_design_var_values()
         self._dvlist = list(self._designvars)
 
@@ -366,18 +384,14 @@ class ScipyOptimizeDriver(Driver):
             else:
                 self._lincongrad_cache = None
 
-            # map constraints to index and instantiate constraints for scipy
+            # map constraints to index
             for name, meta in self._cons.items():
                 if meta['indices'] is not None:
                     meta['size'] = size = meta['indices'].indexed_src_size
                 else:
                     size = meta['global_size'] if meta['distributed'] else meta['size']
-                upper = meta['upper']
-                lower = meta['lower']
-                equals = meta['equals']
-                linear = name in lincons
 
-                if linear:
+                if name in lincons:
                     self._con_idx[name] = lin_i
                     lin_i += size
                 else:
@@ -385,78 +399,43 @@ class ScipyOptimizeDriver(Driver):
                     self._con_idx[name] = nl_i
                     nl_i += size
 
-                # In scipy constraint optimizers take constraints in two separate formats
-
-                if opt in _supports_new_style and _use_new_style:
-                    # Type of constraints is list of NonlinearConstraint and/or LinearConstraint
-                    try:
-                        from scipy.optimize import NonlinearConstraint, LinearConstraint
-                    except ImportError:
-                        msg = ('The "trust-constr" optimizer is supported for SciPy 1.1.0 and'
-                               'above. The installed version is {}')
-                        raise ImportError(msg.format(scipy_version))
-
-                    if equals is not None:
-                        lb = ub = equals
+            # In scipy constraint optimizers take constraints in two separate formats
+            if opt in _supports_new_style and _use_new_style:
+                # Type of constraints is list of NonlinearConstraint and/or LinearConstraint
+                try:
+                    from scipy.optimize import NonlinearConstraint, LinearConstraint
+                except ImportError:
+                    msg = ('The "trust-constr" optimizer is supported for SciPy 1.1.0 and'
+                           'above. The installed version is {}')
+                    raise ImportError(msg.format(scipy_version))
+
+                self._setup_con_groups(lincons, new_style=True)
+                for group, grp in self._con_groups.items():
+                    if grp.linear:
+                        con = LinearConstraint(A=self._vec_congradfunc(x_init, group),
+                                               lb=grp.lower, ub=grp.upper, keep_feasible=True)
                     else:
-                        lb = lower
-                        ub = upper
-
-                    if linear:
-                        # LinearConstraint
-                        con = LinearConstraint(A=lincongrad[self._con_idx[name]],
-                                               lb=lower, ub=upper, keep_feasible=True)
-                    else:
-                        # NonlinearConstraint
-                        # Loop over every index separately,
-                        # because scipy calls each constraint by index.
-                        for j in range(size):
-                            # TODO add option for Hessian
-                            # Double-sided constraints are accepted by the algorithm
-                            args = [name, False, j]
-                            con = NonlinearConstraint(
-                                fun=signature_extender(
-                                    WeakMethodWrapper(self, '_con_val_func'), args),
-                                lb=lb, ub=ub,
-                                jac=signature_extender(
-                                    WeakMethodWrapper(self, '_congradfunc'), args)
-                            )
-
+                        # TODO add option for Hessian
+                        # Double-sided constraints are accepted by the algorithm
+                        con = NonlinearConstraint(
+                            fun=signature_extender(WeakMethodWrapper(self, '_vec_confunc'),
+                                                   [group]),
+                            lb=grp.lower, ub=grp.upper,
+                            jac=signature_extender(WeakMethodWrapper(self, '_vec_congradfunc'),
+                                                   [group]))
                     constraints.append(con)
-                else:
-                    # Type of constraints is list of dict
-
-                    # Loop over every index separately,
-                    # because scipy calls each constraint by index.
-                    for j in range(size):
-                        con_dict = {}
-                        if meta['equals'] is not None:
-                            con_dict['type'] = 'eq'
-                        else:
-                            con_dict['type'] = 'ineq'
-                        con_dict['fun'] = WeakMethodWrapper(self, '_confunc')
-                        if opt in _constraint_grad_optimizers:
-                            con_dict['jac'] = WeakMethodWrapper(self, '_congradfunc')
-                        con_dict['args'] = [name, False, j]
-                        constraints.append(con_dict)
-
-                        if isinstance(upper, np.ndarray):
-                            upper = upper[j]
-
-                        if isinstance(lower, np.ndarray):
-                            lower = lower[j]
-
-                        dblcon = (upper < INF_BOUND) and (lower > -INF_BOUND)
-
-                        # Add extra constraint if double-sided
-                        if dblcon:
-                            dcon_dict = {}
-                            dcon_dict['type'] = 'ineq'
-                            dcon_dict['fun'] = WeakMethodWrapper(self, '_confunc')
-                            if opt in _constraint_grad_optimizers:
-                                dcon_dict['jac'] = WeakMethodWrapper(self, '_congradfunc')
-                            dcon_dict['args'] = [name, True, j]
-                            constraints.append(dcon_dict)
+            else:
+                # Type of constraints is list of dict
+                self._setup_con_groups(lincons, new_style=False)
+                for group, grp in self._con_groups.items():
+                    con_dict = {
+                        'type': grp.ctype,
+                        'fun': WeakMethodWrapper(self, '_vec_confunc'),
+                        'args': [group],
+                    }
+                    if opt in _constraint_grad_optimizers:
+                        con_dict['jac'] = WeakMethodWrapper(self, '_vec_congradfunc')
+                    constraints.append(con_dict)
 
         # Provide gradients for optimizers that support it
         if opt in _gradient_optimizers:
@@ -637,6 +616,7 @@ class ScipyOptimizeDriver(Driver):
                 break
 
             self._con_cache = self.get_constraint_values()
+            self._con_array = None
 
         except Exception:
             if self._exc_info is None:  # only record the first one
@@ -650,85 +630,182 @@ class ScipyOptimizeDriver(Driver):
 
         return f_new
 
-    def _con_val_func(self, x_new, name, dbl, idx):
+    def _setup_con_groups(self, lincons, new_style):
         """
-        Return the value of the constraint function requested in args.
+        Group the constraints so that each group is passed to scipy as a single vector function.
 
-        The lower or upper bound is **not** subtracted from the value. Used for optimizers,
-        which take the bounds of the constraints (e.g. trust-constr)
+        Index arrays mapping each group's entries into the flat array of constraint values and
+        into the rows of the total jacobian, along with the bounds, are computed here once so
+        that the functions called by scipy only have to do array operations.
+
+        Parameters
+        ----------
+        lincons : list of str
+            Names of the linear constraints.
+        new_style : bool
+            If True, make groups for NonlinearConstraint and LinearConstraint objects, where
+            scipy applies the bounds.  Otherwise make groups of 'eq' and 'ineq' constraint
+            dicts, where the bounds are applied here so that the constraints are satisfied when
+            zero or positive, respectively.
+        """
+        entries = defaultdict(lambda: ([], [], [], [], []))
+        start = 0
+
+        for name, meta in self._cons.items():
+            if meta['indices'] is not None or not meta['distributed']:
+                size = meta['size']
+            else:
+                size = meta['global_size']
+            linear = name in lincons
+            vidx = np.arange(start, start + size)
+            rows = vidx - start + self._con_idx[name]
+            start += size
+
+            equals = meta['equals']
+            if equals is not None:
+                lower = upper = np.broadcast_to(equals, (size,))
+            else:
+                lower = np.broadcast_to(meta['lower'], (size,))
+                upper = np.broadcast_to(meta['upper'], (size,))
+
+            if new_style:
+                ent = entries['linear' if linear else 'nonlinear']
+                ent[0].append(vidx)
+                ent[1].append(rows)
+                ent[3].append(lower)
+                ent[4].append(upper)
+            elif equals is not None:
+                ent = entries['linear_eq' if linear else 'eq']
+                ent[0].append(vidx)
+                ent[1].append(rows)
+                ent[2].append(np.ones(size))
+                ent[3].append(-lower)
+            else:
+                # Note, scipy defines constraints to be satisfied when positive,
+                # which is the opposite of OpenMDAO.  Entries with a lower bound give
+                # val - lower and entries with an upper bound (or no bounds at all) give
+                # upper - val, so double-sided entries appear twice.
+                ent = entries['linear_ineq' if linear else 'ineq']
+                has_lower = lower > -INF_BOUND
+                has_upper = (upper < INF_BOUND) | ~has_lower
+                ent[0].extend((vidx[has_lower], vidx[has_upper]))
+                ent[1].extend((rows[has_lower], rows[has_upper]))
+                ent[2].extend((np.ones(np.count_nonzero(has_lower)),
+                               -np.ones(np.count_nonzero(has_upper))))
+                ent[3].extend((-lower[has_lower], upper[has_upper]))
+
+        self._con_groups = groups = {}
+        for group, (vidx, rows, sign, lower, upper) in entries.items():
+            vidx = np.concatenate(vidx)
+            rows = np.concatenate(rows)
+            if vidx.size == 0:
+                continue
+
+            # use slices where possible to avoid copying
+            if np.all(np.diff(vidx) == 1):
+                vidx = slice(vidx[0], vidx[-1] + 1)
+            if np.all(np.diff(rows) == 1):
+                rows = slice(rows[0], rows[-1] + 1)
+
+            if new_style:
+                groups[group] = _ConGroup(None, group == 'linear', vidx, rows, None, None,
+                                          np.concatenate(lower), np.concatenate(upper))
+            else:
+                sign = np.concatenate(sign)
+                groups[group] = _ConGroup('ineq' if group.endswith('ineq') else 'eq',
+                                          group.startswith('linear'), vidx, rows,
+                                          None if np.all(sign > 0.) else sign,
+                                          np.concatenate(lower), None, None)
+
+    def _get_con_array(self):
+        """
+        Return the values of all constraints as a flat array.
+
+        Returns
+        -------
+        ndarray
+            Flat array of constraint values, in the order of self._cons.
+        """
+        if self._con_array is None:
+            cons = self._con_cache
+            self._con_array = np.concatenate([np.ravel(cons[name]) for name in self._cons])
+        return self._con_array
+
+    def _vec_confunc(self, x_new, group):
+        """
+        Return the values of all constraints in the given constraint group.
+
+        Note that this function is called for each constraint group, so the model is only run
+        when the objective is evaluated.
 
         Parameters
         ----------
         x_new : ndarray
             Array containing input values at new design point.
-        name : str
-            Name of the constraint to be evaluated.
-        dbl : bool
-            True if double sided constraint.
-        idx : float
-            Contains index into the constraint array.
+        group : str
+            Name of the constraint group.
 
         Returns
         -------
-        float
-            Value of the constraint function.
+        ndarray
+            Values of the constraint functions.
         """
-        if self.options['optimizer'] in ['differential_evolution', 'COBYQA']:
-            # the DE opt will not have called this, so we do it here to update DV/resp values
-            self._objfunc(x_new)
+        if self._exc_info is not None:
+            self._reraise()
+
+        grp = self._con_groups[group]
+
+        if grp.ctype is None:
+            # The bounds are **not** subtracted from the values. Used for optimizers,
+            # which take the bounds of the constraints (e.g. trust-constr)
+            if self.options['optimizer'] in ['differential_evolution', 'COBYQA']:
+                # the DE opt will not have called this, so we do it here to update DV/resp values
+                self._objfunc(x_new)
+            return self._get_con_array()[grp.vidx]
 
-        return self._con_cache[name][idx]
+        vals = self._get_con_array()[grp.vidx]
+        if grp.sign is not None:
+            vals = vals * grp.sign
+        return vals + grp.offset
 
-    def _confunc(self, x_new, name, dbl, idx):
+    def _vec_congradfunc(self, x_new, group):
         """
-        Return the value of the constraint function requested in args.
+        Return the cached gradients of all constraints in the given constraint group.
 
-        Note that this function is called for each constraint, so the model is only run when the
-        objective is evaluated.
+        Note, gradients of nonlinear constraints are cached when the objective gradient is
+        computed.
 
         Parameters
         ----------
         x_new : ndarray
             Array containing input values at new design point.
-        name : str
-            Name of the constraint to be evaluated.
-        dbl : bool
-            True if double sided constraint.
-        idx : float
-            Contains index into the constraint array.
+        group : str
+            Name of the constraint group.
 
         Returns
         -------
-        float
-            Value of the constraint function.
+        ndarray
+            Gradients of the constraint functions wrt all inputs.
         """
         if self._exc_info is not None:
             self._reraise()
 
-        cons = self._con_cache
-        meta = self._cons[name]
+        grp = self._con_groups[group]
 
-        # Equality constraints
-        equals = meta['equals']
-        if equals is not None:
-            if isinstance(equals, np.ndarray):
-                equals = equals[idx]
-            return cons[name][idx] - equals
-
-        # Note, scipy defines constraints to be satisfied when positive,
-        # which is the opposite of OpenMDAO.
-        upper = meta['upper']
-        if isinstance(upper, np.ndarray):
-            upper = upper[idx]
+        if grp.linear:
+            grad = self._lincongrad_cache
+        else:
+            if self._grad_cache is None:
+                # _gradfunc has not been called, meaning gradients are not
+                # used for the objective but are needed for the constraints
+                self._gradfunc(x_new)
+            grad = self._grad_cache
 
-        lower = meta['lower']
-        if isinstance(lower, np.ndarray):
-            lower = lower[idx]
+        grad = grad[grp.rows]
+        if grp.sign is not None:
+            grad = grad * grp.sign[:, np.newaxis]
 
-        if dbl or (lower <= -INF_BOUND):
-            return upper - cons[name][idx]
-        else:
-            return cons[name][idx] - lower
+        return grad
 
     def _gradfunc(self, x_new):
         """
@@ -776,64 +853,6 @@ class ScipyOptimizeDriver(Driver):
 
         return grad[0, :]
 
-    def _congradfunc(self, x_new, name, dbl, idx):
-        """
-        Return the cached gradient of the constraint function.
-
-        Note, scipy calls the constraints one at a time, so the gradient is cached when the
-        objective gradient is called.
-
-        Parameters
-        ----------
-        x_new : ndarray
-            Array containing input values at new design point.
-        name : str
-            Name of the constraint to be evaluated.
-        dbl : bool
-            Denotes if a constraint is double-sided or not.
-        idx : float
-            Contains index into the constraint array.
-
-        Returns
-        -------
-        float
-            Gradient of the constraint function wrt all inputs.
-        """
-        if self._exc_info is not None:
-            self._reraise()
-
-        meta = self._cons[name]
-
-        if meta['linear']:
-            grad = self._lincongrad_cache
-        else:
-            if self._grad_cache is None:
-                # _gradfunc has not been called, meaning gradients are not
-                # used for the objective but are needed for the constraints
-                self._gradfunc(x_new)
-            grad = self._grad_cache
-
-        grad_idx = self._con_idx[name] + idx
-
-        # print("Constraint Gradient returned")
-        # print('   xnew', x_new)
-        # print('   grad', name, 'idx', idx, grad[grad_idx, :])
-
-        # Equality constraints
-        if meta['equals'] is not None:
-            return grad[grad_idx, :]
-
-        # Note, scipy defines constraints to be satisfied when positive,
-        # which is the opposite of OpenMDAO.
-        lower = meta['lower']
-        if isinstance(lower, np.ndarray):
-            lower = lower[idx]
-
-        if dbl or (lower <= -INF_BOUND):
-            return -grad[grad_idx, :]
-        else:
-            return grad[grad_idx, :]
-
 
 def signature_extender(fcn, extra_args):
     """
@@ -373,6 +373,38 @@ class TestAnalysisDriverParallel(unittest.TestCase):
 @use_tempdirs
 class TestAnalysisDriver(unittest.TestCase):
 
+    def test_process_pool(self):
+        """
+        Test AnalysisDriver running samples in a local process pool.
+        """
+        prob = om.Problem(reports=None)
+
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+
+        prob.driver = om.AnalysisDriver(samples=fullfact3, run_parallel=True,
+                                        parallel_backend='process_pool', num_workers=4)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+        prob.driver.recording_options.set(record_derivatives=True)
+
+        prob.driver.add_response('f_xy', units=None, indices=[0])
+
+        prob.setup()
+        result = prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / "cases.sql")
+        case_numbers = set()
+        for case in cr.get_cases(source='driver'):
+            case_number = int(case.name.split('|')[-1])
+            case_numbers.add(case_number)
+            assert_near_equal(case.get_val('f_xy'), expected_fullfact3[case_number]['f_xy'])
+            for wrt in ['x', 'y']:
+                expected_deriv = expected_fullfact3_derivs[case_number]['f_xy', wrt]
+                assert_near_equal(case.derivatives['f_xy', wrt], np.atleast_2d(expected_deriv))
+
+        self.assertSetEqual(case_numbers, set(range(9)))
+        self.assertEqual(result.model_evals, 9)
+
     def test_changing_sample_vars(self):
         """
         Test AnalysisDriver when the variables changed in the samples are changing.
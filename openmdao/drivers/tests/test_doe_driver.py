@@ -1589,6 +1589,66 @@ class TestDOEDriver(unittest.TestCase):
             derivs = cr.get_case(case).derivatives
             self.assertIsNone(derivs)
 
+    def test_process_pool(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.set_input_defaults('x', 0.0)
+        model.set_input_defaults('y', 0.0)
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(self.fullfact3, run_parallel=True,
+                                   parallel_backend='process_pool', num_workers=3)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+        prob.driver.recording_options['record_derivatives'] = True
+
+        prob.setup()
+        result = prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / "cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+
+        self.assertEqual(len(cases), 9)
+
+        # cases are recorded as they complete, but are named by their position in the DOE
+        for case_name in cases:
+            case = cr.get_case(case_name)
+            idx = int(case_name.split('|')[-1])
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(case.outputs[name], self.expected_fullfact3[idx][name])
+            for dv in ('x', 'y'):
+                self.assertEqual(case.derivatives['f_xy', dv],
+                                 self.expected_fullfact3_derivs[idx]['f_xy', dv])
+
+        self.assertEqual(result.iter_count, 9)
+        self.assertEqual(result.model_evals, 9)
+        self.assertEqual(result.deriv_evals, 9)
+
+    def test_process_pool_case_error(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        cases = [[('x', 0.), ('y', 0.)], [('x', np.ones(2)), ('y', 0.)]]
+        prob.driver = om.DOEDriver(cases, run_parallel=True,
+                                   parallel_backend='process_pool', num_workers=2)
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as err:
+            prob.run_driver()
+
+        self.assertIn("DOEDriver: Error running case 1:", str(err.exception))
+        self.assertIn("Error assigning x = [1. 1.]", str(err.exception))
+
 
 @use_tempdirs
 class TestDOEDriverListVars(unittest.TestCase):
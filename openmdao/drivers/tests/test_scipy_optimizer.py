@@ -2574,5 +2574,57 @@ class TestScipyOptimizeDriverCOBYQA(unittest.TestCase):
         assert_near_equal(prob['x'], 0.0, 1e-3)
 
 
+class TestScipyOptimizeDriverVectorConstraints(unittest.TestCase):
+
+    def build(self, optimizer, dv_bounds=True, linear=True):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.zeros(4)), promotes=['*'])
+        model.add_subsystem('obj', om.ExecComp('f = sum((x - a)**2)', x=np.zeros(4),
+                                               a=np.array([3., 3., -3., 0.])), promotes=['*'])
+        model.add_subsystem('dbl', om.ExecComp('y = 2.0 * x', x=np.zeros(4), y=np.zeros(4)),
+                            promotes=['*'])
+        model.add_subsystem('sum', om.ExecComp('s = x[2] + x[3]', x=np.zeros(4)),
+                            promotes=['*'])
+
+        if dv_bounds:
+            model.add_design_var('x', lower=-10., upper=10.)
+        else:
+            model.add_design_var('x')
+        model.add_objective('f')
+        model.add_constraint('x', indices=[0], equals=1.0, alias='x0')
+        model.add_constraint('y', lower=np.array([-20., -20., -2., -20.]), upper=4.0)
+        if linear:
+            model.add_constraint('s', lower=0.0, linear=True)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer=optimizer, tol=1e-9, maxiter=500,
+                                             disp=False)
+        prob.setup()
+        return prob
+
+    def test_slsqp(self):
+        prob = self.build('SLSQP')
+        prob.run_driver()
+
+        assert_near_equal(prob.get_val('x'), [1., 2., -1., 1.], 1e-6)
+
+        groups = prob.driver._con_groups
+        self.assertEqual(set(groups), {'eq', 'ineq', 'linear_ineq'})
+        self.assertEqual([g.ctype for g in groups.values()], ['eq', 'ineq', 'ineq'])
+        # each of the 4 entries of y is double-sided
+        self.assertEqual(prob.driver._vec_confunc(None, 'ineq').shape, (8,))
+        self.assertEqual(prob.driver._vec_congradfunc(None, 'ineq').shape, (8, 4))
+
+    @unittest.skipUnless(ScipyVersion >= Version("1.2"), "scipy >= 1.2 is required.")
+    def test_trust_constr(self):
+        prob = self.build('trust-constr', dv_bounds=False, linear=False)
+        prob.run_driver()
+
+        # every entry of the vector constraints must be enforced
+        assert_near_equal(prob.get_val('x'), [1., 2., -1., 0.], 1e-4)
+        self.assertEqual(set(prob.driver._con_groups), {'nonlinear'})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -114,6 +114,14 @@ class Jacobian(object):
                 for subjac in self._subjacs.values():
                     subjac.set_dtype(dtype)
 
+    def _reset_views(self):
+        """
+        Discard the views into the linear vectors that are cached by the subjacs.
+        """
+        if self._subjacs is not None:
+            for subjac in self._subjacs.values():
+                subjac._reset_views()
+
     def _post_update(self):
         """
         Post-update the jacobian.
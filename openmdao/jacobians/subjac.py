@@ -242,6 +242,16 @@ class Subjac(object):
         else:
             raise ValueError(f"Subjacobian {self.key}: Unsupported dtype: {dtype}")
 
+    def _reset_views(self):
+        """
+        Discard the cached views into the linear vectors.
+
+        This must be called whenever the data arrays of the linear vectors are replaced.
+        """
+        self._in_view = None
+        self._out_view = None
+        self._res_view = None
+
     def _map_functions(self, wrt_is_input):
         if wrt_is_input:
             self.apply_fwd = self._apply_fwd_input
@@ -1176,14 +1186,42 @@ class OMCOOSubjac(COOSubjac):
         self._set_coo_col(icol, column, self.info['val'], self.rows, self.cols,
                           uncovered_threshold)
 
+    def _matmat(self, val, arr, fwd):
+        """
+        Multiply the subjacobian or its transpose by an array holding one seed per column.
+
+        Parameters
+        ----------
+        val : ndarray
+            Nonzero values of the subjacobian.
+        arr : ndarray
+            2D array to be multiplied.
+        fwd : bool
+            If False, multiply by the transpose.
+
+        Returns
+        -------
+        ndarray
+            The product.
+        """
+        if fwd:
+            mtx = coo_matrix((val, (self.rows, self.cols)), shape=(self.nrows, self.parent_ncols))
+        else:
+            mtx = coo_matrix((val, (self.cols, self.rows)), shape=(self.parent_ncols, self.nrows))
+        return mtx @ arr
+
     def _apply_fwd_input(self, d_inputs, d_outputs, d_residuals, randgen=None):
         if self._in_view is None:
             self._in_view = d_inputs.get_slice(self.col_slice)
             self._res_view = d_residuals.get_slice(self.row_slice)
 
         val = self.info['val'] if randgen is None else self.get_rand_val(randgen)
-        # bincount allows rows and cols to contain repeated (row, col) pairs.
-        self._res_view += bincount(self.rows, self._in_view[self.cols] * val, minlength=self.nrows)
+        if self._in_view.ndim > 1:
+            self._res_view += self._matmat(val, self._in_view, True)
+        else:
+            # bincount allows rows and cols to contain repeated (row, col) pairs.
+            self._res_view += bincount(self.rows, self._in_view[self.cols] * val,
+                                       minlength=self.nrows)
 
     def _apply_fwd_output(self, d_inputs, d_outputs, d_residuals, randgen=None):
         if self._out_view is None:
@@ -1191,8 +1229,12 @@ class OMCOOSubjac(COOSubjac):
             self._res_view = d_residuals.get_slice(self.row_slice)
 
         val = self.info['val'] if randgen is None else self.get_rand_val(randgen)
-        # bincount allows rows and cols to contain repeated (row, col) pairs.
-        self._res_view += bincount(self.rows, self._out_view[self.cols] * val, minlength=self.nrows)
+        if self._out_view.ndim > 1:
+            self._res_view += self._matmat(val, self._out_view, True)
+        else:
+            # bincount allows rows and cols to contain repeated (row, col) pairs.
+            self._res_view += bincount(self.rows, self._out_view[self.cols] * val,
+                                       minlength=self.nrows)
 
     def _apply_rev_input(self, d_inputs, d_outputs, d_residuals, randgen=None):
         if self._in_view is None:
@@ -1200,8 +1242,11 @@ class OMCOOSubjac(COOSubjac):
             self._res_view = d_residuals.get_slice(self.row_slice)
 
         val = self.info['val'] if randgen is None else self.get_rand_val(randgen)
-        self._in_view += bincount(self.cols, self._res_view[self.rows] * val,
-                                  minlength=self.parent_ncols)
+        if self._res_view.ndim > 1:
+            self._in_view += self._matmat(val, self._res_view, False)
+        else:
+            self._in_view += bincount(self.cols, self._res_view[self.rows] * val,
+                                      minlength=self.parent_ncols)
 
     def _apply_rev_output(self, d_inputs, d_outputs, d_residuals, randgen=None):
         if self._out_view is None:
@@ -1209,8 +1254,11 @@ class OMCOOSubjac(COOSubjac):
             self._res_view = d_residuals.get_slice(self.row_slice)
 
         val = self.info['val'] if randgen is None else self.get_rand_val(randgen)
-        self._out_view += bincount(self.cols, self._res_view[self.rows] * val,
-                                   minlength=self.parent_ncols)
+        if self._res_view.ndim > 1:
+            self._out_view += self._matmat(val, self._res_view, False)
+        else:
+            self._out_view += bincount(self.cols, self._res_view[self.rows] * val,
+                                       minlength=self.parent_ncols)
 
 
 class DiagonalSubjac(SparseSubjac):
@@ -1413,6 +1461,8 @@ class DiagonalSubjac(SparseSubjac):
             self._res_view = d_residuals.get_slice(self.row_slice)
 
         val = self.info['val'] if randgen is None else self.get_rand_val(randgen)
+        if self._in_view.ndim > 1:
+            val = val[:, np.newaxis]
         self._res_view += self._in_view * val
 
     def _apply_fwd_output(self, d_inputs, d_outputs, d_residuals, randgen=None):
@@ -1421,6 +1471,8 @@ class DiagonalSubjac(SparseSubjac):
             self._res_view = d_residuals.get_slice(self.row_slice)
 
         val = self.info['val'] if randgen is None else self.get_rand_val(randgen)
+        if self._out_view.ndim > 1:
+            val = val[:, np.newaxis]
         self._res_view += self._out_view * val
 
     def _apply_rev_input(self, d_inputs, d_outputs, d_residuals, randgen=None):
@@ -1429,6 +1481,8 @@ class DiagonalSubjac(SparseSubjac):
             self._res_view = d_residuals.get_slice(self.row_slice)
 
         val = self.info['val'] if randgen is None else self.get_rand_val(randgen)
+        if self._res_view.ndim > 1:
+            val = val[:, np.newaxis]
         self._in_view += self._res_view * val
 
     def _apply_rev_output(self, d_inputs, d_outputs, d_residuals, randgen=None):
@@ -1437,6 +1491,8 @@ class DiagonalSubjac(SparseSubjac):
             self._res_view = d_residuals.get_slice(self.row_slice)
 
         val = self.info['val'] if randgen is None else self.get_rand_val(randgen)
+        if self._res_view.ndim > 1:
+            val = val[:, np.newaxis]
         self._out_view += self._res_view * val
 
     def set_dtype(self, dtype):
@@ -134,9 +134,13 @@ class Case(object):
         self.residuals = None
         self.derivatives = None
 
+        # packed driver iteration data (format 15+) will already have been converted to
+        # structured arrays by the case table
         if 'inputs' in data.keys():
             if data_format >= 3:
-                inputs = deserialize(data['inputs'], abs2meta, prom2abs, conns)
+                inputs = data['inputs']
+                if isinstance(inputs, str):
+                    inputs = deserialize(inputs, abs2meta, prom2abs, conns)
             elif data_format in (1, 2):
                 inputs = blob_to_array(data['inputs'])
                 if type(inputs) is np.ndarray and not inputs.shape:
@@ -148,7 +152,9 @@ class Case(object):
 
         if 'outputs' in data.keys():
             if data_format >= 3:
-                outputs = deserialize(data['outputs'], abs2meta, prom2abs, conns)
+                outputs = data['outputs']
+                if isinstance(outputs, str):
+                    outputs = deserialize(outputs, abs2meta, prom2abs, conns)
             elif self._format_version in (1, 2):
                 outputs = blob_to_array(data['outputs'])
                 if type(outputs) is np.ndarray and not outputs.shape:
@@ -161,7 +167,9 @@ class Case(object):
 
         if 'residuals' in data.keys():
             if data_format >= 3:
-                residuals = deserialize(data['residuals'], abs2meta, prom2abs, conns)
+                residuals = data['residuals']
+                if isinstance(residuals, str):
+                    residuals = deserialize(residuals, abs2meta, prom2abs, conns)
             elif data_format in (1, 2):
                 residuals = blob_to_array(data['residuals'])
                 if type(residuals) is np.ndarray and not residuals.shape:
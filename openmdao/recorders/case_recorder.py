@@ -1,6 +1,13 @@
 """
 Class definition for CaseRecorder, the base class for all recorders.
 """
+from copy import deepcopy
+import atexit
+import queue
+import threading
+
+import numpy as np
+
 from openmdao.core.system import System
 from openmdao.core.driver import Driver
 from openmdao.solvers.solver import Solver
@@ -13,6 +20,37 @@ from openmdao.utils.record_util import check_path
 # default pickle protocol version for serialization
 PICKLE_VER = 4
 
+# maximum number of records waiting to be written when recording asynchronously
+ASYNC_QUEUE_SIZE = 1000
+
+# maximum number of records written in a single batch when recording asynchronously
+ASYNC_BATCH_SIZE = 100
+
+
+def _snapshot(data):
+    """
+    Return a copy of recording data that is not affected by later changes to the model.
+
+    Parameters
+    ----------
+    data : dict
+        Data to be recorded, possibly containing nested dicts.
+
+    Returns
+    -------
+    dict
+        Copy of the data.
+    """
+    snap = {}
+    for key, val in data.items():
+        if isinstance(val, dict):
+            snap[key] = _snapshot(val)
+        elif isinstance(val, np.ndarray):
+            snap[key] = val.copy()
+        else:
+            snap[key] = deepcopy(val)
+    return snap
+
 
 class CaseRecorder(object):
     """
@@ -22,11 +60,23 @@ class CaseRecorder(object):
     ----------
     record_viewer_data : bool, optional
         If True, record data needed for visualization.
+    async_write : bool, optional
+        If True, iteration and derivative data are copied into a bounded queue and written by
+        a background thread.  Recorded data is only guaranteed to be complete after `flush`
+        or `shutdown` (e.g. via `Problem.cleanup`) is called, or after the interpreter exits.
 
     Attributes
     ----------
     _record_viewer_data : bool
         Flag indicating whether to record data needed to generate N2 diagram.
+    _async_write : bool
+        Flag indicating whether data is written by a background thread.
+    _queue : queue.Queue or None
+        Queue of records waiting to be written by the background thread.
+    _writer : threading.Thread or None
+        The background thread writing queued records.
+    _writer_error : Exception or None
+        An exception raised in the background thread, to be re-raised in the main thread.
     _counter : int
         A global counter for execution order, used in iteration coordinate.
     _inputs : dict
@@ -49,7 +99,7 @@ class CaseRecorder(object):
         List of ranks on which this recorder will record if running under MPI.
     """
 
-    def __init__(self, record_viewer_data=True):
+    def __init__(self, record_viewer_data=True, async_write=False):
         """
         Initialize.
 
@@ -57,9 +107,16 @@ class CaseRecorder(object):
         ----------
         record_viewer_data : bool, optional
             If True, record data needed for visualization.
+        async_write : bool, optional
+            If True, write iteration and derivative data in a background thread.
         """
         self._record_viewer_data = record_viewer_data
 
+        self._async_write = async_write
+        self._queue = None
+        self._writer = None
+        self._writer_error = None
+
         # global counter that is used in iteration coordinate
         self._counter = 0
 
@@ -130,6 +187,9 @@ class CaseRecorder(object):
         comm : MPI.Comm or <FakeComm> or None
             The MPI communicator for the recorder (should be the comm for the Problem).
         """
+        # make sure records from a previous run are written before starting over
+        self.flush()
+
         self._counter = 0
 
         if MPI and comm and comm.size > 1:
@@ -146,6 +206,19 @@ class CaseRecorder(object):
 
             self._do_gather = len(recording_ranks) < comm.size
 
+    def update_driver_vars(self, recording_requester, driver):
+        """
+        Update any recorded metadata after design variables or responses were added or removed.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        driver : Driver
+            Driver whose design variables or responses have changed.
+        """
+        pass
+
     def _get_metadata_system(self, system):
         """
         Get system metadata.
@@ -237,22 +310,46 @@ class CaseRecorder(object):
             Some implementations of record_iteration need additional args.
         """
         if not self._parallel or self._record_on_proc:
-            self._counter += 1
-
-            self._iteration_coordinate = \
-                recording_requester._recording_iter.get_formatted_iteration_coordinate()
-
             if isinstance(recording_requester, Driver):
-                self.record_iteration_driver(recording_requester, data, metadata)
+                record = self.record_iteration_driver
             elif isinstance(recording_requester, System):
-                self.record_iteration_system(recording_requester, data, metadata)
+                record = self.record_iteration_system
             elif isinstance(recording_requester, Solver):
-                self.record_iteration_solver(recording_requester, data, metadata)
+                record = self.record_iteration_solver
             elif isinstance(recording_requester, Problem):
-                self.record_iteration_problem(recording_requester, data, metadata)
+                record = self.record_iteration_problem
             else:
                 raise ValueError("Recorders must be attached to Drivers, Systems, or Solvers.")
 
+            coord = recording_requester._recording_iter.get_formatted_iteration_coordinate()
+
+            if self._async_write:
+                self._enqueue(self._write_iteration, record, recording_requester,
+                              _snapshot(data), _snapshot(metadata), coord)
+            else:
+                self._write_iteration(record, recording_requester, data, metadata, coord)
+
+    def _write_iteration(self, record, recording_requester, data, metadata, coord):
+        """
+        Write an iteration using the given record method.
+
+        Parameters
+        ----------
+        record : method
+            The record_iteration_* method for the type of recording requester.
+        recording_requester : object
+            System, Solver, Driver in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict
+            Dictionary containing execution metadata.
+        coord : str
+            The iteration coordinate of the iteration.
+        """
+        self._counter += 1
+        self._iteration_coordinate = coord
+        record(recording_requester, data, metadata)
+
     def record_iteration_driver(self, recording_requester, data, metadata):
         """
         Record data and metadata from a Driver.
@@ -328,9 +425,30 @@ class CaseRecorder(object):
         **kwargs : keyword args
             Some implementations of record_derivatives need additional args.
         """
-        self._iteration_coordinate = \
-            recording_requester._recording_iter.get_formatted_iteration_coordinate()
+        coord = recording_requester._recording_iter.get_formatted_iteration_coordinate()
 
+        if self._async_write:
+            self._enqueue(self._write_derivatives, recording_requester, _snapshot(data),
+                          _snapshot(metadata), coord)
+        else:
+            self._write_derivatives(recording_requester, data, metadata, coord)
+
+    def _write_derivatives(self, recording_requester, data, metadata, coord):
+        """
+        Write derivatives data from a Driver.
+
+        Parameters
+        ----------
+        recording_requester : Driver
+            Driver in need of recording.
+        data : dict
+            Dictionary containing derivatives keyed by 'of,wrt' to be recorded.
+        metadata : dict
+            Dictionary containing execution metadata.
+        coord : str
+            The iteration coordinate of the derivatives.
+        """
+        self._iteration_coordinate = coord
         self.record_derivatives_driver(recording_requester, data, metadata)
 
     def record_derivatives_driver(self, recording_requester, data, metadata):
@@ -359,8 +477,103 @@ class CaseRecorder(object):
         """
         raise NotImplementedError("record_viewer_data has not been overridden")
 
+    def _enqueue(self, func, *args):
+        """
+        Queue a write to be performed by the background writer thread.
+
+        Parameters
+        ----------
+        func : method
+            The method that performs the write.
+        *args : list
+            Arguments to func.
+        """
+        self._check_writer_error()
+
+        if self._writer is None:
+            self._queue = queue.Queue(maxsize=ASYNC_QUEUE_SIZE)
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True,
+                                            name=f'{type(self).__name__}_writer')
+            self._writer.start()
+            # the writer is a daemon thread, so make sure queued records are written if the
+            # recorder is never shut down
+            atexit.register(self._stop_writer)
+
+        # blocks if the writer has fallen too far behind
+        self._queue.put((func, args))
+
+    def _writer_loop(self):
+        """
+        Write queued records in batches until a stop request (None) is received.
+        """
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            while batch[-1] is not None and len(batch) < ASYNC_BATCH_SIZE:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is None
+            if stop:
+                batch.pop()
+
+            try:
+                if batch and self._writer_error is None:
+                    self._write_batch(batch)
+            except Exception as err:
+                self._writer_error = err
+            finally:
+                for _ in range(len(batch) + stop):
+                    q.task_done()
+
+            if stop:
+                break
+
+    def _write_batch(self, batch):
+        """
+        Perform a batch of queued writes.
+
+        Parameters
+        ----------
+        batch : list of (method, tuple)
+            The write methods and their arguments.
+        """
+        for func, args in batch:
+            func(*args)
+
+    def _check_writer_error(self):
+        """
+        Re-raise any exception raised in the background writer thread.
+        """
+        if self._writer_error is not None:
+            err = self._writer_error
+            self._writer_error = None
+            raise RuntimeError(f"{type(self).__name__}: error while writing recorded data in "
+                               f"the background: {err}") from err
+
+    def flush(self):
+        """
+        Wait until all queued records have been written.
+        """
+        if self._queue is not None:
+            self._queue.join()
+        self._check_writer_error()
+
+    def _stop_writer(self):
+        """
+        Write all queued records and stop the background writer thread.
+        """
+        if self._writer is not None:
+            atexit.unregister(self._stop_writer)
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = self._queue = None
+        self._check_writer_error()
+
     def shutdown(self):
         """
         Shut down the recorder.
         """
-        pass
+        self._stop_writer()
@@ -74,6 +74,27 @@ class RecordingManager(object):
         for recorder in self._recorders:
             recorder.startup(recording_requester, comm)
 
+    def update_driver_vars(self, recording_requester, driver):
+        """
+        Update recorder metadata after design variables or responses were added or removed.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        driver : Driver
+            Driver whose design variables or responses have changed.
+        """
+        for recorder in self._recorders:
+            recorder.update_driver_vars(recording_requester, driver)
+
+    def flush(self):
+        """
+        Wait until all recorders have written any data queued for asynchronous writing.
+        """
+        for recorder in self._recorders:
+            recorder.flush()
+
     def shutdown(self):
         """
         Shut down and remove all recorders.
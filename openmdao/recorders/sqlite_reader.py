@@ -4,6 +4,7 @@ Definition of the SqliteCaseReader.
 import pathlib
 import sqlite3
 from collections import OrderedDict
+from fnmatch import fnmatchcase
 
 import sys
 import numpy as np
@@ -1013,6 +1014,52 @@ class SqliteCaseReader(BaseCaseReader):
 
         raise RuntimeError('Case not found:', case_id)
 
+    def get_val_history(self, names, source='driver', coord_pattern=None):
+        """
+        Get the values of one or more variables over all cases from a source.
+
+        This reads only the recorded variable data from the database and assembles the
+        values in bulk, without creating a Case object for each case.
+
+        Parameters
+        ----------
+        names : str or list of str
+            Promoted or absolute names of the variables to retrieve.
+        source : 'problem', 'driver', component pathname or solver pathname
+            Identifies which cases to retrieve the values from.
+        coord_pattern : str or None
+            If not None, only cases whose iteration coordinate (or case name, for problem
+            cases) matches this glob pattern are included.
+
+        Returns
+        -------
+        ndarray or dict
+            An array of shape (number of cases, size of the variable) if names is a string,
+            otherwise a dictionary of such arrays keyed on variable name.
+        """
+        if not isinstance(source, str):
+            raise TypeError("Source parameter must be a string, %s is type %s." %
+                            (source, type(source).__name__))
+
+        if source == 'driver':
+            case_table, source = self._driver_cases, None
+        elif source == 'problem':
+            if self._format_version < 2:
+                raise RuntimeError('No problem cases recorded (data format = %d).' %
+                                   self._format_version)
+            case_table, source = self._problem_cases, None
+        elif source in self._system_cases.list_sources():
+            case_table = self._system_cases
+        elif source in self._solver_cases.list_sources():
+            case_table = self._solver_cases
+        else:
+            raise RuntimeError('Source not found: %s' % source)
+
+        if isinstance(names, str):
+            return case_table.get_val_history([names], source, coord_pattern)[names]
+
+        return case_table.get_val_history(names, source, coord_pattern)
+
 
 class CaseTable(object):
     """
@@ -1403,6 +1450,178 @@ class CaseTable(object):
 
         return None
 
+    def _get_history_columns(self):
+        """
+        Get the names of the columns holding the output and input data in this table.
+
+        Returns
+        -------
+        tuple of str
+            Names of the output and input columns.
+        """
+        return ('outputs', 'inputs')
+
+    def _find_history_key(self, name, outputs, inputs):
+        """
+        Find the key under which a variable was recorded, resolving names as Case does.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or absolute name of the variable.
+        outputs : dict-like
+            Container of the recorded output names.
+        inputs : dict-like
+            Container of the recorded input names.
+
+        Returns
+        -------
+        tuple or None
+            Index of the container (0 for outputs, 1 for inputs) and the recorded name, or
+            None if the variable was not recorded.
+        """
+        prom2abs = self._prom2abs
+        abs2prom = self._abs2prom
+
+        if name in outputs:
+            return 0, name
+        if name in prom2abs['output']:
+            for abs_name in prom2abs['output'][name]:
+                if abs_name in outputs:
+                    return 0, abs_name
+        elif name in abs2prom['output'] and abs2prom['output'][name] in outputs:
+            return 0, abs2prom['output'][name]
+        if name in prom2abs['input'] and name not in abs2prom['input']:
+            src = self._conns[prom2abs['input'][name][0]]
+            if src in outputs:
+                return 0, src
+
+        if name in inputs:
+            return 1, name
+        if name in prom2abs['input']:
+            for abs_name in prom2abs['input'][name]:
+                if abs_name in inputs:
+                    return 1, abs_name
+
+        return None
+
+    def get_val_history(self, names, source=None, coord_pattern=None):
+        """
+        Get the values of the named variables over all matching cases in the table.
+
+        Parameters
+        ----------
+        names : list of str
+            Promoted or absolute names of the variables to retrieve.
+        source : str or None
+            If not None, only cases originating from the specified source are included.
+        coord_pattern : str or None
+            If not None, only cases whose identifier matches this glob pattern are included.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each name to an array of shape (number of cases, size of the
+            variable).
+        """
+        def size_error(name, sizes):
+            return ValueError(f"Can't get the history of variable '{name}' because its size "
+                              f"is not the same in all cases: {sorted(sizes)}.")
+
+        if self._format_version < 3:
+            # data is not stored as JSON, so fall back on full cases
+            hist = {name: [] for name in names}
+            for case in self.cases():
+                if source is not None and case.source != source:
+                    continue
+                if coord_pattern is not None and not fnmatchcase(case.name, coord_pattern):
+                    continue
+                for name in names:
+                    hist[name].append(np.ravel(case[name]))
+            for name, vals in hist.items():
+                sizes = {v.size for v in vals}
+                if len(sizes) > 1:
+                    raise size_error(name, sizes)
+            return {name: np.array(vals, dtype=float).reshape((len(vals), -1))
+                    for name, vals in hist.items()}
+
+        columns = ', '.join((self._index_name,) + self._get_history_columns())
+        with sqlite3.connect(self._filename) as con:
+            cur = con.cursor()
+            cur.execute(f"SELECT {columns} FROM {self._table_name} "  # nosec: trusted input
+                        "ORDER BY id ASC")
+            rows = cur.fetchall()
+        con.close()
+
+        no_vars = {}
+        packed = {}  # layout id -> (case positions, data buffers)
+        unpacked = []  # (case position, outputs, inputs) of JSON encoded cases
+        ncases = 0
+        for row in rows:
+            case_id = row[0]
+            if coord_pattern is not None and not fnmatchcase(case_id, coord_pattern):
+                continue
+            if source is not None and self._get_source(case_id) != source:
+                continue
+
+            if len(row) > 3 and row[3] is not None:
+                positions, buffers = packed.setdefault(row[3], ([], []))
+                positions.append(ncases)
+                buffers.append(row[4])
+            else:
+                # JSON has to be decoded in full, but each row is only decoded once for all names
+                unpacked.append((ncases,
+                                 json_loads(row[1]) if row[1] else no_vars,
+                                 json_loads(row[2]) if row[2] else no_vars))
+            ncases += 1
+
+        hist = {}
+        for name in names:
+            blocks = []
+
+            for layout_id, (positions, buffers) in packed.items():
+                dtypes = self._get_layout(layout_id)
+                containers = [dtypes[kind].fields if dtypes[kind] is not None else no_vars
+                              for kind in ('output', 'input')]
+                found = self._find_history_key(name, *containers)
+                if found is None:
+                    raise KeyError(f'Variable name "{name}" not found in all cases.')
+                idx, key = found
+                kind = ('output', 'input')[idx]
+                data = np.frombuffer(bytearray(b''.join(buffers)),
+                                     dtype=dtypes[kind])
+                blocks.append((positions, data[key].reshape((len(positions), -1))))
+
+            if unpacked:
+                positions = []
+                vals = []
+                for pos, outputs, inputs in unpacked:
+                    found = self._find_history_key(name, outputs, inputs)
+                    if found is None:
+                        raise KeyError(f'Variable name "{name}" not found in all cases.')
+                    idx, key = found
+                    positions.append(pos)
+                    vals.append((outputs, inputs)[idx][key])
+                sizes = {np.size(v) for v in vals}
+                if len(sizes) > 1:
+                    raise size_error(name, sizes)
+                try:
+                    vals = np.array(vals, dtype=float)
+                except (TypeError, ValueError):
+                    raise TypeError(f"Can't get the history of non-numeric variable '{name}'.")
+                blocks.append((positions, vals.reshape((len(positions), -1))))
+
+            sizes = {block.shape[1] for _, block in blocks}
+            if len(sizes) > 1:
+                raise size_error(name, sizes)
+            size = sizes.pop() if sizes else 0
+            arr = np.empty((ncases, size))
+            for positions, block in blocks:
+                arr[positions] = block
+            hist[name] = arr
+
+        return hist
+
 
 class DriverCases(CaseTable):
     """
@@ -1426,6 +1645,12 @@ class DriverCases(CaseTable):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+
+    Attributes
+    ----------
+    _layouts : dict
+        Mapping of layout id to the structured dtypes used to view packed input, output and
+        residual data of driver iterations.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
@@ -1436,6 +1661,99 @@ class DriverCases(CaseTable):
         super().__init__(filename, format_version,
                          'driver_iterations', 'iteration_coordinate', giter,
                          prom2abs, abs2prom, abs2meta, conns, var_info)
+        self._layouts = {}
+
+    def _get_history_columns(self):
+        """
+        Get the names of the columns holding the output and input data in this table.
+
+        Packed data (format 15+) is returned in the layout and data columns.
+
+        Returns
+        -------
+        tuple of str
+            Names of the output and input columns, followed by the packed data columns.
+        """
+        if self._format_version >= 15:
+            return ('outputs', 'inputs', 'layout', 'data')
+        return ('outputs', 'inputs')
+
+    def _get_layout(self, layout_id):
+        """
+        Get the structured dtypes for viewing packed data with the given layout.
+
+        Parameters
+        ----------
+        layout_id : int
+            The id of the layout in the driver_layouts table.
+
+        Returns
+        -------
+        dict
+            Structured dtype, or None if there are no variables, keyed by kind.
+        """
+        try:
+            return self._layouts[layout_id]
+        except KeyError:
+            pass
+
+        with sqlite3.connect(self._filename) as con:
+            cur = con.cursor()
+            cur.execute("SELECT id, layout FROM driver_layouts")
+            rows = cur.fetchall()
+        con.close()
+
+        for lid, layout in rows:
+            layout = json_loads(layout)
+            fields = {}
+            offset = 0
+            for kind in ('input', 'output', 'residual'):
+                names = []
+                formats = []
+                offsets = []
+                for name, shape in layout[kind]:
+                    names.append(name)
+                    formats.append(f'{tuple(shape)}f8')
+                    offsets.append(offset)
+                    offset += 8 * int(np.prod(shape))
+                fields[kind] = (names, formats, offsets)
+
+            # all dtypes span the full buffer so that each can view it without a copy
+            self._layouts[lid] = {
+                kind: np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                                'itemsize': offset}) if names else None
+                for kind, (names, formats, offsets) in fields.items()
+            }
+
+        return self._layouts[layout_id]
+
+    def _unpack_row(self, row):
+        """
+        Convert packed data in a driver iteration row into structured arrays.
+
+        Parameters
+        ----------
+        row : sqlite3.Row or dict
+            A row of the driver_iterations table.
+
+        Returns
+        -------
+        sqlite3.Row or dict
+            The row, with inputs, outputs, and residuals replaced by structured array views of
+            the packed data, if the row contains packed data.
+        """
+        if self._format_version < 15 or row['layout'] is None:
+            return row
+
+        dtypes = self._get_layout(row['layout'])
+        row = dict(row)
+        # arrays over the bytes from sqlite would be read-only, so unpack from a writable copy
+        data = bytearray(row['data'])
+        for kind, col in (('input', 'inputs'), ('output', 'outputs'), ('residual', 'residuals')):
+            dtype = dtypes[kind]
+            row[col] = None if dtype is None else np.frombuffer(data, dtype=dtype)
+
+        return row
 
     def cases(self, cache=False):
         """
@@ -1470,6 +1788,7 @@ class DriverCases(CaseTable):
                         row = dict(zip(row.keys(), row))
                         row['jacobian'] = derivs_row['derivatives']
 
+                row = self._unpack_row(row)
                 case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
                             self._conns, self._var_info, self._format_version)
 
@@ -1528,6 +1847,9 @@ class DriverCases(CaseTable):
                     row['jacobian'] = derivs_row['derivatives']
         con.close()
 
+        if row:
+            row = self._unpack_row(row)
+
         # if found, create Case object (and cache it if requested) else return None
         if row:
             case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
@@ -1649,6 +1971,17 @@ class SolverCases(CaseTable):
                          'solver_iterations', 'iteration_coordinate', giter,
                          prom2abs, abs2prom, abs2meta, conns, var_info)
 
+    def _get_history_columns(self):
+        """
+        Get the names of the columns holding the output and input data in this table.
+
+        Returns
+        -------
+        tuple of str
+            Names of the output and input columns.
+        """
+        return ('solver_output', 'solver_inputs')
+
     def _get_source(self, iteration_coordinate):
         """
         Get pathname of solver that is the source of the iteration.
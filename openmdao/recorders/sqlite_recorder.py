@@ -2,11 +2,13 @@
 Class definition for SqliteRecorder, which provides dictionary backed by SQLite.
 """
 
+from contextlib import contextmanager
 from io import BytesIO
 
 import os.path
 import gc
 import sqlite3
+import threading
 
 import json
 import numpy as np
@@ -30,6 +32,9 @@ from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
 """
 SQL case database version history.
 ----------------------------------
+15-- OpenMDAO 3.40.1
+     Driver iteration data that is entirely numeric is stored as a single packed float64 BLOB,
+     with the variable layout of the BLOB stored once in the driver_layouts table.
 14-- OpenMDAO 3.8.1
      Metadata pickle and JSON blobs are compressed.
      Save metadata separately for parallel runs.
@@ -62,7 +67,7 @@ SQL case database version history.
 1 -- Through OpenMDAO 2.3
      Original implementation.
 """
-format_version = 14
+format_version = 15
 
 # separator, cannot be a legal char for names
 META_KEY_SEP = '!'
@@ -128,6 +133,9 @@ class SqliteRecorder(CaseRecorder):
         The pickle protocol version to use when pickling metadata.
     record_viewer_data : bool, optional
         If True, record data needed for visualization.
+    async_write : bool, optional
+        If True, write iteration and derivative data in a background thread, batching many
+        records into each database transaction.
 
     Attributes
     ----------
@@ -156,9 +164,16 @@ class SqliteRecorder(CaseRecorder):
         set of recording requesters for which this recorder has been started.
     _use_outputs_dir : bool
         Flag indicating if the database is being saved in the problem outputs dir.
+    _batch : threading.local
+        Thread local state whose 'active' attribute is True while the current thread writes
+        records as part of a batch in a single transaction.
+    _driver_layouts : dict
+        Mapping of driver iteration variable layouts to their id in the driver_layouts table
+        and a preallocated buffer and list of slices used to pack data with that layout.
     """
 
-    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True):
+    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True,
+                 async_write=False):
         """
         Initialize the SqliteRecorder.
         """
@@ -180,8 +195,11 @@ class SqliteRecorder(CaseRecorder):
 
         self._database_initialized = False
         self._started = set()
+        self._driver_layouts = {}
 
-        super().__init__(record_viewer_data)
+        self._batch = threading.local()
+
+        super().__init__(record_viewer_data, async_write)
 
     def _initialize_database(self, comm):
         """
@@ -228,7 +246,8 @@ class SqliteRecorder(CaseRecorder):
             except OSError:
                 pass
 
-            self.connection = sqlite3.connect(filepath)
+            # with async_write, cases are written from a background thread
+            self.connection = sqlite3.connect(filepath, check_same_thread=not self._async_write)
             if self._record_metadata and self.metadata_connection is None:
                 self.metadata_connection = self.connection
 
@@ -239,7 +258,9 @@ class SqliteRecorder(CaseRecorder):
 
                 c.execute("CREATE TABLE driver_iterations(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
-                          "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT)")
+                          "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT, "
+                          "layout INT, data BLOB)")
+                c.execute("CREATE TABLE driver_layouts(id INTEGER PRIMARY KEY, layout TEXT)")
                 c.execute("CREATE TABLE driver_derivatives(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
                           "success INT, msg TEXT, derivatives BLOB)")
@@ -407,11 +428,10 @@ class SqliteRecorder(CaseRecorder):
                     meta['type'] = ['input']
                     meta['explicit'] = True
 
-            for varinfo, var_type in [(desvars, 'desvar'), (responses, 'response'),
-                                      (objectives, 'objective'), (constraints, 'constraint')]:
-                for name, vmeta in varinfo.items():
+            self._add_voi_types(desvars, responses, objectives, constraints)
+            for varinfo in (desvars, responses):
+                for vmeta in varinfo.values():
                     srcname = vmeta['source']
-                    self._abs2meta[srcname]['type'].append(var_type)
                     self._abs2meta[srcname]['explicit'] = srcname not in states
 
             self._make_abs2meta_serializable()
@@ -423,16 +443,8 @@ class SqliteRecorder(CaseRecorder):
             conns = zlib.compress(json.dumps(
                 system._problem_meta['model_ref']()._conn_global_abs_in2out).encode('ascii'))
 
-            # TODO: seems like we could clobber the var_settings for a desvar in cases where a
-            # desvar is also a constraint... Make a test case and fix if needed.
-            var_settings = {}
-            var_settings.update(desvars)
-            var_settings.update(objectives)
-            var_settings.update(constraints)
-            var_settings = self._make_var_setting_serializable(var_settings)
-            var_settings['execution_order'] = var_order
-            var_settings_json = zlib.compress(
-                json.dumps(var_settings, default=default_noraise).encode('ascii'))
+            var_settings_json = self._get_var_settings_json(desvars, objectives, constraints,
+                                                            var_order)
 
             if self._record_metadata:
                 with self.metadata_connection as m:
@@ -442,6 +454,125 @@ class SqliteRecorder(CaseRecorder):
 
         self._started.add(recording_requester)
 
+    def _add_voi_types(self, desvars, responses, objectives, constraints):
+        """
+        Add the design variable and response types to the metadata of their source variables.
+
+        Parameters
+        ----------
+        desvars : dict
+            Design variable metadata keyed by name.
+        responses : dict
+            Response metadata keyed by name.
+        objectives : dict
+            Objective metadata keyed by name.
+        constraints : dict
+            Constraint metadata keyed by name.
+        """
+        for varinfo, var_type in [(desvars, 'desvar'), (responses, 'response'),
+                                  (objectives, 'objective'), (constraints, 'constraint')]:
+            for vmeta in varinfo.values():
+                self._abs2meta[vmeta['source']]['type'].append(var_type)
+
+    def _get_var_settings_json(self, desvars, objectives, constraints, var_order):
+        """
+        Return the compressed JSON of the design variable and response settings.
+
+        Parameters
+        ----------
+        desvars : dict
+            Design variable metadata keyed by name.
+        objectives : dict
+            Objective metadata keyed by name.
+        constraints : dict
+            Constraint metadata keyed by name.
+        var_order : list
+            Variables in execution order.
+
+        Returns
+        -------
+        bytes
+            The compressed JSON string.
+        """
+        # TODO: seems like we could clobber the var_settings for a desvar in cases where a
+        # desvar is also a constraint... Make a test case and fix if needed.
+        var_settings = {}
+        var_settings.update(desvars)
+        var_settings.update(objectives)
+        var_settings.update(constraints)
+        var_settings = self._make_var_setting_serializable(var_settings)
+        var_settings['execution_order'] = var_order
+        return zlib.compress(json.dumps(var_settings, default=default_noraise).encode('ascii'))
+
+    def update_driver_vars(self, recording_requester, driver):
+        """
+        Update the recorded metadata after design variables or responses were added or removed.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        driver : Driver
+            Driver whose design variables or responses have changed.
+        """
+        if recording_requester not in self._started:
+            return  # startup will record the current ones
+
+        system = driver._problem().model
+
+        # _get_vars_exec_order makes a collective MPI call so need to call in all procs
+        var_order = system._get_vars_exec_order(inputs=True, outputs=True, local=False)
+
+        if self.connection:
+            for meta in self._abs2meta.values():
+                meta['type'] = [t for t in meta['type'] if t in ('input', 'output')]
+
+            self._add_voi_types(driver._designvars, driver._responses, driver._objs,
+                                driver._cons)
+
+            abs2meta = zlib.compress(json.dumps(self._abs2meta).encode('ascii'))
+            var_settings_json = self._get_var_settings_json(driver._designvars, driver._objs,
+                                                            driver._cons, var_order)
+
+            if self._record_metadata:
+                # make sure queued cases are written first
+                self.flush()
+                with self.metadata_connection as m:
+                    m.execute("UPDATE metadata SET abs2meta=?, var_settings=?",
+                              (abs2meta, var_settings_json))
+
+    @contextmanager
+    def _cursor(self):
+        """
+        Provide a cursor for writing a record, committing it unless part of a batch.
+
+        Yields
+        ------
+        sqlite3.Cursor
+            A cursor on the case database connection.
+        """
+        if getattr(self._batch, 'active', False):
+            yield self.connection.cursor()
+        else:
+            with self.connection as c:
+                yield c.cursor()  # need a real cursor for lastrowid
+
+    def _write_batch(self, batch):
+        """
+        Perform a batch of queued writes in a single transaction.
+
+        Parameters
+        ----------
+        batch : list of (method, tuple)
+            The write methods and their arguments.
+        """
+        with self.connection:
+            self._batch.active = True
+            try:
+                super()._write_batch(batch)
+            finally:
+                self._batch.active = False
+
     def record_iteration_driver(self, driver, data, metadata):
         """
         Record data and metadata from a Driver.
@@ -466,30 +597,123 @@ class SqliteRecorder(CaseRecorder):
             inputs = data['input']
             residuals = data['residual']
 
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
+            layout, packed = self._pack_driver_data(inputs, outputs, residuals)
 
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
+            if packed is None:
+                # convert to list so this can be dumped as JSON
+                for in_out_resid in (inputs, outputs, residuals):
+                    if in_out_resid is None:
+                        continue
+                    for var in in_out_resid:
+                        in_out_resid[var] = make_serializable(in_out_resid[var])
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+                outputs_text = json.dumps(outputs)
+                inputs_text = json.dumps(inputs)
+                residuals_text = json.dumps(residuals)
+            else:
+                outputs_text = inputs_text = residuals_text = None
+
+            with self._cursor() as c:
+
+                layout_id = None if layout is None else self._get_driver_layout_id(c, layout)
 
                 c.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs, outputs, residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
+                          "timestamp, success, msg, inputs, outputs, residuals, layout, data) "
+                          "VALUES(?,?,?,?,?,?,?,?,?,?)",
                           (self._counter, self._iteration_coordinate,
                            metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
+                           inputs_text, outputs_text, residuals_text, layout_id, packed))
 
                 c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
                           ('driver', c.lastrowid, driver._get_name()))
 
+    def _pack_driver_data(self, inputs, outputs, residuals):
+        """
+        Pack driver iteration data into a single float64 buffer if possible.
+
+        Data can only be packed if every value is a float or floating point array of a continuous
+        variable. Otherwise it must be stored as JSON, which keeps the type of integer and
+        boolean values.
+
+        Parameters
+        ----------
+        inputs : dict or None
+            Input values keyed by variable name.
+        outputs : dict or None
+            Output values keyed by variable name.
+        residuals : dict or None
+            Residual values keyed by variable name.
+
+        Returns
+        -------
+        tuple or None
+            The layout of the packed data, or None if the data could not be packed.
+        sqlite3.Binary or None
+            The packed data, or None if the data could not be packed.
+        """
+        abs2meta = self._abs2meta
+        layout = []
+        for kind, vals in (('input', inputs), ('output', outputs), ('residual', residuals)):
+            if vals:
+                for name, val in vals.items():
+                    if name not in abs2meta or 'shape' not in abs2meta[name]:
+                        return None, None
+                    if isinstance(val, float):
+                        layout.append((kind, name, ()))
+                    elif isinstance(val, np.ndarray) and val.dtype.kind == 'f':
+                        layout.append((kind, name, val.shape))
+                    else:
+                        return None, None
+        layout = tuple(layout)
+
+        try:
+            _, buf, slices = self._driver_layouts[layout]
+        except KeyError:
+            slices = []
+            start = 0
+            for _, _, shape in layout:
+                end = start + int(np.prod(shape))
+                slices.append(slice(start, end))
+                start = end
+            buf = np.empty(start)
+            self._driver_layouts[layout] = (None, buf, slices)
+
+        vals = (v for vals in (inputs, outputs, residuals) if vals for v in vals.values())
+        for val, slc in zip(vals, slices):
+            buf[slc] = np.ravel(val)
+
+        return layout, sqlite3.Binary(buf)
+
+    def _get_driver_layout_id(self, cursor, layout):
+        """
+        Return the id of the given layout, adding it to the driver_layouts table if necessary.
+
+        Parameters
+        ----------
+        cursor : sqlite3.Cursor
+            Cursor used to write the layout.
+        layout : tuple
+            Tuple of (kind, name, shape) for each variable in packed driver iteration data.
+
+        Returns
+        -------
+        int
+            The id of the layout in the driver_layouts table.
+        """
+        layout_id, buf, slices = self._driver_layouts[layout]
+
+        if layout_id is None:
+            layout_dict = {'input': [], 'output': [], 'residual': []}
+            for kind, name, shape in layout:
+                layout_dict[kind].append([name, shape])
+
+            cursor.execute("INSERT INTO driver_layouts(layout) VALUES(?)",
+                           (json.dumps(layout_dict),))
+            layout_id = cursor.lastrowid
+            self._driver_layouts[layout] = (layout_id, buf, slices)
+
+        return layout_id
+
     def record_iteration_problem(self, problem, data, metadata):
         """
         Record data and metadata from a Problem.
@@ -537,8 +761,7 @@ class SqliteRecorder(CaseRecorder):
             abs_err = data['abs'] if 'abs' in data else None
             rel_err = data['rel'] if 'rel' in data else None
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+            with self._cursor() as c:
 
                 c.execute("INSERT INTO problem_cases(counter, case_name, "
                           "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
@@ -585,8 +808,7 @@ class SqliteRecorder(CaseRecorder):
             inputs_text = json.dumps(inputs)
             residuals_text = json.dumps(residuals)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+            with self._cursor() as c:
 
                 c.execute("INSERT INTO system_iterations(counter, iteration_coordinate, "
                           "timestamp, success, msg, inputs , outputs , residuals ) "
@@ -640,8 +862,7 @@ class SqliteRecorder(CaseRecorder):
             inputs_text = json.dumps(inputs)
             residuals_text = json.dumps(residuals)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+            with self._cursor() as c:
 
                 c.execute("INSERT INTO solver_iterations(counter, iteration_coordinate, "
                           "timestamp, success, msg, abs_err, rel_err, "
@@ -681,6 +902,9 @@ class SqliteRecorder(CaseRecorder):
             The unique ID to use for this data in the table.
         """
         if self._record_metadata and self.metadata_connection:
+            # queued cases may be written on the same connection by the background writer
+            self.flush()
+
             json_data = json.dumps(model_viewer_data, default=default_noraise)
 
             # Note: recorded to 'driver_metadata' table for legacy/compatibility reasons.
@@ -739,6 +963,7 @@ class SqliteRecorder(CaseRecorder):
             else:
                 name = META_KEY_SEP.join([path, str(run_number)])
 
+            self.flush()
             with self.metadata_connection as m:
                 m.execute("INSERT INTO system_metadata"
                           "(id, scaling_factors, component_metadata) "
@@ -771,6 +996,7 @@ class SqliteRecorder(CaseRecorder):
 
             solver_options = zlib.compress(pickle.dumps(solver.options, self._pickle_version))
 
+            self.flush()
             with self.metadata_connection as m:
                 m.execute("INSERT INTO solver_metadata(id, solver_options, solver_class)"
                           " VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
@@ -793,8 +1019,7 @@ class SqliteRecorder(CaseRecorder):
             data_array = dict_to_structured_array(data)
             data_blob = array_to_blob(data_array)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+            with self._cursor() as c:
 
                 c.execute("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
                           "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
@@ -806,6 +1031,9 @@ class SqliteRecorder(CaseRecorder):
         """
         Shut down the recorder.
         """
+        # write any queued cases before closing
+        super().shutdown()
+
         # close database connection
         if self._record_metadata and self.metadata_connection and \
                 self.metadata_connection != self.connection:
@@ -824,9 +1052,13 @@ class SqliteRecorder(CaseRecorder):
         """
         Delete all the recordings.
         """
+        self.flush()
+
         if self.connection:
             self.connection.execute("DELETE FROM global_iterations")
             self.connection.execute("DELETE FROM driver_iterations")
+            self.connection.execute("DELETE FROM driver_layouts")
+            self._driver_layouts = {}
             self.connection.execute("DELETE FROM driver_derivatives")
             self.connection.execute("DELETE FROM problem_cases")
             self.connection.execute("DELETE FROM system_iterations")
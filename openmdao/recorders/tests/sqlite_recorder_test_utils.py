@@ -5,7 +5,8 @@ import zlib
 
 from contextlib import contextmanager
 
-from openmdao.utils.record_util import format_iteration_coordinate, deserialize
+from openmdao.utils.record_util import format_iteration_coordinate, deserialize, \
+    dict_to_structured_array
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.recorders.sqlite_recorder import blob_to_array, format_version
 
@@ -120,6 +121,27 @@ def assertProblemDataRecorded(test, filepath, expected, tolerance):
                         assert_near_equal(actual[key], expected[key], tolerance)
 
 
+def unpack_driver_data(db_cur, layout_id, data):
+    """
+    Return the inputs, outputs and residuals in packed driver iteration data as structured arrays.
+    """
+    db_cur.execute("SELECT layout FROM driver_layouts WHERE id=?", (layout_id,))
+    layout = json.loads(db_cur.fetchone()[0])
+
+    flat = np.frombuffer(data)
+    start = 0
+    arrays = []
+    for kind in ('input', 'output', 'residual'):
+        values = {}
+        for name, shape in layout[kind]:
+            size = int(np.prod(shape))
+            values[name] = flat[start:start + size].reshape(shape)
+            start += size
+        arrays.append(dict_to_structured_array(values))
+
+    return arrays
+
+
 def assertDriverIterDataRecorded(test, filepath, expected, tolerance, prefix=None):
     """
     Expected can be from multiple cases.
@@ -141,9 +163,12 @@ def assertDriverIterDataRecorded(test, filepath, expected, tolerance, prefix=Non
                             'iteration coordinate: "{}"'.format(iter_coord))
 
             counter, global_counter, iteration_coordinate, timestamp, success, msg,\
-                inputs_text, outputs_text, residuals_text = row_actual
+                inputs_text, outputs_text, residuals_text = row_actual[:9]
 
-            if f_version >= 3:
+            if f_version >= 15 and row_actual[9] is not None:
+                inputs_actual, outputs_actual, residuals_actual = \
+                    unpack_driver_data(db_cur, row_actual[9], row_actual[10])
+            elif f_version >= 3:
                 inputs_actual = deserialize(inputs_text, abs2meta, prom2abs, conns)
                 outputs_actual = deserialize(outputs_text, abs2meta, prom2abs, conns)
                 residuals_actual = deserialize(residuals_text, abs2meta, prom2abs, conns)
@@ -4,6 +4,8 @@ import sys
 import os
 import unittest
 import platform
+import sqlite3
+import json
 
 from io import StringIO
 from tempfile import mkstemp
@@ -366,6 +368,216 @@ class TestSqliteCaseReader(unittest.TestCase):
         np.testing.assert_almost_equal(last_case.residuals['f_xy'], 0.0)
         np.testing.assert_almost_equal(last_case.residuals['x'], 0.0)
 
+    def test_driver_packed_data(self):
+        prob = ParaboloidProblem()
+        driver = prob.driver = om.ScipyOptimizeDriver(disp=False, tol=1e-9)
+        driver.recording_options['record_inputs'] = True
+        driver.recording_options['record_outputs'] = True
+        driver.recording_options['record_residuals'] = True
+        driver.recording_options['includes'] = ['*']
+        driver.add_recorder(self.recorder)
+
+        prob.setup()
+        prob.set_solver_print(0)
+        prob.run_driver()
+        prob.cleanup()
+
+        filename = prob.get_outputs_dir() / self.filename
+
+        # numeric driver data is stored as a packed buffer sharing a single layout
+        with sqlite3.connect(filename) as con:
+            rows = con.execute("SELECT inputs, outputs, residuals, layout, data "
+                               "FROM driver_iterations").fetchall()
+            nlayouts = con.execute("SELECT count(*) FROM driver_layouts").fetchone()[0]
+        con.close()
+
+        self.assertEqual(nlayouts, 1)
+        for inputs, outputs, residuals, layout, data in rows:
+            self.assertEqual((inputs, outputs, residuals), (None, None, None))
+            self.assertEqual(layout, 1)
+            self.assertIsNotNone(data)
+
+        cr = om.CaseReader(filename)
+        last_case = cr.get_case(-1)
+        for name in ('x', 'y', 'f_xy', 'c'):
+            np.testing.assert_almost_equal(last_case.outputs[name], prob[name])
+            np.testing.assert_almost_equal(last_case.residuals[name], 0.0)
+        np.testing.assert_almost_equal(last_case.inputs['comp.x'], prob['x'])
+        np.testing.assert_almost_equal(last_case.get_val('f_xy'), prob['f_xy'])
+
+    def test_driver_packed_data_writeable(self):
+        prob = SellarProblem(SellarDerivativesGrouped)
+        driver = prob.driver = om.ScipyOptimizeDriver(disp=False, tol=1e-9)
+        driver.recording_options['record_inputs'] = True
+        driver.recording_options['includes'] = ['*']
+        driver.add_recorder(self.recorder)
+
+        prob.setup()
+        prob.set_solver_print(0)
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / self.filename)
+        case = cr.get_case(-1)
+
+        # values unpacked from the database can be modified in place
+        z = case.get_val('z')
+        self.assertTrue(z.flags.writeable)
+        z += 1.0
+        np.testing.assert_almost_equal(z, prob['z'] + 1.0)
+
+        case.outputs['z'][:] = 3.0
+        np.testing.assert_almost_equal(case.outputs['z'], [3.0, 3.0])
+
+        case.inputs['mda.d1.z'] *= 2.0
+        np.testing.assert_almost_equal(case.inputs['mda.d1.z'], 2.0 * prob['z'])
+
+        history = cr.get_val_history('z')
+        history[:] = 0.0
+        np.testing.assert_almost_equal(history, 0.0)
+
+    def test_driver_discrete_data_not_packed(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('expl', ModCompEx(3), promotes_inputs=['x'])
+        model.add_objective('expl.b')
+
+        prob.driver.recording_options['includes'] = ['*']
+        prob.driver.add_recorder(self.recorder)
+
+        prob.setup()
+        prob.set_val('x', 11)
+        prob.run_driver()
+        prob.cleanup()
+
+        filename = prob.get_outputs_dir() / self.filename
+
+        # discrete variables can't be packed, so the data is stored as JSON
+        with sqlite3.connect(filename) as con:
+            layout, data = con.execute("SELECT layout, data FROM driver_iterations").fetchone()
+        con.close()
+
+        self.assertIsNone(layout)
+        self.assertIsNone(data)
+
+        case = om.CaseReader(filename).get_case(0)
+        self.assertEqual(case.outputs['expl.y'], prob.get_val('expl.y'))
+        np.testing.assert_almost_equal(case.outputs['expl.b'], prob.get_val('expl.b'))
+
+    def test_driver_int_data_not_packed(self):
+        prob = ParaboloidProblem()
+        prob.driver.add_recorder(self.recorder)
+        prob.setup()
+        prob.run_driver()
+
+        # packed data is read back as float64, so integer and boolean arrays are stored as JSON
+        # to keep their dtype
+        name = prob.model.get_source('x')
+        for val in (np.array([3]), np.array([True])):
+            self.assertEqual(self.recorder._pack_driver_data(None, {name: val}, None),
+                             (None, None))
+
+        layout, packed = self.recorder._pack_driver_data(None, {name: np.array([3.])}, None)
+        self.assertEqual(layout, (('output', name, (1,)),))
+        self.assertIsNotNone(packed)
+
+        prob.cleanup()
+
+    def test_get_val_history(self):
+        prob = SellarProblem(SellarDerivativesGrouped, nonlinear_solver=om.NonlinearBlockGS)
+        prob.driver = om.ScipyOptimizeDriver(disp=False, tol=1e-9)
+        prob.driver.recording_options['record_inputs'] = True
+        prob.driver.recording_options['includes'] = ['*']
+        prob.driver.add_recorder(self.recorder)
+
+        prob.setup()
+
+        prob.model.mda.recording_options['record_inputs'] = True
+        prob.model.mda.add_recorder(self.recorder)
+
+        prob.set_solver_print(0)
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / self.filename)
+
+        # packed driver data, with promoted, absolute and auto_ivc connected input names
+        names = ['x', 'z', 'obj', 'mda.d1.y1', 'obj_cmp.y2']
+        hist = cr.get_val_history(names)
+        cases = cr.get_cases('driver', recurse=False)
+        for name in names:
+            expected = np.array([np.ravel(case.get_val(name)) for case in cases])
+            np.testing.assert_equal(hist[name], expected)
+
+        self.assertEqual(cr.get_val_history('z').shape, (len(cases), 2))
+
+        # JSON encoded system data, filtered by iteration coordinate
+        hist = cr.get_val_history(['mda.d1.y1', 'y2', 'mda.d2.y1'], source='root.mda')
+        cases = cr.get_cases('root.mda', recurse=False)
+        self.assertEqual(len(hist['y2']), len(cases))
+        for name in hist:
+            expected = np.array([np.ravel(case.get_val(name)) for case in cases])
+            np.testing.assert_equal(hist[name], expected)
+
+        pattern = 'rank0:ScipyOptimize_SLSQP|1|*'
+        hist = cr.get_val_history('y2', source='root.mda', coord_pattern=pattern)
+        cases = [case for case in cases if case.name.startswith(pattern[:-1])]
+        self.assertTrue(0 < len(cases) < len(cr.list_cases('root.mda', recurse=False,
+                                                              out_stream=None)))
+        np.testing.assert_equal(hist, np.array([case.get_val('y2') for case in cases]))
+
+        with self.assertRaises(KeyError) as cm:
+            cr.get_val_history('foo')
+        self.assertEqual(str(cm.exception), '\'Variable name "foo" not found in all cases.\'')
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_history('x', source='bar')
+        self.assertEqual(str(cm.exception), 'Source not found: bar')
+
+    def test_get_val_history_size_mismatch(self):
+        prob = SellarProblem(SellarDerivativesGrouped, nonlinear_solver=om.NonlinearBlockGS)
+        prob.driver = om.ScipyOptimizeDriver(disp=False, tol=1e-9)
+        prob.driver.add_recorder(self.recorder)
+
+        prob.setup()
+
+        prob.model.mda.add_recorder(self.recorder)
+
+        prob.set_solver_print(0)
+        prob.run_driver()
+        prob.cleanup()
+
+        filename = prob.get_outputs_dir() / self.filename
+
+        with sqlite3.connect(filename) as con:
+            # a JSON system case where y2 has a different size than in the other cases
+            rowid, outputs = con.execute("SELECT id, outputs FROM system_iterations "
+                                         "ORDER BY id LIMIT 1").fetchone()
+            outputs = json.loads(outputs)
+            outputs['mda.d2.y2'] = [1.0, 2.0]
+            con.execute("UPDATE system_iterations SET outputs=? WHERE id=?",
+                        (json.dumps(outputs), rowid))
+
+            # a JSON driver case where z has a different size than in the packed cases
+            con.execute("UPDATE driver_iterations SET layout=NULL, data=NULL, inputs=NULL, "
+                        "outputs=? WHERE id=(SELECT max(id) FROM driver_iterations)",
+                        (json.dumps({'z': [1.0, 2.0, 3.0]}),))
+        con.close()
+
+        cr = om.CaseReader(filename)
+
+        with self.assertRaises(ValueError) as cm:
+            cr.get_val_history('y2', source='root.mda')
+        self.assertEqual(str(cm.exception),
+                         "Can't get the history of variable 'y2' because its size is not the "
+                         "same in all cases: [1, 2].")
+
+        with self.assertRaises(ValueError) as cm:
+            cr.get_val_history('z')
+        self.assertEqual(str(cm.exception),
+                         "Can't get the history of variable 'z' because its size is not the "
+                         "same in all cases: [2, 3].")
+
     def test_reading_system_cases(self):
         prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
                              linear_solver=om.ScipyKrylov)
@@ -3153,7 +3365,8 @@ class DummyClass(object):
         parab_component_options = cr._system_options['parab_with_dummy_metadata']['component_options']
         component_options_names = [name for name in parab_component_options]
         from openmdao.recorders.sqlite_reader import UnknownType
-        self.assertEqual(['always_opt', 'default_shape', 'derivs_method', 'distributed', 'dummy', 'run_root_only', 'use_jit'],
+        self.assertEqual(['always_opt', 'default_shape', 'derivs_method', 'distributed', 'dummy',
+                          'par_fd_backend', 'run_root_only', 'use_jit'],
                          sorted(component_options_names))
         self.assertTrue(isinstance(parab_component_options['dummy'], UnknownType))
 
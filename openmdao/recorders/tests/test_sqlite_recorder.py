@@ -1,5 +1,8 @@
 """ Unit test for the SqliteRecorder. """
 import os
+import subprocess
+import sys
+import textwrap
 import unittest
 from io import StringIO
 import sqlite3
@@ -473,6 +476,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "        always_opt: False",
             "        use_jit: True",
             "        default_shape: (1,)",
+            "        par_fd_backend: mpi",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: ()",
@@ -492,6 +496,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "        always_opt: False",
             "        use_jit: True",
             "        default_shape: (1,)",
+            "        par_fd_backend: mpi",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: ()",
@@ -511,17 +516,20 @@ class TestSqliteRecorder(unittest.TestCase):
             "        always_opt: False",
             "        use_jit: True",
             "        default_shape: ()",
+            "        par_fd_backend: mpi",
             "    Subsystem : con",
             "        derivs_method: None",
             "        run_root_only: False",
             "        always_opt: False",
             "        use_jit: True",
             "        default_shape: ()",
+            "        par_fd_backend: mpi",
             "        has_diag_partials: False",
             "        units: None",
             "        shape: None",
             "        shape_by_conn: False",
             "        do_coloring: False",
+            "        use_kernel: True",
             ""
         ]
 
@@ -588,6 +596,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "        always_opt: False",
             "        use_jit: True",
             "        default_shape: (1,)",
+            "        par_fd_backend: mpi",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: ()",
@@ -607,6 +616,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "        always_opt: False",
             "        use_jit: True",
             "        default_shape: (1,)",
+            "        par_fd_backend: mpi",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: ()",
@@ -626,17 +636,20 @@ class TestSqliteRecorder(unittest.TestCase):
             "        always_opt: False",
             "        use_jit: True",
             "        default_shape: ()",
+            "        par_fd_backend: mpi",
             "    Subsystem : con",
             "        derivs_method: None",
             "        run_root_only: False",
             "        always_opt: False",
             "        use_jit: True",
             "        default_shape: ()",
+            "        par_fd_backend: mpi",
             "        has_diag_partials: False",
             "        units: None",
             "        shape: None",
             "        shape_by_conn: False",
             "        do_coloring: False",
+            "        use_kernel: True",
             ""
         ]
 
@@ -1296,6 +1309,89 @@ class TestSqliteRecorder(unittest.TestCase):
         assertSolverIterDataRecorded(self, prob.get_outputs_dir() / self.filename,
                                      expected_data, self.eps, prefix='run_again')
 
+    def test_async_write(self):
+        def run(filename, async_write):
+            prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
+                                 linear_solver=om.ScipyKrylov)
+            recorder = om.SqliteRecorder(filename, record_viewer_data=False,
+                                         async_write=async_write)
+            prob.add_recorder(recorder)
+            prob.driver.add_recorder(recorder)
+            prob.driver.recording_options['record_derivatives'] = True
+            prob.model.add_recorder(recorder)
+            prob.setup()
+            prob.model.nonlinear_solver.add_recorder(recorder)
+
+            prob.run_driver()
+            prob.record('first')
+            prob.set_val('x', 2.0)
+            prob.run_driver()
+            prob.record('second')
+
+            # everything recorded so far can be read after a flush
+            recorder.flush()
+            cr = om.CaseReader(prob.get_outputs_dir() / filename)
+            flushed_cases = cr.list_cases(out_stream=None)
+
+            prob.cleanup()
+
+            cr = om.CaseReader(prob.get_outputs_dir() / filename)
+            self.assertEqual(cr.list_cases(out_stream=None), flushed_cases)
+
+            return cr
+
+        expected = run('sync.sql', async_write=False)
+        actual = run('async.sql', async_write=True)
+
+        expected_cases = []
+        for source in ('problem', 'driver', 'root', 'root.nonlinear_solver'):
+            cases = expected.list_cases(source, recurse=False, out_stream=None)
+            self.assertTrue(cases)
+            self.assertEqual(actual.list_cases(source, recurse=False, out_stream=None), cases)
+            expected_cases.extend(cases)
+
+        for name in expected_cases:
+            expected_case = expected.get_case(name)
+            actual_case = actual.get_case(name)
+            self.assertEqual(actual_case.counter, expected_case.counter)
+            for key, val in expected_case.outputs.items():
+                assert_near_equal(actual_case.outputs[key], val)
+            if expected_case.derivatives is not None:
+                for key, val in expected_case.derivatives.items():
+                    assert_near_equal(actual_case.derivatives[key], val)
+
+    def test_async_write_without_cleanup(self):
+        # queued cases are written when the interpreter exits, even if the recorder was never
+        # shut down
+        filename = os.path.join(self.tempdir, 'no_cleanup.sql')
+        script = os.path.join(self.tempdir, 'no_cleanup.py')
+        with open(script, 'w') as f:
+            f.write(textwrap.dedent(f"""
+                import openmdao.api as om
+                from openmdao.test_suite.components.sellar import SellarProblem
+
+                prob = SellarProblem()
+                recorder = om.SqliteRecorder({filename!r}, record_viewer_data=False,
+                                             async_write=True)
+                prob.add_recorder(recorder)
+                prob.setup()
+                for i in range(200):
+                    prob.set_val('x', 1.0 + i)
+                    prob.run_model()
+                    prob.record(f'case_{{i}}')
+            """))
+
+        env = os.environ.copy()
+        env['OPENMDAO_REPORTS'] = '0'
+        env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(os.path.dirname(om.__file__)),
+                                             env.get('PYTHONPATH', '')])
+        subprocess.run([sys.executable, script], check=True, cwd=self.tempdir, env=env)
+
+        cr = om.CaseReader(filename)
+        cases = cr.list_cases('problem', out_stream=None)
+        self.assertEqual(len(cases), 200)
+        assert_near_equal(cr.get_case(cases[-1]).get_val('x'), 200.0)
+
     def test_record_solver_includes_excludes(self):
         prob = om.Problem()
 
@@ -3014,7 +3110,9 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['type'], 'doe')
         self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
                                                'invalid_desvar_behavior': 'warn',
-                                               'run_parallel': False, 'procs_per_model': 1})
+                                               'design_point_cache_size': 0,
+                                               'run_parallel': False, 'procs_per_model': 1,
+                                               'parallel_backend': 'mpi', 'num_workers': None})
 
         # Optimization
         driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-3)
@@ -3034,6 +3132,7 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['options'], {"debug_print": [], "optimizer": "SLSQP",
                                                "tol": 1e-03, "maxiter": 200, "disp": True,
                                                "invalid_desvar_behavior": "warn",
+                                               "design_point_cache_size": 0,
                                                 'singular_jac_behavior': 'warn', 'singular_jac_tol': 1e-16})
         self.assertEqual(metadata['opt_settings'], {"maxiter": 1000})
 
@@ -0,0 +1,182 @@
+"""Define the AssembledPrecon class used by the Krylov solvers."""
+
+import numpy as np
+from scipy.sparse import coo_matrix, csc_matrix
+from scipy.sparse.linalg import spilu, splu
+
+
+class AssembledPrecon(object):
+    """
+    Preconditioner factored directly from the assembled dr/do matrix of a system.
+
+    The factorization is computed once per linearization and each application is a single
+    sparse triangular solve, so no OpenMDAO solver recursion happens inside the Krylov
+    iteration.
+
+    Parameters
+    ----------
+    kind : str
+        'ilu' for an incomplete LU factorization of the whole matrix, or 'block_jacobi' for an
+        exact LU factorization of the diagonal blocks belonging to each child subsystem.
+    drop_tol : float
+        Drop tolerance of the incomplete LU factorization.
+    fill_factor : float
+        Upper bound on the fill ratio of the incomplete LU factorization.
+
+    Attributes
+    ----------
+    kind : str
+        Type of the preconditioner.
+    drop_tol : float
+        Drop tolerance of the incomplete LU factorization.
+    fill_factor : float
+        Upper bound on the fill ratio of the incomplete LU factorization.
+    _lu : SuperLU or None
+        The factorization, or None if there is no matrix on this proc.
+    _complex : bool
+        True if the factored matrix is complex.
+    _block_ids : ndarray or None
+        Index of the diagonal block of each row, for block Jacobi.
+    """
+
+    def __init__(self, kind, drop_tol=1e-4, fill_factor=10.):
+        """
+        Initialize attributes.
+        """
+        self.kind = kind
+        self.drop_tol = drop_tol
+        self.fill_factor = fill_factor
+        self._lu = None
+        self._complex = False
+        self._block_ids = None
+
+    def _get_block_ids(self, system):
+        """
+        Return the index of the diagonal block of each row of the dr/do matrix.
+
+        Each local child subsystem of a Group is one block. The outputs of any other system are
+        each their own block.
+
+        Parameters
+        ----------
+        system : System
+            The system that owns the matrix.
+
+        Returns
+        -------
+        ndarray
+            Index of the diagonal block of each row.
+        """
+        if self._block_ids is not None:
+            return self._block_ids
+
+        doutputs = system._doutputs
+        block_ids = np.arange(len(doutputs._data))
+        subsystems = getattr(system, '_subsystems_myproc', None)
+
+        if subsystems:
+            for i, subsys in enumerate(subsystems):
+                names = list(subsys._doutputs._views)
+                if names:
+                    start = doutputs.get_range(names[0])[0]
+                    stop = doutputs.get_range(names[-1])[1]
+                    block_ids[start:stop] = -1 - i
+        else:
+            for i, name in enumerate(doutputs._views):
+                start, stop = doutputs.get_range(name)
+                block_ids[start:stop] = -1 - i
+
+        self._block_ids = block_ids
+        return block_ids
+
+    def factor(self, system):
+        """
+        Factor the current dr/do matrix of the system.
+
+        Parameters
+        ----------
+        system : System
+            The system that owns the assembled jacobian.
+        """
+        matrix = system._assembled_jac.get_dr_do_matrix()
+        if matrix is None:
+            # this happens if we're not rank 0 when using owned_sizes
+            self._lu = None
+            return
+
+        if self.kind == 'block_jacobi':
+            coo = coo_matrix(matrix)
+            block_ids = self._get_block_ids(system)
+            mask = block_ids[coo.row] == block_ids[coo.col]
+            mtx = csc_matrix((coo.data[mask], (coo.row[mask], coo.col[mask])), shape=coo.shape)
+        else:
+            mtx = csc_matrix(matrix)
+
+        self._complex = np.iscomplexobj(mtx.data)
+
+        try:
+            if self.kind == 'ilu':
+                self._lu = spilu(mtx, drop_tol=self.drop_tol, fill_factor=self.fill_factor)
+            else:
+                self._lu = splu(mtx)
+        except RuntimeError as err:
+            raise RuntimeError(f"{system.msginfo}: Failed to compute the '{self.kind}' "
+                               f"preconditioner of the assembled jacobian: {err}")
+
+    def solve(self, arr, mode):
+        """
+        Apply the preconditioner.
+
+        Parameters
+        ----------
+        arr : ndarray
+            Incoming vector.
+        mode : str
+            'fwd' or 'rev'. In rev mode the transposed preconditioner is applied.
+
+        Returns
+        -------
+        ndarray
+            The preconditioned vector.
+        """
+        if self._lu is None:
+            return arr.copy()
+
+        trans = 'N' if mode == 'fwd' else 'T'
+
+        if np.iscomplexobj(arr) and not self._complex:
+            # complex step with a real factorization
+            return self._lu.solve(arr.real, trans=trans) + 1j * self._lu.solve(arr.imag,
+                                                                               trans=trans)
+
+        return self._lu.solve(arr, trans=trans)
+
+
+def create_assembled_precon(solver):
+    """
+    Create the assembled preconditioner requested by the options of a Krylov solver.
+
+    Parameters
+    ----------
+    solver : LinearSolver
+        A Krylov solver with 'assembled_precon', 'ilu_drop_tol' and 'ilu_fill_factor' options.
+
+    Returns
+    -------
+    AssembledPrecon or None
+        The preconditioner, or None if none was requested.
+    """
+    options = solver.options
+    kind = options['assembled_precon']
+    if kind is None:
+        return None
+
+    if solver.precon is not None:
+        raise RuntimeError(f"{solver.msginfo}: Option 'assembled_precon' can't be used when a "
+                           "'precon' solver is also set.")
+
+    if solver._system().comm.size > 1:
+        raise RuntimeError(f"{solver.msginfo}: Option 'assembled_precon' is not supported when "
+                           "the system is running on more than one proc.")
+
+    return AssembledPrecon(kind, options['ilu_drop_tol'], options['ilu_fill_factor'])
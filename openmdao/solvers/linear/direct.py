@@ -1,5 +1,6 @@
 """LinearSolver that uses linalg.solve or LU factor/solve."""
 
+import time
 import warnings
 
 import numpy as np
@@ -11,6 +12,7 @@ from openmdao.solvers.solver import LinearSolver
 from openmdao.matrices.dense_matrix import DenseMatrix
 from openmdao.utils.array_utils import identity_column_iter
 from openmdao.solvers.linear.linear_rhs_checker import LinearRHSChecker
+from openmdao.solvers.linear.sparse_lu import check_sparse_lu, create_sparse_lu
 
 
 def index_to_varname(system, loc):
@@ -184,6 +186,8 @@ class DirectSolver(LinearSolver):
     ----------
     _lin_rhs_checker : LinearRHSChecker or None
         Object for checking the right-hand side of the linear solve.
+    _sparse_lu : SparseLU or None
+        Backend used to factor assembled sparse jacobians.
     """
 
     SOLVER = 'LN: Direct'
@@ -194,6 +198,7 @@ class DirectSolver(LinearSolver):
         """
         super().__init__(**kwargs)
         self._lin_rhs_checker = None
+        self._sparse_lu = None
 
     def _declare_options(self):
         """
@@ -211,6 +216,25 @@ class DirectSolver(LinearSolver):
                              "allow finer control over it. Allowed options are: "
                              f"{LinearRHSChecker.options}")
 
+        self.options.declare('multi_rhs', types=bool, default=False,
+                             desc="If True and this is the model's linear solver, solve all "
+                             "seeds of a total derivative computation as a single block of "
+                             "right-hand sides instead of one at a time. Seeds are solved one "
+                             "at a time if 'rhs_checking' is set or if any of them has "
+                             "'cache_linear_solution' set.")
+
+        self.options.declare('sparse_lu', default='scipy_cached_ordering',
+                             check_valid=check_sparse_lu,
+                             desc="Backend used to factor an assembled sparse (CSC) jacobian. "
+                             "'scipy' runs a full scipy splu at every linearization, "
+                             "'scipy_cached_ordering' computes the fill-reducing column "
+                             "ordering once and reuses it while the sparsity pattern is "
+                             "unchanged. Can also be set to a subclass of "
+                             "openmdao.solvers.linear.sparse_lu.SparseLU.")
+
+        self.options.declare('debug_print', types=bool, default=False,
+                             desc="If True, print the time taken by each factorization.")
+
         # this solver does not iterate
         self.options.undeclare("maxiter")
         self.options.undeclare("err_on_non_converge")
@@ -257,6 +281,7 @@ class DirectSolver(LinearSolver):
         super()._setup_solvers(system, depth)
         self._disallow_distrib_solve()
         self._lin_rhs_checker = LinearRHSChecker.create(system, self.options['rhs_checking'])
+        self._sparse_lu = create_sparse_lu(self.options['sparse_lu'])
 
     def _linearize_children(self):
         """
@@ -291,6 +316,29 @@ class DirectSolver(LinearSolver):
         """
         return False
 
+    def can_solve_multi_rhs(self):
+        """
+        Return True if this solver can solve for multiple right-hand sides in a single call.
+
+        Returns
+        -------
+        bool
+            True if solve_multi_rhs can be called on this solver.
+        """
+        return (self.options['multi_rhs'] and not self.options['rhs_checking'] and
+                self._system().comm.size == 1)
+
+    def _supports_multi_col(self):
+        """
+        Return True if this solver can solve linear vectors holding one seed per column.
+
+        Returns
+        -------
+        bool
+            True if solve() works while the linear vectors hold multiple columns.
+        """
+        return not self.options['rhs_checking']
+
     def _build_mtx(self):
         """
         Assemble a Jacobian matrix by matrix-vector-product with columns of identity.
@@ -339,6 +387,10 @@ class DirectSolver(LinearSolver):
         system = self._system()
         nproc = system.comm.size
 
+        if self.options['debug_print']:
+            start = time.perf_counter()
+        kind = 'dense'
+
         if system._get_assembled_jac() is not None:
             matrix = system._assembled_jac.get_dr_do_matrix()
 
@@ -349,9 +401,11 @@ class DirectSolver(LinearSolver):
             # Perform dense or sparse lu factorization.
             elif isinstance(matrix, csc_matrix):
                 try:
-                    self._lu = scipy.sparse.linalg.splu(matrix)
+                    self._sparse_lu.factor(matrix)
                 except RuntimeError:
                     raise RuntimeError(format_singular_error(system, matrix))
+                self._lu = self._sparse_lu
+                kind = 'sparse, reused ordering' if self._lu.reused_analysis else 'sparse'
 
             elif isinstance(matrix, np.ndarray):  # dense
                 # During LU decomposition, detect singularities and warn user.
@@ -395,9 +449,28 @@ class DirectSolver(LinearSolver):
                 except ValueError:
                     raise RuntimeError(format_nan_error(system, mtx))
 
+        if self.options['debug_print']:
+            self._print_factor_time(kind, time.perf_counter() - start)
+
         if self._lin_rhs_checker is not None:
             self._lin_rhs_checker.clear()
 
+    def _print_factor_time(self, kind, elapsed):
+        """
+        Print the time taken by a factorization.
+
+        Parameters
+        ----------
+        kind : str
+            Description of the kind of factorization.
+        elapsed : float
+            Elapsed wall time of the factorization in seconds.
+        """
+        system = self._system()
+        if system.comm.rank == 0:
+            print(f"{self._solver_info.prefix}{self.SOLVER} factorization ({kind}) of "
+                  f"'{system.pathname}': {elapsed:.6g} sec")
+
     def _inverse(self):
         """
         Return the inverse Jacobian.
@@ -530,6 +603,80 @@ class DirectSolver(LinearSolver):
         if not system.under_complex_step and self._lin_rhs_checker is not None and mode == 'rev':
             self._lin_rhs_checker.add_solution(b_vec, sol_array, copy=True)
 
+    def solve_multi_rhs(self, rhs, mode):
+        """
+        Solve the factored linear system for a block of right-hand sides.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Array of shape (n, nrhs) where each column is a right-hand side in physical
+            (unscaled) form.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n, nrhs) containing the solutions in physical form.
+        """
+        system = self._system()
+
+        if mode == 'fwd':
+            b_vec = system._dresiduals
+            x_vec = system._doutputs
+            trans_lu = 0
+            trans_splu = 'N'
+        else:  # rev
+            b_vec = system._doutputs
+            x_vec = system._dresiduals
+            trans_lu = 1
+            trans_splu = 'T'
+
+        # AssembledJacobians are unscaled.
+        if system._get_assembled_jac() is not None:
+            if isinstance(system._assembled_jac._dr_do_mtx, DenseMatrix):
+                return scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
+            return self._lu.solve(rhs, trans_splu)
+
+        # matrix-vector-product generated jacobians are scaled.
+        b_factors = self._get_norm_factors(b_vec)
+        if b_factors is not None:
+            rhs = rhs * b_factors[:, np.newaxis]
+
+        sol_array = scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
+
+        x_factors = self._get_norm_factors(x_vec)
+        if x_factors is not None:
+            sol_array /= x_factors[:, np.newaxis]
+
+        return sol_array
+
+    def _get_norm_factors(self, vec):
+        """
+        Return the factors that convert the given linear vector from physical to scaled form.
+
+        Parameters
+        ----------
+        vec : <Vector>
+            The linear output or residual vector of the owning system.
+
+        Returns
+        -------
+        ndarray or None
+            Multiplicative scaling factors, or None if the vector is not scaled.
+        """
+        system = self._system()
+        if vec._kind == 'output':
+            if not system._has_output_scaling:
+                return None
+        elif not system._has_resid_scaling:
+            return None
+
+        # same scaler that vec.scale_to_norm() divides by
+        scaling = vec._nlvec._scaling if vec._has_solver_ref else vec._scaling
+        return 1.0 / scaling[0]
+
     def preferred_sparse_format(self):
         """
         Return the preferred sparse format for the dr/do matrix of a split jacobian.
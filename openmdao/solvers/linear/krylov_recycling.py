@@ -0,0 +1,317 @@
+"""
+GMRES with deflated restarting and subspace recycling (GCRO-DR).
+
+Based on Parks, de Sturler, Mackey, Johnson and Maiti, "Recycling Krylov subspaces for sequences
+of linear systems", SIAM J. Sci. Comput. 28(5), 2006.
+"""
+
+import numpy as np
+from scipy.linalg import eig, lstsq, qr, solve_triangular
+from scipy.sparse.linalg import aslinearoperator
+
+
+class RecycleSpace(object):
+    """
+    Subspace retained by gcrodr between solves.
+
+    Attributes
+    ----------
+    U : ndarray or None
+        Basis of the recycled subspace, one vector per column.
+    C : ndarray or None
+        Orthonormal basis of A @ U, or None if it must be recomputed because the operator has
+        changed.
+    """
+
+    def __init__(self):
+        """
+        Initialize attributes.
+        """
+        self.U = None
+        self.C = None
+
+    def __bool__(self):
+        """
+        Return True if the space contains any vectors.
+
+        Returns
+        -------
+        bool
+            True if the space contains any vectors.
+        """
+        return self.U is not None
+
+    def clear(self):
+        """
+        Discard the subspace.
+        """
+        self.U = None
+        self.C = None
+
+    def operator_changed(self):
+        """
+        Keep the subspace, but recompute its image at the start of the next solve.
+        """
+        self.C = None
+
+
+def _harmonic_ritz(G, VW, k):
+    """
+    Return a basis for the k harmonic Ritz vectors of smallest harmonic Ritz value.
+
+    Parameters
+    ----------
+    G : ndarray
+        Projected operator, with one more row than columns.
+    VW : ndarray
+        Product of the transposed left and the right bases of the projection.
+    k : int
+        Number of vectors.
+
+    Returns
+    -------
+    ndarray
+        Real basis of the harmonic Ritz vectors, one per column.
+    """
+    vals, vecs = eig(G.T.dot(G), G.T.dot(VW))
+    vals[~np.isfinite(vals)] = np.inf
+
+    cols = []
+    for i in np.argsort(np.abs(vals)):
+        if len(cols) >= k or not np.isfinite(vals[i]):
+            break
+        vec = vecs[:, i]
+        if vals[i].imag > 0.0:
+            # take the real and imaginary parts of a complex conjugate pair
+            cols.append(vec.real)
+            cols.append(vec.imag)
+        elif vals[i].imag == 0.0:
+            cols.append(vec.real)
+
+    if not cols:
+        return None
+
+    return qr(np.column_stack(cols), mode='economic')[0]
+
+
+def _set_space(space, U, C, R):
+    """
+    Store U R^-1 and C in the recycle space, or clear it if R is numerically singular.
+
+    Parameters
+    ----------
+    space : RecycleSpace
+        The recycle space.
+    U : ndarray
+        Basis of the new subspace.
+    C : ndarray
+        Orthonormal basis of A @ U R^-1.
+    R : ndarray
+        Triangular factor of A @ U.
+    """
+    diag = np.abs(np.diag(R))
+    if diag.size == 0 or diag.min() <= 1e-12 * diag.max():
+        space.clear()
+    else:
+        space.U = solve_triangular(R, U.T, trans='T').T
+        space.C = C
+
+
+def gcrodr(A, b, x0=None, *, rtol=1e-5, atol=0., maxiter=1000, M=None, callback=None, m=20,
+           k=10, recycle=None):
+    """
+    Solve A x = b with GCRO-DR, recycling a subspace from previous solves.
+
+    The k harmonic Ritz vectors with the smallest harmonic Ritz values, which approximate the
+    eigenvectors that slow down restarted GMRES, are kept in the recycle space at every restart
+    and at the end of the solve. A later solve projects them out of its residual before
+    building its own Krylov subspace, so it starts as if restarted GMRES had already converged
+    in those directions.
+
+    Parameters
+    ----------
+    A : LinearOperator
+        The linear operator.
+    b : ndarray
+        The right-hand side.
+    x0 : ndarray or None
+        The initial guess, or None for zero.
+    rtol : float
+        Relative tolerance on the residual norm.
+    atol : float
+        Absolute tolerance on the residual norm.
+    maxiter : int
+        Maximum number of iterations, summed over all cycles.
+    M : LinearOperator or None
+        Right preconditioner.
+    callback : function or None
+        Called with the estimated residual norm after every iteration.
+    m : int
+        Dimension of the search space of each cycle, including the recycled vectors.
+    k : int
+        Number of vectors to recycle. Must be less than m.
+    recycle : RecycleSpace or None
+        Recycled subspace, updated in place. If None, nothing is recycled and the solver
+        behaves like restarted GMRES with deflation within this solve.
+
+    Returns
+    -------
+    ndarray
+        The solution.
+    int
+        0 if the solve converged, else the number of iterations performed.
+    """
+    A = aslinearoperator(A)
+    if M is None:
+        def op(v):
+            return A.matvec(v).ravel()
+    else:
+        M = aslinearoperator(M)
+
+        def op(v):
+            return A.matvec(M.matvec(v).ravel()).ravel()
+
+    if recycle is None:
+        recycle = RecycleSpace()
+
+    k = min(k, m - 1)
+    n = b.size
+    dtype = np.result_type(b, float)
+    b = b.ravel()
+
+    if x0 is None or not np.any(x0):
+        x0 = np.zeros(n, dtype=dtype)
+        r = b.astype(dtype, copy=True)
+    else:
+        x0 = np.asarray(x0, dtype=dtype).ravel()
+        r = b - A.matvec(x0).ravel()
+
+    tol = max(atol, rtol * np.linalg.norm(b))
+
+    # the solution is x0 + M z
+    z = np.zeros(n, dtype=dtype)
+
+    U = recycle.U
+    if U is not None and (U.shape[0] != n or U.dtype != dtype):
+        recycle.clear()
+        U = None
+
+    if U is not None and recycle.C is None:
+        Q, R = qr(np.column_stack([op(u) for u in U.T]), mode='economic')
+        _set_space(recycle, U, Q, R)
+
+    rnorm = np.linalg.norm(r)
+    iters = 0
+    true_residual = True
+
+    while iters < maxiter:
+        if rnorm <= tol:
+            if true_residual:
+                break
+
+            # the updated residual can drift away from the true one if A is ill-conditioned
+            x0 = x0 + (z if M is None else M.matvec(z).ravel())
+            z = np.zeros(n, dtype=dtype)
+            r = b - A.matvec(x0).ravel()
+            rnorm = np.linalg.norm(r)
+            true_residual = True
+            continue
+
+        true_residual = False
+        nrec = recycle.U.shape[1] if recycle else 0
+        s = min(m - nrec, maxiter - iters)
+
+        if nrec:
+            # the residual is orthogonal to C in exact arithmetic (except for the first cycle),
+            # keep it that way
+            proj = recycle.C.T.dot(r)
+            z += recycle.U.dot(proj)
+            r -= recycle.C.dot(proj)
+            rnorm = np.linalg.norm(r)
+
+        # the basis vectors are stored as rows so that they are contiguous
+        V = np.zeros((s + 1, n), dtype=dtype)
+        H = np.zeros((s + 1, s), dtype=dtype)
+        B = np.zeros((nrec, s), dtype=dtype)
+        V[0] = r / rnorm
+
+        # Givens rotations of H, used to estimate the residual norm at each iteration. Since the
+        # residual is orthogonal to C, it is the same as for GMRES on H alone.
+        rot_c = np.zeros(s, dtype=dtype)
+        rot_s = np.zeros(s, dtype=dtype)
+        g = np.zeros(s + 1, dtype=dtype)
+        g[0] = rnorm
+
+        # Arnoldi process on (I - C C^T) A, with classical Gram-Schmidt applied twice
+        for j in range(s):
+            w = op(V[j])
+            Vj = V[:j + 1]
+            for _ in range(2):
+                if nrec:
+                    proj = recycle.C.T.dot(w)
+                    B[:, j] += proj
+                    w -= recycle.C.dot(proj)
+                proj = Vj.dot(w)
+                H[:j + 1, j] += proj
+                w -= proj.dot(Vj)
+            H[j + 1, j] = np.linalg.norm(w)
+
+            h = H[:j + 2, j].copy()
+            for i in range(j):
+                h[i], h[i + 1] = (rot_c[i] * h[i] + rot_s[i] * h[i + 1],
+                                  rot_c[i] * h[i + 1] - rot_s[i] * h[i])
+            denom = np.sqrt(h[j] ** 2 + h[j + 1] ** 2)
+            rot_c[j] = h[j] / denom
+            rot_s[j] = h[j + 1] / denom
+            g[j + 1] = -rot_s[j] * g[j]
+            g[j] *= rot_c[j]
+
+            iters += 1
+            if callback is not None:
+                callback(abs(g[j + 1]))
+
+            if H[j + 1, j] <= 1e-14 * np.abs(h[j]):
+                s = j + 1
+                break
+            V[j + 1] = w / H[j + 1, j]
+            if abs(g[j + 1]) <= tol:
+                s = j + 1
+                break
+
+        V = V[:s + 1].T
+        H = H[:s + 1, :s]
+        B = B[:, :s]
+
+        if nrec:
+            Ur = recycle.U
+            scale = 1.0 / np.linalg.norm(Ur, axis=0)
+            Vh = np.hstack((recycle.C, V))
+            Wh = np.hstack((Ur * scale, V[:, :s]))
+            G = np.zeros((nrec + s + 1, nrec + s), dtype=dtype)
+            G[:nrec, :nrec] = np.diag(scale)
+            G[:nrec, nrec:] = B
+            G[nrec:, nrec:] = H
+        else:
+            Vh = V
+            Wh = V[:, :s]
+            G = H
+
+        c = Vh.T.dot(r)
+        y = lstsq(G, c)[0]
+        z += Wh.dot(y)
+        r = Vh.dot(c - G.dot(y))
+        rnorm = np.linalg.norm(r)
+
+        if k > 0:
+            P = _harmonic_ritz(G, Vh.T.dot(Wh), k)
+            if P is None:
+                recycle.clear()
+            else:
+                Q, R = qr(G.dot(P), mode='economic')
+                _set_space(recycle, Wh.dot(P), Vh.dot(Q), R)
+        else:
+            recycle.clear()
+
+    x = x0 + (z if M is None else M.matvec(z).ravel())
+
+    return x, 0 if rnorm <= tol else iters
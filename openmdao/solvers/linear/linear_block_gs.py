@@ -50,6 +50,20 @@ class LinearBlockGS(BlockLinearSolver):
         self.options.declare('aitken_initial_factor', default=1.0,
                              desc='initial value for Aitken relaxation factor')
 
+    def _supports_multi_col(self):
+        """
+        Return True if this solver can solve linear vectors holding one seed per column.
+
+        Aitken relaxation computes a single relaxation factor, so it can't be shared by
+        multiple seeds.
+
+        Returns
+        -------
+        bool
+            True if solve() works while the linear vectors hold multiple columns.
+        """
+        return not self.options['use_aitken']
+
     def _iter_initialize(self):
         """
         Perform any necessary pre-processing operations.
@@ -4,6 +4,7 @@ import numpy as np
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.solvers.linear.linear_rhs_checker import LinearRHSChecker
+from openmdao.solvers.linear.assembled_precon import create_assembled_precon
 from openmdao.utils.mpi import check_mpi_env
 
 use_mpi = check_mpi_env()
@@ -180,6 +181,8 @@ class PETScKrylov(LinearSolver):
         Dictionary of KSP instances (keyed on vector name).
     _lin_rhs_checker : LinearRHSChecker or None
         Object for checking the right-hand side of the linear solve.
+    _assembled_precon : AssembledPrecon or None
+        Preconditioner factored from the assembled jacobian, if requested.
     """
 
     SOLVER = 'LN: PETScKrylov'
@@ -197,6 +200,7 @@ class PETScKrylov(LinearSolver):
         self._ksp = None
         self.precon = None
         self._lin_rhs_checker = None
+        self._assembled_precon = None
 
     def _declare_options(self):
         """
@@ -214,6 +218,21 @@ class PETScKrylov(LinearSolver):
         self.options.declare('precon_side', default='right', values=['left', 'right'],
                              desc='Preconditioner side, default is right.')
 
+        self.options.declare('assembled_precon', default=None,
+                             values=(None, 'ilu', 'block_jacobi'),
+                             desc="Preconditioner computed directly from the assembled jacobian "
+                             "of the system once per linearization. 'ilu' is an incomplete LU "
+                             "factorization of the whole matrix and 'block_jacobi' an LU "
+                             "factorization of the diagonal blocks of each subsystem. Setting it "
+                             "implies 'assemble_jac'. It can't be combined with 'precon'.")
+
+        self.options.declare('ilu_drop_tol', default=1e-4, types=float, lower=0.0,
+                             desc="Drop tolerance of the 'ilu' assembled preconditioner.")
+
+        self.options.declare('ilu_fill_factor', default=10.0, types=(int, float), lower=1.0,
+                             desc="Upper bound on the fill ratio of the 'ilu' assembled "
+                             "preconditioner.")
+
         self.options.declare('rhs_checking', types=(bool, dict),
                              default=False,
                              desc="If True, check RHS vs. cache and/or zero to avoid some solves."
@@ -225,12 +244,13 @@ class PETScKrylov(LinearSolver):
         self.options['maxiter'] = 100
 
         self.supports['implicit_components'] = True
+        self.supports['jac_vec_product'] = True
 
     def _assembled_jac_solver_iter(self):
         """
         Return a generator of linear solvers using assembled jacs.
         """
-        if self.options['assemble_jac']:
+        if self.options['assemble_jac'] or self.options['assembled_precon'] is not None:
             yield self, self.preferred_sparse_format()
         if self.precon is not None:
             for tup in self.precon._assembled_jac_solver_iter():
@@ -286,6 +306,8 @@ class PETScKrylov(LinearSolver):
         self._lin_rhs_checker = LinearRHSChecker.create(self._system(),
                                                         self.options['rhs_checking'])
 
+        self._assembled_precon = create_assembled_precon(self)
+
     def _set_solver_print(self, level=2, type_='all'):
         """
         Control printing for solvers and subsolvers in the model.
@@ -331,6 +353,9 @@ class PETScKrylov(LinearSolver):
         system = self._system()
 
         if self._mode == 'fwd':
+            if self._jac_vec_product is not None:
+                result.array[:] = self._jac_vec_product(_get_petsc_vec_array(in_vec))
+                return
             x_vec = system._doutputs
             b_vec = system._dresiduals
         else:  # rev
@@ -364,6 +389,8 @@ class PETScKrylov(LinearSolver):
         """
         if self.precon is not None:
             self.precon._linearize()
+        elif self._assembled_precon is not None:
+            self._assembled_precon.factor(self._system())
 
         if self._lin_rhs_checker is not None:
             self._lin_rhs_checker.clear()
@@ -477,6 +504,9 @@ class PETScKrylov(LinearSolver):
 
             # stuff resulting value of x vector into result for KSP
             result.array[:] = x_vec.asarray()
+        elif self._assembled_precon is not None:
+            result.array[:] = self._assembled_precon.solve(_get_petsc_vec_array(in_vec),
+                                                           self._mode)
         else:
             # no preconditioner, just pass back the incoming vector
             result.array[:] = _get_petsc_vec_array(in_vec)
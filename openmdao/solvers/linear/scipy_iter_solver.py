@@ -4,6 +4,8 @@ from packaging.version import Version
 import numpy as np
 import scipy
 from scipy.sparse.linalg import LinearOperator, gmres
+from openmdao.solvers.linear.krylov_recycling import gcrodr, RecycleSpace
+from openmdao.solvers.linear.assembled_precon import create_assembled_precon
 from openmdao.solvers.linear.linear_rhs_checker import LinearRHSChecker
 
 from openmdao.solvers.solver import LinearSolver
@@ -14,6 +16,7 @@ _SOLVER_TYPES = {
     # 'cg': cg,
     # 'cgs': cgs,
     'gmres': gmres,
+    'gcrodr': gcrodr,
 }
 
 
@@ -30,8 +33,23 @@ class ScipyKrylov(LinearSolver):
     ----------
     precon : Solver
         Preconditioner for linear solve. Default is None for no preconditioner.
+    recycle_stats : dict
+        Statistics of the solves performed with the 'gcrodr' solver. 'solves' and 'iterations'
+        count all solves and their matrix-vector products, 'recycled_solves' counts the solves
+        that started from a recycled subspace, 'iterations_saved' estimates the products saved by
+        recycling, relative to the most recent solve without a recycled subspace, and 'discarded'
+        counts the recycled solves that failed and were repeated without the subspace.
     _lin_rhs_checker : LinearRHSChecker or None
         Object for checking the right-hand side of the linear solve.
+    _assembled_precon : AssembledPrecon or None
+        Preconditioner factored from the assembled jacobian, if requested.
+    _recycle_space : dict
+        Recycled subspace for each derivative direction.
+    _cold_iterations : dict
+        Matrix-vector products of the most recent solve without a recycled subspace, for each
+        derivative direction.
+    _num_matvecs : int
+        Number of matrix-vector products computed during the current solve.
     """
 
     SOLVER = 'LN: SCIPY'
@@ -44,12 +62,18 @@ class ScipyKrylov(LinearSolver):
 
         self.precon = None
         self._lin_rhs_checker = None
+        self._assembled_precon = None
+        self._recycle_space = {}
+        self._cold_iterations = {}
+        self._num_matvecs = 0
+        self.recycle_stats = {}
+        self._reset_recycle_stats()
 
     def _assembled_jac_solver_iter(self):
         """
         Return a generator of linear solvers using assembled jacs.
         """
-        if self.options['assemble_jac']:
+        if self.options['assemble_jac'] or self.options['assembled_precon'] is not None:
             yield self, self.preferred_sparse_format()
         if self.precon is not None:
             for tup in self.precon._assembled_jac_solver_iter():
@@ -67,7 +91,30 @@ class ScipyKrylov(LinearSolver):
         self.options.declare('restart', default=20, types=int,
                              desc='Number of iterations between restarts. Larger values increase '
                                   'iteration cost, but may be necessary for convergence. This '
-                                  'option applies only to gmres.')
+                                  'option applies only to gmres and gcrodr.')
+
+        self.options.declare('recycle_size', default=10, types=int, lower=0,
+                             desc="Number of approximate eigenvectors that the 'gcrodr' solver "
+                             "deflates at each restart and keeps for later solves, e.g., for the "
+                             "other seeds of compute_totals. The subspace is kept when the "
+                             "system is linearized again, so later iterations of an "
+                             "optimization also start from it. Must be less than 'restart'. "
+                             "Set to 0 to disable recycling.")
+
+        self.options.declare('assembled_precon', default=None,
+                             values=(None, 'ilu', 'block_jacobi'),
+                             desc="Preconditioner computed directly from the assembled jacobian "
+                             "of the system once per linearization. 'ilu' is an incomplete LU "
+                             "factorization of the whole matrix and 'block_jacobi' an LU "
+                             "factorization of the diagonal blocks of each subsystem. Setting it "
+                             "implies 'assemble_jac'. It can't be combined with 'precon'.")
+
+        self.options.declare('ilu_drop_tol', default=1e-4, types=float, lower=0.0,
+                             desc="Drop tolerance of the 'ilu' assembled preconditioner.")
+
+        self.options.declare('ilu_fill_factor', default=10.0, types=(int, float), lower=1.0,
+                             desc="Upper bound on the fill ratio of the 'ilu' assembled "
+                             "preconditioner.")
 
         self.options.declare('rhs_checking', types=(bool, dict),
                              default=False,
@@ -81,6 +128,7 @@ class ScipyKrylov(LinearSolver):
         self.options['atol'] = 1.0e-12
 
         self.supports['implicit_components'] = True
+        self.supports['jac_vec_product'] = True
 
     def check_config(self, logger):
         """
@@ -121,6 +169,24 @@ class ScipyKrylov(LinearSolver):
         self._lin_rhs_checker = LinearRHSChecker.create(self._system(),
                                                         self.options['rhs_checking'])
 
+        self._assembled_precon = create_assembled_precon(self)
+
+        self._recycle_space = {}
+        self._cold_iterations = {}
+        self._reset_recycle_stats()
+
+    def _reset_recycle_stats(self):
+        """
+        Reset the statistics of the recycled solves.
+        """
+        self.recycle_stats = {
+            'solves': 0,
+            'iterations': 0,
+            'recycled_solves': 0,
+            'iterations_saved': 0,
+            'discarded': 0,
+        }
+
     def _set_solver_print(self, level=2, type_='all'):
         """
         Control printing for solvers and subsolvers in the model.
@@ -156,10 +222,17 @@ class ScipyKrylov(LinearSolver):
         """
         if self.precon is not None:
             self.precon._linearize()
+        elif self._assembled_precon is not None:
+            self._assembled_precon.factor(self._system())
 
         if self._lin_rhs_checker is not None:
             self._lin_rhs_checker.clear()
 
+        # The subspace is still a good guess if the Jacobian changes slowly, but its image
+        # under the new operator must be recomputed.
+        for space in self._recycle_space.values():
+            space.operator_changed()
+
     def _mat_vec(self, in_arr):
         """
         Compute matrix-vector product.
@@ -175,8 +248,11 @@ class ScipyKrylov(LinearSolver):
             the outgoing array after the product.
         """
         system = self._system()
+        self._num_matvecs += 1
 
         if self._mode == 'fwd':
+            if self._jac_vec_product is not None:
+                return self._jac_vec_product(in_arr)
             x_vec = system._doutputs
             b_vec = system._dresiduals
         else:  # rev
@@ -212,6 +288,79 @@ class ScipyKrylov(LinearSolver):
         self._mpi_print(self._iter_count, norm, norm / self._norm0)
         self._iter_count += 1
 
+    def _solve_gcrodr(self, b, x0, M):
+        """
+        Solve the linear system with gcrodr, recycling the subspace from previous solves.
+
+        Parameters
+        ----------
+        b : ndarray
+            The right-hand side.
+        x0 : ndarray
+            The initial guess.
+        M : LinearOperator or None
+            The preconditioner.
+
+        Returns
+        -------
+        ndarray
+            The solution.
+        int
+            Convergence information.
+        """
+        mode = self._mode
+        options = self.options
+        k = options['recycle_size']
+
+        # the subspace can't be shared between real and complex solves
+        if k > 0 and not self._system().under_complex_step:
+            space = self._recycle_space.get(mode)
+            if space is None:
+                space = self._recycle_space[mode] = RecycleSpace()
+        else:
+            space = None
+
+        recycled = bool(space)
+        self._num_matvecs = 0
+
+        # gcrodr keeps the products, and the system vectors change during the solve, so neither
+        # can be a view of them
+        x0 = x0.copy()
+        size = x0.size
+        linop = LinearOperator((size, size), dtype=float,
+                               matvec=lambda arr: self._mat_vec(arr).copy())
+
+        x, info = gcrodr(linop, b, x0=x0, M=M, rtol=options['rtol'], atol=options['atol'],
+                         maxiter=options['maxiter'], callback=self._monitor,
+                         m=options['restart'], k=k, recycle=space)
+
+        stats = self.recycle_stats
+
+        if info != 0 and recycled:
+            # a subspace recycled from a different operator can hurt convergence, so start over
+            # without it
+            stats['discarded'] += 1
+            stats['iterations'] += self._num_matvecs
+            space.clear()
+            recycled = False
+            self._iter_count = 0
+            self._num_matvecs = 0
+            x, info = gcrodr(linop, b, x0=x0, M=M, rtol=options['rtol'], atol=options['atol'],
+                             maxiter=options['maxiter'], callback=self._monitor,
+                             m=options['restart'], k=k, recycle=space)
+
+        stats['solves'] += 1
+        stats['iterations'] += self._num_matvecs
+        if recycled:
+            stats['recycled_solves'] += 1
+            if mode in self._cold_iterations:
+                stats['iterations_saved'] += max(self._cold_iterations[mode] - self._num_matvecs,
+                                                 0)
+        elif space is not None:
+            self._cold_iterations[mode] = self._num_matvecs
+
+        return x, info
+
     def solve(self, mode, rel_systems=None):
         """
         Run the solver.
@@ -257,11 +406,16 @@ class ScipyKrylov(LinearSolver):
         # Support a preconditioner
         if self.precon:
             M = LinearOperator((size, size), matvec=self._apply_precon, dtype=float)
+        elif self._assembled_precon is not None:
+            M = LinearOperator((size, size), dtype=float,
+                               matvec=lambda arr: self._assembled_precon.solve(arr, mode))
         else:
             M = None
 
         self._iter_count = 0
-        if solver is gmres:
+        if solver is gcrodr:
+            x, info = self._solve_gcrodr(b_vec.asarray(True), x_vec_combined, M)
+        elif solver is gmres:
             if Version(Version(scipy.__version__).base_version) < Version("1.12"):
                 x, info = solver(linop, b_vec.asarray(True), M=M, restart=restart,
                                  x0=x_vec_combined, maxiter=maxiter, tol=atol, atol='legacy',
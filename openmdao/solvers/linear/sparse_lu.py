@@ -0,0 +1,288 @@
+"""
+Sparse LU factorization backends used by the DirectSolver.
+
+The sparsity pattern of an assembled CSC jacobian doesn't change after setup, so a backend can
+compute any symbolic analysis of the pattern once and reuse it for every numeric factorization.
+"""
+
+import numpy as np
+import scipy.sparse.linalg
+from scipy.sparse import csc_matrix
+
+
+class SparseLU(object):
+    """
+    Base class for sparse LU factorization backends.
+
+    A new backend instance is created each time the owning DirectSolver is set up.
+    Subclasses must implement factor and solve.
+
+    Attributes
+    ----------
+    reused_analysis : bool
+        True if the last factorization reused the analysis of the sparsity pattern from an
+        earlier factorization.
+    """
+
+    def __init__(self):
+        """
+        Initialize attributes.
+        """
+        self.reused_analysis = False
+
+    def factor(self, matrix):
+        """
+        Compute the LU factorization of the given matrix.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The matrix to factor.
+        """
+        raise NotImplementedError(f"class {type(self).__name__} does not implement factor().")
+
+    def solve(self, rhs, trans='N'):
+        """
+        Solve the factored linear system.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Right-hand side, either a vector or an array with one right-hand side per column.
+        trans : str
+            'N' to solve with the matrix, 'T' to solve with its transpose.
+
+        Returns
+        -------
+        ndarray
+            The solution, with the same shape as rhs.
+        """
+        raise NotImplementedError(f"class {type(self).__name__} does not implement solve().")
+
+
+class ScipySparseLU(SparseLU):
+    """
+    Sparse LU using scipy's splu, recomputing the column ordering at every factorization.
+
+    Parameters
+    ----------
+    permc_spec : str
+        Column ordering method passed to splu.
+
+    Attributes
+    ----------
+    _permc_spec : str
+        Column ordering method passed to splu.
+    _lu : SuperLU or None
+        The current factorization.
+    """
+
+    def __init__(self, permc_spec='COLAMD'):
+        """
+        Initialize attributes.
+        """
+        super().__init__()
+        self._permc_spec = permc_spec
+        self._lu = None
+
+    def factor(self, matrix):
+        """
+        Compute the LU factorization of the given matrix.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The matrix to factor.
+        """
+        self._lu = scipy.sparse.linalg.splu(matrix, permc_spec=self._permc_spec)
+
+    def solve(self, rhs, trans='N'):
+        """
+        Solve the factored linear system.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Right-hand side, either a vector or an array with one right-hand side per column.
+        trans : str
+            'N' to solve with the matrix, 'T' to solve with its transpose.
+
+        Returns
+        -------
+        ndarray
+            The solution, with the same shape as rhs.
+        """
+        return self._lu.solve(rhs, trans)
+
+
+class ScipyCachedOrderingLU(ScipySparseLU):
+    """
+    Sparse LU using scipy's splu, computing the fill-reducing column ordering only once.
+
+    The first factorization computes the ordering. Later factorizations apply the cached
+    column permutation directly to the matrix data and call splu with 'NATURAL' ordering, so
+    only the numeric factorization (with partial pivoting) is redone.  If the sparsity pattern
+    changes, the ordering is recomputed.
+
+    Parameters
+    ----------
+    permc_spec : str
+        Column ordering method used to compute the cached ordering.
+
+    Attributes
+    ----------
+    _perm : ndarray or None
+        Column permutation applied to the matrix before factoring it, or None if the current
+        factorization is of the unpermuted matrix.
+    _col_perm : ndarray or None
+        The cached column permutation.
+    _data_map : ndarray or None
+        Indices into the data array of the matrix giving the data of the permuted matrix.
+    _indices : ndarray or None
+        Row indices of the permuted matrix.
+    _indptr : ndarray or None
+        Column pointers of the permuted matrix.
+    _orig_indptr : ndarray or None
+        Column pointers of the matrix the ordering was computed for.
+    _orig_indices : ndarray or None
+        Row indices of the matrix the ordering was computed for.
+    """
+
+    def __init__(self, permc_spec='COLAMD'):
+        """
+        Initialize attributes.
+        """
+        super().__init__(permc_spec)
+        self._perm = None
+        self._col_perm = None
+        self._data_map = None
+        self._indices = None
+        self._indptr = None
+        self._orig_indptr = None
+        self._orig_indices = None
+
+    def _same_pattern(self, matrix):
+        """
+        Return True if the matrix has the sparsity pattern the ordering was computed for.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The matrix to check.
+
+        Returns
+        -------
+        bool
+            True if the cached ordering can be applied to the matrix.
+        """
+        return (self._data_map is not None and
+                np.array_equal(matrix.indptr, self._orig_indptr) and
+                np.array_equal(matrix.indices, self._orig_indices))
+
+    def factor(self, matrix):
+        """
+        Compute the LU factorization of the given matrix.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The matrix to factor.
+        """
+        if self._same_pattern(matrix):
+            permuted = csc_matrix((matrix.data[self._data_map], self._indices, self._indptr),
+                                  shape=matrix.shape)
+            self._lu = scipy.sparse.linalg.splu(permuted, permc_spec='NATURAL')
+            self._perm = self._col_perm
+            self.reused_analysis = True
+            return
+
+        self._lu = lu = scipy.sparse.linalg.splu(matrix, permc_spec=self._permc_spec)
+        self._perm = None
+        self.reused_analysis = False
+
+        # matrix @ Pc == matrix[:, col_perm]
+        self._col_perm = np.argsort(lu.perm_c)
+
+        # find where the data of each entry of the permuted matrix lives in the original one
+        locs = csc_matrix((np.arange(1, matrix.nnz + 1, dtype=float), matrix.indices,
+                           matrix.indptr), shape=matrix.shape)[:, self._col_perm]
+        self._data_map = locs.data.astype(int) - 1
+        self._indices = locs.indices
+        self._indptr = locs.indptr
+        self._orig_indptr = matrix.indptr.copy()
+        self._orig_indices = matrix.indices.copy()
+
+    def solve(self, rhs, trans='N'):
+        """
+        Solve the factored linear system.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Right-hand side, either a vector or an array with one right-hand side per column.
+        trans : str
+            'N' to solve with the matrix, 'T' to solve with its transpose.
+
+        Returns
+        -------
+        ndarray
+            The solution, with the same shape as rhs.
+        """
+        perm = self._perm
+        if perm is None:
+            return self._lu.solve(rhs, trans)
+
+        if trans == 'N':
+            # A x = b  ->  (A P) y = b, x = P y
+            y = self._lu.solve(rhs)
+            sol = np.empty_like(y)
+            sol[perm] = y
+            return sol
+
+        # A^T x = b  ->  (A P)^T x = P^T b
+        return self._lu.solve(rhs[perm], trans)
+
+
+_sparse_lu_backends = {
+    'scipy': ScipySparseLU,
+    'scipy_cached_ordering': ScipyCachedOrderingLU,
+}
+
+
+def check_sparse_lu(name, value):
+    """
+    Check the value of the 'sparse_lu' option on the DirectSolver.
+
+    Parameters
+    ----------
+    name : str
+        Name of the option being checked.
+    value : str or type
+        Value of the option being checked.
+    """
+    if isinstance(value, str):
+        if value not in _sparse_lu_backends:
+            raise ValueError(f"Option '{name}' with value '{value}' is not one of "
+                             f"{sorted(_sparse_lu_backends)} or a subclass of SparseLU.")
+    elif not (isinstance(value, type) and issubclass(value, SparseLU)):
+        raise ValueError(f"Option '{name}' must be one of {sorted(_sparse_lu_backends)} or a "
+                         f"subclass of SparseLU, but a {type(value).__name__} was given.")
+
+
+def create_sparse_lu(value):
+    """
+    Create the sparse LU backend specified by the value of the 'sparse_lu' option.
+
+    Parameters
+    ----------
+    value : str or type
+        Name of a built-in backend or a subclass of SparseLU.
+
+    Returns
+    -------
+    SparseLU
+        A new instance of the backend.
+    """
+    if isinstance(value, str):
+        return _sparse_lu_backends[value]()
+    return value()
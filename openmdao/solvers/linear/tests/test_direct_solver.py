@@ -1,11 +1,15 @@
 """Test the DirectSolver linear solver class."""
 
 import unittest
+from unittest import mock
+from contextlib import redirect_stdout
+from io import StringIO
 
 import numpy as np
 
 import openmdao.api as om
 
+from openmdao.solvers.linear.sparse_lu import ScipySparseLU
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
 from openmdao.test_suite.components.double_sellar import DoubleSellar
 from openmdao.test_suite.components.expl_comp_simple import TestExplCompSimpleJacVec
@@ -933,6 +937,208 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
             prob.model.run_linearize()
         self.assertEqual(ctx.exception.args[0], '<model> <class Group>: AssembledJacobian not supported for matrix-free subcomponent.')
 
+
+class LinearSystem(om.ImplicitComponent):
+    """Solve A y = x, optionally with output and residual scaling."""
+
+    def initialize(self):
+        self.options.declare('scaled', types=bool, default=False)
+
+    def setup(self):
+        self.A = np.array([[4.0, 1.0, 0.5], [1.0, 3.0, 0.0], [0.2, 0.0, 2.0]])
+        self.add_input('x', np.ones(3))
+        if self.options['scaled']:
+            self.add_output('y', np.ones(3), ref=3.0, ref0=0.5, res_ref=7.0)
+        else:
+            self.add_output('y', np.ones(3))
+        self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3), val=-1.0)
+        self.declare_partials('y', 'y', val=self.A)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['y'] = self.A.dot(outputs['y']) - inputs['x']
+
+
+class TestDirectSolverMultiRHS(unittest.TestCase):
+
+    def _build(self, mode, assemble_jac, multi_rhs, scaled, rhs_checking=False,
+               cache_linear_solution=False):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('lin', LinearSystem(scaled=scaled), promotes_inputs=[('x', 'b')])
+        model.add_subsystem('f', om.ExecComp('f = y**2 + 2.0*b', f=np.ones(3), y=np.ones(3),
+                                             b=np.ones(3)), promotes_inputs=['b'])
+        model.connect('lin.y', 'f.y')
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+        model.linear_solver = om.DirectSolver(assemble_jac=assemble_jac, multi_rhs=multi_rhs,
+                                              rhs_checking=rhs_checking)
+
+        model.add_design_var('b', lower=-10.0, upper=10.0,
+                             cache_linear_solution=cache_linear_solution)
+        model.add_objective('f.f', index=0)
+        model.add_constraint('lin.y', upper=10.0)
+        model.add_constraint('f.f', indices=[1, 2], upper=10.0, alias='f_con')
+
+        prob.setup(mode=mode)
+        prob.set_val('b', np.array([1.0, -2.0, 3.0]))
+        prob.run_model()
+        return prob
+
+    def test_multi_rhs_matches_single(self):
+        for mode in ('fwd', 'rev'):
+            for assemble_jac in (True, False):
+                for scaled in (True, False):
+                    with self.subTest(mode=mode, assemble_jac=assemble_jac, scaled=scaled):
+                        expected = self._build(mode, assemble_jac, False, scaled).compute_totals()
+                        prob = self._build(mode, assemble_jac, True, scaled)
+                        J = prob.compute_totals()
+                        for key, val in expected.items():
+                            assert_near_equal(J[key], val, 1e-12)
+
+    def _count_solves(self, prob):
+        model = prob.model
+        solver = model.linear_solver
+
+        ncalls = {'solve': 0, 'solve_multi_rhs': 0}
+        seed_vars = []
+        orig_solve = solver.solve
+        orig_multi = solver.solve_multi_rhs
+
+        def solve(*args, **kwargs):
+            ncalls['solve'] += 1
+            return orig_solve(*args, **kwargs)
+
+        def solve_multi_rhs(*args, **kwargs):
+            ncalls['solve_multi_rhs'] += 1
+            seed_vars.append(model._problem_meta['seed_vars'])
+            return orig_multi(*args, **kwargs)
+
+        solver.solve = solve
+        solver.solve_multi_rhs = solve_multi_rhs
+
+        J = prob.compute_totals()
+
+        return ncalls, seed_vars, J
+
+    def test_multi_rhs_single_solver_call(self):
+        prob = self._build('rev', True, True, False)
+
+        ncalls, seed_vars, _ = self._count_solves(prob)
+
+        self.assertEqual(ncalls, {'solve': 0, 'solve_multi_rhs': 1})
+        # the block is solved with the seeds of all of its columns active
+        self.assertEqual(seed_vars, [('f.f', 'lin.y')])
+        self.assertIsNone(prob.model._problem_meta['seed_vars'])
+
+    def test_multi_rhs_norm_factors(self):
+        prob = self._build('fwd', False, True, True)
+        model = prob.model
+        solver = model.linear_solver
+
+        # y has ref=3.0, ref0=0.5 and res_ref=7.0
+        for vec, scaler in [(model._doutputs, 2.5), (model._dresiduals, 7.0)]:
+            vec.set_val(np.arange(len(vec)) + 5.0)
+            save = vec.asarray(copy=True)
+            expected = np.ones(len(vec))
+            start, stop = vec.get_info('lin.y').range
+            expected[start:stop] = 1.0 / scaler
+
+            with mock.patch.object(vec, 'set_val', side_effect=AssertionError('vector modified')):
+                factors = solver._get_norm_factors(vec)
+
+            assert_near_equal(factors, expected, 1e-15)
+            assert_near_equal(vec.asarray(), save, 0.0)
+
+    def test_multi_rhs_fallback(self):
+        # seeds are solved one at a time when the block solve would skip rhs checking or cached
+        # linear solutions
+        for mode, kwargs in [('rev', {'rhs_checking': True}),
+                             ('fwd', {'cache_linear_solution': True})]:
+            with self.subTest(mode=mode, **kwargs):
+                expected = self._build(mode, True, False, False, **kwargs).compute_totals()
+                prob = self._build(mode, True, True, False, **kwargs)
+
+                ncalls, _, J = self._count_solves(prob)
+
+                self.assertEqual(ncalls['solve_multi_rhs'], 0)
+                self.assertTrue(ncalls['solve'] > 0)
+                for key, val in expected.items():
+                    assert_near_equal(J[key], val, 1e-12)
+
+
+class CountingLU(ScipySparseLU):
+
+    nfactor = 0
+
+    def factor(self, matrix):
+        CountingLU.nfactor += 1
+        super().factor(matrix)
+
+
+class TestDirectSolverSparseLU(unittest.TestCase):
+
+    def _build(self, sparse_lu, mode='rev'):
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+        model.linear_solver = om.DirectSolver(sparse_lu=sparse_lu)
+
+        prob.setup(mode=mode)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        return prob
+
+    def test_cached_ordering_matches_full(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                expected = self._build('scipy', mode)
+                prob = self._build('scipy_cached_ordering', mode)
+
+                assert_near_equal(prob.get_val('y1'), expected.get_val('y1'), 1e-12)
+                assert_near_equal(prob.get_val('y2'), expected.get_val('y2'), 1e-12)
+
+                of = ['obj', 'con1', 'con2']
+                wrt = ['x', 'z']
+                J = prob.compute_totals(of, wrt)
+                for key, val in expected.compute_totals(of, wrt).items():
+                    assert_near_equal(J[key], val, 1e-12)
+
+                # the ordering was computed once and reused by the later factorizations
+                self.assertTrue(prob.model.linear_solver._sparse_lu.reused_analysis)
+
+    def test_custom_backend(self):
+        CountingLU.nfactor = 0
+        prob = self._build(CountingLU)
+
+        self.assertIsInstance(prob.model.linear_solver._sparse_lu, CountingLU)
+        self.assertEqual(CountingLU.nfactor, prob.model.nonlinear_solver._iter_count)
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+
+    def test_bad_backend(self):
+        with self.assertRaises(ValueError) as cm:
+            om.DirectSolver(sparse_lu='foo')
+
+        self.assertEqual(str(cm.exception),
+                         "Option 'sparse_lu' with value 'foo' is not one of "
+                         "['scipy', 'scipy_cached_ordering'] or a subclass of SparseLU.")
+
+    def test_debug_print(self):
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+        model.linear_solver = om.DirectSolver(debug_print=True)
+        prob.setup()
+
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            prob.run_model()
+
+        lines = stdout.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith("|  LN: Direct factorization (sparse) of '': "))
+        self.assertTrue(lines[1].startswith("|  LN: Direct factorization (sparse, reused ordering) "
+                                            "of '': "))
+
+
 @unittest.skipUnless(MPI and PETScVector, "only run with MPI and PETSc.")
 class TestDirectSolverRemoteErrors(unittest.TestCase):
 
@@ -2,6 +2,8 @@
 
 import unittest
 
+import numpy as np
+
 import openmdao.api as om
 from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.groups.parallel_groups import ConvergeDivergeGroups
@@ -75,5 +77,183 @@ class TestLinearRunOnceSolver(unittest.TestCase):
         assert_near_equal(derivs['f_xy']['y'], [[8.0]], 1e-6)
 
 
+class MatrixFreeComp(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('y', np.ones(3))
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = 3.0 * inputs['x'] ** 2
+
+    def compute_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+        if mode == 'fwd':
+            d_outputs['y'] += 6.0 * inputs['x'] * d_inputs['x']
+        else:
+            d_inputs['x'] += 6.0 * inputs['x'] * d_outputs['y']
+
+
+class MultiMatrixFreeComp(MatrixFreeComp):
+
+    def initialize(self):
+        self.nmulti = 0
+
+    def compute_multi_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+        self.nmulti += 1
+        partials = 6.0 * inputs['x'][:, np.newaxis]
+        if mode == 'fwd':
+            d_outputs['y'] += partials * d_inputs['x']
+        else:
+            d_inputs['x'] += partials * d_outputs['y']
+
+
+class SparseComp(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('x', np.ones(4))
+        self.add_output('y', np.ones(3), ref=2.0, ref0=1.0)
+        self.declare_partials('y', 'x', rows=[0, 1, 2, 2], cols=[0, 1, 2, 3])
+
+    def compute(self, inputs, outputs):
+        x = inputs['x']
+        outputs['y'] = [3.0 * x[0], x[1] ** 2, x[2] * x[3]]
+
+    def compute_partials(self, inputs, partials):
+        x = inputs['x']
+        partials['y', 'x'] = [3.0, 2.0 * x[1], x[3], x[2]]
+
+
+class QuadraticComp(om.ImplicitComponent):
+    # solves a * x**2 + b * x + c = 0 with matrix-free derivatives
+
+    def setup(self):
+        self.add_input('a', 1.0)
+        self.add_input('b', 1.0)
+        self.add_input('c', 1.0)
+        self.add_output('x', 1.0)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['x'] = inputs['a'] * outputs['x'] ** 2 + inputs['b'] * outputs['x'] + \
+            inputs['c']
+
+    def solve_nonlinear(self, inputs, outputs):
+        a, b, c = inputs['a'], inputs['b'], inputs['c']
+        outputs['x'] = (-b + np.sqrt(b ** 2 - 4.0 * a * c)) / (2.0 * a)
+
+    def linearize(self, inputs, outputs, partials):
+        self.partials = {'x': 2.0 * inputs['a'] * outputs['x'] + inputs['b'],
+                         'a': outputs['x'] ** 2, 'b': outputs['x'], 'c': 1.0}
+
+    def apply_linear(self, inputs, outputs, d_inputs, d_outputs, d_residuals, mode):
+        for name, vec in (('x', d_outputs), ('a', d_inputs), ('b', d_inputs), ('c', d_inputs)):
+            if name in vec:
+                if mode == 'fwd':
+                    d_residuals['x'] += self.partials[name] * vec[name]
+                else:
+                    vec[name] += self.partials[name] * d_residuals['x']
+
+    def solve_linear(self, d_outputs, d_residuals, mode):
+        if mode == 'fwd':
+            d_outputs['x'] = d_residuals['x'] / self.partials['x']
+        else:
+            d_residuals['x'] = d_outputs['x'] / self.partials['x']
+
+
+class TestLinearRunOnceMultiRHS(unittest.TestCase):
+
+    def _build(self, mode, multi_rhs, cycle_solver=None):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.array([1.0, 5.0, 2.0, -0.5])))
+        model.add_subsystem('sparse', SparseComp())
+        model.add_subsystem('quad', QuadraticComp())
+        model.add_subsystem('diag', om.ExecComp('y = 2.0*x**2', x=np.ones(3), y=np.ones(3),
+                                                has_diag_partials=True))
+        model.add_subsystem('mf', MatrixFreeComp())
+        model.add_subsystem('mmf', MultiMatrixFreeComp())
+
+        cycle = model.add_subsystem('cycle', om.Group())
+        cycle.add_subsystem('c1', om.ExecComp('y1 = 0.5*y2 + x**2', y1=np.ones(3),
+                                              y2=np.ones(3), x=np.ones(3)))
+        cycle.add_subsystem('c2', om.ExecComp('y2 = 0.25*y1 + sum(z)', y1=np.ones(3),
+                                              y2=np.ones(3), z=np.ones(2)))
+        cycle.connect('c1.y1', 'c2.y1')
+        cycle.connect('c2.y2', 'c1.y2')
+        cycle.nonlinear_solver = om.NonlinearBlockGS(atol=1e-14, rtol=1e-14, maxiter=100)
+        if cycle_solver is None:
+            cycle.linear_solver = om.DirectSolver()
+        else:
+            cycle.linear_solver = cycle_solver
+
+        model.connect('ivc.x', 'sparse.x')
+        model.connect('sparse.y', 'quad.a', src_indices=[0])
+        model.connect('sparse.y', 'quad.b', src_indices=[1])
+        model.connect('ivc.x', 'quad.c', src_indices=[3])
+        model.connect('sparse.y', 'diag.x')
+        model.connect('diag.y', 'mf.x')
+        model.connect('mf.y', 'mmf.x')
+        model.connect('mmf.y', 'cycle.c1.x')
+        model.connect('quad.x', 'cycle.c2.z', src_indices=[0, 0])
+
+        model.add_design_var('ivc.x', ref=3.0)
+        model.add_objective('cycle.c2.y2', index=1, ref=10.0)
+        model.add_constraint('quad.x', lower=0.0, ref=0.5)
+        model.add_constraint('cycle.c1.y1', lower=0.0)
+        model.add_constraint('sparse.y', lower=0.0)
+
+        model.linear_solver = om.LinearRunOnce(multi_rhs=multi_rhs)
+
+        prob.set_solver_print(level=0)
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        return prob
+
+    def test_multi_rhs_matches_single(self):
+        cycle_solvers = {
+            'direct': om.DirectSolver,
+            'direct_mtx_free': lambda: om.DirectSolver(assemble_jac=False),
+            'lnbgs': lambda: om.LinearBlockGS(atol=1e-14, rtol=1e-14, maxiter=100),
+            'lnbj': lambda: om.LinearBlockJac(atol=1e-14, rtol=1e-14, maxiter=100),
+        }
+        for mode in ('fwd', 'rev'):
+            for name, solver_class in cycle_solvers.items():
+                with self.subTest(mode=mode, cycle_solver=name):
+                    expected = self._build(mode, False, solver_class()).compute_totals()
+
+                    prob = self._build(mode, True, solver_class())
+                    self.assertTrue(prob.model.linear_solver.can_solve_multi_rhs())
+                    J = prob.compute_totals()
+
+                    for key, val in expected.items():
+                        assert_near_equal(J[key], val, 1e-12)
+
+                    # the seeds were propagated together, with a single call to the
+                    # multi-seed jacvec product
+                    self.assertEqual(prob.model.mmf.nmulti, 1)
+
+                    # the linear vectors are back to their usual layout
+                    for vec in (prob.model._dinputs, prob.model._doutputs,
+                                prob.model._dresiduals, prob.model.cycle._doutputs):
+                        self.assertEqual(vec.asarray().ndim, 1)
+
+    def test_multi_rhs_unsupported_solver(self):
+        for name, solver in (('aitken', om.LinearBlockGS(use_aitken=True, atol=1e-14,
+                                                         rtol=1e-14, maxiter=100)),
+                             ('krylov', om.ScipyKrylov(atol=1e-14, rtol=1e-14))):
+            with self.subTest(cycle_solver=name):
+                prob = self._build('rev', True, solver)
+                self.assertFalse(prob.model.linear_solver.can_solve_multi_rhs())
+
+                J = prob.compute_totals()
+                expected = self._build('rev', False).compute_totals()
+                for key, val in expected.items():
+                    assert_near_equal(J[key], val, 1e-10)
+
+                # every seed was solved separately
+                self.assertEqual(prob.model.mmf.nmulti, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -183,6 +183,34 @@ class TestPETScKrylov(unittest.TestCase):
         output = d_residuals.asarray()
         assert_near_equal(output, group.expected_solution, 3e-15)
 
+    def test_solve_linear_ksp_assembled_precon(self):
+        """Solve Sellar with PETScKrylov using a preconditioner from the assembled jacobian."""
+
+        def build(linear_solver):
+            prob = om.Problem()
+            model = prob.model
+            model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+            model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+            model.nonlinear_solver = om.NonlinearBlockGS()
+            model.linear_solver = linear_solver
+
+            prob.setup()
+            prob.set_solver_print(level=0)
+            prob.run_model()
+            return prob
+
+        of = ['y1', 'y2']
+        wrt = ['x', 'z']
+        expected = build(om.DirectSolver()).compute_totals(of=of, wrt=wrt)
+
+        for kind in ('ilu', 'block_jacobi'):
+            with self.subTest(kind=kind):
+                prob = build(om.PETScKrylov(assembled_precon=kind))
+                J = prob.compute_totals(of=of, wrt=wrt)
+
+                for key, val in expected.items():
+                    assert_near_equal(J[key], val, 1e-10)
+
     def test_solve_linear_ksp_precon_left(self):
         """Solve implicit system with PETScKrylov using a preconditioner."""
 
@@ -4,10 +4,12 @@ import unittest
 
 import numpy as np
 import scipy
+import scipy.sparse.linalg
 
 from packaging.version import Version
 
 import openmdao.api as om
+from openmdao.solvers.linear.krylov_recycling import gcrodr, RecycleSpace
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
 from openmdao.test_suite.components.expl_comp_simple import TestExplCompSimpleDense
 from openmdao.test_suite.components.misc_components import Comp4LinearCacheTest
@@ -201,6 +203,183 @@ class TestScipyKrylov(LinearSolverTests.LinearSolverTestCase):
                         f"the first solve, which ran for {icount1} iterations.")
 
 
+class TestScipyKrylovGcrodr(TestScipyKrylov):
+
+    linear_solver_name = 'gcrodr'
+    linear_solver_class = krylov_factory('gcrodr')
+
+
+class TestKrylovRecycling(unittest.TestCase):
+
+    def _get_matrix(self, n):
+        # a few small eigenvalues make restarted GMRES stagnate
+        rng = np.random.default_rng(0)
+        Q, _ = np.linalg.qr(rng.standard_normal((n, n)))
+        lam = np.linspace(1., 3., n)
+        lam[:8] = np.logspace(-2, -1, 8)
+        return Q.dot(np.diag(lam)).dot(Q.T) + 0.05 * rng.standard_normal((n, n)) / np.sqrt(n)
+
+    def test_gcrodr_recycling(self):
+        n = 60
+        A = self._get_matrix(n)
+
+        def solve(recycle):
+            counts = []
+            for i in range(5):
+                b = np.zeros(n)
+                b[i] = 1.0
+                count = [0]
+
+                def matvec(v):
+                    count[0] += 1
+                    return A.dot(v)
+
+                linop = scipy.sparse.linalg.LinearOperator((n, n), matvec=matvec)
+                x, info = gcrodr(linop, b, rtol=1e-12, m=20, k=8, recycle=recycle)
+                self.assertEqual(info, 0)
+                assert_near_equal(A.dot(x), b, 1e-10)
+                counts.append(count[0])
+            return counts
+
+        cold = solve(None)
+        recycled = solve(RecycleSpace())
+
+        self.assertEqual(recycled[0], cold[0])
+        self.assertLess(sum(recycled[1:]), sum(cold[1:]) / 2)
+
+    def test_recycle_across_seeds_and_linearizations(self):
+        n = 30
+        A = self._get_matrix(n)
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('lin', om.LinearSystemComp(size=n), promotes=['*'])
+        model.add_design_var('b')
+        model.add_constraint('x', lower=0.)
+        model.linear_solver = om.ScipyKrylov(solver='gcrodr', restart=15, recycle_size=6,
+                                             rtol=1e-12, atol=1e-14)
+        prob.setup(mode='rev')
+
+        prob.set_val('A', A)
+        prob.set_val('b', np.ones(n))
+        prob.run_model()
+
+        J = prob.compute_totals()
+        assert_near_equal(J['x', 'b'], np.linalg.inv(A), 1e-8)
+
+        stats = model.linear_solver.recycle_stats
+        self.assertEqual(stats['solves'], n)
+        self.assertEqual(stats['recycled_solves'], n - 1)
+        self.assertGreater(stats['iterations_saved'], 0)
+        self.assertEqual(stats['discarded'], 0)
+
+        # the subspace is kept after the Jacobian changes
+        prob.set_val('A', A * 1.1)
+        prob.run_model()
+
+        J = prob.compute_totals()
+        assert_near_equal(J['x', 'b'], np.linalg.inv(A * 1.1), 1e-8)
+        self.assertEqual(stats['recycled_solves'], 2 * n - 1)
+
+        # fwd mode solves get their own subspace
+        prob.setup(mode='fwd')
+        prob.set_val('A', A)
+        prob.set_val('b', np.ones(n))
+        prob.run_model()
+
+        J = prob.compute_totals()
+        assert_near_equal(J['x', 'b'], np.linalg.inv(A), 1e-8)
+        self.assertEqual(model.linear_solver.recycle_stats['recycled_solves'], n - 1)
+
+
+class Tridiag(om.ImplicitComponent):
+    """Residual is K u - f for a diagonally dominant tridiagonal K."""
+
+    def initialize(self):
+        self.options.declare('n', default=30)
+
+    def setup(self):
+        n = self.options['n']
+        self.add_input('f', np.ones(n))
+        self.add_output('u', np.ones(n))
+
+        r = np.arange(n)
+        self.declare_partials('u', 'u', rows=np.concatenate([r, r[1:], r[:-1]]),
+                              cols=np.concatenate([r, r[:-1], r[1:]]),
+                              val=np.concatenate([2.5 * np.ones(n), -np.ones(2 * n - 2)]))
+        self.declare_partials('u', 'f', rows=r, cols=r, val=-1.0)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        u = outputs['u']
+        residuals['u'] = 2.5 * u - inputs['f']
+        residuals['u'][1:] -= u[:-1]
+        residuals['u'][:-1] -= u[1:]
+
+
+class TestAssembledPrecon(unittest.TestCase):
+
+    def _build(self, mode, linear_solver, n=30, nblocks=3):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.ones(n)))
+        for i in range(nblocks):
+            model.add_subsystem(f'c{i}', Tridiag(n=n))
+            model.connect('ivc.x' if i == 0 else f'c{i - 1}.u', f'c{i}.f')
+        model.add_design_var('ivc.x')
+        model.add_constraint(f'c{nblocks - 1}.u', lower=0.)
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+        model.nonlinear_solver.linear_solver = om.DirectSolver()
+        model.linear_solver = linear_solver
+
+        prob.setup(mode=mode)
+        prob.set_solver_print(level=-1)
+        prob.run_model()
+        return prob
+
+    def _count_iters(self, prob):
+        solver = prob.model.linear_solver
+        iters = [0]
+        monitor = solver._monitor
+
+        def count(res):
+            iters[0] += 1
+            monitor(res)
+
+        solver._monitor = count
+        return iters
+
+    def test_assembled_precon(self):
+        for mode in ('fwd', 'rev'):
+            ref = self._build(mode, om.DirectSolver()).compute_totals()['c2.u', 'ivc.x']
+
+            prob = self._build(mode, om.ScipyKrylov())
+            base_iters = self._count_iters(prob)
+            prob.compute_totals()
+
+            for solver in ('gmres', 'gcrodr'):
+                for kind in ('ilu', 'block_jacobi'):
+                    with self.subTest(mode=mode, solver=solver, kind=kind):
+                        prob = self._build(mode, om.ScipyKrylov(solver=solver,
+                                                                assembled_precon=kind))
+                        iters = self._count_iters(prob)
+                        J = prob.compute_totals()
+
+                        assert_near_equal(J['c2.u', 'ivc.x'], ref, 1e-9)
+                        self.assertLess(iters[0], base_iters[0] / 4)
+
+    def test_assembled_precon_errors(self):
+        solver = om.ScipyKrylov(assembled_precon='ilu')
+        solver.precon = om.LinearBlockGS()
+
+        with self.assertRaises(RuntimeError) as cm:
+            self._build('fwd', solver)
+
+        self.assertEqual(str(cm.exception),
+                         "ScipyKrylov in <model> <class Group>: Option 'assembled_precon' can't be "
+                         "used when a 'precon' solver is also set.")
+
+
 class TestScipyKrylovFeature(unittest.TestCase):
 
     def test_feature_simple(self):
@@ -0,0 +1,171 @@
+"""Define the AndersonAccelerator class used by the nonlinear block solvers."""
+
+import os
+
+import numpy as np
+
+
+class AndersonAccelerator(object):
+    """
+    Windowed (type-II) Anderson acceleration of a fixed point iteration.
+
+    Each iteration of a block solver is treated as a fixed point map x -> g(x). The accelerated
+    iterate is the combination of the most recent iterates that minimizes the linearized
+    residual f = g(x) - x in the least squares sense. Only the last 'depth' differences of
+    residuals and iterates are kept, in buffers that are allocated once.
+
+    Parameters
+    ----------
+    depth : int
+        Maximum number of previous iterations used to compute the accelerated iterate.
+    mixing : float
+        Fraction of the residual added to the accelerated iterate. A value of 1.0 uses the
+        undamped Anderson update.
+    comm : MPI.Comm or <FakeComm>
+        Communicator of the owning system, used to reduce the least squares system when the
+        vector is distributed.
+
+    Attributes
+    ----------
+    num_iterations : int
+        Number of iterations passed to update since the last reset.
+    num_accelerated : int
+        Number of iterations since the last reset that returned an accelerated iterate.
+    _depth : int
+        Maximum number of previous iterations used to compute the accelerated iterate.
+    _mixing : float
+        Fraction of the residual added to the accelerated iterate.
+    _comm : MPI.Comm or <FakeComm>
+        Communicator used to reduce the least squares system.
+    _dF : ndarray or None
+        Ring buffer of differences between consecutive residuals, one per row.
+    _dG : ndarray or None
+        Ring buffer of differences between consecutive fixed point map values, one per row.
+    _f_prev : ndarray or None
+        Residual from the previous iteration.
+    _g_prev : ndarray or None
+        Fixed point map value from the previous iteration.
+    _nhist : int
+        Number of valid rows in the ring buffers.
+    _pos : int
+        Row of the ring buffers that will be overwritten next.
+    """
+
+    def __init__(self, depth, mixing=1.0, comm=None):
+        """
+        Initialize attributes.
+        """
+        self._depth = depth
+        self._mixing = mixing
+        self._comm = comm
+        self._dF = None
+        self._dG = None
+        self._f_prev = None
+        self._g_prev = None
+        self.reset()
+
+    def reset(self):
+        """
+        Discard the iteration history.
+        """
+        self._nhist = 0
+        self._pos = 0
+        self._f_prev = None
+        self.num_iterations = 0
+        self.num_accelerated = 0
+
+    def print_summary(self, solver):
+        """
+        Print the number of accelerated iterations of the last solve if iprint is at least 1.
+
+        Parameters
+        ----------
+        solver : NonlinearSolver
+            The solver that owns this accelerator.
+        """
+        system = solver._system()
+        if solver.options['iprint'] > 0 and (system.comm.rank == 0 or
+                                             os.environ.get('USE_PROC_FILES')):
+            prefix = solver._solver_info.prefix + solver.SOLVER
+            print(f"{prefix} Anderson acceleration applied in {self.num_accelerated} of "
+                  f"{self.num_iterations} iterations")
+
+    def _allocate(self, size, dtype):
+        """
+        Allocate the history buffers if they don't match the size or type of the iterates.
+
+        Parameters
+        ----------
+        size : int
+            Length of the iterate vector.
+        dtype : dtype
+            Type of the iterate vector.
+        """
+        if self._dF is None or self._dF.shape[1] != size or self._dF.dtype != dtype:
+            self._dF = np.zeros((self._depth, size), dtype=dtype)
+            self._dG = np.zeros((self._depth, size), dtype=dtype)
+            self._f_prev = None
+            self._g_prev = np.zeros(size, dtype=dtype)
+            self._nhist = 0
+            self._pos = 0
+
+    def update(self, x, g):
+        """
+        Add an iteration to the history and compute the next iterate.
+
+        Parameters
+        ----------
+        x : ndarray
+            Iterate at the start of the iteration.
+        g : ndarray
+            Value of the fixed point map at x, i.e., the iterate at the end of the iteration.
+
+        Returns
+        -------
+        ndarray
+            The next iterate.
+        """
+        self._allocate(g.size, g.dtype)
+        self.num_iterations += 1
+
+        f = g - x
+
+        if self._f_prev is not None:
+            pos = self._pos
+            np.subtract(f, self._f_prev, out=self._dF[pos])
+            np.subtract(g, self._g_prev, out=self._dG[pos])
+            self._pos = (pos + 1) % self._depth
+            self._nhist = min(self._nhist + 1, self._depth)
+            self._f_prev[:] = f
+        else:
+            self._f_prev = f.copy()
+
+        self._g_prev[:] = g
+
+        mixing = self._mixing
+        nhist = self._nhist
+
+        if nhist == 0:
+            return x + mixing * f
+
+        dF = self._dF[:nhist]
+        dG = self._dG[:nhist]
+
+        # Solve min ||f - dF.T gamma|| through its normal equations, which are small and can be
+        # summed across procs when the vector is distributed. Plain (unconjugated) products are
+        # used so that the update stays analytic under complex step.
+        gram = dF.dot(dF.T)
+        rhs = dF.dot(f)
+        if self._comm is not None and self._comm.size > 1:
+            gram = self._comm.allreduce(gram)
+            rhs = self._comm.allreduce(rhs)
+
+        gamma = np.linalg.lstsq(gram, rhs, rcond=None)[0]
+
+        self.num_accelerated += 1
+
+        new_x = g - gamma.dot(dG)
+        if mixing != 1.0:
+            new_x -= (1.0 - mixing) * (f - gamma.dot(dF))
+
+        return new_x
@@ -1,5 +1,9 @@
 """Define the NewtonSolver class."""
 
+import os
+
+import numpy as np
+
 from openmdao.solvers.linesearch.backtracking import BoundsEnforceLS
 from openmdao.solvers.solver import NonlinearSolver
 from openmdao.recorders.recording_iteration_stack import Recording
@@ -21,8 +25,27 @@ class NewtonSolver(NonlinearSolver):
     linear_solver : LinearSolver
         Linear solver to use to find the Newton search direction. The default
         is the parent system's linear solver.
+    linearize_stats : dict
+        Statistics of the most recent solve. 'linearizations' counts the iterations that computed
+        a new Jacobian and linear solver factorization, 'reuses' counts the iterations that reused
+        the previous ones because of 'jac_reuse_limit', and 'jac_vec_products' counts the
+        Jacobian-vector products computed by directional differences when 'jacobian_free' is
+        True.
     _linesearch : NonlinearSolver
         Line search algorithm. Default is None for no line search.
+    _prev_norm : float or None
+        Residual norm at the start of the previous iteration, used to monitor the convergence
+        rate when reusing the Jacobian.
+    _jac_reuses : int
+        Number of consecutive iterations that have reused the current Jacobian.
+    _eta : float or None
+        Forcing term (relative tolerance of the linear solve) of the previous Jacobian-free
+        iteration.
+    _jfnk_outputs : ndarray or None
+        Outputs at the current Jacobian-free iteration, used as the base point of the directional
+        derivatives.
+    _jfnk_residuals : ndarray or None
+        Residuals at the current Jacobian-free iteration.
     """
 
     SOLVER = 'NL: Newton'
@@ -35,6 +58,13 @@ class NewtonSolver(NonlinearSolver):
 
         self.linear_solver = None
         self._linesearch = BoundsEnforceLS()
+        self._prev_norm = None
+        self._jac_reuses = 0
+        self._eta = None
+        self._jfnk_outputs = None
+        self._jfnk_residuals = None
+        self.linearize_stats = {}
+        self._reset_linearize_stats()
 
     def _declare_options(self):
         """
@@ -53,11 +83,60 @@ class NewtonSolver(NonlinearSolver):
                              desc='When the option is true, a solver will reraise any '
                              'AnalysisError that arises during subsolve; when false, it will '
                              'continue solving.')
+        self.options.declare('jac_reuse_limit', types=(int, float), default=None, allow_none=True,
+                             lower=0.0,
+                             desc='If set, reuse the Jacobian and the linear solver factorization '
+                             '(e.g. the LU decomposition in a DirectSolver) from the previous '
+                             'iteration as long as the ratio of the current residual norm to the '
+                             'previous one is below this value (chord Newton). When the '
+                             'convergence rate degrades beyond it, the Jacobian is recomputed. '
+                             'If None, the Jacobian is recomputed at every iteration.')
+        self.options.declare('max_jac_reuses', types=int, default=10, lower=1,
+                             desc="Maximum number of consecutive iterations that reuse the same "
+                             "Jacobian when 'jac_reuse_limit' is set.")
+        self.options.declare('jacobian_free', types=bool, default=False,
+                             desc='If True, compute the Newton step without linearizing the '
+                             'system (Jacobian-free Newton-Krylov). The products of the Jacobian '
+                             'with the Krylov vectors are approximated by directional differences '
+                             'of the residuals, so compute_partials is never called during the '
+                             'solve. Requires a linear solver that supports Jacobian-vector '
+                             'products, e.g. ScipyKrylov or PETScKrylov, without a '
+                             'preconditioner.')
+        self.options.declare('jfnk_method', default='fd', values=['fd', 'cs'],
+                             desc="Method used to compute the Jacobian-vector products when "
+                             "'jacobian_free' is True. 'cs' requires complex vectors to be "
+                             "allocated and falls back to 'fd' under complex step.")
+        self.options.declare('jfnk_step', types=float, default=None, allow_none=True,
+                             lower=0.0,
+                             desc="Step size of the Jacobian-vector products. For 'fd' the step "
+                             "is relative to the norm of the outputs. If None, a default of "
+                             "sqrt(machine epsilon) is used for 'fd' and 1e-40 for 'cs'.")
+        self.options.declare('ew_eta0', types=float, default=0.5, lower=0.0, upper=1.0,
+                             desc="Forcing term (linear solver rtol) of the first Jacobian-free "
+                             "iteration.")
+        self.options.declare('ew_eta_max', types=float, default=0.9, lower=0.0, upper=1.0,
+                             desc="Maximum forcing term of the Eisenstat-Walker update.")
+        self.options.declare('ew_gamma', types=float, default=0.9, lower=0.0, upper=1.0,
+                             desc="Gamma parameter of the Eisenstat-Walker forcing term update "
+                             "eta = gamma * (norm / prev_norm) ** alpha.")
+        self.options.declare('ew_alpha', types=float, default=2.0, lower=1.0, upper=2.0,
+                             desc="Alpha parameter of the Eisenstat-Walker forcing term update "
+                             "eta = gamma * (norm / prev_norm) ** alpha.")
 
         self.supports['linesearch'] = True
         self.supports['gradients'] = True
         self.supports['implicit_components'] = True
 
+    def _reset_linearize_stats(self):
+        """
+        Reset the linearization statistics.
+        """
+        self.linearize_stats = {
+            'linearizations': 0,
+            'reuses': 0,
+            'jac_vec_products': 0,
+        }
+
     def _setup_solvers(self, system, depth):
         """
         Assign system instance, set depth, and optionally perform setup.
@@ -82,6 +161,20 @@ class NewtonSolver(NonlinearSolver):
         else:
             self.linear_solver = system.linear_solver
 
+        if self.options['jacobian_free']:
+            linear_solver = self.linear_solver
+            if linear_solver is None or not linear_solver.supports['jac_vec_product']:
+                name = type(linear_solver).__name__
+                raise RuntimeError(f"{self.msginfo}: Option 'jacobian_free' requires a linear "
+                                   "solver that supports Jacobian-vector products, such as "
+                                   f"ScipyKrylov or PETScKrylov, but the linear solver is {name}.")
+            if (getattr(linear_solver, 'precon', None) is not None or
+                    ('assembled_precon' in linear_solver.options and
+                     linear_solver.options['assembled_precon'] is not None)):
+                raise RuntimeError(f"{self.msginfo}: Option 'jacobian_free' does not support a "
+                                   "preconditioner on the linear solver because the system is "
+                                   "not linearized.")
+
         if self.linesearch is not None:
             self.linesearch._setup_solvers(system, self._depth + 1)
 
@@ -177,6 +270,11 @@ class NewtonSolver(NonlinearSolver):
             self._err_cache['inputs'] = system._inputs._copy_vars()
             self._err_cache['outputs'] = system._outputs._copy_vars()
 
+        # always compute a new Jacobian at the start of a solve
+        self._prev_norm = None
+        self._eta = None
+        self._reset_linearize_stats()
+
         # Execute guess_nonlinear if specified and
         # we have not restarted from a saved point
         if not self._restarted and system._has_guess:
@@ -202,6 +300,25 @@ class NewtonSolver(NonlinearSolver):
 
         return norm0, norm
 
+    def _solve(self):
+        """
+        Run the iterative solver.
+        """
+        super()._solve()
+
+        # only print on root if USE_PROC_FILES is not set to True
+        print_flag = self._system().comm.rank == 0 or os.environ.get('USE_PROC_FILES')
+        if self.options['iprint'] < 1 or not print_flag:
+            return
+
+        prefix = self._solver_info.prefix + self.SOLVER
+        stats = self.linearize_stats
+        if self.options['jacobian_free']:
+            print(f"{prefix} Jacobian-vector products: {stats['jac_vec_products']}")
+        elif self.options['jac_reuse_limit'] is not None:
+            print(f"{prefix} Jacobian computed {stats['linearizations']} times, reused "
+                  f"{stats['reuses']} times")
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
@@ -219,11 +336,18 @@ class NewtonSolver(NonlinearSolver):
         try:
             system._dresiduals.set_vec(system._residuals)
             system._dresiduals *= -1.0
-            system._linearize(sub_do_ln=do_sub_ln)
 
-            self._linearize()
+            if self.options['jacobian_free']:
+                self._jacobian_free_solve()
+            else:
+                if self._reuse_jac():
+                    self.linearize_stats['reuses'] += 1
+                else:
+                    system._linearize(sub_do_ln=do_sub_ln)
+                    self._linearize()
+                    self.linearize_stats['linearizations'] += 1
 
-            self.linear_solver.solve('fwd')
+                self.linear_solver.solve('fwd')
 
             if self.linesearch and not system.under_complex_step:
                 self.linesearch._do_subsolve = do_subsolve
@@ -243,6 +367,162 @@ class NewtonSolver(NonlinearSolver):
             # Enable local fd
             system._owns_approx_jac = approx_status
 
+    def _reuse_jac(self):
+        """
+        Return True if the Jacobian and factorization from the previous iteration can be reused.
+
+        Returns
+        -------
+        bool
+            True if the residual norm has dropped quickly enough since the previous iteration.
+        """
+        limit = self.options['jac_reuse_limit']
+        if limit is None:
+            return False
+
+        norm = self._iter_get_norm()
+        prev_norm = self._prev_norm
+        self._prev_norm = norm
+
+        if prev_norm and not self._system().under_complex_step and \
+                self._jac_reuses < self.options['max_jac_reuses'] and norm / prev_norm < limit:
+            self._jac_reuses += 1
+            return True
+
+        self._jac_reuses = 0
+        return False
+
+    def _forcing_term(self, norm):
+        """
+        Compute the relative tolerance of the linear solve using the Eisenstat-Walker update.
+
+        Parameters
+        ----------
+        norm : float
+            Residual norm at the start of the current iteration.
+
+        Returns
+        -------
+        float
+            The forcing term for the current iteration.
+        """
+        options = self.options
+        eta_max = options['ew_eta_max']
+        prev_norm = self._prev_norm
+        prev_eta = self._eta
+        self._prev_norm = norm
+
+        if prev_eta is None or not prev_norm:
+            eta = options['ew_eta0']
+        else:
+            # Choice 2 of Eisenstat and Walker, "Choosing the forcing terms in an inexact Newton
+            # method", with their safeguard against the forcing term dropping too quickly.
+            gamma = options['ew_gamma']
+            alpha = options['ew_alpha']
+            eta = gamma * (norm / prev_norm) ** alpha
+            safeguard = gamma * prev_eta ** alpha
+            if safeguard > 0.1:
+                eta = max(eta, safeguard)
+
+        eta = min(eta, eta_max)
+
+        # don't solve the linear system much tighter than the nonlinear tolerance requires
+        if norm > 0.0:
+            eta = max(eta, 0.5 * options['atol'] / norm)
+
+        self._eta = eta
+        return eta
+
+    def _jacobian_free_solve(self):
+        """
+        Solve for the Newton step using Jacobian-vector products of the residuals.
+        """
+        system = self._system()
+        linear_solver = self.linear_solver
+
+        self._linearize()
+
+        eta = self._forcing_term(self._iter_get_norm())
+
+        self._jfnk_outputs = system._outputs.asarray(copy=True)
+        self._jfnk_residuals = system._residuals.asarray(copy=True)
+        system._doutputs.set_val(0.0)
+
+        rtol = linear_solver.options['rtol']
+        linear_solver.options['rtol'] = eta
+        linear_solver._jac_vec_product = self._jac_vec_product
+        try:
+            linear_solver.solve('fwd')
+        finally:
+            linear_solver.options['rtol'] = rtol
+            linear_solver._jac_vec_product = None
+
+            system._outputs.set_val(self._jfnk_outputs)
+            system._residuals.set_val(self._jfnk_residuals)
+            self._jfnk_outputs = self._jfnk_residuals = None
+
+    def _jac_vec_product(self, in_arr):
+        """
+        Compute the product of the Jacobian of the residuals with the given array.
+
+        Parameters
+        ----------
+        in_arr : ndarray
+            Array of output perturbations.
+
+        Returns
+        -------
+        ndarray
+            The approximated Jacobian-vector product.
+        """
+        system = self._system()
+        outputs = system._outputs
+        residuals = system._residuals
+        u = self._jfnk_outputs
+        v = in_arr.ravel()
+        step = self.options['jfnk_step']
+
+        vnorm = np.linalg.norm(v)
+        if system.comm.size > 1:
+            vnorm = np.sqrt(system.comm.allreduce(vnorm ** 2))
+        if vnorm == 0.0:
+            return np.zeros_like(self._jfnk_residuals)
+
+        self.linearize_stats['jac_vec_products'] += 1
+
+        if self.options['jfnk_method'] == 'cs' and not system.under_complex_step:
+            if not outputs._alloc_complex:
+                raise RuntimeError(f"{self.msginfo}: Option 'jfnk_method' is 'cs', but complex "
+                                   "vectors were not allocated. Set force_alloc_complex=True in "
+                                   "the call to setup.")
+            if step is None:
+                step = 1e-40
+
+            system._set_complex_step_mode(True)
+            try:
+                outputs.set_val(u + (step * 1j) * v)
+                system._apply_nonlinear()
+                result = residuals.asarray().imag / step
+            finally:
+                system._set_complex_step_mode(False)
+                for vec in (system._inputs, outputs, residuals):
+                    vec._data.imag[:] = 0.0
+
+            return result
+
+        if step is None:
+            step = np.sqrt(np.finfo(float).eps)
+
+        unorm = np.linalg.norm(u)
+        if system.comm.size > 1:
+            unorm = np.sqrt(system.comm.allreduce(unorm ** 2))
+        delta = step * (1.0 + unorm) / vnorm
+
+        outputs.set_val(u + delta * v)
+        system._apply_nonlinear()
+
+        return (residuals.asarray() - self._jfnk_residuals) / delta
+
     def _set_complex_step_mode(self, active):
         """
         Turn on or off complex stepping mode.
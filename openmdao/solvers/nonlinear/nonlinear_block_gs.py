@@ -2,10 +2,10 @@
 
 import numpy as np
 
-from openmdao.solvers.solver import NonlinearSolver
+from openmdao.solvers.solver import BlockNonlinearSolver
 
 
-class NonlinearBlockGS(NonlinearSolver):
+class NonlinearBlockGS(BlockNonlinearSolver):
     """
     Nonlinear block Gauss-Seidel solver.
 
@@ -52,6 +52,10 @@ class NonlinearBlockGS(NonlinearSolver):
             raise RuntimeError('{}: Nonlinear Gauss-Seidel cannot be used on a '
                                'parallel group.'.format(self.msginfo))
 
+        if self.options['use_anderson'] and self.options['use_aitken']:
+            raise RuntimeError(f"{self.msginfo}: Options 'use_aitken' and 'use_anderson' "
+                               "cannot both be True.")
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -94,6 +98,9 @@ class NonlinearBlockGS(NonlinearSolver):
             self._delta_outputs_n_1 = system._outputs.asarray(copy=True)
             self._theta_n_1 = 1.
 
+        if self._anderson is not None:
+            self._anderson.reset()
+
         # When under a complex step from higher in the hierarchy, sometimes the step is too small
         # to trigger reconvergence, so nudge the outputs slightly so that we always get at least
         # one iteration.
@@ -107,6 +114,15 @@ class NonlinearBlockGS(NonlinearSolver):
 
         return super()._iter_initialize()
 
+    def _solve(self):
+        """
+        Run the iterative solver.
+        """
+        super()._solve()
+
+        if self._anderson is not None:
+            self._anderson.print_summary(self)
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
@@ -115,8 +131,9 @@ class NonlinearBlockGS(NonlinearSolver):
         outputs = system._outputs
         residuals = system._residuals
         use_aitken = self.options['use_aitken']
+        anderson = self._anderson
 
-        if use_aitken:
+        if use_aitken or anderson is not None:
             # store a copy of the outputs, used to compute the change in outputs later
             delta_outputs_n = outputs.asarray(copy=True)
 
@@ -134,6 +151,8 @@ class NonlinearBlockGS(NonlinearSolver):
 
         if use_aitken:
             self._aitken_relax(outputs, residuals, outputs_n, delta_outputs_n)
+        elif anderson is not None:
+            outputs.set_val(anderson.update(delta_outputs_n, outputs.asarray()))
 
         if not self.options['use_apply_nonlinear']:
             # Residual is the change in the outputs vector.
@@ -166,8 +185,9 @@ class NonlinearBlockGS(NonlinearSolver):
             outputs = system._outputs
             residuals = system._residuals
             use_aitken = self.options['use_aitken']
+            anderson = self._anderson
 
-            if use_aitken:
+            if use_aitken or anderson is not None:
                 # store a copy of the outputs, used to compute the change in outputs later
                 delta_outputs_n = outputs.asarray(copy=True)
 
@@ -182,6 +202,8 @@ class NonlinearBlockGS(NonlinearSolver):
 
             if use_aitken:
                 self._aitken_relax(outputs, residuals, outputs_n, delta_outputs_n)
+            elif anderson is not None:
+                outputs.set_val(anderson.update(delta_outputs_n, outputs.asarray()))
 
             self._solver_info.pop()
             with system._unscaled_context(residuals=[residuals], outputs=[outputs]):
@@ -1,10 +1,10 @@
 """Define the NonlinearBlockJac class."""
 from openmdao.recorders.recording_iteration_stack import Recording
-from openmdao.solvers.solver import NonlinearSolver
+from openmdao.solvers.solver import BlockNonlinearSolver
 from openmdao.utils.mpi import multi_proc_fail_check
 
 
-class NonlinearBlockJac(NonlinearSolver):
+class NonlinearBlockJac(BlockNonlinearSolver):
     """
     Nonlinear block Jacobi solver.
 
@@ -16,11 +16,41 @@ class NonlinearBlockJac(NonlinearSolver):
 
     SOLVER = 'NL: NLBJ'
 
+    def _iter_initialize(self):
+        """
+        Perform any necessary pre-processing operations.
+
+        Returns
+        -------
+        float
+            initial error.
+        float
+            error at the first iteration.
+        """
+        if self._anderson is not None:
+            self._anderson.reset()
+
+        return super()._iter_initialize()
+
+    def _solve(self):
+        """
+        Run the iterative solver.
+        """
+        super()._solve()
+
+        if self._anderson is not None:
+            self._anderson.print_summary(self)
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
         """
         system = self._system()
+        anderson = self._anderson
+
+        if anderson is not None:
+            outputs_n = system._outputs.asarray(copy=True)
+
         self._solver_info.append_subsolver()
         system._transfer('nonlinear', 'fwd')
 
@@ -40,6 +70,10 @@ class NonlinearBlockJac(NonlinearSolver):
 
         self._solver_info.pop()
 
+        if anderson is not None:
+            outputs = system._outputs
+            outputs.set_val(anderson.update(outputs_n, outputs.asarray()))
+
     def _run_apply(self):
         """
         Run the apply_nonlinear method on the system.
@@ -53,6 +53,180 @@ class TestNewton(unittest.TestCase):
         # Make sure we aren't iterating like crazy
         self.assertLess(prob.model.nonlinear_solver._iter_count, 8)
 
+    def test_jac_reuse(self):
+        # chord Newton, reusing the DirectSolver factorization while convergence is fast enough
+        newton = om.NewtonSolver(solve_subsystems=False, jac_reuse_limit=0.5, rtol=1e-12,
+                                 atol=1e-12, maxiter=50)
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                                  linear_solver=om.DirectSolver()))
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+
+        direct = prob.model.linear_solver
+        nfactor = 0
+        linearize = direct._linearize
+
+        def count_linearize():
+            nonlocal nfactor
+            nfactor += 1
+            linearize()
+
+        direct._linearize = count_linearize
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        stats = newton.linearize_stats
+        self.assertTrue(stats['reuses'] > 0)
+        self.assertEqual(stats['linearizations'], nfactor)
+        self.assertEqual(stats['linearizations'] + stats['reuses'], newton._iter_count)
+
+        # a new solve always starts with a new factorization, and the stats are reset
+        nfactor = 0
+        prob.set_val('x', 2.0)
+        prob.run_model()
+        stats = newton.linearize_stats
+        self.assertTrue(nfactor > 0)
+        self.assertEqual(stats['linearizations'], nfactor)
+        self.assertEqual(stats['linearizations'] + stats['reuses'], newton._iter_count)
+
+        # without a limit, every iteration linearizes
+        newton.options['jac_reuse_limit'] = None
+        prob.run_model()
+        stats = newton.linearize_stats
+        self.assertEqual(stats['reuses'], 0)
+        self.assertEqual(stats['linearizations'], newton._iter_count)
+
+    def test_jac_reuse_print(self):
+        newton = om.NewtonSolver(solve_subsystems=False, jac_reuse_limit=0.5, rtol=1e-12,
+                                 atol=1e-12, maxiter=50)
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                                  linear_solver=om.DirectSolver()))
+
+        prob.setup()
+        prob.set_solver_print(level=1)
+
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            prob.run_model()
+
+        stats = newton.linearize_stats
+        self.assertEqual(stats['linearizations'] + stats['reuses'], newton._iter_count)
+        self.assertIn(f"NL: Newton Jacobian computed {stats['linearizations']} times, reused "
+                      f"{stats['reuses']} times", stdout.getvalue())
+
+        # nothing extra is printed without jac_reuse_limit
+        newton.options['jac_reuse_limit'] = None
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            prob.run_model()
+        self.assertNotIn("Jacobian computed", stdout.getvalue())
+
+    def test_jac_reuse_max_reuses(self):
+        # a limit above 1 would always reuse, so max_jac_reuses forces a new Jacobian
+        newton = om.NewtonSolver(solve_subsystems=False, jac_reuse_limit=10.0, max_jac_reuses=2,
+                                 rtol=1e-12, atol=1e-12, maxiter=50)
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                                  linear_solver=om.DirectSolver()))
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        # the first iteration and every third one after that compute a new Jacobian
+        self.assertEqual(newton.linearize_stats['linearizations'], (newton._iter_count + 2) // 3)
+
+    def test_jacobian_free(self):
+        for method in ['fd', 'cs']:
+            with self.subTest(method=method):
+                newton = om.NewtonSolver(solve_subsystems=False, jacobian_free=True,
+                                         jfnk_method=method, atol=1e-10, rtol=1e-12)
+                prob = om.Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                                          linear_solver=om.ScipyKrylov()))
+
+                prob.setup(force_alloc_complex=True)
+                prob.set_solver_print(level=0)
+
+                ncalls = 0
+                for comp in (prob.model.d1, prob.model.d2):
+                    compute_partials = comp.compute_partials
+
+                    def count_compute_partials(inputs, partials, func=compute_partials):
+                        nonlocal ncalls
+                        ncalls += 1
+                        func(inputs, partials)
+
+                    comp.compute_partials = count_compute_partials
+
+                prob.run_model()
+
+                assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+                assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+                self.assertLess(newton._iter_count, 8)
+                self.assertTrue(newton.linearize_stats['jac_vec_products'] > 0)
+                self.assertEqual(ncalls, 0)
+
+                # the linear solver tolerance is restored after the solve
+                self.assertEqual(prob.model.linear_solver.options['rtol'], 1e-10)
+
+                # totals still use the partials
+                J = prob.compute_totals(of=['y1'], wrt=['x'])
+                assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
+                self.assertTrue(ncalls > 0)
+
+    def test_jacobian_free_forcing_term(self):
+        newton = om.NewtonSolver(solve_subsystems=False, jacobian_free=True, ew_eta0=0.5,
+                                 ew_eta_max=0.8, ew_gamma=0.9, ew_alpha=2.0, atol=1e-10)
+
+        self.assertEqual(newton._forcing_term(1.0), 0.5)
+
+        # fast convergence, but the safeguard keeps eta from dropping below 0.9 * 0.5 ** 2
+        assert_near_equal(newton._forcing_term(0.01), 0.9 * 0.5 ** 2, 1e-15)
+
+        # slow convergence is limited by eta_max
+        self.assertEqual(newton._forcing_term(0.01), 0.8)
+
+        # oversolving is avoided close to the solution
+        newton._eta = 1e-8
+        self.assertEqual(newton._forcing_term(1e-10), 0.5)
+
+    def test_jacobian_free_errors(self):
+        newton = om.NewtonSolver(solve_subsystems=False, jacobian_free=True)
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                                  linear_solver=om.DirectSolver()))
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "NewtonSolver in <model> <class SellarDerivatives>: Option "
+                         "'jacobian_free' requires a linear solver that supports Jacobian-vector "
+                         "products, such as ScipyKrylov or PETScKrylov, but the linear solver is "
+                         "DirectSolver.")
+
+        krylov = om.ScipyKrylov()
+        krylov.precon = om.LinearBlockGS()
+        newton = om.NewtonSolver(solve_subsystems=False, jacobian_free=True)
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                                  linear_solver=krylov))
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "NewtonSolver in <model> <class SellarDerivatives>: Option "
+                         "'jacobian_free' does not support a preconditioner on the linear "
+                         "solver because the system is not linearized.")
+
     def test_sellar(self):
         # Just tests Newton on Sellar with FD derivs.
 
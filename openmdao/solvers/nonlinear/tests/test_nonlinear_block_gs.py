@@ -1,6 +1,8 @@
 """Test the Nonlinear Block Gauss Seidel solver. """
 
 import unittest
+from contextlib import redirect_stdout
+from io import StringIO
 
 import numpy as np
 
@@ -401,6 +403,75 @@ class TestNLBGaussSeidel(unittest.TestCase):
         J = prob.compute_totals(of=['y1'], wrt=['x'])
         assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
 
+    def test_NLBGS_Anderson(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS(use_anderson=True, anderson_depth=3)
+
+        prob.setup()
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+        self.assertEqual(model.nonlinear_solver._iter_count, 5)
+
+        anderson = model.nonlinear_solver._anderson
+        self.assertEqual(anderson.num_iterations, 5)
+        self.assertEqual(anderson.num_accelerated, 4)
+
+        # history buffers are bounded by the depth
+        self.assertEqual(anderson._dF.shape[0], 3)
+        self.assertEqual(anderson._dG.shape[0], 3)
+
+    def test_NLBGS_Anderson_iprint(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS(use_anderson=True)
+
+        prob.setup()
+
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            prob.run_model()
+
+        self.assertIn("NL: NLBGS Anderson acceleration applied in 4 of 5 iterations",
+                      stdout.getvalue())
+
+    def test_NLBGS_Anderson_cs(self):
+
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=om.NonlinearBlockGS))
+
+        model = prob.model
+        model.approx_totals(method='cs', step=1e-10)
+
+        prob.setup()
+        model.nonlinear_solver.options['use_anderson'] = True
+        model.nonlinear_solver.options['atol'] = 1e-15
+        model.nonlinear_solver.options['rtol'] = 1e-15
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        J = prob.compute_totals(of=['y1'], wrt=['x'])
+        assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
+
+    def test_NLBGS_Anderson_Aitken_error(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        prob.model.nonlinear_solver = om.NonlinearBlockGS(use_anderson=True, use_aitken=True)
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "NonlinearBlockGS in <model> <class SellarDerivatives>: Options "
+                         "'use_aitken' and 'use_anderson' cannot both be True.")
+
     def test_aitken_bug(self):
         class Spring(om.ExplicitComponent):
             def setup(self):
@@ -136,6 +136,37 @@ class TestNLBlockJacobi(unittest.TestCase):
         assert_near_equal(prob['y1'], 25.5886171567, .00001)
         assert_near_equal(prob['y2'], 12.05848819, .00001)
 
+    def test_anderson(self):
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        nlbj = model.nonlinear_solver = om.NonlinearBlockJac(atol=1e-10, rtol=1e-10)
+
+        prob.setup()
+
+        prob.set_val('x', 1.)
+        prob.set_val('z', np.array([5.0, 2.0]))
+
+        prob.run_model()
+        plain_iters = nlbj._iter_count
+
+        nlbj.options['use_anderson'] = True
+        prob.setup()
+
+        prob.set_val('x', 1.)
+        prob.set_val('z', np.array([5.0, 2.0]))
+
+        prob.run_model()
+
+        assert_near_equal(prob['y1'], 25.58830273, 1e-6)
+        assert_near_equal(prob['y2'], 12.05848819, 1e-6)
+        self.assertLess(nlbj._iter_count, plain_iters)
+        self.assertEqual(nlbj._anderson.num_iterations, nlbj._iter_count)
+
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class TestNonlinearBlockJacobiMPI(unittest.TestCase):
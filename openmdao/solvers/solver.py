@@ -11,6 +11,7 @@ from openmdao.core.analysis_error import AnalysisError
 from openmdao.core.constants import _UNDEFINED
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.recorders.recording_manager import RecordingManager
+from openmdao.solvers.nonlinear.anderson import AndersonAccelerator
 from openmdao.utils.file_utils import _get_outputs_dir
 from openmdao.utils.mpi import MPI
 from openmdao.utils.options_dictionary import OptionsDictionary
@@ -979,6 +980,63 @@ class NonlinearSolver(Solver):
             self.solve()
 
 
+class BlockNonlinearSolver(NonlinearSolver):
+    """
+    A base class for NonlinearBlockGS and NonlinearBlockJac.
+
+    Parameters
+    ----------
+    **kwargs : dict
+        Options dictionary.
+
+    Attributes
+    ----------
+    _anderson : AndersonAccelerator or None
+        Anderson acceleration history. Only used if the anderson acceleration option is turned on.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize attributes.
+        """
+        super().__init__(**kwargs)
+        self._anderson = None
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('use_anderson', types=bool, default=False,
+                             desc='set to True to use Anderson acceleration')
+        self.options.declare('anderson_depth', types=int, default=5, lower=1,
+                             desc='number of previous iterations used by Anderson acceleration')
+        self.options.declare('anderson_mixing', types=(int, float), default=1.0, lower=0.0,
+                             upper=1.0,
+                             desc='fraction of the fixed point residual added to the Anderson '
+                             'accelerated outputs')
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+
+        if self.options['use_anderson']:
+            self._anderson = AndersonAccelerator(self.options['anderson_depth'],
+                                                 self.options['anderson_mixing'], system.comm)
+        else:
+            self._anderson = None
+
+
 class LinearSolver(Solver):
     """
     Base class for linear solvers.
@@ -992,6 +1050,9 @@ class LinearSolver(Solver):
     ----------
     _assembled_jac : AssembledJacobian or None
         If not None, the AssembledJacobian instance used by this solver.
+    _jac_vec_product : function or None
+        If not None, function that computes the product of the Jacobian with the given array.
+        Solvers that support it call it instead of apply_linear in fwd mode.
     _scope_in : set or None or _UNDEFINED
         Relevant input variables for the current matrix vector product.
     _scope_out : set or None or _UNDEFINED
@@ -1003,6 +1064,7 @@ class LinearSolver(Solver):
         Initialize all attributes.
         """
         self._assembled_jac = None
+        self._jac_vec_product = None
         self._scope_out = _UNDEFINED
         self._scope_in = _UNDEFINED
 
@@ -1050,6 +1112,7 @@ class LinearSolver(Solver):
                              desc='Activates use of assembled jacobian by this solver.')
 
         self.supports.declare('assembled_jac', types=bool, default=True)
+        self.supports.declare('jac_vec_product', types=bool, default=False)
 
     def _setup_solvers(self, system, depth):
         """
@@ -1081,6 +1144,48 @@ class LinearSolver(Solver):
         """
         raise NotImplementedError("class %s does not implement solve()." % (type(self).__name__))
 
+    def can_solve_multi_rhs(self):
+        """
+        Return True if this solver can solve for multiple right-hand sides in a single call.
+
+        Returns
+        -------
+        bool
+            True if solve_multi_rhs can be called on this solver.
+        """
+        return False
+
+    def solve_multi_rhs(self, rhs, mode):
+        """
+        Solve the linear system for a block of right-hand sides.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Array of shape (n, nrhs) where each column is a right-hand side in physical
+            (unscaled) form.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n, nrhs) containing the solutions in physical form.
+        """
+        raise NotImplementedError("class %s does not implement solve_multi_rhs()." %
+                                  (type(self).__name__))
+
+    def _supports_multi_col(self):
+        """
+        Return True if this solver can solve linear vectors holding one seed per column.
+
+        Returns
+        -------
+        bool
+            True if solve() works while the linear vectors hold multiple columns.
+        """
+        return False
+
     def _solve(self):
         """
         Run the iterative solver.
@@ -1194,6 +1299,13 @@ class BlockLinearSolver(LinearSolver):
         super()._declare_options()
         self.supports['assembled_jac'] = False
 
+        self.options.declare('multi_rhs', types=bool, default=False,
+                             desc="If True and this is the model's linear solver, propagate all "
+                             "seeds of a total derivative computation through the model at "
+                             "once, with one seed per column of the linear vectors, instead of "
+                             "one at a time. Only used if every linear solver in the model "
+                             "supports it.")
+
     def does_recursive_applies(self):
         """
         Return True.
@@ -1229,7 +1341,8 @@ class BlockLinearSolver(LinearSolver):
             self._rhs_vec = system._doutputs.asarray(True)
 
     def _update_rhs_vec(self):
-        if self._rhs_vec is None:
+        # the shape changes when the linear vectors switch to or from holding multiple columns
+        if self._rhs_vec is None or self._rhs_vec.shape != self._system()._doutputs._data.shape:
             self._create_rhs_vec()
 
         if self._mode == 'fwd':
@@ -1256,6 +1369,81 @@ class BlockLinearSolver(LinearSolver):
         else:
             self._rhs_vec = np.ascontiguousarray(self._rhs_vec.real, dtype=float)
 
+    def _supports_multi_col(self):
+        """
+        Return True if this solver can solve linear vectors holding one seed per column.
+
+        Returns
+        -------
+        bool
+            True if solve() works while the linear vectors hold multiple columns.
+        """
+        return True
+
+    def can_solve_multi_rhs(self):
+        """
+        Return True if this solver can solve for multiple right-hand sides in a single call.
+
+        This requires every linear solver in the owning system and its descendants to support
+        linear vectors holding multiple columns.
+
+        Returns
+        -------
+        bool
+            True if solve_multi_rhs can be called on this solver.
+        """
+        system = self._system()
+        if not self.options['multi_rhs'] or system.comm.size > 1 or system._doutputs.distributed:
+            return False
+
+        return all(s._linear_solver._supports_multi_col()
+                   for s in system.system_iter(include_self=True, recurse=True)
+                   if s._linear_solver is not None)
+
+    def solve_multi_rhs(self, rhs, mode):
+        """
+        Solve the linear system for a block of right-hand sides.
+
+        The linear vectors of the owning system and its descendants hold one right-hand side
+        per column for the duration of the solve, so the model is traversed only once.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Array of shape (n, nrhs) where each column is a right-hand side in physical
+            (unscaled) form.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n, nrhs) containing the solutions in physical form.
+        """
+        system = self._system()
+
+        system._set_linear_ncol(rhs.shape[1])
+        try:
+            system._dinputs.set_val(0.0)
+            system._doutputs.set_val(0.0)
+            system._dresiduals.set_val(0.0)
+
+            if mode == 'fwd':
+                b_vec = system._dresiduals
+                x_vec = system._doutputs
+            else:  # rev
+                b_vec = system._doutputs
+                x_vec = system._dresiduals
+
+            b_vec.set_val(rhs)
+
+            with system._scaled_context_all():
+                system._solve_linear(mode)
+
+            return x_vec.asarray(copy=True)
+        finally:
+            system._set_linear_ncol(1)
+
     def _union_matvec_scope(self, slv_vars, sys_vars):
         """
         Return the union of the two 'set's of variables.
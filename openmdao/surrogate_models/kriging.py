@@ -318,9 +318,7 @@ class KrigingSurrogate(SurrogateModel):
         # Normalize input
         x_n = (x - self.X_mean) / self.X_std
 
-        r = np.zeros((n_eval, self.n_samples), dtype=x.dtype)
-        for r_i, x_i in zip(r, x_n):
-            r_i[:] = np.exp(-thetas.dot(np.square((x_i - self.X).T)))
+        r = np.exp(-np.einsum('ijk,k->ij', np.square(x_n[:, np.newaxis, :] - self.X), thetas))
 
         # Scaled Predictor
         y_t = np.dot(r, self.alpha)
@@ -329,8 +327,9 @@ class KrigingSurrogate(SurrogateModel):
         y = self.Y_mean + self.Y_std * y_t
 
         if self.options['eval_rmse']:
-            mse = (1. - np.dot(np.dot(r, self.Vh.T),
-                               np.einsum('j,kj,lk->jl', self.S_inv, self.U, r))) * self.sigma2
+            # only the diagonal of r V S^-1 U^T r^T is needed, one entry per evaluation point.
+            mse = (1. - np.einsum('ij,ij->i', np.dot(r, self.Vh.T),
+                                  np.dot(r, self.U) * self.S_inv))[:, np.newaxis] * self.sigma2
 
             # Forcing negative RMSE to zero if negative due to machine precision
             mse[mse < 0.] = 0.
@@ -338,6 +337,25 @@ class KrigingSurrogate(SurrogateModel):
 
         return y
 
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at multiple points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_inputs) containing the points at which the surrogate is
+            evaluated.
+
+        Returns
+        -------
+        ndarray
+            Kriging predictions of shape (n_points, n_outputs).
+        ndarray, optional (if eval_rmse is True)
+            Root mean square of the prediction error at each point.
+        """
+        return self.predict(x)
+
     def linearize(self, x):
         """
         Calculate the jacobian of the Kriging surface at the requested point.
@@ -366,3 +384,30 @@ class KrigingSurrogate(SurrogateModel):
         jac = np.einsum('i,j,ij->ij', self.Y_std, 1. /
                         self.X_std, gradr.dot(self.alpha).T)
         return jac
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the Kriging surface at multiple points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_inputs) containing the points at which the surrogate
+            Jacobian is evaluated.
+
+        Returns
+        -------
+        ndarray
+            Jacobians of surrogate outputs wrt inputs, of shape (n_points, n_outputs, n_inputs).
+        """
+        thetas = self.thetas
+
+        # Normalize Input
+        x_n = (np.atleast_2d(x) - self.X_mean) / self.X_std
+
+        # dist[i, j, k] is the distance from point i to training point j in dimension k
+        dist = x_n[:, np.newaxis, :] - self.X
+        r = np.exp(-np.einsum('ijk,k->ij', np.square(dist), thetas))
+
+        gradr = -2. * r[:, :, np.newaxis] * dist * thetas
+        return np.einsum('j,k,ilk,lj->ijk', self.Y_std, 1. / self.X_std, gradr, self.alpha)
@@ -165,13 +165,7 @@ def l1_cross_distances(X, Y=None):
             raise ValueError("X and Y must have the same dimensions.")
         n_features = n_features_X
 
-        n_nonzero_cross_dist = n_samples_X * n_samples_Y
-        D = np.zeros((n_nonzero_cross_dist, n_features))
-        ll_1 = 0
-        for k in range(n_samples_X):
-            ll_0 = ll_1
-            ll_1 = ll_0 + n_samples_Y  # - k - 1
-            D[ll_0:ll_1] = np.abs(X[k] - Y)
+        D = np.abs(X[:, np.newaxis, :] - Y).reshape((n_samples_X * n_samples_Y, n_features))
 
     return D
 
@@ -974,6 +968,28 @@ class MultiFiCoKrigingSurrogate(MultiFiSurrogateModel):
         Y_pred, MSE = self.model.predict([new_x])
         return Y_pred, np.sqrt(np.abs(MSE))
 
+    def vectorized_predict(self, new_x):
+        """
+        Calculate predicted values of the response at multiple points.
+
+        Parameters
+        ----------
+        new_x : array_like
+            An array with shape (n_eval, n_features) giving the points at
+            which the predictions should be made.
+
+        Returns
+        -------
+        array_like
+            An array with shape (n_eval, 1) with the Best Linear Unbiased
+            Prediction at each point.
+        array_like
+            An array with shape (n_eval, 1) with the square root of the Mean Squared Error at
+            each point.
+        """
+        Y_pred, MSE = self.model.predict(new_x)
+        return Y_pred, np.sqrt(np.abs(MSE))
+
     def train_multifi(self, X, Y):
         """
         Train the surrogate model with the given set of inputs and outputs.
@@ -5,6 +5,9 @@ https://github.com/SMarone/NDInterp
 """
 
 from collections import OrderedDict
+
+import numpy as np
+
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
 from openmdao.surrogate_models.nn_interpolators.linear_interpolator import \
     LinearInterpolator
@@ -95,6 +98,26 @@ class NearestNeighbor(SurrogateModel):
         super().predict(x)
         return self.interpolant(x, **kwargs)
 
+    def vectorized_predict(self, x, **kwargs):
+        """
+        Calculate predicted values of the response at multiple points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_inputs) containing the points at which the surrogate is
+            evaluated.
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Predicted values of shape (n_points, n_outputs).
+        """
+        super().predict(x)
+        return self.interpolant(np.atleast_2d(x), **kwargs)
+
     def linearize(self, x, **kwargs):
         """
         Calculate the jacobian of the interpolant at the requested point.
@@ -115,3 +138,25 @@ class NearestNeighbor(SurrogateModel):
         if jac.shape[0] == 1 and len(jac.shape) > 2:
             return jac[0, ...]
         return jac
+
+    def vectorized_linearize(self, x, **kwargs):
+        """
+        Calculate the jacobian of the interpolant at multiple points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_inputs) containing the points at which the surrogate
+            Jacobian is evaluated.
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Jacobians of surrogate outputs wrt inputs, of shape (n_points, n_outputs, n_inputs).
+        """
+        x = np.atleast_2d(x)
+        return self.interpolant.gradient(x, **kwargs).reshape((x.shape[0],
+                                                               self.interpolant._dep_dims,
+                                                               self.interpolant._indep_dims))
@@ -104,9 +104,10 @@ class LinearInterpolator(NNBase):
         predictions = np.einsum('ij,ijk->ik', normalized_pts,
                                 normal[:, :self._indep_dims, :]) - pc
 
-        # Check to see if there are any collinear points and replace them
+        # Check to see if there are any collinear points and replace them with the value of
+        # the closest neighbor
         n0 = np.where(normal[:, -1, :] == 0)
-        predictions[n0, :] = self._tv[nloc[0, n0], :]
+        predictions[n0] = self._tv[nloc[n0[0], 0], n0[1]]
 
         # Finish computation for the good normals
         n = np.where(normal[:, -1, :] != 0)
@@ -145,16 +146,19 @@ class LinearInterpolator(NNBase):
         dims = self._indep_dims + 1
 
         # Find the neighbors
-        if self._pt_cache is not None and \
+        if self._pt_cache is not None and self._pt_cache[0].shape == normPredPts.shape and \
                 np.allclose(self._pt_cache[0], normPredPts):
             ndist, nloc = self._pt_cache[1:]
         else:
             ndist, nloc = self._KData.query(normPredPts.real, dims)
 
         normal, pc = self._find_hyperplane(nloc)
-        if np.any(normal[:, -1, :]) == 0:
-            return gradient
-        gradient[:] = (-normal[:, :-1, :] / normal[:, -1, :]).squeeze().T
+
+        # the gradient is zero wherever the neighbors are collinear
+        good = normal[:, -1, :] != 0
+        denom = np.where(good, normal[:, -1, :], 1.0)
+        grad = -normal[:, :-1, :] / denom[:, np.newaxis, :]
+        gradient[:] = np.where(good[:, np.newaxis, :], grad, 0.0).transpose((0, 2, 1))
 
         grad = gradient * (self._tvr[:, np.newaxis] / self._tpr)
 
@@ -382,7 +382,7 @@ class RBFInterpolator(NNBase):
         # Setup prediction points and find their radial neighbors
         ndist, nloc = self._KData.query(normalized_pts, self.N)
         # Check if complex step is being run
-        if np.any(np.abs(normalized_pts[0, :].imag)) > 0:
+        if np.any(normalized_pts.imag):
             dimdiff = np.subtract(normalized_pts.reshape((nppts, 1, self._indep_dims)),
                                   self._tp[nloc, :])
             # KD Tree ignores imaginary part, muse redo ndist if complex
@@ -419,7 +419,7 @@ class RBFInterpolator(NNBase):
 
         normalized_pts = (prediction_points - self._tpm) / self._tpr
         # Setup prediction points and find their radial neighbors
-        if self._pt_cache is not None and \
+        if self._pt_cache is not None and self._pt_cache[0].shape == normalized_pts.shape and \
                 np.allclose(self._pt_cache[0], normalized_pts):
             pdist, ploc = self._pt_cache[1:]
         else:
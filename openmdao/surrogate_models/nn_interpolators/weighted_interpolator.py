@@ -142,7 +142,7 @@ class WeightedInterpolator(NNBase):
 
         normalized_pts = (prediction_points - self._tpm) / self._tpr
 
-        if self._pt_cache is not None and \
+        if self._pt_cache is not None and self._pt_cache[0].shape == normalized_pts.shape and \
                 np.allclose(self._pt_cache[0], normalized_pts):
             ndist, nloc = self._pt_cache[1:]
         else:
@@ -153,7 +153,7 @@ class WeightedInterpolator(NNBase):
             ndist.shape = (1, ndist.shape[0])
             nloc.shape = (1, nloc.shape[0])
 
-        dimdiff = normalized_pts - self._tp[nloc]
+        dimdiff = normalized_pts[:, np.newaxis, :] - self._tp[nloc]
 
         weights = np.power(ndist, -dist_eff)
         dweights = -dist_eff * \
@@ -163,9 +163,10 @@ class WeightedInterpolator(NNBase):
 
         vals = self._tv[nloc]
 
+        weight_sum = weight_sum[:, np.newaxis, np.newaxis]
         gradient = (weight_sum * np.einsum('ikj,ikl->ilj', dweights, vals)
                     - (np.einsum('ij,ijk->ik', weights, vals)[..., np.newaxis]
-                       * np.sum(dweights, axis=1))) / np.power(weight_sum, 2)
+                       * np.sum(dweights, axis=1)[:, np.newaxis, :])) / np.power(weight_sum, 2)
 
         grad = gradient * (self._tvr[..., np.newaxis] / self._tpr)
 
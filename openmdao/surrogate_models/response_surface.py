@@ -52,10 +52,32 @@ class ResponseSurface(SurrogateModel):
         """
         super().train(x, y)
 
-        m = self.m = x.shape[0]
-        n = self.n = x.shape[1]
+        self.m = x.shape[0]
+        self.n = x.shape[1]
 
-        X = zeros((m, ((n + 1) * (n + 2)) // 2))
+        X = self._quadratic_terms(x)
+
+        # Determine response surface equation coefficients (betas) using least
+        # squares
+        self.betas, rs, r, s = lstsq(X, y)
+
+    def _quadratic_terms(self, x):
+        """
+        Compute the constant, linear, squared and cross terms of the response surface.
+
+        Parameters
+        ----------
+        x : ndarray
+            Array of shape (n_points, n) of input locations.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n_points, (n + 1) * (n + 2) / 2) containing the terms at each point.
+        """
+        m, n = x.shape
+
+        X = zeros((m, ((n + 1) * (n + 2)) // 2), dtype=np.result_type(x, float))
 
         # Modify X to include constant, squared terms and cross terms
 
@@ -74,9 +96,7 @@ class ResponseSurface(SurrogateModel):
             X_offset[:, :n - i] = einsum('i,ij->ij', x[:, i], x[:, i:])
             X_offset = X_offset[:, n - i:]
 
-        # Determine response surface equation coefficients (betas) using least
-        # squares
-        self.betas, rs, r, s = lstsq(X, y)
+        return X
 
     def predict(self, x):
         """
@@ -115,6 +135,25 @@ class ResponseSurface(SurrogateModel):
         # Predict new_y using X and betas
         return X.dot(self.betas)
 
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at multiple points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_inputs) containing the points at which the surrogate is
+            evaluated.
+
+        Returns
+        -------
+        ndarray
+            Predicted responses of shape (n_points, n_outputs).
+        """
+        super().predict(x)
+
+        return self._quadratic_terms(np.atleast_2d(x)).dot(self.betas)
+
     def linearize(self, x):
         """
         Calculate the jacobian of the Kriging surface at the requested point.
@@ -142,3 +181,35 @@ class ResponseSurface(SurrogateModel):
             beta_offset = beta_offset[n - i:, :]
 
         return jac.T
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the response surface at multiple points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_inputs) containing the points at which the surrogate
+            Jacobian is evaluated.
+
+        Returns
+        -------
+        ndarray
+            Jacobians of surrogate outputs wrt inputs, of shape (n_points, n_outputs, n_inputs).
+        """
+        n = self.n
+        betas = self.betas
+        x = np.atleast_2d(x)
+
+        # row and column index of the two factors in each quadratic term, in the same order
+        # used by _quadratic_terms
+        ii, jj = np.triu_indices(n)
+        eye = np.eye(n)
+        beta_quad = betas[n + 1:, :]
+
+        # d(x_i * x_j)/dx_k = x_j * delta_ik + x_i * delta_jk
+        jac = np.einsum('pt,tk,to->pok', x[:, jj], eye[ii], beta_quad)
+        jac += np.einsum('pt,tk,to->pok', x[:, ii], eye[jj], beta_quad)
+        jac += betas[1:n + 1, :].T
+
+        return jac
@@ -65,7 +65,23 @@ class SurrogateModel(object):
         Parameters
         ----------
         x : array-like
-            Vectorized point(s) at which the surrogate is evaluated.
+            Array of shape (n_points, n_inputs) containing the points at which the surrogate is
+            evaluated.
+        """
+        pass
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the interpolant at each of the requested points.
+
+        Surrogates that implement this method should return an array of shape
+        (n_points, n_outputs, n_inputs).
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_inputs) containing the points at which the surrogate
+            Jacobian is evaluated.
         """
         pass
 
@@ -149,6 +149,29 @@ class TestKrigingSurrogate(unittest.TestCase):
         jac = surrogate.linearize(np.array([[0.5, 0.5]]))
         assert_near_equal(jac, np.array([[1, 1], [1, -1], [1, 2]]), 1e-3)
 
+    def test_vectorized(self):
+        surrogate = KrigingSurrogate(eval_rmse=True)
+        n = 8
+        x = np.array([[a, b] for a, b in
+                      itertools.product(np.linspace(0, 1, n), repeat=2)])
+        y = np.array([[a + b**2, a*b, np.sin(a + 2*b)] for a, b in x])
+        surrogate.train(x, y)
+
+        test_x = np.array([[0.1, 0.2], [0.55, 0.45], [0.9, 0.3], [0.33, 0.71]])
+
+        mu, rmse = surrogate.vectorized_predict(test_x)
+        jac = surrogate.vectorized_linearize(test_x)
+
+        self.assertEqual(mu.shape, (4, 3))
+        self.assertEqual(rmse.shape, (4, 3))
+        self.assertEqual(jac.shape, (4, 3, 2))
+
+        for i, x0 in enumerate(test_x):
+            mu0, rmse0 = surrogate.predict(x0)
+            assert_near_equal(mu[i], mu0[0], 1e-12)
+            assert_near_equal(rmse[i], rmse0[0], 1e-6)
+            assert_near_equal(jac[i], surrogate.linearize(x0), 1e-12)
+
     def test_cache(self):
         x = np.array([[-2., 0.], [-0.5, 1.5], [1., 3.], [8.5, 4.5],
                       [-3.5, 6.], [4., 7.5], [-5., 9.], [5.5, 10.5],
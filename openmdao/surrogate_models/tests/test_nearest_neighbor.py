@@ -426,3 +426,27 @@ class TestRBFInterpolatorND(unittest.TestCase):
         for x0, y0 in zip(test_x, expected_deriv):
             mu = self.surrogate.linearize(x0)
             assert_near_equal(mu, y0, 1e-6)
+
+
+class TestNearestNeighborVectorized(unittest.TestCase):
+
+    def test_vectorized(self):
+        x = np.array([[a, b] for a in np.linspace(0, 2, 5) for b in np.linspace(0, 2, 5)])
+        y = np.array([[np.sin(a) + b, a * b] for a, b in x])
+
+        test_x = np.array([[0.3, 0.6], [1.1, 1.7], [1.6, 0.2], [0.7, 1.3]])
+
+        for interp in ['linear', 'weighted', 'rbf']:
+            with self.subTest(interpolant_type=interp):
+                surrogate = NearestNeighbor(interpolant_type=interp)
+                surrogate.train(x, y)
+
+                mu = surrogate.vectorized_predict(test_x.copy())
+                jac = surrogate.vectorized_linearize(test_x.copy())
+
+                self.assertEqual(mu.shape, (4, 2))
+                self.assertEqual(jac.shape, (4, 2, 2))
+
+                for i, x0 in enumerate(test_x):
+                    assert_near_equal(mu[i], surrogate.predict(x0.copy())[0], 1e-12)
+                    assert_near_equal(jac[i], surrogate.linearize(x0.copy()), 1e-12)
@@ -137,6 +137,27 @@ class TestResponseSurfaceSurrogate(unittest.TestCase):
         jac = surrogate.linearize(array([[0.5, 0.5]]))
         assert_near_equal(jac, array([[1, 1], [1, -1]]), 1e-5)
 
+    def test_vectorized(self):
+        surrogate = ResponseSurface()
+
+        x = array([[a, b, c] for a, b, c in
+                   itertools.product(linspace(0, 1, 5), repeat=3)])
+        y = array([[a*b + c**2 - 2*a, 3*a*c + b] for a, b, c in x])
+
+        surrogate.train(x, y)
+
+        test_x = array([[0.2, 0.4, 0.6], [0.9, 0.1, 0.5], [0.35, 0.75, 0.05]])
+
+        mu = surrogate.vectorized_predict(test_x)
+        jac = surrogate.vectorized_linearize(test_x)
+
+        self.assertEqual(mu.shape, (3, 2))
+        self.assertEqual(jac.shape, (3, 2, 3))
+
+        for i, x0 in enumerate(test_x):
+            assert_near_equal(mu[i], surrogate.predict(x0), 1e-12)
+            assert_near_equal(jac[i], surrogate.linearize(x0), 1e-12)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,14 +12,15 @@ import tempfile
 import traceback
 import webbrowser
 import inspect
-from itertools import combinations, groupby
+from heapq import heapify, heappop, heappush
+from itertools import groupby
 from contextlib import contextmanager
 from pprint import pprint
 from packaging.version import Version
 
 import networkx as nx
 import numpy as np
-from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
+from scipy.sparse import coo_matrix, csc_matrix, csr_matrix, issparse
 
 from openmdao.core.constants import INT_DTYPE, _DEFAULT_OUT_STREAM
 from openmdao.utils.general_utils import _src_name_iter, pattern_filter
@@ -175,6 +176,12 @@ class ColoringMeta(object):
     direct : bool
         If doing bidirectional coloring, use the direct method for assembling the column adjacency
         matrix of partitions, else use the substitution method.
+    sparsity_method : str
+        How the total sparsity is determined.  'random' computes total jacobians from random
+        partials, while 'structural' combines the declared partial sparsity patterns.
+    order : str
+        Order in which columns (or rows) are colored, either 'id' (incidence degree) or 'sl'
+        (smallest last).
 
     Attributes
     ----------
@@ -215,15 +222,20 @@ class ColoringMeta(object):
     direct : bool
         If doing bidirectional coloring, use the direct method for assembling the column adjacency
         matrix of partitions, else use the substitution method.
+    sparsity_method : str
+        How the total sparsity is determined ('random' or 'structural').
+    order : str
+        Order in which columns (or rows) are colored ('id' or 'sl').
     """
 
     _meta_names = {'num_full_jacs', 'tol', 'orders', 'min_improve_pct', 'show_summary',
                    'show_sparsity', 'dynamic', 'perturb_size', 'use_scaling', 'msginfo',
-                   'direct'}
+                   'direct', 'sparsity_method', 'order'}
 
     def __init__(self, num_full_jacs=3, tol=1e-25, orders=None, min_improve_pct=5.,
                  show_summary=True, show_sparsity=False, dynamic=False, static=None,
-                 perturb_size=1e-9, use_scaling=False, msginfo='', direct=True):
+                 perturb_size=1e-9, use_scaling=False, msginfo='', direct=True,
+                 sparsity_method='random', order='id'):
         """
         Initialize data structures.
         """
@@ -244,6 +256,8 @@ class ColoringMeta(object):
         self.randomize_subjacs = True
         self.randomize_seeds = False
         self.direct = direct
+        self.sparsity_method = sparsity_method
+        self.order = order
 
     def do_compute_coloring(self):
         """
@@ -1286,14 +1300,29 @@ class Coloring(object):
 
         sparsity_time = meta.get('sparsity_time', None)
         if sparsity_time is not None:
-            print(f"Dense {meta['type']} jacobian for {meta['class']} '{meta['pathname']}' was "
-                  f"computed {meta['num_full_jacs']} times.", file=out_stream)
+            if meta.get('sparsity_method') == 'structural':
+                print(f"Sparsity of the {meta['type']} jacobian for {meta['class']} "
+                      f"'{meta['pathname']}' was determined from the declared partial "
+                      "sparsity.", file=out_stream)
+            else:
+                print(f"Dense {meta['type']} jacobian for {meta['class']} '{meta['pathname']}' "
+                      f"was computed {meta['num_full_jacs']} times.", file=out_stream)
             print(f"Time to compute sparsity: {sparsity_time:8.4f} sec", file=out_stream)
 
         coloring_time = meta.get('coloring_time', None)
         if coloring_time is not None:
             print(f"Time to compute coloring: {coloring_time:8.4f} sec", file=out_stream)
 
+        candidates = meta.get('coloring_candidates')
+        if candidates:
+            print("Colorings tried:", file=out_stream)
+            for name, info in candidates.items():
+                if info is None:
+                    print(f"   {name:>13}: skipped (can't require fewer solves)", file=out_stream)
+                else:
+                    print(f"   {name:>13}: {info[0]} solves in {info[1]:8.4f} sec",
+                          file=out_stream)
+
         coloring_mem = meta.get('coloring_memory', None)
         if coloring_mem is not None:
             print(f"Memory to compute coloring: {coloring_mem:8.4f} MB", file=out_stream)
@@ -2297,6 +2326,68 @@ class Coloring(object):
         return _sort_subtractions(subtractions)
 
 
+class _BlockMax(object):
+    """
+    Array of values supporting repeated argmax queries while some of the values change.
+
+    The values are split into blocks of about sqrt(n) entries and the max of each block is
+    kept, so after values change only the blocks containing them have to be searched again.
+
+    Parameters
+    ----------
+    values : ndarray
+        Initial values.
+    fill : int
+        Value used to pad the last block.  Must be lower than any value that can be returned.
+
+    Attributes
+    ----------
+    values : ndarray
+        Current values, padded to a whole number of blocks.  Call update after changing them.
+    _bsize : int
+        Number of values in each block.
+    _blocks : ndarray
+        2D view of values with one row per block.
+    _maxes : ndarray
+        Max value of each block.
+    """
+
+    def __init__(self, values, fill):
+        """
+        Initialize attributes.
+        """
+        self._bsize = bsize = max(int(np.sqrt(values.size)), 1)
+        nblocks = -(-values.size // bsize)
+        self.values = np.full(nblocks * bsize, fill, dtype=values.dtype)
+        self.values[:values.size] = values
+        self._blocks = self.values.reshape((nblocks, bsize))
+        self._maxes = self._blocks.max(axis=1)
+
+    def argmax(self):
+        """
+        Return the index of the max value, the lowest one in case of ties.
+
+        Returns
+        -------
+        int
+            Index of the max value.
+        """
+        block = self._maxes.argmax()
+        return block * self._bsize + self._blocks[block].argmax()
+
+    def update(self, idxs):
+        """
+        Update the block maxes after the given values have changed.
+
+        Parameters
+        ----------
+        idxs : ndarray
+            Indices of the changed values.
+        """
+        blocks = np.unique(idxs // self._bsize)
+        self._maxes[blocks] = self._blocks[blocks].max(axis=1)
+
+
 def _order_by_ID(col_adj_matrix):
     """
     Return columns in order of incidence degree (ID).
@@ -2316,22 +2407,105 @@ def _order_by_ID(col_adj_matrix):
     int
         Column index.
     ndarray
-        Boolean array that's True where the column matches nzcols.
+        Indices of the columns adjacent to the column.
     """
     assert isinstance(col_adj_matrix, csc_matrix)
 
     ncols = col_adj_matrix.shape[1]
+    indptr = col_adj_matrix.indptr
+    indices = col_adj_matrix.indices
+
     colored_degrees = np.zeros(ncols, dtype=INT_DTYPE)
-    colored_degrees[col_adj_matrix.indices] = 1  # make sure zero cols aren't considered
+    colored_degrees[indices] = 1  # make sure zero cols aren't considered
+    ncolored = np.count_nonzero(colored_degrees)
 
-    for _ in range(np.nonzero(colored_degrees)[0].size):
+    colored_degrees = _BlockMax(colored_degrees, fill=-ncols - 1)
+    degrees = colored_degrees.values
+
+    for _ in range(ncolored):
         col = colored_degrees.argmax()
-        colnzrows = col_adj_matrix.getcol(col).indices
-        colored_degrees[colnzrows] += 1
-        colored_degrees[col] = -ncols  # ensure that this col will never have max degree again
+        colnzrows = indices[indptr[col]:indptr[col + 1]]
+        degrees[colnzrows] += 1
+        degrees[col] = -ncols  # ensure that this col will never have max degree again
+        colored_degrees.update(np.append(colnzrows, col))
         yield col, colnzrows
 
 
+def _order_by_SL(col_adj_matrix):
+    """
+    Return columns in smallest last (SL) order.
+
+    Columns of minimum degree (lowest index first) are removed from the column adjacency graph
+    one at a time, and the columns are returned in the reverse order of their removal.
+
+    Parameters
+    ----------
+    col_adj_matrix : csc matrix
+        CSC column adjacency matrix.
+
+    Yields
+    ------
+    int
+        Column index.
+    ndarray
+        Indices of the columns adjacent to the column.
+    """
+    assert isinstance(col_adj_matrix, csc_matrix)
+
+    ncols = col_adj_matrix.shape[1]
+    indptr = col_adj_matrix.indptr
+    indices = col_adj_matrix.indices
+
+    # don't count a column as its own neighbor
+    counts = np.diff(indptr)
+    owner = np.repeat(np.arange(ncols, dtype=INT_DTYPE), counts)
+    degrees = counts - np.bincount(owner[indices == owner], minlength=ncols)
+    owner = None
+
+    removed = np.ones(ncols, dtype=bool)
+    removed[indices] = False  # zero cols aren't considered
+    nremove = ncols - np.count_nonzero(removed)
+
+    # the max of the negated degrees is the min degree
+    neg_degrees = _BlockMax(np.where(removed, -ncols - 1, -degrees), fill=-ncols - 1)
+    degrees = neg_degrees.values
+
+    removal_order = []
+    for _ in range(nremove):
+        col = neg_degrees.argmax()
+        removal_order.append(col)
+        removed[col] = True
+        nbrs = indices[indptr[col]:indptr[col + 1]]
+        nbrs = nbrs[~removed[nbrs]]
+        degrees[nbrs] += 1
+        degrees[col] = -ncols - 1
+        neg_degrees.update(np.append(nbrs, col))
+
+    for col in reversed(removal_order):
+        yield col, indices[indptr[col]:indptr[col + 1]]
+
+
+def _bool_csr(rows, cols, shape):
+    """
+    Return a boolean CSR matrix with nonzeros at the given locations.
+
+    Parameters
+    ----------
+    rows : ndarray
+        Row indices of the nonzeros.
+    cols : ndarray
+        Column indices of the nonzeros.
+    shape : tuple
+        Shape of the matrix.
+
+    Returns
+    -------
+    csr_matrix
+        The boolean matrix.
+    """
+    return csr_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=shape)
+
+
 def _2col_adj_rows_cols(J):
     """
     Convert nonzero rows/cols of sparsity matrix to those of a column adjacency matrix.
@@ -2346,31 +2520,10 @@ def _2col_adj_rows_cols(J):
     csc_matrix
         Sparse column adjacency matrix.
     """
-    nrows, ncols = J.shape
-    nzrows, nzcols = J.row, J.col
+    csr = _bool_csr(J.row, J.col, J.shape)
 
-    adjrows = []
-    adjcols = []
-
-    csr = csr_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
-
-    # mark col_matrix entries as True when nonzero row entries make them dependent
-    for row in np.unique(nzrows):
-        row_nzcols = csr.getrow(row).indices
-
-        if row_nzcols.size > 0:
-            for c in row_nzcols:
-                adjrows.append(row_nzcols)
-                adjcols.append(np.full(row_nzcols.size, c))
-
-    if adjrows:
-        adjrows = np.hstack(adjrows)
-        adjcols = np.hstack(adjcols)
-    else:
-        adjrows = np.zeros(0, dtype=INT_DTYPE)
-        adjcols = np.zeros(0, dtype=INT_DTYPE)
-
-    return csc_matrix((np.ones(adjrows.size, dtype=bool), (adjrows, adjcols)), shape=(ncols, ncols))
+    # columns are dependent if they have a nonzero in the same row
+    return csc_matrix(csr.T @ csr, dtype=bool)
 
 
 def _Jc2col_matrix_direct(J, Jrows, Jcols):
@@ -2393,52 +2546,17 @@ def _Jc2col_matrix_direct(J, Jrows, Jcols):
 
     Returns
     -------
-    tuple
-        (nzrows, nzcols, shape) of column adjacency matrix.
-    """
-    shape = J.shape
-    _, ncols = shape
-    allnzr = []
-    allnzc = []
-
-    Jrow = np.zeros(ncols, dtype=bool)
-    csr = csr_matrix((np.ones(Jrows.size, dtype=bool), (Jrows, Jcols)), shape=shape)
-
-    for row in np.unique(Jrows):
-        nzr = []
-        nzc = []
-        partrow = csr.getrow(row).indices
-        fullrow = J.getrow(row).indices
-
-        if fullrow.size > 1:
-            Jrow[partrow] = True
-            for col1, col2 in combinations(fullrow, 2):
-                if Jrow[col1] or Jrow[col2]:
-                    nzr.append(col1)
-                    nzc.append(col2)
-            Jrow[partrow] = False
-
-        elif partrow.size == 1:
-            nzr.append(partrow[0])
-            nzc.append(partrow[0])
-
-        if nzr:
-            allnzr.append(nzr)
-            allnzc.append(nzc)
-
-    csr = Jrow = None  # free up memory
-
-    if allnzr:
-        # matrix is symmetric, so duplicate
-        rows = np.hstack(allnzr + allnzc)
-        cols = np.hstack(allnzc + allnzr)
-    else:
-        rows = np.zeros(0, dtype=INT_DTYPE)
-        cols = np.zeros(0, dtype=INT_DTYPE)
+    csc_matrix
+        Sparse column adjacency matrix.
+    """
+    rows = np.unique(Jrows)
+    part = _bool_csr(Jrows, Jcols, J.shape)[rows]
+    full = _bool_csr(J.row, J.col, J.shape)[rows]
 
-    allnzr = allnzc = None
+    # two columns are dependent if they share a row and at least one of them is in the partition
+    adj = part.T @ full
 
-    return csc_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(ncols, ncols))
+    return csc_matrix(adj + adj.T, dtype=bool)
 
 
 def _Jc2col_matrix_substitution(J, part_rows, part_cols, overlap):
@@ -2463,66 +2581,25 @@ def _Jc2col_matrix_substitution(J, part_rows, part_cols, overlap):
 
     Returns
     -------
-    tuple
-        (nzrows, nzcols, shape) of column adjacency matrix.
-    """
-    shape = J.shape
-    _, ncols = shape
-    allnzr = []
-    allnzc = []
-
-    Jrow = np.zeros(ncols, dtype=bool)
-    part_csr = csr_matrix((np.ones(part_rows.size, dtype=bool), (part_rows, part_cols)),
-                          shape=shape)
-
-    for row in np.unique(part_rows):
-        nzr = []
-        nzc = []
-        partrow_cols = part_csr.getrow(row).indices
-
-        if partrow_cols.size > 1:
-            Jrow[partrow_cols] = True
-
-            # col1 and col2 are both nonzero in the full matrix for this row
-            for col1, col2 in combinations(J.getrow(row).indices, 2):
-                if Jrow[col1]:
-                    if Jrow[col2]:  # both are in the partition, so cols are dependent
-                        nzr.append(col1)
-                        nzc.append(col2)
-                    else:
-                        # one is in the partition, the other is not
-                        overlap.add((row, col1))
-                elif Jrow[col2]:
-                    # one is in the partition, the other is not
-                    overlap.add((row, col2))
-
-            Jrow[partrow_cols] = False
-
-        else:  # partrow_cols.size == 1
-            nzr.append(partrow_cols[0])
-            nzc.append(partrow_cols[0])
-            overlap.add((row, partrow_cols[0]))
-
-        if nzr:
-            allnzr.append(nzr)
-            allnzc.append(nzc)
-
-    part_csr = Jrow = None  # free up memory
-
-    if allnzr:
-        # matrix is symmetric, so duplicate
-        rows = np.hstack(allnzr + allnzc)
-        cols = np.hstack(allnzc + allnzr)
-    else:
-        rows = np.zeros(0, dtype=INT_DTYPE)
-        cols = np.zeros(0, dtype=INT_DTYPE)
+    csc_matrix
+        Sparse column adjacency matrix.
+    """
+    part = _bool_csr(part_rows, part_cols, J.shape)
+    full = _bool_csr(J.row, J.col, J.shape)
 
-    allnzr = allnzc = None
+    # an entry overlaps when its row also has nonzeros outside of the partition, or when it's
+    # the only nonzero of its row in the partition
+    part_counts = np.diff(part.indptr)
+    full_counts = np.diff(full.indptr)
+    overlap_rows = (part_counts == 1) | ((part_counts > 0) & (full_counts > part_counts))
+    ovr = part[overlap_rows].tocoo()
+    overlap.update(zip(np.nonzero(overlap_rows)[0][ovr.row].tolist(), ovr.col.tolist()))
 
-    return csc_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(ncols, ncols))
+    # two columns are dependent if they're both in the partition and share a row
+    return csc_matrix(part.T @ part, dtype=bool)
 
 
-def _get_full_disjoint_cols(J):
+def _get_full_disjoint_cols(J, order='id'):
     """
     Find sets of disjoint columns in J and their corresponding rows using a col adjacency matrix.
 
@@ -2530,16 +2607,19 @@ def _get_full_disjoint_cols(J):
     ----------
     J : coo_matrix
         Sparse matrix to be colored.
+    order : str
+        Order in which columns are colored, either 'id' (incidence degree) or 'sl' (smallest
+        last).
 
     Returns
     -------
     list
         List of lists of disjoint columns
     """
-    return _get_full_disjoint_col_matrix_cols(_2col_adj_rows_cols(J))
+    return _get_full_disjoint_col_matrix_cols(_2col_adj_rows_cols(J), order=order)
 
 
-def _get_full_disjoint_col_matrix_cols(col_adj_matrix):
+def _get_full_disjoint_col_matrix_cols(col_adj_matrix, order='id'):
     """
     Find sets of disjoint columns in a column intersection matrix.
 
@@ -2547,33 +2627,46 @@ def _get_full_disjoint_col_matrix_cols(col_adj_matrix):
     ----------
     col_adj_matrix : csc_matrix
         Sparse column adjacency matrix.
+    order : str
+        Order in which columns are colored, either 'id' (incidence degree) or 'sl' (smallest
+        last).
 
     Returns
     -------
     list
         List of lists of disjoint columns.
     """
+    if order == 'id':
+        col_iter = _order_by_ID(col_adj_matrix)
+    elif order == 'sl':
+        col_iter = _order_by_SL(col_adj_matrix)
+    else:
+        raise ValueError(f"Invalid coloring order '{order}'. Must be 'id' or 'sl'.")
+
     color_groups = []
     _, ncols = col_adj_matrix.shape
 
     # -1 indicates that a column has not been colored
     colors = np.full(ncols, -1, dtype=INT_DTYPE)
 
-    for icol, colnzrows in _order_by_ID(col_adj_matrix):
+    for icol, colnzrows in col_iter:
+        # the lowest color not used by a neighbor can't be higher than the number of neighbors
+        ncolors = min(len(color_groups), colnzrows.size)
         neighbor_colors = colors[colnzrows]
-        for color, grp in enumerate(color_groups):
-            if color not in neighbor_colors:
-                grp.append(icol)
-                colors[icol] = color
-                break
+        used = np.zeros(ncolors + 1, dtype=bool)
+        used[neighbor_colors[(neighbor_colors >= 0) & (neighbor_colors <= ncolors)]] = True
+        color = used.argmin()
+
+        if color < len(color_groups):
+            color_groups[color].append(icol)
         else:
-            colors[icol] = len(color_groups)
             color_groups.append([icol])
+        colors[icol] = color
 
     return color_groups
 
 
-def _color_partition(J, Jprows, Jpcols, direct=True, overlap=None):
+def _color_partition(J, Jprows, Jpcols, direct=True, overlap=None, order='id'):
     """
     Compute a single directional fwd coloring using partition Jpart.
 
@@ -2592,6 +2685,9 @@ def _color_partition(J, Jprows, Jpcols, direct=True, overlap=None):
         substitution method.
     overlap : set or None
         Nonzero entries indicate overlapping columns.
+    order : str
+        Order in which columns are colored, either 'id' (incidence degree) or 'sl' (smallest
+        last).
 
     Returns
     -------
@@ -2605,15 +2701,17 @@ def _color_partition(J, Jprows, Jpcols, direct=True, overlap=None):
     else:  # use substitution method
         col_adj_matrix = _Jc2col_matrix_substitution(J, Jprows, Jpcols, overlap=overlap)
 
-    col_groups = _get_full_disjoint_col_matrix_cols(col_adj_matrix)
+    col_groups = _get_full_disjoint_col_matrix_cols(col_adj_matrix, order=order)
 
     col_adj_matrix = None
 
     csc = csc_matrix((np.ones(Jprows.size), (Jprows, Jpcols)), shape=J.shape)
+    indptr = csc.indptr
+    indices = csc.indices
     _, ncols = J.shape
     col2row = [None] * ncols
-    for col in np.unique(Jpcols):
-        col2row[col] = csc.getcol(col).indices
+    for col in np.unique(Jpcols).tolist():
+        col2row[col] = indices[indptr[col]:indptr[col + 1]]
 
     if direct:
         for i, group in enumerate(col_groups):
@@ -2646,7 +2744,7 @@ def _sort_subtractions(allsubs):
     return sorted_subs
 
 
-def MNCO_bidir(J, direct=True):
+def MNCO_bidir(J, direct=True, order='id'):
     """
     Compute bidirectional coloring using Minimum Nonzero Count Order (MNCO).
 
@@ -2661,6 +2759,9 @@ def MNCO_bidir(J, direct=True):
     direct : bool
         If True, use the direct method to compute the column adjacency matrix of partitions.
         Otherwise, use the substitution method. See the paper for descriptions of both methods.
+    order : str
+        Order in which columns (or rows) of each partition are colored, either 'id' (incidence
+        degree) or 'sl' (smallest last).
 
     Returns
     -------
@@ -2673,20 +2774,24 @@ def MNCO_bidir(J, direct=True):
 
     coloring = Coloring(sparsity=J)
 
-    M_col_nonzeros = np.zeros(ncols, dtype=INT_DTYPE)
-    M_row_nonzeros = np.zeros(nrows, dtype=INT_DTYPE)
-
-    sparse = csc_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
+    csr = _bool_csr(nzrows, nzcols, J.shape)
+    csc = csr.tocsc()
 
-    for c in range(ncols):
-        M_col_nonzeros[c] = sparse.getcol(c).size
-    sparse = sparse.tocsr()
-    for r in range(nrows):
-        M_row_nonzeros[r] = sparse.getrow(r).size
+    # M is the part of J that hasn't yet been assigned to Jf or Jr
+    M_row_nonzeros = np.diff(csr.indptr).astype(INT_DTYPE)
+    M_col_nonzeros = np.diff(csc.indptr).astype(INT_DTYPE)
+    M_nnz = csr.nnz
 
-    sparse = None
+    row_removed = np.zeros(nrows, dtype=bool)
+    col_removed = np.zeros(ncols, dtype=bool)
 
-    M_rows, M_cols = nzrows, nzcols
+    # heaps of (nonzeros, index) used to find the row and col with the fewest nonzeros (lowest
+    # index first), without searching all rows and cols at every step.  Entries whose count is
+    # out of date are discarded when they reach the top.
+    row_heap = list(zip(M_row_nonzeros.tolist(), range(nrows)))
+    col_heap = list(zip(M_col_nonzeros.tolist(), range(ncols)))
+    heapify(row_heap)
+    heapify(col_heap)
 
     Jf_rows = [None] * nrows
     Jr_cols = [None] * ncols
@@ -2700,52 +2805,55 @@ def MNCO_bidir(J, direct=True):
     Jf_nz_max = 0   # max row nonzeros in Jf
     Jr_nz_max = 0   # max col nonzeros in Jr
 
-    rowcols = {}
-
-    while M_rows.size > 0:
+    while M_nnz > 0:
         # the algorithm is minimizing the total of the max number of nonzero
         # rows in Jf + the max number of nonzero columns in Jr, so it's basically minimizing
         # the upper bound of the number of colors that will be needed.
 
         # get index of row with fewest nonzeros and col with fewest nonzeros
-        r = M_row_nonzeros.argmin()
-        c = M_col_nonzeros.argmin()
+        while row_removed[row_heap[0][1]] or row_heap[0][0] != M_row_nonzeros[row_heap[0][1]]:
+            heappop(row_heap)
+        while col_removed[col_heap[0][1]] or col_heap[0][0] != M_col_nonzeros[col_heap[0][1]]:
+            heappop(col_heap)
 
-        # get number of nonzeros in the selected row and column
-        nnz_c = M_col_nonzeros[c]
-        nnz_r = M_row_nonzeros[r]
+        nnz_r, r = row_heap[0]
+        nnz_c, c = col_heap[0]
 
         if Jr_nz_max + max(Jf_nz_max, nnz_r) < (Jf_nz_max + max(Jr_nz_max, nnz_c)):
 
-            Jf_rows[r] = M_cols[M_rows == r]  # add a row to Jf
-            keep = M_rows != r  # remove row r from M
-            M_row_nonzeros[r] = skip  # make sure we don't pick this row again
-            M_col_nonzeros[Jf_rows[r]] -= 1  # -1 all column nonzeros for columns in removed row
+            cols = csr.indices[csr.indptr[r]:csr.indptr[r + 1]]
+            Jf_rows[r] = cols = cols[~col_removed[cols]]  # add a row to Jf
+            heappop(row_heap)  # remove row r from M
+            row_removed[r] = True
+            M_row_nonzeros[r] = skip
+            M_col_nonzeros[cols] -= 1  # -1 all column nonzeros for columns in removed row
+            for entry in zip(M_col_nonzeros[cols].tolist(), cols.tolist()):
+                heappush(col_heap, entry)
 
             if nnz_r > Jf_nz_max:
                 Jf_nz_max = nnz_r  # update max nonzero rows in Jf
 
             row_i += 1
-            rowcols[r, True] = len(rowcols)
+            M_nnz -= nnz_r
 
         else:
 
-            Jr_cols[c] = M_rows[M_cols == c]  # add a column to Jr
-            keep = M_cols != c  # remove column c from M
-            M_col_nonzeros[c] = skip  # make sure we don't pick this one again
-            M_row_nonzeros[Jr_cols[c]] -= 1  # -1 all row nonzeros for rows in removed column
+            rows = csc.indices[csc.indptr[c]:csc.indptr[c + 1]]
+            Jr_cols[c] = rows = rows[~row_removed[rows]]  # add a column to Jr
+            heappop(col_heap)  # remove column c from M
+            col_removed[c] = True
+            M_col_nonzeros[c] = skip
+            M_row_nonzeros[rows] -= 1  # -1 all row nonzeros for rows in removed column
+            for entry in zip(M_row_nonzeros[rows].tolist(), rows.tolist()):
+                heappush(row_heap, entry)
 
             if nnz_c > Jr_nz_max:
                 Jr_nz_max = nnz_c  # update max nonzero columns in Jr
 
             col_i += 1
-            rowcols[c, False] = len(rowcols)
-
-        # M gets smaller by one row or one column
-        M_rows = M_rows[keep]
-        M_cols = M_cols[keep]
+            M_nnz -= nnz_c
 
-    M_row_nonzeros = M_col_nonzeros = None
+    M_row_nonzeros = M_col_nonzeros = row_heap = col_heap = csc = None
 
     nnz_Jf = nnz_Jr = 0
 
@@ -2779,11 +2887,13 @@ def MNCO_bidir(J, direct=True):
 
     overlap = set()
     if row_i > 0:
-        coloring._fwd = _color_partition(J, Jfr, Jfc, direct=direct, overlap=overlap)
+        coloring._fwd = _color_partition(J, Jfr, Jfc, direct=direct, overlap=overlap,
+                                         order=order)
 
     overlapr = set()
     if col_i > 0:
-        coloring._rev = _color_partition(J.T, Jrc, Jrr, direct=direct, overlap=overlapr)
+        coloring._rev = _color_partition(J.T, Jrc, Jrr, direct=direct, overlap=overlapr,
+                                         order=order)
         overlapr = {(c, r) for r, c in overlapr}
 
     if not direct and row_i > 0 and col_i > 0:
@@ -2797,7 +2907,7 @@ def MNCO_bidir(J, direct=True):
         else:
             coloring._subtractions = {}
 
-    if nzrows.size != nnz_Jf + nnz_Jr:
+    if csr.nnz != nnz_Jf + nnz_Jr:
         raise RuntimeError("Nonzero mismatch for J vs. Jf and Jr")
 
     coloring._meta['bidirectional'] = row_i > 0 and col_i > 0
@@ -3021,7 +3131,181 @@ def _get_total_jac_sparsity(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_ful
     return coo_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=shape), spmeta
 
 
-def _compute_coloring(J, mode, direct=True):
+def _subjac_sparsity(meta):
+    """
+    Return the nonzero rows and columns declared for a subjacobian.
+
+    Parameters
+    ----------
+    meta : dict
+        Metadata of the subjacobian.
+
+    Returns
+    -------
+    tuple of ndarray or None
+        Row and column indices of the nonzero entries, or None if the subjacobian is dense.
+    """
+    if meta.get('diagonal'):
+        diag = np.arange(meta['shape'][0], dtype=INT_DTYPE)
+        return diag, diag
+    if meta.get('rows') is not None:
+        return np.asarray(meta['rows']), np.asarray(meta['cols'])
+    if issparse(meta.get('val')):
+        coo = meta['val'].tocoo()
+        return coo.row, coo.col
+    return None
+
+
+def _get_structural_total_jac_sparsity(prob, of, wrt):
+    """
+    Return the sparsity of the total jacobian based on the declared sparsity of the partials.
+
+    No derivatives are computed.  Instead, the declared sparsity patterns of the partial
+    jacobians of every component are combined into a sparse boolean matrix of the direct
+    dependencies between the entries of the model's outputs, with inputs replaced by the
+    entries of their sources.  The design variable entries are then propagated through that
+    matrix, using sparse matrix products, until no new dependencies are found.  Dense
+    subjacobians, matrix free components without declared partials and groups that approximate
+    their own derivatives are each represented by one extra node that all of their rows depend
+    on and that depends on all of their columns, so they never have to be expanded.
+
+    The result is a superset of the true sparsity, since declared nonzeros whose values happen
+    to be zero, or that cancel each other, are treated as nonzero.
+
+    Parameters
+    ----------
+    prob : Problem
+        The Problem being analyzed.
+    of : dict
+        Metadata of the response variables, keyed by name.
+    wrt : dict
+        Metadata of the design variables, keyed by name.
+
+    Returns
+    -------
+    csc_matrix
+        The boolean total sparsity.
+    dict
+        Metadata about the sparsity computation.
+    """
+    from openmdao.core.group import Group
+
+    start_time = time.perf_counter()
+
+    model = prob.model
+    outputs = model._outputs
+    inputs = model._inputs
+    nout = len(outputs)
+
+    out_starts = {name: outputs.get_range(name)[0] for name in model._var_abs2meta['output']}
+
+    # entries of every input are replaced by the corresponding entries of its source
+    in2src = np.empty(len(inputs), dtype=INT_DTYPE)
+    conns = model._conn_global_abs_in2out
+    for name, meta in model._var_abs2meta['input'].items():
+        start, stop = inputs.get_range(name)
+        src_start = out_starts[conns[name]]
+        if meta['src_indices'] is None:
+            in2src[start:stop] = np.arange(src_start, src_start + stop - start)
+        else:
+            in2src[start:stop] = meta['src_indices'].shaped_array(flat=True) + src_start
+
+    def var_nodes(name, idxs=None):
+        if name in out_starts:
+            start = out_starts[name]
+            if idxs is None:
+                return np.arange(start, outputs.get_range(name)[1], dtype=INT_DTYPE)
+            return idxs + start
+        start, stop = inputs.get_range(name)
+        return in2src[start:stop] if idxs is None else in2src[idxs + start]
+
+    def system_nodes(system, iotypes):
+        nodes = [var_nodes(n) for io in iotypes for n in system._var_abs2meta[io]]
+        return np.concatenate(nodes) if nodes else np.zeros(0, dtype=INT_DTYPE)
+
+    rows = []
+    cols = []
+    nhubs = 0
+
+    def add_dense(row_nodes, col_nodes):
+        nonlocal nhubs
+        hub = nout + nhubs
+        nhubs += 1
+        rows.extend((row_nodes, np.full(col_nodes.size, hub, dtype=INT_DTYPE)))
+        cols.extend((np.full(row_nodes.size, hub, dtype=INT_DTYPE), col_nodes))
+
+    stack = [model]
+    while stack:
+        group = stack.pop()
+        for system in group._subsystems_myproc:
+            if isinstance(system, Group):
+                if system._owns_approx_jac:
+                    add_dense(system_nodes(system, ('output',)),
+                              system_nodes(system, ('input', 'output')))
+                else:
+                    stack.append(system)
+            elif system.matrix_free and not system._declared_partials_patterns:
+                # matrix free components without declared partials are assumed to be dense
+                add_dense(system_nodes(system, ('output',)),
+                          system_nodes(system, ('input', 'output')))
+            else:
+                for (ofname, wrtname), meta in system._subjacs_info.items():
+                    pattern = _subjac_sparsity(meta)
+                    if pattern is None:
+                        add_dense(var_nodes(ofname), var_nodes(wrtname))
+                    else:
+                        rows.append(var_nodes(ofname, pattern[0]))
+                        cols.append(var_nodes(wrtname, pattern[1]))
+
+    nnodes = nout + nhubs
+    if rows:
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+    else:
+        rows = cols = np.zeros(0, dtype=INT_DTYPE)
+    deps = csr_matrix((np.ones(rows.size, dtype=np.float32), (rows, cols)),
+                      shape=(nnodes, nnodes))
+    rows = cols = None
+
+    def meta_nodes(meta):
+        nodes = var_nodes(meta['source'])
+        if meta['indices'] is not None:
+            nodes = nodes[meta['indices'].as_array()]
+        return nodes
+
+    # reach[i, j] is True if node i depends on design variable entry j
+    seeds = np.concatenate([meta_nodes(meta) for meta in wrt.values()])
+    ncols = seeds.size
+    reach = csr_matrix((np.ones(ncols, dtype=np.float32), (seeds, np.arange(ncols))),
+                       shape=(nnodes, ncols))
+
+    front = reach
+    while front.nnz > 0:
+        new = deps @ front
+        new.data[:] = 1.
+        new = new - new.multiply(reach)
+        new.eliminate_zeros()
+        reach = reach + new
+        front = new
+
+    response_nodes = np.concatenate([meta_nodes(meta) for meta in of.values()])
+    J = csc_matrix(reach[response_nodes], dtype=bool)
+    reach = deps = None
+
+    spmeta = {
+        'J_shape': J.shape,
+        'class': type(prob).__name__,
+        'pathname': prob._metadata['pathname'],
+        'nz_entries': J.nnz,
+        'sparsity_time': time.perf_counter() - start_time,
+        'sparsity_method': 'structural',
+        'type': 'total',
+    }
+
+    return J, spmeta
+
+
+def _compute_coloring(J, mode, direct=True, order='id'):
     """
     Compute a good coloring in a specified dominant direction.
 
@@ -3035,6 +3319,9 @@ def _compute_coloring(J, mode, direct=True):
     direct : bool
         If True and doing bidirectional coloring, use the direct method to compute the column
         adjacency matrix of partitions, else use the substitution method.
+    order : str
+        Order in which columns (or rows) are colored, either 'id' (incidence degree) or 'sl'
+        (smallest last).
 
     Returns
     -------
@@ -3054,19 +3341,37 @@ def _compute_coloring(J, mode, direct=True):
         else:
             J = J.tocoo()
 
-        coloring = MNCO_bidir(J, direct=direct)
-        fallback = _compute_coloring(J, 'fwd')
-        if coloring.total_solves() >= fallback.total_solves():
-            coloring = fallback
-            coloring._meta['fallback'] = True
-        fallback = _compute_coloring(J, 'rev')
-        if coloring.total_solves() > fallback.total_solves():
-            coloring = fallback
-            coloring._meta['fallback'] = True
+        coloring = MNCO_bidir(J, direct=direct, order=order)
+        candidates = {'bidirectional': (coloring.total_solves(), time.perf_counter() - start_time)}
+
+        # A fwd coloring needs at least as many colors as the densest row has nonzeros, and a rev
+        # coloring at least as many as the densest column, so don't compute a fallback
+        # coloring that can't be chosen.  Their column adjacency matrices can be very large.
+        csr = _bool_csr(J.row, J.col, J.shape)
+        max_row_nnz = np.diff(csr.indptr).max(initial=0)
+        max_col_nnz = np.bincount(csr.indices, minlength=J.shape[1]).max(initial=0)
+        csr = None
+
+        candidates['fwd'] = None
+        if max_row_nnz <= coloring.total_solves():
+            fallback = _compute_coloring(J, 'fwd', order=order)
+            candidates['fwd'] = (fallback.total_solves(), fallback._meta['coloring_time'])
+            if coloring.total_solves() >= fallback.total_solves():
+                coloring = fallback
+                coloring._meta['fallback'] = True
+
+        candidates['rev'] = None
+        if max_col_nnz < coloring.total_solves():
+            fallback = _compute_coloring(J, 'rev', order=order)
+            candidates['rev'] = (fallback.total_solves(), fallback._meta['coloring_time'])
+            if coloring.total_solves() > fallback.total_solves():
+                coloring = fallback
+                coloring._meta['fallback'] = True
         fallback = None
 
         # record the total time and memory usage for bidir, fwd, and rev
         coloring._meta['coloring_time'] = time.perf_counter() - start_time
+        coloring._meta['coloring_candidates'] = candidates
         if start_mem is not None:
             coloring._meta['coloring_memory'] = mem_usage() - start_mem
 
@@ -3086,15 +3391,13 @@ def _compute_coloring(J, mode, direct=True):
         J = coo_matrix((np.ones(nzrows.size), (nzrows, nzcols)), shape=J.shape)
 
     nzrows, nzcols = J.row, J.col
-    col_groups = _get_full_disjoint_cols(J)
-
-    col2rows = [None] * ncols  # will contain list of nonzero rows for each column
+    col_groups = _get_full_disjoint_cols(J, order=order)
 
-    for r, c in sorted(zip(nzrows, nzcols)):
-        if col2rows[c] is None:
-            col2rows[c] = [r]
-        else:
-            col2rows[c].append(r)
+    # list of nonzero rows for each column, in ascending order
+    srt = np.lexsort((nzrows, nzcols))
+    col_nnz = np.bincount(nzcols, minlength=ncols)
+    col2rows = [rows.tolist() if rows.size > 0 else None
+                for rows in np.split(nzrows[srt], np.cumsum(col_nnz[:-1]))]
 
     if rev:
         coloring._rev = (col_groups, col2rows)
@@ -3113,7 +3416,7 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
                            tol=_DEF_COMP_SPARSITY_ARGS['tol'],
                            orders=_DEF_COMP_SPARSITY_ARGS['orders'],
                            setup=False, run_model=False, fname=None,
-                           driver=None):
+                           driver=None, sparsity_method='random', order='id'):
     """
     Compute simultaneous derivative colorings for the total jacobian of the given problem.
 
@@ -3142,6 +3445,14 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
     driver : <Driver>, None, or False
         The driver associated with the coloring.  If None, use problem.driver.  If False, no
         driver will be used.
+    sparsity_method : str
+        If 'random', determine the sparsity from total jacobians computed using random partials.
+        If 'structural', determine it from the declared sparsity of the partials without
+        computing any derivatives.  'structural' is only available when running on a single
+        process.
+    order : str
+        Order in which columns (or rows) are colored, either 'id' (incidence degree) or 'sl'
+        (smallest last).
 
     Returns
     -------
@@ -3151,6 +3462,16 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
     if driver is None:
         driver = problem.driver
 
+    if sparsity_method not in ('random', 'structural'):
+        raise ValueError(f"Invalid sparsity_method '{sparsity_method}'. Must be 'random' or "
+                         "'structural'.")
+
+    if sparsity_method == 'structural' and problem.comm.size > 1:
+        issue_warning("Structural total sparsity is not supported under MPI. Computing the "
+                      "sparsity from random total jacobians instead.",
+                      category=DerivativesWarning)
+        sparsity_method = 'random'
+
     ofs, wrts, _ = problem.model._get_totals_metadata(driver, of, wrt)
 
     model = problem.model
@@ -3180,12 +3501,21 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
         coloring = model._compute_coloring(method=list(model._approx_schemes)[0],
                                            num_full_jacs=num_full_jacs, tol=tol, orders=orders)[0]
     else:
-        J, sparsity_info = _get_total_jac_sparsity(problem, num_full_jacs=num_full_jacs, tol=tol,
-                                                   orders=orders, setup=setup,
-                                                   run_model=run_model, of=ofs, wrt=wrts,
-                                                   driver=driver)
+        if sparsity_method == 'structural':
+            if setup and not problem._computing_coloring:
+                problem.setup(mode=problem._orig_mode)
+                problem.final_setup()
+                ofs, wrts, _ = model._get_totals_metadata(driver, of, wrt)
+            J, sparsity_info = _get_structural_total_jac_sparsity(problem, ofs, wrts)
+            J = J.tocoo()
+        else:
+            J, sparsity_info = _get_total_jac_sparsity(problem, num_full_jacs=num_full_jacs,
+                                                       tol=tol, orders=orders, setup=setup,
+                                                       run_model=run_model, of=ofs, wrt=wrts,
+                                                       driver=driver)
         if driver:
-            coloring = _compute_coloring(J, mode, direct=driver._coloring_info.direct)
+            coloring = _compute_coloring(J, mode, direct=driver._coloring_info.direct,
+                                         order=order)
         else:
             coloring = None
 
@@ -3260,7 +3590,9 @@ def dynamic_total_coloring(driver, run_model=True, fname=None, of=None, wrt=None
 
     coloring = compute_total_coloring(problem, of=of, wrt=wrt, num_full_jacs=num_full_jacs, tol=tol,
                                       orders=orders, setup=False, run_model=run_model, fname=fname,
-                                      driver=driver)
+                                      driver=driver,
+                                      sparsity_method=driver._coloring_info.sparsity_method,
+                                      order=driver._coloring_info.order)
 
     driver._coloring_info.coloring = coloring
 
@@ -3305,6 +3637,12 @@ def _total_coloring_setup_parser(parser):
                         help='Number of orders (+/-) used in the tolerance sweep.')
     parser.add_argument('-t', '--tol', action='store', dest='tolerance', type=float,
                         help='tolerance used to determine if a jacobian entry is nonzero')
+    parser.add_argument('--structural', action='store_true', dest='structural',
+                        help="Determine the sparsity from the declared partial sparsity instead "
+                        "of computing total jacobians.")
+    parser.add_argument('--order', action='store', dest='order', choices=('id', 'sl'),
+                        help="Order in which columns (or rows) are colored, either 'id' "
+                        "(incidence degree) or 'sl' (smallest last).")
     parser.add_argument('--view', action='store_true', dest='show_sparsity',
                         help="Display a visualization of the final jacobian used to "
                         "compute the coloring.")
@@ -3349,13 +3687,19 @@ def _total_coloring_cmd(options, user_args):
                 coloring_info.num_full_jacs = options.num_jacs
             if options.show_sparsity:
                 coloring_info.show_sparsity = options.show_sparsity
+            if options.structural:
+                coloring_info.sparsity_method = 'structural'
+            if options.order is not None:
+                coloring_info.order = options.order
 
             with profiling('coloring_profile.out') if options.profile else do_nothing_context():
                 coloring_info.coloring = \
                     compute_total_coloring(prob, num_full_jacs=coloring_info.num_full_jacs,
                                            tol=coloring_info.tol, orders=coloring_info.orders,
                                            setup=False, run_model=True, fname=outfile,
-                                           driver=prob.driver)
+                                           driver=prob.driver,
+                                           sparsity_method=coloring_info.sparsity_method,
+                                           order=coloring_info.order)
 
             coloring_info.display()
         else:
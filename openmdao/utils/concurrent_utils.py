@@ -1,14 +1,20 @@
 """
-Utilities for submitting function evaluations under MPI.
+Utilities for submitting function evaluations under MPI or in a local process pool.
 """
 import os
 import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from itertools import chain, islice
 
 from openmdao.utils.mpi import debug
 
 trace = os.environ.get('OPENMDAO_TRACE')
 
+# function evaluated by the workers of concurrent_eval_pool.  It's stored here rather than
+# passed to the pool so that forked workers inherit it and it never has to be pickled.
+_pool_func = None
+
 
 def concurrent_eval_lb(func, cases, comm, broadcast=False):
     """
@@ -252,3 +258,92 @@ def concurrent_eval(func, cases, comm, allgather=False, model_mpi=None):
                 results = None
 
     return results
+
+
+def concurrent_eval_pool(func, cases, num_workers=None, initializer=None):
+    """
+    Evaluate function in a pool of forked local processes with load balancing.
+
+    Each worker process is forked from the current process, so it inherits a copy of any
+    state (e.g., a fully set up Problem) that func depends on.  Only the case arguments and
+    the return values are pickled.  As in concurrent_eval_lb, a new case is handed to a
+    worker as soon as it has finished its last one.  Results are yielded as they complete,
+    so they will generally not be in the same order as the cases.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in workers.
+    cases : iter of function args
+        Entries are assumed to be of the form (args, kwargs) where
+        kwargs are allowed to be None and args should be a list or tuple.
+    num_workers : int or None
+        Number of worker processes.  If None, os.cpu_count() is used.
+    initializer : function or None
+        If not None, called with no arguments in each worker process when it starts.
+
+    Yields
+    ------
+    int
+        Index of the case in cases.
+    object
+        Return from function, or None if it raised an exception.
+    str or None
+        Formatted traceback if function raised an exception, else None.
+    """
+    global _pool_func
+
+    try:
+        ctx = multiprocessing.get_context('fork')
+    except ValueError:
+        raise RuntimeError("concurrent_eval_pool requires the 'fork' process start method, "
+                           "which is not available on this platform.")
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    # keep a bounded number of cases in flight so that lazily generated cases are not
+    # all pulled into memory at once
+    max_pending = 2 * num_workers
+
+    _pool_func = func
+    try:
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=ctx,
+                                 initializer=initializer) as executor:
+            case_iter = enumerate(cases)
+            pending = {}
+            exhausted = False
+
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    try:
+                        i, (args, kwargs) = next(case_iter)
+                    except StopIteration:
+                        exhausted = True
+                    else:
+                        pending[executor.submit(_pool_worker, args, kwargs)] = i
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    retval, err = future.result()
+                    yield pending.pop(future), retval, err
+    finally:
+        _pool_func = None
+
+
+def _pool_worker(args, kwargs):
+    try:
+        if kwargs:
+            retval = _pool_func(*args, **kwargs)
+        else:
+            retval = _pool_func(*args)
+    except Exception:
+        err = traceback.format_exc()
+        retval = None
+    else:
+        err = None
+
+    return retval, err
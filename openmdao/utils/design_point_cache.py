@@ -0,0 +1,165 @@
+"""
+An in-memory LRU cache of model evaluations, keyed on the values of the design variables.
+"""
+from collections import OrderedDict
+from copy import deepcopy
+
+
+class DesignPointCache(object):
+    """
+    Least recently used cache of model states and total derivatives at design points.
+
+    Each entry holds the nonlinear model state computed at one design point along with any
+    total derivatives computed there, so that a driver asking for the same point again doesn't
+    have to rerun the model or recompute the derivatives.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of design points to keep.
+
+    Attributes
+    ----------
+    capacity : int
+        Maximum number of design points to keep.
+    hits : dict
+        Number of cache hits, keyed by kind ('model' or 'deriv').
+    misses : dict
+        Number of cache misses, keyed by kind ('model' or 'deriv').
+    _entries : OrderedDict
+        Mapping of design point key to (model state, totals dict), ordered from least to most
+        recently used.
+    """
+
+    def __init__(self, capacity):
+        """
+        Initialize attributes.
+        """
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self.hits = {'model': 0, 'deriv': 0}
+        self.misses = {'model': 0, 'deriv': 0}
+
+    def __len__(self):
+        """
+        Return the number of cached design points.
+
+        Returns
+        -------
+        int
+            Number of cached design points.
+        """
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """
+        Return True if the given design point is in the cache.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the design point.
+
+        Returns
+        -------
+        bool
+            True if the design point is in the cache.
+        """
+        return key in self._entries
+
+    def clear(self):
+        """
+        Remove all entries and reset the statistics.
+        """
+        self._entries.clear()
+        for stats in (self.hits, self.misses):
+            for kind in stats:
+                stats[kind] = 0
+
+    def get_state(self, key):
+        """
+        Return the model state stored for the given design point.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the design point.
+
+        Returns
+        -------
+        object or None
+            The model state, or None if the design point isn't in the cache.
+        """
+        try:
+            state, _ = self._entries[key]
+        except KeyError:
+            self.misses['model'] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits['model'] += 1
+        return state
+
+    def add_state(self, key, state):
+        """
+        Store the model state for the given design point, evicting the oldest point if necessary.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the design point.
+        state : object
+            The model state.
+        """
+        self._entries[key] = (state, {})
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def get_totals(self, key, totals_key):
+        """
+        Return a copy of the total derivatives stored for the given design point.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the design point.
+        totals_key : tuple
+            Key identifying the requested derivatives and their format.
+
+        Returns
+        -------
+        object or None
+            The total derivatives, or None if they aren't in the cache.
+        """
+        try:
+            totals = self._entries[key][1][totals_key]
+        except KeyError:
+            self.misses['deriv'] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits['deriv'] += 1
+        return deepcopy(totals)
+
+    def add_totals(self, key, totals_key, totals):
+        """
+        Store a copy of the total derivatives for the given design point.
+
+        Nothing is stored if the model state for the design point is no longer in the cache.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the design point.
+        totals_key : tuple
+            Key identifying the requested derivatives and their format.
+        totals : object
+            The total derivatives.
+        """
+        try:
+            _, all_totals = self._entries[key]
+        except KeyError:
+            return
+
+        all_totals[totals_key] = deepcopy(totals)
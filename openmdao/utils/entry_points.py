@@ -18,7 +18,8 @@ from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.implicitcomponent import ImplicitComponent
 from openmdao.core.group import Group
 from openmdao.core.driver import Driver
-from openmdao.solvers.solver import LinearSolver, NonlinearSolver, BlockLinearSolver
+from openmdao.solvers.solver import LinearSolver, NonlinearSolver, BlockLinearSolver, \
+    BlockNonlinearSolver
 from openmdao.recorders.base_case_reader import BaseCaseReader
 from openmdao.recorders.case_recorder import CaseRecorder
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
@@ -125,7 +126,8 @@ def compute_entry_points(package, dir_excludes=(), outstream=sys.stdout):
     check = tuple(_epgroup_bases)
 
     seen = set(check)
-    seen.update((ImplicitComponent, ExplicitComponent, BlockLinearSolver, LinesearchSolver))
+    seen.update((ImplicitComponent, ExplicitComponent, BlockLinearSolver, BlockNonlinearSolver,
+                 LinesearchSolver))
     # Driver and Group are instantiatable, so we should have entry points for them
     seen.remove(Driver)
     seen.remove(Group)
@@ -95,6 +95,7 @@ cmd_tests = [
     ('openmdao summary {}'.format(os.path.join(scriptdir, 'circle_opt.py')), {}),
     ('openmdao timing -v no_browser {}'.format(os.path.join(scriptdir, 'circle_opt.py')), {}),
     ('openmdao total_coloring {}'.format(os.path.join(scriptdir, 'circle_opt.py')), {}),
+    ('openmdao total_coloring --order sl {}'.format(os.path.join(scriptdir, 'circle_opt.py')), {}),
     ('openmdao trace {}'.format(os.path.join(scriptdir, 'circle_opt.py')), {}),
     ('openmdao tree -c {}'.format(os.path.join(scriptdir, 'circle_opt.py')), {}),
     ('openmdao view_connections --no_browser {}'.format(os.path.join(scriptdir, 'circle_opt.py')), {}),
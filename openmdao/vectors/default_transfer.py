@@ -63,18 +63,77 @@ def _setup_index_views(tot_size, in_xfers, out_xfers):
     return full_in, full_out
 
 
-def _setup_index_arrays(tot_size, in_xfers, out_xfers, vectors, scaled_in_set):
+# Contiguous runs shorter than this are copied with fancy indexing, which is faster than a
+# separate slice copy for each of them.
+_MIN_SLICE_SIZE = 256
+
+
+def _iter_runs(in_ranges, out_inds_list):
     """
-    Create index arrays for all subsystems.
+    Yield the contiguous runs of a list of connections.
+
+    Parameters
+    ----------
+    in_ranges : list of range
+        Input indices of each connection.
+    out_inds_list : list of range or int ndarray
+        Output indices of each connection.
+
+    Yields
+    ------
+    tuple of (int, int, int)
+        Input start index, output start index and size of the run.
+    """
+    for in_range, out_inds in zip(in_ranges, out_inds_list):
+        if isinstance(out_inds, range):
+            if len(out_inds) > 0:
+                yield in_range.start, out_inds.start, len(out_inds)
+        elif out_inds.size > 0:
+            breaks = (np.nonzero(np.diff(out_inds) != 1)[0] + 1).tolist()
+            for start, end in zip([0] + breaks, breaks + [out_inds.size]):
+                yield in_range.start + start, int(out_inds[start]), end - start
+
+
+def _merge_runs(runs):
+    """
+    Merge consecutive runs that are contiguous in both the input and the output.
+
+    Parameters
+    ----------
+    runs : iter of tuple of (int, int, int)
+        Input start index, output start index and size of each run.
+
+    Returns
+    -------
+    list of tuple of (int, int, int)
+        The merged runs.
+    """
+    merged = []
+    for in_start, out_start, size in runs:
+        if merged:
+            prev_in, prev_out, prev_size = merged[-1]
+            if prev_in + prev_size == in_start and prev_out + prev_size == out_start:
+                merged[-1] = (prev_in, prev_out, prev_size + size)
+                continue
+        merged.append((in_start, out_start, size))
+
+    return merged
+
+
+def _setup_index_arrays(in_xfers, out_xfers, vectors, scaled_in_set):
+    """
+    Compile the transfers of all subsystems into slice copies and index arrays.
+
+    Contiguous runs of at least _MIN_SLICE_SIZE entries are copied as slices. The remaining
+    entries of all subsystems are stored in one pair of index arrays, and each subsystem transfer
+    uses views of them.
 
     Parameters
     ----------
-    tot_size : int
-        Total size of each full array.
     in_xfers : dict
-        Mapping of subsystem name to input index arrays.
+        Mapping of subsystem name to a list of input index ranges.
     out_xfers : dict
-        Mapping of subsystem name to output index arrays.
+        Mapping of subsystem name to a list of output index ranges or arrays.
     vectors : dict
         Dictionary of input and output vectors.
     scaled_in_set : set
@@ -86,23 +145,52 @@ def _setup_index_arrays(tot_size, in_xfers, out_xfers, vectors, scaled_in_set):
         Mapping of subsystem name to Transfer object. None key maps to the
         'full' transfer across all subsystems.
     """
-    xfer_in, xfer_out = _setup_index_views(tot_size, in_xfers, out_xfers)
+    sub_slices = {}
+    sub_fancy = {}
+    fancy_size = 0
+
+    for sname, ranges in in_xfers.items():
+        slices = []
+        fancy = []
+        for run in _merge_runs(_iter_runs(ranges, out_xfers[sname])):
+            if run[2] >= _MIN_SLICE_SIZE:
+                slices.append(run)
+            else:
+                fancy.append(run)
+                fancy_size += run[2]
+        sub_slices[sname] = slices
+        sub_fancy[sname] = fancy
+
+    full_in = np.empty(fancy_size, dtype=INT_DTYPE)
+    full_out = np.empty(fancy_size, dtype=INT_DTYPE)
 
-    if tot_size > 0:
-        xfer_all = DefaultTransfer(vectors['input']['nonlinear'],
-                                   vectors['output']['nonlinear'], xfer_in, xfer_out,
-                                   len(scaled_in_set) > 0)
+    start = end = 0
+    for sname, fancy in sub_fancy.items():
+        for in_start, out_start, size in fancy:
+            full_in[end:end + size] = range(in_start, in_start + size)
+            full_out[end:end + size] = range(out_start, out_start + size)
+            end += size
+
+        # subsystem index arrays are views of the full index arrays
+        sub_fancy[sname] = (full_in[start:end], full_out[start:end])
+        start = end
+
+    in_vec = vectors['input']['nonlinear']
+    out_vec = vectors['output']['nonlinear']
+
+    all_slices = _merge_runs(run for slices in sub_slices.values() for run in slices)
+    if all_slices or fancy_size > 0:
+        xfer_all = DefaultTransfer(in_vec, out_vec, full_in, full_out, len(scaled_in_set) > 0,
+                                   all_slices)
     else:
         xfer_all = None
 
     xfer_dict = {None: xfer_all}
 
-    for sname, inds in in_xfers.items():
-        if inds.size > 0:
-            xfer_dict[sname] = DefaultTransfer(vectors['input']['nonlinear'],
-                                               vectors['output']['nonlinear'],
-                                               inds, out_xfers[sname],
-                                               sname in scaled_in_set)
+    for sname, (in_inds, out_inds) in sub_fancy.items():
+        if sub_slices[sname] or in_inds.size > 0:
+            xfer_dict[sname] = DefaultTransfer(in_vec, out_vec, in_inds, out_inds,
+                                               sname in scaled_in_set, sub_slices[sname])
         else:
             xfer_dict[sname] = None
 
@@ -120,13 +208,51 @@ class DefaultTransfer(Transfer):
     out_vec : <Vector>
         Pointer to the output vector.
     in_inds : int ndarray
-        Input indices for the transfer.
+        Input indices of the entries that are transferred with fancy indexing.
     out_inds : int ndarray
-        Output indices for the transfer.
+        Output indices of the entries that are transferred with fancy indexing.
     has_input_scaling : bool
         Whether any of the inputs has scaling.
+    slices : list of tuple of (int, int, int)
+        Input start index, output start index and size of the contiguous runs that are
+        transferred as slices.
+
+    Attributes
+    ----------
+    _slices : list of tuple of (slice, slice)
+        Input and output slices of the contiguous runs.
+    _out_has_dups : bool
+        True if the same output index appears more than once in out_inds.
     """
 
+    def __init__(self, in_vec, out_vec, in_inds, out_inds, has_input_scaling, slices=()):
+        """
+        Initialize all attributes.
+        """
+        super().__init__(in_vec, out_vec, in_inds, out_inds, has_input_scaling)
+        self._slices = [(slice(in_start, in_start + size), slice(out_start, out_start + size))
+                        for in_start, out_start, size in slices]
+        self._out_has_dups = np.unique(out_inds).size < out_inds.size
+
+    def _get_full_indices(self):
+        """
+        Return the input and output indices of all transferred entries.
+
+        Returns
+        -------
+        int ndarray
+            Input indices.
+        int ndarray
+            Output indices.
+        """
+        in_inds = [self._in_inds]
+        out_inds = [self._out_inds]
+        for in_slice, out_slice in self._slices:
+            in_inds.append(np.arange(in_slice.start, in_slice.stop, dtype=INT_DTYPE))
+            out_inds.append(np.arange(out_slice.start, out_slice.stop, dtype=INT_DTYPE))
+
+        return np.concatenate(in_inds), np.concatenate(out_inds)
+
     @staticmethod
     def _setup_transfers(group):
         """
@@ -164,8 +290,6 @@ class DefaultTransfer(Transfer):
         if offsets_out.size > 0:
             offsets_out = offsets_out[iproc]
 
-        tot_size = 0
-
         scaled_in_set = set()
         scale_factors = group._problem_meta['model_ref']()._scale_factors
 
@@ -195,7 +319,6 @@ class DefaultTransfer(Transfer):
                 # 2. Compute the input indices
                 # all input indices can be simple ranges during this part in order to save memory
                 input_inds = range(offsets_in[idx_in], offsets_in[idx_in] + sizes_in[idx_in])
-                tot_size += sizes_in[idx_in]
 
                 sub_in = abs_in[mypathlen:].split('.', 1)[0]
 
@@ -215,10 +338,9 @@ class DefaultTransfer(Transfer):
                     rev_xfer_in[sub_out].append(input_inds)
                     rev_xfer_out[sub_out].append(output_inds)
 
-        transfers['fwd'] = _setup_index_arrays(tot_size, fwd_xfer_in, fwd_xfer_out, vectors,
-                                               scaled_in_set)
+        transfers['fwd'] = _setup_index_arrays(fwd_xfer_in, fwd_xfer_out, vectors, scaled_in_set)
         if rev:
-            transfers['rev'] = _setup_index_arrays(tot_size, rev_xfer_in, rev_xfer_out, vectors,
+            transfers['rev'] = _setup_index_arrays(rev_xfer_in, rev_xfer_out, vectors,
                                                    scaled_in_set)
 
     @staticmethod
@@ -315,9 +437,20 @@ class DefaultTransfer(Transfer):
 
         """
         if mode == 'fwd':
-            # this works whether the vecs have multi columns or not due to broadcasting
-            in_vec.set_val(out_vec.asarray()[self._out_inds.flat], self._in_inds)
+            out_arr = out_vec.asarray()
+            for in_slice, out_slice in self._slices:
+                in_vec.set_val(out_arr[out_slice], in_slice)
+            if self._in_inds.size > 0:
+                in_vec.set_val(out_arr[self._out_inds], self._in_inds)
 
         else:  # rev
-            out_vec.iadd(np.bincount(self._out_inds, in_vec._get_data()[self._in_inds],
-                                     minlength=out_vec._data.size))
+            in_arr = in_vec._get_data()
+            for in_slice, out_slice in self._slices:
+                out_vec.iadd(in_arr[in_slice], out_slice)
+            if self._in_inds.size > 0:
+                if self._out_has_dups:
+                    # several inputs are connected to the same output entry, so their
+                    # contributions must be accumulated
+                    np.add.at(out_vec.asarray(), self._out_inds, in_arr[self._in_inds])
+                else:
+                    out_vec.iadd(in_arr[self._in_inds], self._out_inds)
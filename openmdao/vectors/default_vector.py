@@ -89,6 +89,49 @@ class DefaultVector(Vector):
         else:
             self._names = views
 
+    def _set_data(self, data):
+        """
+        Replace the data array and point the variable views into it.
+
+        Parameters
+        ----------
+        data : ndarray
+            The new data array, either flat or with one column per derivative seed.
+        """
+        self._data = data
+        self._ncol = 1 if data.ndim == 1 else data.shape[1]
+        for vinfo in self._views.values():
+            vinfo.set_view(data)
+
+    def _set_ncol(self, ncol, parent_vector=None):
+        """
+        Switch between the flat data layout and a layout holding ncol columns.
+
+        Parameters
+        ----------
+        ncol : int
+            Number of columns.  A value of 1 restores the flat layout.
+        parent_vector : <Vector> or None
+            Parent vector, already switched to the new layout, or None if this is a root vector.
+        """
+        if parent_vector is not None:
+            self._set_data(parent_vector._data[self._parent_slice])
+            return
+
+        if self._ncol == 1:
+            self._flat_data = self._data
+
+        if ncol == 1:
+            data = self._flat_data
+            self._flat_data = None
+        else:
+            data = self._multi_data
+            if data is None or data.shape[1] != ncol:
+                flat = self._flat_data
+                data = self._multi_data = np.zeros((flat.size, ncol), dtype=flat.dtype)
+
+        self._set_data(data)
+
     def _set_scaling(self, system, do_adder, nlvec=None):
         """
         Set the scaling vectors.
@@ -185,7 +228,7 @@ class DefaultVector(Vector):
         int
             Total flattened length of this vector.
         """
-        return self._data.size
+        return self._data.shape[0]
 
     def _in_matvec_context(self):
         """
@@ -347,6 +390,8 @@ class DefaultVector(Vector):
             Vector of additive scaling factors.
         """
         data = self.asarray()
+        if data.ndim > 1:
+            scaler = scaler[:, np.newaxis]
         if adder is not None:  # nonlinear only
             data -= adder
         data /= scaler
@@ -363,6 +408,8 @@ class DefaultVector(Vector):
             Vector of additive scaling factors.
         """
         data = self.asarray()
+        if data.ndim > 1:
+            scaler = scaler[:, np.newaxis]
         data *= scaler
         if adder is not None:  # nonlinear only
             data += adder
@@ -468,11 +515,15 @@ class DefaultVector(Vector):
         """
         Return the norm of this vector.
 
+        If the vector holds multiple columns, the largest column norm is returned.
+
         Returns
         -------
         float
             Norm of this vector.
         """
+        if self._ncol > 1:
+            return np.linalg.norm(self.asarray(), axis=0).max()
         return np.linalg.norm(self.asarray())
 
     def get_range(self, name):
@@ -0,0 +1,89 @@
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_totals, assert_near_equal
+from openmdao.vectors.default_transfer import _MIN_SLICE_SIZE
+
+
+class TestDefaultTransfer(unittest.TestCase):
+
+    def _build(self, mode):
+        n = 2 * _MIN_SLICE_SIZE
+
+        prob = om.Problem()
+        model = prob.model
+
+        ivc = model.add_subsystem('src', om.IndepVarComp())
+        ivc.add_output('a', np.arange(n, dtype=float))
+        ivc.add_output('b', np.arange(10, dtype=float))
+
+        model.add_subsystem('c1', om.ExecComp('f = sum(x) + 2.*sum(y**2) + 3.*sum(z**2)',
+                                              x=np.ones(n), y=np.ones(5),
+                                              z=np.ones(_MIN_SLICE_SIZE)))
+        model.add_subsystem('c2', om.ExecComp('g = sum(x**2)', x=np.ones(n)))
+
+        # plain connections, long src_indices runs, short strided src_indices and a fan-out
+        model.connect('src.a', 'c1.x')
+        model.connect('src.b', 'c1.y', src_indices=[0, 2, 4, 6, 8])
+        model.connect('src.a', 'c1.z', src_indices=np.arange(_MIN_SLICE_SIZE) + 3)
+        model.connect('src.a', 'c2.x')
+
+        model.add_design_var('src.a')
+        model.add_design_var('src.b')
+        model.add_objective('c1.f')
+        model.add_constraint('c2.g', upper=0.)
+
+        prob.setup(mode=mode, force_alloc_complex=True)
+        prob.run_model()
+
+        return prob
+
+    def test_transfer_compiled(self):
+        prob = self._build('rev')
+        n = 2 * _MIN_SLICE_SIZE
+        a = np.arange(n, dtype=float)
+
+        for mode in ('fwd', 'rev'):
+            xfer = prob.model._transfers[mode][None]
+            self.assertGreater(len(xfer._slices), 0)
+            # only the strided src_indices need index arrays, and the first of them extends the
+            # run of c1.x
+            self.assertEqual(xfer._in_inds.size, 4)
+
+            in_inds, out_inds = xfer._get_full_indices()
+            self.assertEqual(in_inds.size, 2 * n + 5 + _MIN_SLICE_SIZE)
+            self.assertEqual(np.unique(in_inds).size, in_inds.size)
+
+        assert_near_equal(prob.get_val('c1.x'), a)
+        assert_near_equal(prob.get_val('c1.y'), [0., 2., 4., 6., 8.])
+        assert_near_equal(prob.get_val('c1.z'), a[3:3 + _MIN_SLICE_SIZE])
+        assert_near_equal(prob.get_val('c2.x'), a)
+
+    def test_totals(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                prob = self._build(mode)
+                assert_check_totals(prob.check_totals(method='cs', out_stream=None))
+
+    def test_rev_accumulates_duplicates(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('src', om.IndepVarComp('a', np.ones(3)))
+        model.add_subsystem('c', om.ExecComp('f = sum(x**2)', x=np.ones(4)))
+        model.connect('src.a', 'c.x', src_indices=[0, 1, 1, 1])
+        model.add_design_var('src.a')
+        model.add_objective('c.f')
+
+        prob.setup(mode='rev')
+        prob.run_model()
+
+        self.assertTrue(prob.model._transfers['rev']['src']._out_has_dups)
+
+        J = prob.compute_totals()
+        assert_near_equal(J['c.f', 'src.a'], [[2., 6., 0.]])
+
+
+if __name__ == '__main__':
+    unittest.main()
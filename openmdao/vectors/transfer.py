@@ -36,6 +36,19 @@ class Transfer(object):
         self._out_inds = out_inds
         self._has_input_scaling = has_input_scaling
 
+    def _get_full_indices(self):
+        """
+        Return the input and output indices of all transferred entries.
+
+        Returns
+        -------
+        int ndarray
+            Input indices.
+        int ndarray
+            Output indices.
+        """
+        return self._in_inds, self._out_inds
+
     def __str__(self):
         """
         Return a string representation of the Transfer object.
@@ -46,7 +59,7 @@ class Transfer(object):
             String rep of this object.
         """
         try:
-            return "%s(in=%s, out=%s" % (self.__class__.__name__, self._in_inds, self._out_inds)
+            return "%s(in=%s, out=%s" % ((self.__class__.__name__,) + self._get_full_indices())
         except Exception as err:
             return "<error during call to Transfer.__str__: %s" % err
 
@@ -32,8 +32,14 @@ class _VecData(object):
     def set_view(self, data):
         start, end = self.range
         vflat = v = data[start:end]
-        if self.shape != vflat.shape and self.shape != ():
-            v = vflat.view().reshape(self.shape)
+        if data.ndim > 1:
+            # one column per derivative seed, so each view gets a trailing column dimension
+            v = vflat.reshape(self.shape + (data.shape[1],))
+            self.is_scalar = False
+        else:
+            self.is_scalar = self.shape == ()
+            if self.shape != vflat.shape and not self.is_scalar:
+                v = vflat.view().reshape(self.shape)
 
         self.view = v
         self.flat = vflat
@@ -84,6 +90,13 @@ class Vector(object):
         If True, then space for the complex vector is also allocated.
     _data : ndarray
         Actual allocated data.
+    _ncol : int
+        Number of columns in the data array.  Linear vectors hold more than one column, with
+        one derivative seed per column, only while a block of seeds is being solved.
+    _flat_data : ndarray or None
+        The original flat data array of a root vector while it holds multiple columns.
+    _multi_data : ndarray or None
+        Multiple column data array of a root vector, kept for reuse by later block solves.
     _parent_slice : slice
         Slice of the parent vector that this vector represents.
     _under_complex_step : bool
@@ -120,6 +133,9 @@ class Vector(object):
         self._names = self._views
 
         self._data = None
+        self._ncol = 1
+        self._flat_data = None
+        self._multi_data = None
         self._parent_slice = None
 
         # Support for Complex Step
@@ -513,6 +529,36 @@ class Vector(object):
         raise NotImplementedError('_initialize_data not defined for vector type '
                                   f'{type(self).__name__}')
 
+    def _set_data(self, data):
+        """
+        Replace the data array and point the variable views into it.
+
+        Must be implemented by the subclass.
+
+        Parameters
+        ----------
+        data : ndarray
+            The new data array, either flat or with one column per derivative seed.
+        """
+        raise NotImplementedError('_set_data not defined for vector type '
+                                  f'{type(self).__name__}')
+
+    def _set_ncol(self, ncol, parent_vector=None):
+        """
+        Switch between the flat data layout and a layout holding ncol columns.
+
+        Must be implemented by the subclass.
+
+        Parameters
+        ----------
+        ncol : int
+            Number of columns.  A value of 1 restores the flat layout.
+        parent_vector : <Vector> or None
+            Parent vector, already switched to the new layout, or None if this is a root vector.
+        """
+        raise NotImplementedError('_set_ncol not defined for vector type '
+                                  f'{type(self).__name__}')
+
     def __iadd__(self, vec):
         """
         Perform in-place vector addition.
@@ -245,7 +245,7 @@ class _CaseRecorderTracker:
             var_info = self._cr.problem_metadata["variables"]
             case = Case(
                 "driver",
-                row,
+                self._cr._driver_cases._unpack_row(row),
                 self._cr._prom2abs,
                 self._cr._abs2prom,
                 self._cr._abs2meta,